@@ -36,7 +36,7 @@ from .setobj    import *
 from .asnobj    import *
 from .asnobj    import _path_stack, _path_pop
 from .extractor import get_objs
-from .generator import PycrateGenerator, JSONDepGraphGenerator
+from .generator import PycrateGenerator, PycratePERCompGenerator, JSONDepGraphGenerator
 from .utils     import logger
 
 #------------------------------------------------------------------------------#
@@ -324,6 +324,10 @@ class PycrateGenerator(_Generator):
     """
     _impl = 0
     
+    # if True, the compiled PER codec (see pycrate_asn1rt/percomp.py) is enabled 
+    # for all objects of the generated modules
+    _percomp = False
+    
     def gen(self):
         #
         self.wrl('# -*- coding: UTF-8 -*-')
@@ -341,6 +345,8 @@ class PycrateGenerator(_Generator):
         self.wrl('from pycrate_asn1rt.asnobj_class     import *')
         self.wrl('from pycrate_asn1rt.asnobj_ext       import *')
         self.wrl('from pycrate_asn1rt.init             import init_modules')
+        if self._percomp:
+            self.wrl('from pycrate_asn1rt.percomp          import compile_modules')
         self.wrl('')
         #
         modlist = []
@@ -401,6 +407,8 @@ class PycrateGenerator(_Generator):
             self.wrl('')
         #
         self.wrl('init_modules(' + ', '.join(modlist) + ')')        
+        if self._percomp:
+            self.wrl('compile_modules(' + ', '.join(modlist) + ')')
     
     def gen_mod(self, Mod):
         obj_names = [obj_name for obj_name in Mod.keys() if obj_name[0:1] != '_']
@@ -974,6 +982,16 @@ class PycrateGenerator(_Generator):
                 logger.debug('%s.%s: %r' % (Obj._name, ident, Obj._cont[ident]._const))
             '''
 
+
+class PycratePERCompGenerator(PycrateGenerator):
+    """
+    PycratePERCompGenerator generates Python source code like PycrateGenerator,
+    and enables in addition the compiled PER codec for all generated objects:
+    their from_aper() / to_aper() (and UPER) methods will then dispatch to
+    specialized Python functions, generated at the object's first use
+    """
+    _percomp = True
+
 #------------------------------------------------------------------------------#
 # JSON graph dependency generator
 #------------------------------------------------------------------------------#
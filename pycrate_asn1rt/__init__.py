@@ -29,4 +29,4 @@
 #
 __all__ = ['utils', 'err', 'glob', 'dictobj', 'setobj', 'refobj', 'codecs', 'init',
            'asnobj_basic', 'asnobj_str', 'asnobj_construct', 'asnobj_class', 'asnobj_ext',
-           'wrapper']
+           'wrapper', 'percomp', 'lazy', 'snapshot', 'pool', 'berscan']
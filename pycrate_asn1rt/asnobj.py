@@ -28,6 +28,9 @@
 # *--------------------------------------------------------
 #*/
 
+from copy      import deepcopy
+from threading import local
+
 from .utils   import *
 from .err     import *
 from .refobj  import *
@@ -35,6 +38,11 @@ from .dictobj import *
 from .setobj  import *
 from .codecs  import *
 from .codecs  import _with_json
+from .percomp import compile_per
+
+
+# per-thread private copies of ASN.1 objects, see ASN1Obj.get_local()
+_ASN1ObjLocal = local()
 
 
 ASN1Obj_docstring = """
@@ -135,6 +143,12 @@ class ASN1Obj(Element):
     _SAFE_BND    = True
     # this enables object's table constraint verification when using set_val()
     _SAFE_BNDTAB = True
+    # this enables the compiled PER codec (see percomp.py) in from_aper(), 
+    # from_uper(), to_aper() and to_uper()
+    _PER_COMP    = False
+    # bit-stream handler used when decoding from a bytes buffer, can be set to
+    # CharpyFast for PER-heavy workloads
+    _CHARPY      = Charpy
     
     #--------------------------------------------------------------------------#
     # class attributes, initialization and safe checking methods
@@ -169,6 +183,11 @@ class ASN1Obj(Element):
     #_const_tab_id = None
     #_const_tab_at = None
     
+    # compiled PER codec, set at first use when _PER_COMP is enabled
+    _per_comp     = None
+    # objects looked up into the table constraint, cached by _get_tab_obj()
+    _tab_cache    = None
+    
     
     TYPE = None
     TAG  = None
@@ -358,6 +377,28 @@ class ASN1Obj(Element):
             IndVal   = self._get_val_by_path(self._const_tab_at)
         except Exception:
             return ret
+        # the result is cached per key value, as long as the table constraint
+        # and its set of values are unchanged
+        # only keys found in the table are cached (so the cache is bounded by
+        # the size of the table), not arbitrary values from decoded buffers
+        const_tab = self._const_tab
+        cache = self._tab_cache
+        if cache is None or cache[0] is not const_tab or cache[1] is not const_tab._val:
+            cache = self._tab_cache = (const_tab, const_tab._val, {})
+        try:
+            key = (IndIdent, hashable_val(IndVal))
+        except TypeError:
+            return self._get_tab_obj_lookup(IndIdent, IndVal)
+        try:
+            return cache[2][key]
+        except KeyError:
+            ret = self._get_tab_obj_lookup(IndIdent, IndVal)
+            if ret[0] != CLASET_NONE:
+                cache[2][key] = ret
+            return ret
+    
+    def _get_tab_obj_lookup(self, IndIdent, IndVal):
+        ret = (CLASET_NONE, None)
         cla_val_type, cla_val = self._const_tab.get(IndIdent, IndVal)
         if cla_val_type == CLASET_UNIQ and self._const_tab_id in cla_val:
             return (CLASET_UNIQ, cla_val[self._const_tab_id])
@@ -1369,17 +1410,25 @@ class ASN1Obj(Element):
     def _to_per(self):
         raise(ASN1NotSuppErr(self.fullname()))
     
+    def _get_per_comp(self):
+        if self._per_comp is None:
+            compile_per(self)
+        return self._per_comp
+    
     def from_uper(self, buf):
         if self._param:
             raise(ASN1ObjErr('Parameterized object cannot be used for decoding'))
         ASN1CodecPER.ALIGNED = False
         if isinstance(buf, bytes_types):
-            char = Charpy(buf)
+            char = self._CHARPY(buf)
         else:
             char = buf
             #assert( char.len_bit() % 8 == 0 )
         off0 = char._cur
-        self._from_per(char)
+        if self._PER_COMP:
+            self._get_per_comp()[1](char)
+        else:
+            self._from_per(char)
         off1 = char._cur
         if off1 == off0:
             # char was not consumed at all (all decoded values were implicit)
@@ -1399,7 +1448,12 @@ class ASN1Obj(Element):
         if val is not None:
             self.set_val(val)
         if self._val is not None:
-            ret = pack_val(*self._to_per())[0]
+            w = BitWriter()
+            if self._PER_COMP:
+                self._get_per_comp()[3](w)
+            else:
+                w.extend(self._to_per())
+            ret = w.to_bytes()
             if ret:
                 return ret
             else:
@@ -1413,11 +1467,14 @@ class ASN1Obj(Element):
         ASN1CodecPER.ALIGNED = True
         ASN1CodecPER._off.append(0)
         if isinstance(buf, bytes_types):
-            char = Charpy(buf)
+            char = self._CHARPY(buf)
         else:
             char = buf
             assert( char.len_bit() % 8 == 0 )
-        self._from_per(char)
+        if self._PER_COMP:
+            self._get_per_comp()[0](char)
+        else:
+            self._from_per(char)
         if ASN1CodecPER._off[-1] == 0:
             # char was not consumed at all (all decoded values were implicit)
             # hence a null byte must be consumed
@@ -1438,7 +1495,12 @@ class ASN1Obj(Element):
             self.set_val(val)
         if self._val is not None:
             ASN1CodecPER._off.append(0)
-            ret = pack_val(*self._to_per())[0]
+            w = BitWriter()
+            if self._PER_COMP:
+                self._get_per_comp()[2](w)
+            else:
+                w.extend(self._to_per())
+            ret = w.to_bytes()
             if not ret:
                 ret = b'\0'
             del ASN1CodecPER._off[-1]
@@ -1459,7 +1521,7 @@ class ASN1Obj(Element):
             raise(ASN1ObjErr('Parameterized object cannot be used for decoding'))
         ASN1CodecPER.ALIGNED = False
         if isinstance(buf, bytes_types):
-            char = Charpy(buf)
+            char = self._CHARPY(buf)
         else:
             char = buf
             #assert( char.len_bit() % 8 == 0 )
@@ -1506,7 +1568,7 @@ class ASN1Obj(Element):
         ASN1CodecPER.ALIGNED = True
         ASN1CodecPER._off.append(0)
         if isinstance(buf, bytes_types):
-            char = Charpy(buf)
+            char = self._CHARPY(buf)
         else:
             char = buf
             assert( char.len_bit() % 8 == 0 )
@@ -1619,7 +1681,7 @@ class ASN1Obj(Element):
         if self._param:
             raise(ASN1ObjErr('Parameterized object cannot be used for decoding'))
         if isinstance(buf, bytes_types):
-            char = Charpy(buf)
+            char = self._CHARPY(buf)
         else:
             char = buf
         # decode the whole char buffer into tag, length and value boundary
@@ -1693,7 +1755,9 @@ class ASN1Obj(Element):
         if val is not None:
             self.set_val(val)
         if self._val is not None:
-            return pack_val(*self._to_ber())[0]
+            w = BitWriter()
+            w.extend(self._to_ber())
+            return w.to_bytes()
         else:
             return None
     
@@ -1751,7 +1815,7 @@ class ASN1Obj(Element):
         if self._param:
             raise(ASN1ObjErr('Parameterized object cannot be used for decoding'))
         if isinstance(buf, bytes_types):
-            char = Charpy(buf)
+            char = self._CHARPY(buf)
         else:
             char = buf
         # decode the whole char buffer into tag, length and value boundary
@@ -2046,7 +2110,7 @@ class ASN1Obj(Element):
             raise(ASN1ObjErr('Parameterized object cannot be used for decoding'))
         # ASN1CodecOER.CANONICAL = False
         if isinstance(buf, bytes_types):
-            char = Charpy(buf)
+            char = self._CHARPY(buf)
         else:
             char = buf
         #
@@ -2060,7 +2124,7 @@ class ASN1Obj(Element):
             raise(ASN1ObjErr('Parameterized object cannot be used for decoding'))
         # ASN1CodecOER.CANONICAL = False
         if isinstance(buf, bytes_types):
-            char = Charpy(buf)
+            char = self._CHARPY(buf)
         else:
             char = buf
         #
@@ -2076,7 +2140,9 @@ class ASN1Obj(Element):
         if val is not None:
             self.set_val(val)
         if self._val is not None:
-            ret = pack_val(*self._to_oer())[0]
+            w = BitWriter()
+            w.extend(self._to_oer())
+            ret = w.to_bytes()
             if ret:
                 return ret
             else:
@@ -2113,7 +2179,9 @@ class ASN1Obj(Element):
         if val is not None:
             self.set_val(val)
         if self._val is not None:
-            ret = pack_val(*self._to_oer())[0]
+            w = BitWriter()
+            w.extend(self._to_oer())
+            ret = w.to_bytes()
             if ret:
                 return ret
             else:
@@ -2136,6 +2204,192 @@ class ASN1Obj(Element):
                 return b'\0'
         else:
             return None
+    
+    #--------------------------------------------------------------------------#
+    # thread-safe encoding / decoding methods
+    #--------------------------------------------------------------------------#
+    # all encoding / decoding methods above set the value into the object itself
+    # (and into its content), hence the same object cannot be used concurrently
+    # by several threads
+    # the methods here work on a private copy of the object, specific to each 
+    # thread, and return the value (or buffer) without mutating the object
+    
+    def __deepcopy__(self, memo):
+        Obj = self.__class__.__new__(self.__class__)
+        memo[id(self)] = Obj
+        for attr, attrval in self.__dict__.items():
+            if attr not in ('_per_comp', '_tab_cache'):
+                # compiled PER codec is bound to the original object
+                # and table constraint lookups are rebuilt on demand
+                Obj.__dict__[attr] = deepcopy(attrval, memo)
+        return Obj
+    
+    def __getstate__(self):
+        if '_per_comp' in self.__dict__ or '_tab_cache' in self.__dict__:
+            # compiled PER codec cannot be pickled, it is regenerated on demand,
+            # as table constraint lookups
+            state = self.__dict__.copy()
+            state.pop('_per_comp', None)
+            state.pop('_tab_cache', None)
+            return state
+        else:
+            return self.__dict__
+    
+    def get_local(self):
+        """
+        returns a private copy of self, specific to the calling thread
+        
+        The copy is created at the 1st call within each thread, and then reused.
+        All ASN.1 objects copied within a thread share their common content 
+        (e.g. subtypes, constraints and class sets).
+        """
+        try:
+            memo = _ASN1ObjLocal.memo
+        except AttributeError:
+            memo = _ASN1ObjLocal.memo = {}
+        try:
+            return memo[id(self)]
+        except KeyError:
+            return deepcopy(self, memo)
+    
+    def decode(self, buf, codec='aper'):
+        """
+        decodes buf with the given codec and returns the decoded value, 
+        using the thread-local copy of self
+        
+        Args:
+            buf: bytes
+            codec: str, 'aper', 'uper', 'ber', 'cer', 'der', 'oer', 'coer' or 'jer'
+        
+        Returns:
+            val: single value, specific to the ASN.1 object
+        """
+        Obj = self.get_local()
+        try:
+            from_codec = getattr(Obj, 'from_%s' % codec)
+        except AttributeError:
+            raise(ASN1ObjErr('{0}: invalid codec, {1!r}'.format(self.fullname(), codec)))
+        from_codec(buf)
+        return Obj._val
+    
+    def encode(self, val, codec='aper'):
+        """
+        encodes val with the given codec and returns the encoded buffer, 
+        using the thread-local copy of self
+        
+        Args:
+            val: single value, specific to the ASN.1 object
+            codec: str, 'aper', 'uper', 'ber', 'cer', 'der', 'oer', 'coer' or 'jer'
+        
+        Returns:
+            buf: bytes (or str for jer)
+        """
+        Obj = self.get_local()
+        try:
+            to_codec = getattr(Obj, 'to_%s' % codec)
+        except AttributeError:
+            raise(ASN1ObjErr('{0}: invalid codec, {1!r}'.format(self.fullname(), codec)))
+        return to_codec(val)
+    
+    #--------------------------------------------------------------------------#
+    # batch decoding methods
+    #--------------------------------------------------------------------------#
+    # decoding a large number of buffers with the from_*() methods above
+    # creates a new Charpy instance and setup the codec for each buffer
+    # the methods here setup the codec and checks once, reuse a single Charpy 
+    # instance, and yield the decoded values
+    
+    def decode_many(self, bufs, codec='aper', errors='raise', safe_bnd=None):
+        """
+        decodes each buffer from the iterable bufs with the given codec, and 
+        yields the decoded values, in order
+        
+        Args:
+            bufs: iterable of bytes
+            codec: str, 'aper', 'uper', 'ber', 'cer', 'der', 'oer' or 'coer'
+            errors: str, 'raise' to raise the 1st decoding error, or 'yield' to 
+                yield the exception instead of the value for each buffer that 
+                fails decoding
+            safe_bnd: bool or None, to enable or disable constraints' checks on
+                the decoded values, if None, _SAFE_BND is used
+        
+        Yields:
+            val: single value, specific to the ASN.1 object, or exception
+        """
+        if self._param:
+            raise(ASN1ObjErr('Parameterized object cannot be used for decoding'))
+        if codec in ('aper', 'uper'):
+            dec = self._decode_one_per
+        elif codec in ('ber', 'cer', 'der'):
+            # CER and DER specific parameters are only used for encoding
+            dec = self._decode_one_ber
+        elif codec in ('oer', 'coer'):
+            dec = self._from_oer
+        else:
+            raise(ASN1ObjErr('{0}: invalid codec, {1!r}'.format(self.fullname(), codec)))
+        if errors not in ('raise', 'yield'):
+            raise(ASN1ObjErr('{0}: invalid errors, {1!r}'.format(self.fullname(), errors)))
+        if safe_bnd is None:
+            safe_bnd = self._SAFE_BND
+        if codec in ('aper', 'uper') and self._PER_COMP:
+            if codec == 'aper':
+                dec_comp = self._get_per_comp()[0]
+            else:
+                dec_comp = self._get_per_comp()[1]
+        else:
+            dec_comp = None
+        #
+        char = self._CHARPY()
+        for buf in bufs:
+            char.set_bytes(buf)
+            if codec == 'aper':
+                # to be set again, in case the consumer of the generator uses
+                # the PER codec between 2 iterations
+                ASN1CodecPER.ALIGNED = True
+            elif codec == 'uper':
+                ASN1CodecPER.ALIGNED = False
+            try:
+                if dec_comp is not None:
+                    self._decode_one_per(char, dec_comp)
+                else:
+                    dec(char)
+                if safe_bnd:
+                    self._safechk_bnd(self._val)
+            except Exception as err:
+                if errors == 'raise':
+                    raise(err)
+                else:
+                    yield err
+            else:
+                yield self._val
+    
+    def _decode_one_per(self, char, dec=None):
+        if ASN1CodecPER.ALIGNED:
+            ASN1CodecPER._off.append(0)
+            try:
+                if dec is None:
+                    self._from_per(char)
+                else:
+                    dec(char)
+                if ASN1CodecPER._off[-1] == 0:
+                    # char was not consumed at all (all decoded values were 
+                    # implicit) hence a null byte must be present
+                    if char.get_bytes(8) != b'\0':
+                        raise(ASN1PERDecodeErr('{0}: invalid empty encoding'\
+                              .format(self.fullname())))
+            finally:
+                del ASN1CodecPER._off[-1]
+        else:
+            if dec is None:
+                self._from_per(char)
+            else:
+                dec(char)
+            if char._cur == 0 and char.get_bytes(8) != b'\0':
+                raise(ASN1PERDecodeErr('{0}: invalid empty encoding'\
+                      .format(self.fullname())))
+    
+    def _decode_one_ber(self, char):
+        self._from_ber(char, [ASN1CodecBER.decode_single(char)[0]])
 
 
 def _save_ber_params():
@@ -87,6 +87,10 @@ Specific method:
     # for when the UNIQUE field is actually not unique and the class set is
     # not defined at the module root (and hence has not _lut attribute)
     _CLASET_MULT = False
+    
+    # hash indexes of the CLASS set of values, per field, built at first use
+    # by get_uniq() and get_mult(), see _get_idx()
+    _idx = None
      
     def _safechk_val(self, val):
         if not isinstance(val, dict) or not all([k in self._cont for k in val]):
@@ -190,7 +194,7 @@ Specific method:
             elif ret:
                 return (CLASET_UNIQ, ret[0])
             else:
-                (CLASET_NONE, None)
+                return (CLASET_NONE, None)
         else:
             ret = self.get_uniq(key, val)
             if ret:
@@ -198,12 +202,54 @@ Specific method:
             else:
                 return (CLASET_NONE, None)
     
+    def _get_idx(self, name):
+        # returns the hash index of the CLASS set of values for the field name,
+        # {hashable field value: [CLASS values]}, built at first use for each 
+        # field, or None if some values of the field are not hashable
+        if self._idx is None or self._idx[0] is not self._val:
+            # (re)build indexes when the set of values has been changed
+            self._idx = (self._val, {})
+        idxs = self._idx[1]
+        try:
+            return idxs[name]
+        except KeyError:
+            pass
+        idx = {}
+        try:
+            for valset in (self._val.root, self._val.ext):
+                if valset:
+                    for v in valset:
+                        if name in v:
+                            kv = hashable_val(v[name])
+                            if kv in idx:
+                                idx[kv].append(v)
+                            else:
+                                idx[kv] = [v]
+        except TypeError:
+            idx = None
+        idxs[name] = idx
+        return idx
+    
+    def _get_idx_vals(self, name, val):
+        # returns the list of CLASS values with field name equal to val, 
+        # from the hash index, or None if the index cannot be used
+        idx = self._get_idx(name)
+        if idx is None:
+            return None
+        try:
+            return idx.get(hashable_val(val), [])
+        except TypeError:
+            return None
+    
     def get_uniq(self, name, val):
         # this is using an enumeration of all CLASS set of values,
         # and returns the first corresponding value found
         ret = None
         if self._mode != MODE_SET:
             return ret
+        vals = self._get_idx_vals(name, val)
+        if vals is not None:
+            return vals[0] if vals else ret
         if self._val.root:
             for v in self._val.root:
                 try:
@@ -226,6 +272,9 @@ Specific method:
         ret = []
         if self._mode != MODE_SET:
             return ret
+        vals = self._get_idx_vals(name, val)
+        if vals is not None:
+            return list(vals)
         if self._val.root:
             for v in self._val.root:
                 try:
@@ -409,7 +409,7 @@ Specific constraints attributes:
                 logger.warning('BIT_STR.__from_per_ws_buf: %s, specific CONTAINING encoder unhandled' % self._name)
                 self.__val_from_buf_struct(Buf)
             else:
-                char = Charpy(Buf())
+                char = self._CHARPY(Buf())
                 char._len_bit = Buf.get_bl()
                 try:
                     if ASN1CodecPER.ALIGNED:
@@ -502,7 +502,7 @@ Specific constraints attributes:
                 logger.warning('BIT_STR.__from_per_buf: %s, specific CONTAINING encoder unhandled' % self._name)
                 self.__val_from_buf(buf, bl)
             else:
-                char = Charpy(buf)
+                char = self._CHARPY(buf)
                 char._len_bit = bl
                 try:
                     if ASN1CodecPER.ALIGNED:
@@ -834,7 +834,7 @@ Specific constraints attributes:
                 logger.warning('BIT_STR.__from_ber_buf: %s, specific CONTAINING encoder unhandled' % self._name)
                 self.__val_from_buf(buf, bl)
             else:
-                Obj, char = self._const_cont, Charpy(buf)
+                Obj, char = self._const_cont, self._CHARPY(buf)
                 char._len_bit = bl
                 _const_cont_par = Obj._parent
                 Obj._parent = self._parent
@@ -1664,7 +1664,7 @@ Specific constraints attributes:
                 logger.warning('OCT_STR.__from_ber_buf: %s, specific CONTAINING encoder unhandled' % self._name)
                 self._val = buf
             else:
-                Obj, char = self._const_cont, Charpy(buf)
+                Obj, char = self._const_cont, self._CHARPY(buf)
                 _const_cont_par = Obj._parent
                 Obj._parent = self._parent
                 try:
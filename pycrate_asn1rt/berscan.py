@@ -0,0 +1,578 @@
+# -*- coding: UTF-8 -*-
+#/**
+# * Software Name : pycrate
+# * Version : 0.4
+# *
+# * This library is free software; you can redistribute it and/or
+# * modify it under the terms of the GNU Lesser General Public
+# * License as published by the Free Software Foundation; either
+# * version 2.1 of the License, or (at your option) any later version.
+# *
+# * This library is distributed in the hope that it will be useful,
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# * Lesser General Public License for more details.
+# *
+# * You should have received a copy of the GNU Lesser General Public
+# * License along with this library; if not, write to the Free Software
+# * Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# * MA 02110-1301  USA
+# *
+# *--------------------------------------------------------
+# * File Name : pycrate_asn1rt/berscan.py
+# *--------------------------------------------------------
+#*/
+
+import os
+import sys
+import json
+import mmap
+from array import array
+from time  import time
+
+from .utils  import logger
+from .err    import ASN1Err, ASN1BERDecodeErr
+from .codecs import ASN1CodecBER
+
+
+#------------------------------------------------------------------------------#
+# streaming BER TLV scanner
+#------------------------------------------------------------------------------#
+# ASN1CodecBER.decode_tlv() / decode_all() work on a Charpy instance, hence on
+# a buffer fully loaded in memory, and build nested Python lists with a copy
+# of each primitive value.
+#
+# Here, TLVs are scanned directly from a bytes-like buffer or from a mmap'ed
+# file, and reported as a flat stream of events, with the offsets of their tag
+# and value, without copying nor decoding any value. The scan is iterative,
+# hence the memory used does not depend on the size of the file, nor on the
+# nesting of TLVs.
+
+# maximum number of bytes accepted for a tag integral value
+DEC_MAXT = ASN1CodecBER.DEC_MAXT
+# maximum number of bytes accepted for a length integral value
+DEC_MAXL = ASN1CodecBER.DEC_MAXL
+
+
+class BERScanner(object):
+    """
+    scans BER/CER/DER-encoded TLVs from a buffer or a file, without decoding
+    nor copying their values
+
+    init args:
+        src: bytes-like buffer, or str path to a file, which is then mmap'ed
+        off: int, offset to start scanning at
+        end: int or None, offset to stop scanning at, default is the end of the
+            buffer
+
+    a TLV is reported as a 7-tuple event:
+        (depth, tag class, pc, tag value, length, offset, value offset)
+    with tag class from 0 (universal) to 3 (private), pc 0 for primitive and 1
+    for constructed, and length -1 for an undefinite length
+
+    EOC markers are not reported: they end the current undefinite length
+    constructed TLV, or are skipped at top-level (e.g. zero-padding in CDR
+    files)
+    """
+
+    def __init__(self, src, off=0, end=None):
+        self._fd, self._mm = None, None
+        if isinstance(src, str):
+            self._fd = open(src, 'rb')
+            try:
+                self._mm = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty file
+                self.buf = b''
+            else:
+                self.buf = self._mm
+        else:
+            self.buf = src
+        if end is None or end > len(self.buf):
+            end = len(self.buf)
+        self.off, self.end = off, end
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        closes the mmap'ed file, if any
+
+        memoryviews returned by get_tlv() or get_val() must have been released
+        before
+        """
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._fd is not None:
+            self._fd.close()
+            self._fd = None
+        self.buf = b''
+
+    def read_tl(self, off, lim=None):
+        """
+        decodes the tag and length starting at offset off, and returns a
+        5-tuple (tag class, pc, tag value, length, value offset)
+
+        raises ASN1BERDecodeErr if they overflow the limit offset lim
+        """
+        buf = self.buf
+        if lim is None:
+            lim = self.end
+        if off + 2 > lim:
+            raise(ASN1BERDecodeErr('truncated tag-length at offset %i' % off))
+        b = buf[off]
+        cl, pc, tval = b>>6, (b>>5) & 1, b & 0x1f
+        off += 1
+        if tval == 0x1f:
+            # long tag format
+            tval = 0
+            for i in range(DEC_MAXT):
+                if off >= lim:
+                    raise(ASN1BERDecodeErr('truncated tag at offset %i' % off))
+                b = buf[off]
+                off += 1
+                tval = (tval<<7) + (b & 0x7f)
+                if not b & 0x80:
+                    break
+            else:
+                raise(ASN1BERDecodeErr('tag too long at offset %i' % off))
+            if off >= lim:
+                raise(ASN1BERDecodeErr('truncated length at offset %i' % off))
+        b = buf[off]
+        off += 1
+        if b & 0x80:
+            # long length format
+            nb = b & 0x7f
+            if nb == 0:
+                if not pc:
+                    raise(ASN1BERDecodeErr('invalid undefinite length at offset %i' % off))
+                return cl, pc, tval, -1, off
+            elif nb > DEC_MAXL or off + nb > lim:
+                raise(ASN1BERDecodeErr('invalid length at offset %i' % off))
+            return cl, pc, tval, int.from_bytes(buf[off:off+nb], 'big'), off+nb
+        else:
+            return cl, pc, tval, b, off
+
+    def _end_undef(self, off, lim):
+        # returns the offset after the EOC marker closing the undefinite length
+        # value starting at offset off
+        read_tl, nest = self.read_tl, 1
+        while nest:
+            cl, pc, tval, lval, off = read_tl(off, lim)
+            if lval < 0:
+                nest += 1
+            elif lval == 0 and (cl, pc, tval) == (0, 0, 0):
+                nest -= 1
+            else:
+                off += lval
+        if off > lim:
+            raise(ASN1BERDecodeErr('value overflow at offset %i' % off))
+        return off
+
+    def tlv_end(self, off, lim=None):
+        """
+        returns the offset following the TLV starting at offset off, scanning up
+        to its EOC marker in case of undefinite length
+        """
+        if lim is None:
+            lim = self.end
+        cl, pc, tval, lval, voff = self.read_tl(off, lim)
+        if lval < 0:
+            return self._end_undef(voff, lim)
+        elif voff + lval > lim:
+            raise(ASN1BERDecodeErr('value overflow at offset %i' % voff))
+        return voff + lval
+
+    def get_tlv(self, off):
+        """
+        returns a memoryview over the TLV starting at offset off
+        """
+        return memoryview(self.buf)[off:self.tlv_end(off)]
+
+    def get_val(self, off):
+        """
+        returns a memoryview over the value of the TLV starting at offset off,
+        including its EOC marker in case of undefinite length
+        """
+        voff = self.read_tl(off)[4]
+        return memoryview(self.buf)[voff:self.tlv_end(off)]
+
+    def iter_tlv(self, off=None, end=None, maxdepth=None):
+        """
+        yields an event (depth, tag class, pc, tag value, length, offset, value
+        offset) for each TLV between offsets off and end, the default being the
+        ones of the scanner, in the order of the encoding
+
+        maxdepth: int or None, the content of constructed TLVs at this depth is
+            skipped (0 only yields top-level TLVs)
+
+        calling .send(True) on the generator just after it yielded a constructed
+        TLV skips its content, and returns the next event
+
+        raises ASN1BERDecodeErr on invalid encoding
+        """
+        if off is None:
+            off = self.off
+        if end is None:
+            end = self.end
+        read_tl = self.read_tl
+        # lims: limit offset of each level, undef: undefinite length levels
+        lims, undef = [end], [False]
+        while True:
+            lim = lims[-1]
+            if off >= lim:
+                if len(lims) == 1:
+                    return
+                elif undef[-1]:
+                    raise(ASN1BERDecodeErr('missing EOC marker at offset %i' % off))
+                del lims[-1], undef[-1]
+                continue
+            cl, pc, tval, lval, voff = read_tl(off, lim)
+            if lval == 0 and (cl, pc, tval) == (0, 0, 0):
+                # EOC marker
+                off = voff
+                if undef[-1]:
+                    del lims[-1], undef[-1]
+                elif len(lims) > 1:
+                    raise(ASN1BERDecodeErr('unexpected EOC marker at offset %i' % off))
+                continue
+            depth = len(lims) - 1
+            skip  = (yield (depth, cl, pc, tval, lval, off, voff))
+            if lval < 0:
+                if skip or depth == maxdepth:
+                    off = self._end_undef(voff, lim)
+                else:
+                    lims.append(lim)
+                    undef.append(True)
+                    off = voff
+            else:
+                off = voff + lval
+                if off > lim:
+                    raise(ASN1BERDecodeErr('value overflow at offset %i' % voff))
+                if pc and not skip and depth != maxdepth:
+                    lims.append(off)
+                    undef.append(False)
+                    off = voff
+
+
+#------------------------------------------------------------------------------#
+# index of records in concatenated BER files
+#------------------------------------------------------------------------------#
+# CDR and TAP files are made of concatenated BER-encoded records, which can only
+# be decoded sequentially with from_ber().
+#
+# Here, the top-level TLVs of a file are scanned once, and the offset, length,
+# tag class and tag value of each record are stored into compact arrays, with
+# optional key fields extracted from each record (e.g. a served IMSI) pointing
+# to the list of record numbers having a given value. The index can be saved
+# next to the file, and reloaded as long as the file is not modified, so that
+# any record can be decoded without re-scanning the file.
+#
+# An index file contains:
+# - a magic line
+# - a JSON header line, with the index format version, the size and modification
+#   time of the indexed file, the key fields' paths, the byte order and item
+#   sizes of the arrays, the number of records and of values per key field
+# - the raw arrays of offsets, lengths, tag classes and tag values
+# - for each key field: the raw arrays of values' length, of values' number of
+#   records and of records' number, and the concatenated values
+#
+# Hence, loading an index never unpickles anything, and its content is only
+# checked against the header (any inconsistency making it invalid).
+
+# index format version, to be incremented when the format changes
+INDEX_VERSION = 2
+
+INDEX_MAGIC = b'pycrate-ber-index\n'
+
+
+class BERIndex(object):
+    """
+    index of the top-level BER-encoded records of a file, for random access
+
+    init args:
+        path: str, path to the file of concatenated records
+        keys: dict or None, key fields to be extracted from each record,
+            {name: path}, with path being a list of (tag class, tag value), from
+            the content of the record down to the TLV holding the value, e.g.
+            {'imsi': [(2, 3)]} for the servedIMSI of a 3GPP PGW / SGW record
+        path_idx: str or None, path to the index file, default is path + '.idx'
+
+    attributes after build() or load():
+        off: array of records' offset
+        len: array of records' length
+        cl: array of records' tag class
+        tag: array of records' tag value
+        kval: dict of key fields' values, {name: {value bytes: array of records'
+            number}}
+    """
+
+    # array typecodes for offsets, lengths, tag classes and tag values
+    TC_OFF = 'Q'
+    TC_LEN = 'I'
+    TC_CL  = 'B'
+    TC_TAG = 'I'
+    # array typecode for records' number in key fields' values
+    TC_NUM = 'I'
+
+    def __init__(self, path, keys=None, path_idx=None):
+        self.path     = path
+        self.keys     = dict(keys) if keys else {}
+        if path_idx is None:
+            path_idx  = path + '.idx'
+        self.path_idx = path_idx
+        self._scan    = BERScanner(path)
+        self._init_arr()
+        self.dur = 0.0
+
+    def _init_arr(self):
+        self.off  = array(self.TC_OFF)
+        self.len  = array(self.TC_LEN)
+        self.cl   = array(self.TC_CL)
+        self.tag  = array(self.TC_TAG)
+        self.kval = {name: {} for name in self.keys}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return len(self.off)
+
+    def close(self):
+        """
+        closes the indexed file
+        """
+        self._scan.close()
+
+    def _get_file_info(self):
+        st = os.stat(self.path)
+        return st.st_size, st.st_mtime_ns
+
+    def _get_key(self, voff, lim, kpath):
+        # returns the value of the key field at kpath within the content of a
+        # record, between offsets voff and lim, or None if not found
+        S = self._scan
+        for kcl, ktval in kpath:
+            while True:
+                if voff >= lim:
+                    return None
+                cl, pc, tval, lval, off = S.read_tl(voff, lim)
+                if lval == 0 and (cl, pc, tval) == (0, 0, 0):
+                    # EOC marker
+                    return None
+                if lval < 0:
+                    end = S._end_undef(off, lim)
+                    vend = end - 2
+                else:
+                    end = vend = off + lval
+                if cl == kcl and tval == ktval:
+                    break
+                voff = end
+            voff, lim = off, vend
+        return bytes(S.buf[voff:lim])
+
+    def build(self):
+        """
+        scans the whole file and indexes all its top-level records
+
+        raises ASN1BERDecodeErr on invalid encoding
+        """
+        self._init_arr()
+        S, T0 = self._scan, time()
+        read_tl, off, end = S.read_tl, S.off, S.end
+        off_app, len_app, cl_app, tag_app = \
+            self.off.append, self.len.append, self.cl.append, self.tag.append
+        keys, kval, num = list(self.keys.items()), self.kval, 0
+        while off < end:
+            cl, pc, tval, lval, voff = read_tl(off, end)
+            if lval == 0 and (cl, pc, tval) == (0, 0, 0):
+                # EOC marker at top-level, e.g. zero-padding
+                off = voff
+                continue
+            if lval < 0:
+                rend = S._end_undef(voff, end)
+                vend = rend - 2
+            else:
+                rend = vend = voff + lval
+                if rend > end:
+                    raise(ASN1BERDecodeErr('value overflow at offset %i' % voff))
+            off_app(off)
+            len_app(rend - off)
+            cl_app(cl)
+            tag_app(tval)
+            if pc:
+                for name, kpath in keys:
+                    val = self._get_key(voff, vend, kpath)
+                    if val is not None:
+                        if val in kval[name]:
+                            kval[name][val].append(num)
+                        else:
+                            kval[name][val] = array(self.TC_NUM, (num, ))
+            off, num = rend, num + 1
+        self.dur = time() - T0
+
+    def _get_hdr(self):
+        size, mtime = self._get_file_info()
+        return {'version'  : INDEX_VERSION,
+                'size'     : size,
+                'mtime'    : mtime,
+                'keys'     : {name: [list(k) for k in kpath] for name, kpath in self.keys.items()},
+                'byteorder': sys.byteorder,
+                'itemsize' : [array(tc).itemsize for tc in (self.TC_OFF, self.TC_LEN,
+                              self.TC_CL, self.TC_TAG, self.TC_NUM)]}
+
+    def save(self):
+        """
+        saves the index into the index file
+        """
+        hdr = self._get_hdr()
+        names = sorted(self.kval)
+        hdr['num']  = len(self.off)
+        hdr['kval'] = [[name, len(self.kval[name])] for name in names]
+        # write into a tmp file first, so that concurrent processes never
+        # read an incomplete index
+        path_tmp = '%s.%i.tmp' % (self.path_idx, os.getpid())
+        try:
+            with open(path_tmp, 'wb') as fd:
+                fd.write(INDEX_MAGIC)
+                fd.write(json.dumps(hdr).encode() + b'\n')
+                for arr in (self.off, self.len, self.cl, self.tag):
+                    arr.tofile(fd)
+                for name in names:
+                    vals = list(self.kval[name].items())
+                    array(self.TC_LEN, [len(v) for v, nums in vals]).tofile(fd)
+                    array(self.TC_LEN, [len(nums) for v, nums in vals]).tofile(fd)
+                    for v, nums in vals:
+                        nums.tofile(fd)
+                    fd.write(b''.join([v for v, nums in vals]))
+            os.replace(path_tmp, self.path_idx)
+        finally:
+            # the tmp file only remains here if its writing failed
+            if os.path.exists(path_tmp):
+                os.remove(path_tmp)
+
+    def _read_arr(self, fd, tc, num, swap):
+        arr = array(tc)
+        arr.fromfile(fd, num)
+        if swap:
+            arr.byteswap()
+        return arr
+
+    def load(self):
+        """
+        loads the index from the index file
+
+        returns True if the index is loaded, False if it does not exist, is
+        invalid, or does not correspond to the current file or key fields
+        """
+        if not os.path.exists(self.path_idx):
+            return False
+        hdr_cur = self._get_hdr()
+        with open(self.path_idx, 'rb') as fd:
+            magic = fd.readline()
+            try:
+                hdr = json.loads(fd.readline().decode())
+            except Exception:
+                hdr = None
+            if magic != INDEX_MAGIC or not isinstance(hdr, dict):
+                logger.info('BERIndex.load: invalid index {0}'.format(self.path_idx))
+                return False
+            if any([hdr.get(k) != hdr_cur[k] for k in hdr_cur if k != 'byteorder']):
+                logger.info('BERIndex.load: outdated index {0}'.format(self.path_idx))
+                return False
+            try:
+                swap, num = hdr['byteorder'] != sys.byteorder, hdr['num']
+                off, ln, cl, tag = [self._read_arr(fd, tc, num, swap) for tc in \
+                                      (self.TC_OFF, self.TC_LEN, self.TC_CL, self.TC_TAG)]
+                kval = {}
+                for name, nval in hdr['kval']:
+                    vlen  = self._read_arr(fd, self.TC_LEN, nval, swap)
+                    vnum  = self._read_arr(fd, self.TC_LEN, nval, swap)
+                    nums  = [self._read_arr(fd, self.TC_NUM, n, swap) for n in vnum]
+                    vbuf  = fd.read(sum(vlen))
+                    if len(vbuf) != sum(vlen):
+                        raise(EOFError())
+                    kval[name], voff = {}, 0
+                    for l, n in zip(vlen, nums):
+                        kval[name][vbuf[voff:voff+l]] = n
+                        voff += l
+                if fd.read(1) or set(kval) != set(self.keys):
+                    raise(ValueError())
+            except Exception:
+                logger.info('BERIndex.load: invalid index {0}'.format(self.path_idx))
+                return False
+        self.off, self.len, self.cl, self.tag, self.kval = off, ln, cl, tag, kval
+        return True
+
+    def open(self):
+        """
+        loads the index from the index file if it is up-to-date, or builds it
+        and saves it otherwise
+        """
+        if not self.load():
+            self.build()
+            self.save()
+
+    def throughput(self):
+        """
+        returns the indexing throughput of the last call to build(), as a
+        2-tuple (records per second, bytes per second)
+        """
+        if not self.dur:
+            return (0.0, 0.0)
+        return (len(self.off) / self.dur, self._scan.end / self.dur)
+
+    def get_buf(self, num):
+        """
+        returns a memoryview over the record number num
+        """
+        off = self.off[num]
+        return memoryview(self._scan.buf)[off:off+self.len[num]]
+
+    def find(self, name, val):
+        """
+        returns the list of records' number with the value val (bytes) for the
+        key field name
+        """
+        if name not in self.kval:
+            raise(ASN1Err('undefined key field {0}'.format(name)))
+        return list(self.kval[name].get(val, ()))
+
+    def find_tag(self, cl, tval):
+        """
+        returns the list of records' number with the given tag class and value
+        """
+        return [num for num, (c, t) in enumerate(zip(self.cl, self.tag)) \
+                if c == cl and t == tval]
+
+    def decode(self, Obj, num):
+        """
+        decodes the record number num with the ASN.1 object Obj, and returns
+        the decoded value
+        """
+        Obj.from_ber(bytes(self.get_buf(num)))
+        return Obj()
+
+    def decode_many(self, Obj, nums, errors='raise'):
+        """
+        decodes the records whose number are in the iterable nums with the ASN.1
+        object Obj, and yields the decoded values, in order (see
+        ASN1Obj.decode_many() for errors)
+        """
+        return Obj.decode_many((bytes(self.get_buf(num)) for num in nums), 'ber',
+                               errors=errors)
+
+    def decode_match(self, Obj, name, val, errors='raise'):
+        """
+        decodes the records with the value val (bytes) for the key field name
+        with the ASN.1 object Obj, and yields the decoded values, in order
+        """
+        return self.decode_many(Obj, self.find(name, val), errors)
@@ -27,6 +27,8 @@
 # *--------------------------------------------------------
 #*/
 
+from threading import local
+
 from .utils import *
 from .err   import *
 
@@ -44,9 +46,48 @@ class ASN1CodecASN(ASN1Codec):
     pass
 
 
-class ASN1CodecPER(ASN1Codec):
+class _ASN1CodecPERCtx(local):
+    """
+    PER codec state, specific to each thread
+    """
+    
+    def __init__(self):
+        # True: aligned PER (APER), False: unaligned PER (UPER)
+        self.ALIGNED = False
+        # stack of offsets in bits, only used with APER
+        self._off    = []
+
+
+class _ASN1CodecPERType(type):
+    """
+    metaclass for ASN1CodecPER
+    
+    ALIGNED and _off are stored in the thread-local context _ctx, so that several
+    threads can run the PER codec concurrently
+    """
+    
+    @property
+    def ALIGNED(cla):
+        return cla._ctx.ALIGNED
+    
+    @ALIGNED.setter
+    def ALIGNED(cla, aligned):
+        cla._ctx.ALIGNED = aligned
+    
+    @property
+    def _off(cla):
+        return cla._ctx._off
+    
+    @_off.setter
+    def _off(cla, off):
+        cla._ctx._off = off
+
+
+class ASN1CodecPER(ASN1Codec, metaclass=_ASN1CodecPERType):
     
-    ALIGNED = False # True: aligned PER (APER), False: unaligned PER (UPER)
+    # ALIGNED (True: APER, False: UPER) and _off (stack of offsets in bits, only
+    # used with APER) are thread-local, see _ASN1CodecPERType
+    _ctx = _ASN1CodecPERCtx()
     
     # canonicity is used to decide wether to encode default values or not in 
     # constructed object
@@ -58,8 +99,6 @@ class ASN1CodecPER(ASN1Codec):
     # maximum length (or number of objects) allowed when decoding a fragmented stream
     DEC_MAXL = 1 * 1024 * 1024 # 1M
     
-    _off = [] # stack of offsets in bits, only used with APER
-    
     _CntUndef_LUT = {1:16384, 2:32768, 3:49152, 4:65536,
                      16384:1, 32768:2, 49152:3, 65536:4}
     
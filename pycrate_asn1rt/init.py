@@ -67,52 +67,91 @@ def init_modules(*args, **kwargs):
         for objname in Mod._obj_:
             GLOB.MOD[Mod._name_][objname] = getattr(Mod, name_to_defin(objname))
     #
-    # set special attributes for some objects
+    # lists all objects defined
+    Objs = []
     for Mod in args:
         for Obj in Mod._all_:
-            #
             # useful for debugging...
             Obj._mod = Mod._name_
+            Objs.append(Obj)
+    #
+    init_objects(Objs, GLOB)
+
+
+def init_objects(Objs, GLOB=GLOBAL):
+    """
+    Initializes the given list of ASN.1 objects, whose module has already been 
+    registered in GLOB.MOD (see init_modules for the list of processing done)
+    
+    This is used by init_modules over all objects of the given modules, and
+    by the lazy loader over the objects materialized on demand
+    """
+    # set special attributes for some objects
+    for Obj in Objs:
+        #
+        # setting additional attributes
+        if Obj.TYPE == TYPE_INT:
+            if Obj._cont is not None:
+                Obj._cont_rev = {Obj._cont[name]: name for name in Obj._cont}
+            if Obj._const_val:
+                Obj._const_val._set_root_bnd()
+        #
+        elif Obj.TYPE in TYPES_CONST_SZ:
+            if Obj._const_sz:
+                Obj._const_sz._set_root_bnd()
             #
-            # setting additional attributes
-            if Obj.TYPE == TYPE_INT:
-                if Obj._cont is not None:
+            if Obj.TYPE == TYPE_BIT_STR:
+                if Obj._cont:
                     Obj._cont_rev = {Obj._cont[name]: name for name in Obj._cont}
-                if Obj._const_val:
-                    Obj._const_val._set_root_bnd()
             #
-            elif Obj.TYPE in TYPES_CONST_SZ:
-                if Obj._const_sz:
-                    Obj._const_sz._set_root_bnd()
-                #
-                if Obj.TYPE == TYPE_BIT_STR:
-                    if Obj._cont:
-                        Obj._cont_rev = {Obj._cont[name]: name for name in Obj._cont}
-                #
-                if Obj.TYPE in TYPES_STRING and Obj._const_alpha:
-                    Obj._const_alpha._set_root_bnd()
-                #
-                elif Obj.TYPE in (TYPE_BIT_STR, TYPE_OCT_STR) and Obj._const_cont is not None:
-                    # set _const_cont_enc if not defined
-                    if not hasattr(Obj, '_const_cont_enc'):
-                        Obj._const_cont_enc = None
-                #
-                elif Obj.TYPE in (TYPE_SEQ_OF, TYPE_SET_OF) and Obj._cont is not None:
-                    # set _parent for the component
-                    Obj._cont._parent = Obj
+            if Obj.TYPE in TYPES_STRING and Obj._const_alpha:
+                Obj._const_alpha._set_root_bnd()
             #
-            elif Obj.TYPE == TYPE_ENUM and Obj._cont is not None:
-                # set _root
-                if not Obj._ext:
-                    Obj._root = list(Obj._cont.keys())
-                else:
-                    Obj._root = []
-                    for name in Obj._cont:
-                        if name not in Obj._ext:
-                            Obj._root.append(name)
-                # set _cont_rev
-                Obj._cont_rev  = {Obj._cont[name]: name for name in Obj._cont}
-                # set _const_ind
+            elif Obj.TYPE in (TYPE_BIT_STR, TYPE_OCT_STR) and Obj._const_cont is not None:
+                # set _const_cont_enc if not defined
+                if not hasattr(Obj, '_const_cont_enc'):
+                    Obj._const_cont_enc = None
+            #
+            elif Obj.TYPE in (TYPE_SEQ_OF, TYPE_SET_OF) and Obj._cont is not None:
+                # set _parent for the component
+                Obj._cont._parent = Obj
+        #
+        elif Obj.TYPE == TYPE_ENUM and Obj._cont is not None:
+            # set _root
+            if not Obj._ext:
+                Obj._root = list(Obj._cont.keys())
+            else:
+                Obj._root = []
+                for name in Obj._cont:
+                    if name not in Obj._ext:
+                        Obj._root.append(name)
+            # set _cont_rev
+            Obj._cont_rev  = {Obj._cont[name]: name for name in Obj._cont}
+            # set _const_ind
+            if Obj._ext is None:
+                Obj._const_ind = ASN1Set(rr=[ASN1RangeInt(0, len(Obj._root)-1)])
+            elif not Obj._ext:
+                Obj._const_ind = ASN1Set(rr=[ASN1RangeInt(0, len(Obj._root)-1)], ev=[])
+            else:
+                Obj._const_ind = ASN1Set(rr=[ASN1RangeInt(0, len(Obj._root)-1)], ev=[],
+                                         er=[ASN1RangeInt(0, len(Obj._ext)-1)])
+            Obj._const_ind._set_root_bnd()
+        #
+        elif Obj.TYPE in (TYPE_CHOICE, TYPE_SEQ, TYPE_SET, TYPE_CLASS) and Obj._cont is not None:
+            # set _parent for each component
+            for Comp in Obj._cont.values():
+                Comp._parent = Obj
+            #
+            if Obj.TYPE == TYPE_CHOICE:
+                # set _root, _const_ind
+                Obj._root, ext = [], []
+                if Obj._ext is not None:
+                    ext = Obj._ext
+                for name in Obj._cont:
+                    if name in ext:
+                        break
+                    else:
+                        Obj._root.append(name)
                 if Obj._ext is None:
                     Obj._const_ind = ASN1Set(rr=[ASN1RangeInt(0, len(Obj._root)-1)])
                 elif not Obj._ext:
@@ -121,106 +160,81 @@ def init_modules(*args, **kwargs):
                     Obj._const_ind = ASN1Set(rr=[ASN1RangeInt(0, len(Obj._root)-1)], ev=[],
                                              er=[ASN1RangeInt(0, len(Obj._ext)-1)])
                 Obj._const_ind._set_root_bnd()
+            else:
+                # set _root, _root_mand, _root_opt
+                Obj._root, Obj._root_mand, Obj._root_opt, ext = [], [], [], []
+                if Obj._ext is not None:
+                    ext = Obj._ext
+                for name, Comp in Obj._cont.items():
+                    if name in ext:
+                        break
+                    if Comp._opt or Comp._def is not None:
+                        Obj._root_opt.append(name)
+                    else:
+                        Obj._root_mand.append(name)
+                    Obj._root.append(name)
             #
-            elif Obj.TYPE in (TYPE_CHOICE, TYPE_SEQ, TYPE_SET, TYPE_CLASS) and Obj._cont is not None:
-                # set _parent for each component
-                for Comp in Obj._cont.values():
-                    Comp._parent = Obj
-                #
-                if Obj.TYPE == TYPE_CHOICE:
-                    # set _root, _const_ind
-                    Obj._root, ext = [], []
-                    if Obj._ext is not None:
-                        ext = Obj._ext
-                    for name in Obj._cont:
-                        if name in ext:
-                            break
+            if Obj.TYPE != TYPE_CLASS:
+                # set _ext_ident, _ext_group
+                if Obj._ext is not None:
+                    Obj._ext_ident, Obj._ext_group = {}, {}
+                    for name in Obj._ext:
+                        Comp = Obj._cont[name]
+                        if Comp._group is not None:
+                            Obj._ext_ident[name] = Comp._group
+                            if Comp._group not in Obj._ext_group:
+                                Obj._ext_group[Comp._group] = []
+                            Obj._ext_group[Comp._group].append(name)
+            #
+            if Obj.TYPE in (TYPE_SEQ, TYPE_SET) and Obj._ext is not None:
+                # set _ext_nest and _ext_group_obj
+                Obj._ext_nest, Obj._ext_group_obj = [], {}
+                for ident in Obj._ext:
+                    if ident in Obj._ext_ident:
+                        # ident is in a group
+                        g_idents = Obj._ext_group[Obj._ext_ident[ident]]
+                        if g_idents.index(ident) == 0:
+                            # 1st component of the group
+                            Obj._ext_nest.append( [ident] )
                         else:
-                            Obj._root.append(name)
-                    if Obj._ext is None:
-                        Obj._const_ind = ASN1Set(rr=[ASN1RangeInt(0, len(Obj._root)-1)])
-                    elif not Obj._ext:
-                        Obj._const_ind = ASN1Set(rr=[ASN1RangeInt(0, len(Obj._root)-1)], ev=[])
+                            Obj._ext_nest[-1].append(ident)
                     else:
-                        Obj._const_ind = ASN1Set(rr=[ASN1RangeInt(0, len(Obj._root)-1)], ev=[],
-                                                 er=[ASN1RangeInt(0, len(Obj._ext)-1)])
-                    Obj._const_ind._set_root_bnd()
-                else:
-                    # set _root, _root_mand, _root_opt
-                    Obj._root, Obj._root_mand, Obj._root_opt, ext = [], [], [], []
-                    if Obj._ext is not None:
-                        ext = Obj._ext
-                    for name, Comp in Obj._cont.items():
-                        if name in ext:
-                            break
-                        if Comp._opt or Comp._def is not None:
-                            Obj._root_opt.append(name)
-                        else:
-                            Obj._root_mand.append(name)
-                        Obj._root.append(name)
+                        Obj._ext_nest.append(ident)
                 #
-                if Obj.TYPE != TYPE_CLASS:
-                    # set _ext_ident, _ext_group
-                    if Obj._ext is not None:
-                        Obj._ext_ident, Obj._ext_group = {}, {}
-                        for name in Obj._ext:
-                            Comp = Obj._cont[name]
-                            if Comp._group is not None:
-                                Obj._ext_ident[name] = Comp._group
-                                if Comp._group not in Obj._ext_group:
-                                    Obj._ext_group[Comp._group] = []
-                                Obj._ext_group[Comp._group].append(name)
-                #
-                if Obj.TYPE in (TYPE_SEQ, TYPE_SET) and Obj._ext is not None:
-                    # set _ext_nest and _ext_group_obj
-                    Obj._ext_nest, Obj._ext_group_obj = [], {}
-                    for ident in Obj._ext:
-                        if ident in Obj._ext_ident:
-                            # ident is in a group
-                            g_idents = Obj._ext_group[Obj._ext_ident[ident]]
-                            if g_idents.index(ident) == 0:
-                                # 1st component of the group
-                                Obj._ext_nest.append( [ident] )
-                            else:
-                                Obj._ext_nest[-1].append(ident)
-                        else:
-                            Obj._ext_nest.append(ident)
-                    #
-                    for gid, idents in Obj._ext_group.items():
-                        GSeq = Obj.__class__(name='%s_ext_%d' % (Obj._name, gid),
-                                             mode=MODE_TYPE)
-                        GSeq._cont = ASN1Dict([(i, Obj._cont[i]) for i in idents])
-                        GSeq._parent = Obj
-                        GSeq._root = idents
-                        GSeq._ext  = None
-                        GSeq._root_mand = [i for i in idents if Obj._cont[i]._opt is False and \
-                                                                Obj._cont[i]._def is None]
-                        GSeq._root_opt  = [i for i in idents if i not in GSeq._root_mand]
-                        # add a specific attribute
-                        GSeq._gext = True
-                        Obj._ext_group_obj[gid] = GSeq
-            #
-            elif Obj.TYPE == TYPE_OID and Obj._mode == MODE_VALUE:
-                if Obj._val in GLOB.OID and GLOB.OID[Obj._val] != Obj._name:
-                    logger.info('init_modules: different OID objects (%s, %s) with same OID value %r' % (
-                                 Obj._name, GLOB.OID[Obj._val], Obj._val))
-                elif Obj._val is not None:
-                    GLOB.OID[Obj._val] = Obj._name
-            #
-            elif Obj.TYPE == TYPE_CLASS and Obj._mode == MODE_SET and Obj._val:
-                # this should not conflict with the previous check on TYPE_CLASS
-                # which must have self._cont defined (hence being MODE_TYPE)
-                build_classset_dict(Obj)
-                
+                for gid, idents in Obj._ext_group.items():
+                    GSeq = Obj.__class__(name='%s_ext_%d' % (Obj._name, gid),
+                                         mode=MODE_TYPE)
+                    GSeq._cont = ASN1Dict([(i, Obj._cont[i]) for i in idents])
+                    GSeq._parent = Obj
+                    GSeq._root = idents
+                    GSeq._ext  = None
+                    GSeq._root_mand = [i for i in idents if Obj._cont[i]._opt is False and \
+                                                            Obj._cont[i]._def is None]
+                    GSeq._root_opt  = [i for i in idents if i not in GSeq._root_mand]
+                    # add a specific attribute
+                    GSeq._gext = True
+                    Obj._ext_group_obj[gid] = GSeq
+        #
+        elif Obj.TYPE == TYPE_OID and Obj._mode == MODE_VALUE:
+            if Obj._val in GLOB.OID and GLOB.OID[Obj._val] != Obj._name:
+                logger.info('init_modules: different OID objects (%s, %s) with same OID value %r' % (
+                             Obj._name, GLOB.OID[Obj._val], Obj._val))
+            elif Obj._val is not None:
+                GLOB.OID[Obj._val] = Obj._name
+        #
+        elif Obj.TYPE == TYPE_CLASS and Obj._mode == MODE_SET and Obj._val:
+            # this should not conflict with the previous check on TYPE_CLASS
+            # which must have self._cont defined (hence being MODE_TYPE)
+            build_classset_dict(Obj, GLOB)
+            
     #
-    # lists all objects defined
-    Objs = [Obj for Mod in args for Obj in Mod._all_]
     # lists all objects which inherits in some way from another one
     TRObjs = [Obj for Obj in Objs if Obj._typeref is not None]
     #
     while TRObjs:
-        logger.debug('remaining objects: {0!r}'.format(len(Objs)))
-        for Obj in TRObjs:
+        logger.debug('remaining objects: {0!r}'.format(len(TRObjs)))
+        rem = len(TRObjs)
+        for Obj in TRObjs[:]:
             try:
                 # resolve cross-reference
                 Obj._tr = get_typeref(Obj, GLOB)
@@ -231,6 +245,9 @@ def init_modules(*args, **kwargs):
                 # objects (ASN1RefClassField, ASN1RefChoiceComp, ...)
                 bind_all_attrs(Obj)
                 TRObjs.remove(Obj)
+        if len(TRObjs) == rem:
+            raise(ASN1Err('unable to resolve type references for objects: {0}'.format(
+                  ', '.join(['%s.%s' % (Obj._mod, Obj._name) for Obj in TRObjs]))))
     #
     # When all typeref are resolved, we can set the tag chain and bind attributes 
     # for all objects
@@ -502,11 +519,11 @@ def bind_all_attrs(Obj):
         bind_attrs(Obj, '_ext')
 
 
-def build_classset_dict(Obj):
+def build_classset_dict(Obj, GLOB=GLOBAL):
     key = None
-    tr = get_typeref(Obj)
+    tr = get_typeref(Obj, GLOB)
     while not tr._cont:
-        tr = get_typeref(tr)
+        tr = get_typeref(tr, GLOB)
         if tr is None:
             break
     if tr._cont is None:
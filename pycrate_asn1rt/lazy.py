@@ -0,0 +1,343 @@
+# -*- coding: UTF-8 -*-
+#/**
+# * Software Name : pycrate
+# * Version : 0.4
+# *
+# * This library is free software; you can redistribute it and/or
+# * modify it under the terms of the GNU Lesser General Public
+# * License as published by the Free Software Foundation; either
+# * version 2.1 of the License, or (at your option) any later version.
+# *
+# * This library is distributed in the hope that it will be useful,
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# * Lesser General Public License for more details.
+# *
+# * You should have received a copy of the GNU Lesser General Public
+# * License along with this library; if not, write to the Free Software
+# * Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# * MA 02110-1301  USA
+# *
+# *--------------------------------------------------------
+# * File Name : pycrate_asn1rt/lazy.py
+# *--------------------------------------------------------
+#*/
+
+import re
+import sys
+import json
+import os.path
+from importlib.util import find_spec
+from textwrap       import dedent
+from threading      import RLock
+from types          import ModuleType
+
+from .utils   import *
+from .err     import ASN1Err
+from .glob    import GLOBAL
+from .dictobj import ASN1Dict
+from .init    import init_objects
+
+
+#------------------------------------------------------------------------------#
+# lazy loading of generated ASN.1 modules
+#------------------------------------------------------------------------------#
+# A Python module generated by pycrate_asn1c (e.g. pycrate_asn1dir.S1AP) builds
+# all its ASN.1 objects and initializes them all at import time.
+#
+# Here, the Python source of the generated module is only split into 1 chunk of
+# code per ASN.1 object (following the "#-----< name >-----#" markers emitted by
+# the generator), and each ASN.1 module is registered into GLOBAL.MOD with stubs.
+# An ASN.1 object is only built and initialized at its first access, together
+# with all the objects it depends on, according to the JSON dependency graph
+# generated by JSONDepGraphGenerator alongside the Python module.
+
+_RE_CLASS = re.compile(r'^class (\w+):\n', re.M)
+_RE_CHUNK = re.compile(r'^    #-----< (.+?) >-----#\n', re.M)
+_RE_DEFIN = re.compile(r'^    (\w+) = ', re.M)
+
+
+class ASN1LazyModDict(ASN1Dict):
+    """
+    ASN1Dict registered into GLOBAL.MOD for a lazily loaded ASN.1 module
+
+    ASN.1 objects not yet built are materialized when accessed
+    """
+
+    def __init__(self, loader, mod):
+        ASN1Dict.__init__(self)
+        self._loader = loader
+        self._mod    = mod
+
+    def __getitem__(self, key):
+        try:
+            return self._dict[key]
+        except KeyError:
+            if key in self._index:
+                self._loader.load(self._mod._name_, key)
+                return self._dict[key]
+            else:
+                raise(KeyError(key))
+
+    def __contains__(self, item):
+        return item in self._dict or item in self._index
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self):
+        return [(k, self[k]) for k in self._index].__iter__()
+
+    def values(self):
+        return [self[k] for k in self._index].__iter__()
+
+
+class ASN1LazyModule(object):
+    """
+    stub for a Python class generated for an ASN.1 module
+
+    ASN.1 objects not yet built are materialized when accessed as attributes,
+    and _all_ only lists the objects already materialized
+    """
+
+    def __init__(self, loader, name, ns):
+        self._loader_ = loader
+        self.__name__ = name
+        for attr in ('_name_', '_oid_', '_obj_', '_type_', '_set_', '_val_',
+                     '_class_', '_param_'):
+            if attr in ns:
+                setattr(self, attr, ns[attr])
+        self._all_ = []
+
+    def __repr__(self):
+        return '<%s (lazy)>' % self.__name__
+
+    def __getattr__(self, attr):
+        # only called when attr is not yet set
+        if attr[:1] != '_' or attr[-1:] != '_':
+            val = self._loader_.load_defin(self._name_, attr)
+            if val is not None:
+                return val
+        raise(AttributeError(attr))
+
+
+class ASN1LazyLoader(object):
+    """
+    lazy loader for a Python module generated by pycrate_asn1c
+
+    init args:
+        path: path to the generated Python module
+        path_dep: path to the JSON dependency graph for it,
+            default is the same path with a .json extension
+        GLOBAL: a specific GLOBAL dict, default is the generic GLOBAL
+    """
+
+    def __init__(self, path, path_dep=None, GLOBAL=GLOBAL):
+        if path_dep is None:
+            path_dep = os.path.splitext(path)[0] + '.json'
+        if not os.path.exists(path_dep):
+            raise(ASN1Err('no JSON dependency graph found for {0}'.format(path)))
+        self.GLOB = GLOBAL
+        self._path_dep = path_dep
+        self._lock = RLock()
+        #
+        with open(path) as fd:
+            src = fd.read()
+        classes = list(_RE_CLASS.finditer(src))
+        if not classes:
+            raise(ASN1Err('no ASN.1 module found in {0}'.format(path)))
+        # global namespace for all chunks, with the runtime imports
+        self._glob = {'__name__': 'pycrate_asn1rt.lazy'}
+        exec(src[:classes[0].start()], self._glob)
+        #
+        # for each ASN.1 module:
+        # the module stub, its class namespace, its body, its code chunks and
+        # the Python names they define, the ordering of its objects
+        self.Mod, self._ns, self._body, self._chk, self._def, self._all = \
+            {}, {}, {}, {}, {}, {}
+        # dependency graph: {(mod, objname): [(mod, objname), ...]}
+        self._dep = None
+        # list of ASN.1 objects already built
+        self._done = set()
+        for i, m in enumerate(classes):
+            if i+1 < len(classes):
+                body = src[m.end():classes[i+1].start()]
+            else:
+                body = src[m.end():src.index('\ninit_modules(', m.end())]
+            self._init_class(i, m.group(1), body)
+
+    def _init_class(self, ind, clsname, body):
+        # module header, with the lists of ASN.1 objects
+        off = body.find('\n    #-----< ')
+        if off < 0:
+            off = body.find('\n    _all_ = [\n')
+        ns = {}
+        exec(dedent(body[:off+1]), self._glob, ns)
+        mod = ns['_name_']
+        Mod = ASN1LazyModule(self, clsname, ns)
+        self.Mod[mod], self._ns[mod], self._body[mod] = Mod, ns, (ind, body)
+        #
+        # register the ASN.1 module with its stubs
+        ModDict = ASN1LazyModDict(self, Mod)
+        ModDict['_oid_'] = Mod._oid_
+        ModDict['_obj_'] = Mod._obj_
+        if clsname[:1] != '_':
+            # do not process special modules _IMPL_ and _USER_
+            for attr in ('_type_', '_set_', '_val_', '_class_', '_param_'):
+                ModDict[attr] = getattr(Mod, attr)
+        ModDict._index.extend(Mod._obj_)
+        self.GLOB.MOD[mod] = ModDict
+
+    def _split_class(self, mod):
+        # split the body of the class for module mod into chunks of code
+        ind, body = self._body.pop(mod)
+        end = body.find('\n    _all_ = [\n')
+        if end < 0:
+            raise(ASN1Err('invalid generated class for module {0}'.format(mod)))
+        chunks = list(_RE_CHUNK.finditer(body, 0, end+1))
+        #
+        # code chunks: {objname: (ind, chunk index, source, Python names defined)}
+        # Python names defined: {defin: objname}
+        self._chk[mod], self._def[mod] = chk, defs = {}, {}
+        for j, c in enumerate(chunks):
+            if j+1 < len(chunks):
+                code = body[c.end():chunks[j+1].start()]
+            else:
+                code = body[c.end():end+1]
+            defins = _RE_DEFIN.findall(code)
+            chk[c.group(1)] = (ind, j, code, defins)
+            for d in defins:
+                if d not in defs:
+                    defs[d] = c.group(1)
+        #
+        # ordering of all ASN.1 objects (top-level and inner ones)
+        self._all[mod] = {name: i for i, name in enumerate(
+            [l.strip().rstrip(',') for l in body[end+14:].splitlines()[:-1] if l.strip()])}
+
+    def _load_dep(self):
+        with open(self._path_dep) as fd:
+            graph = json.load(fd)
+        self._dep = {}
+        for link in graph['links']:
+            key = tuple(link['source'].split('.', 1))
+            if key in self._dep:
+                self._dep[key].append( tuple(link['target'].split('.', 1)) )
+            else:
+                self._dep[key] = [ tuple(link['target'].split('.', 1)) ]
+
+    def _get_chk(self, mod):
+        if mod not in self._chk:
+            if mod not in self._body:
+                return None
+            self._split_class(mod)
+        return self._chk[mod]
+
+    def load_defin(self, mod, defin):
+        """
+        materializes the ASN.1 object defining the Python name `defin' within
+        module `mod' and returns the corresponding Python object,
+        or None if `defin' is not defined within `mod'
+        """
+        with self._lock:
+            if self._get_chk(mod) is None or defin not in self._def[mod]:
+                return None
+            self.load(mod, self._def[mod][defin])
+            return self._ns[mod][defin]
+
+    def load(self, mod, objname):
+        """
+        materializes the ASN.1 object `objname' within module `mod', together
+        with all the objects it depends on
+        """
+        with self._lock:
+            if (mod, objname) in self._done:
+                return
+            if self._dep is None:
+                self._load_dep()
+            # collect all objects to be built
+            todo, stack, codes = set(), [(mod, objname)], {}
+            while stack:
+                key = stack.pop()
+                if key in self._done or key in todo:
+                    continue
+                chk = self._get_chk(key[0])
+                if chk is None or key[1] not in chk:
+                    raise(ASN1Err('unable to load object {0}.{1}'.format(*key)))
+                todo.add(key)
+                stack.extend(self._dep.get(key, []))
+                # some generated objects reuse inner objects defined within
+                # another ASN.1 object of the same module
+                code = compile(dedent(chk[key[1]][2]), '<%s.%s>' % key, 'exec')
+                codes[key] = code
+                defs = self._def[key[0]]
+                for name in code.co_names:
+                    if name in defs and defs[name] != key[1]:
+                        stack.append( (key[0], defs[name]) )
+            #
+            # build all objects in the order of the generated module
+            order = sorted(todo, key=lambda k: self._chk[k[0]][k[1]][:2])
+            Objs = []
+            for key in order:
+                ns, Mod, defins = self._ns[key[0]], self.Mod[key[0]], \
+                                  self._chk[key[0]][key[1]][3]
+                exec(codes[key], self._glob, ns)
+                self.GLOB.MOD[key[0]]._dict[key[1]] = ns[name_to_defin(key[1])]
+                self._done.add(key)
+                for name in defins:
+                    setattr(Mod, name, ns[name])
+                allind = self._all[key[0]]
+                for name in sorted([d for d in set(defins) if d in allind],
+                                   key=allind.__getitem__):
+                    Obj = ns[name]
+                    Obj._mod = key[0]
+                    Mod._all_.append(Obj)
+                    Objs.append(Obj)
+            #
+            init_objects(Objs, self.GLOB)
+
+
+def import_lazy(name, **kwargs):
+    """
+    returns a Python module object for the pycrate_asn1c-generated module `name'
+    (e.g. 'pycrate_asn1dir.S1AP') where all ASN.1 objects are only built and
+    initialized on first access, through the GLOBAL.MOD dict or as attributes of
+    the ASN.1 module classes
+
+    kwargs are passed to ASN1LazyLoader
+
+    This requires the JSON dependency graph generated for the Python module
+    (e.g. pycrate_asn1dir/S1AP.json)
+
+    With the generic GLOBAL, the module object is registered into sys.modules,
+    hence any later import of `name' returns it instead of executing the whole
+    generated module; an already imported module `name' is replaced by it, as
+    are its ASN.1 modules in GLOBAL.MOD. Calling import_lazy() again returns
+    the same module object, as long as its ASN.1 modules are still registered.
+    """
+    GLOB = kwargs.get('GLOBAL', GLOBAL)
+    if GLOB is GLOBAL:
+        pymod = sys.modules.get(name)
+        Loader = getattr(pymod, '_loader_', None)
+        if isinstance(Loader, ASN1LazyLoader) and Loader.GLOB is GLOB \
+        and all([mod in GLOB.MOD and getattr(GLOB.MOD[mod], '_loader', None) is Loader \
+                 for mod in Loader.Mod]):
+            return pymod
+    spec = find_spec(name)
+    if spec is None or not spec.origin:
+        raise(ASN1Err('module {0} not found'.format(name)))
+    Loader = ASN1LazyLoader(spec.origin, **kwargs)
+    pymod = ModuleType(name)
+    pymod.__file__ = spec.origin
+    pymod._loader_ = Loader
+    for Mod in Loader.Mod.values():
+        setattr(pymod, Mod.__name__, Mod)
+    if GLOB is GLOBAL:
+        sys.modules[name] = pymod
+        if '.' in name:
+            pkg, attr = name.rsplit('.', 1)
+            if pkg in sys.modules:
+                setattr(sys.modules[pkg], attr, pymod)
+    return pymod
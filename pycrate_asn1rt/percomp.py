@@ -0,0 +1,562 @@
+# -*- coding: UTF-8 -*-
+#/**
+# * Software Name : pycrate
+# * Version : 0.4
+# *
+# * This library is free software; you can redistribute it and/or
+# * modify it under the terms of the GNU Lesser General Public
+# * License as published by the Free Software Foundation; either
+# * version 2.1 of the License, or (at your option) any later version.
+# *
+# * This library is distributed in the hope that it will be useful,
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# * Lesser General Public License for more details.
+# *
+# * You should have received a copy of the GNU Lesser General Public
+# * License along with this library; if not, write to the Free Software
+# * Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# * MA 02110-1301  USA
+# *
+# *--------------------------------------------------------
+# * File Name : pycrate_asn1rt/percomp.py
+# *--------------------------------------------------------
+#*/
+
+from .utils  import *
+from .err    import *
+from .codecs import ASN1CodecPER
+
+
+#------------------------------------------------------------------------------#
+# compiled PER codec
+#------------------------------------------------------------------------------#
+# Instead of walking the object graph for each message (like ASN1Obj._from_per()
+# and ASN1Obj._to_per() do), straight-line Python functions are generated for a
+# given initialized ASN.1 object and all of its content: constraints, optional
+# bitmaps, mandatory components and APER / UPER variants are resolved once at
+# compilation time.
+#
+# The following types are compiled:
+# - SEQUENCE, SET, CHOICE, SEQUENCE OF and SET OF (with a size constraint < 64K),
+# - NULL, BOOLEAN, INTEGER (constrained) and ENUMERATED, which are inlined.
+# All other types (strings, OPEN, CLASS, ...), and all extended values (e.g.
+# when the extension bit is set when decoding) are processed by calling the
+# interpreted _from_per() / _to_per() methods, so that the compiled codec stays
+# bit-exact with the interpreted one.
+#
+# The compiled codec is enabled per object, by setting its _PER_COMP attribute
+# to True (e.g. with compile_modules()); ASN1Obj.from_aper(), from_uper(),
+# to_aper() and to_uper() then dispatch to it, compiling it at first use.
+#
+# The generated encoders do not return lists of (type, val, bitlen) tuples, but
+# write the values into the BitWriter instance (see pycrate_core/utils.py) 
+# passed as argument, named GEN.
+
+_COMP_NODES = (TYPE_SEQ, TYPE_SET, TYPE_CHOICE, TYPE_SEQ_OF, TYPE_SET_OF)
+_COMP_LEAVES = (TYPE_NULL, TYPE_BOOL, TYPE_INT, TYPE_ENUM)
+
+
+def _indent(lines, n=4):
+    return [n*' ' + l for l in lines]
+
+
+class _PERCompiler(object):
+    """
+    generates the Python source code of the decoder and encoder functions for a
+    given ASN.1 object, for either the aligned or unaligned variant of PER
+    """
+
+    def __init__(self, ns, aligned):
+        # ns: namespace dict shared by the generated functions
+        self.ns      = ns
+        self.aligned = aligned
+        self.var     = 'a' if aligned else 'u'
+        self.src     = []
+        self.post    = []
+        self._dec    = {}
+        self._enc    = {}
+
+    #--------------------------------------------------------------------------#
+    # namespace handling
+    #--------------------------------------------------------------------------#
+
+    def bind(self, obj, pref='_c'):
+        name = '%s%i' % (pref, id(obj))
+        if name not in self.ns:
+            self.ns[name] = obj
+        return name
+
+    def bind_obj(self, Obj):
+        return self.bind(Obj, '_o')
+
+    def _head(self):
+        if self.aligned:
+            return ['_off = _PER._off']
+        else:
+            return []
+
+    def _off_add(self, n):
+        if self.aligned and n:
+            return ['_off[-1] += %i' % n]
+        else:
+            return []
+
+    @staticmethod
+    def _get_const(C):
+        # returns (ext, rdyn, lb, ub) for a PER-visible constraint
+        if not C:
+            return None, None, None, None
+        return C.ext, getattr(C, 'rdyn', None), getattr(C, 'lb', None), getattr(C, 'ub', None)
+
+    #--------------------------------------------------------------------------#
+    # constrained integer
+    #--------------------------------------------------------------------------#
+
+    def _dec_intconst(self, C, var):
+        # C.rdyn > 0
+        if C.lb:
+            off = ' + %i' % C.lb
+        else:
+            off = ''
+        if not self.aligned or C.ra <= 255:
+            return ['%s = char.get_uint(%i)%s' % (var, C.rdyn, off)] + self._off_add(C.rdyn)
+        elif C.ra <= 65536:
+            bl = 8 if C.ra == 256 else 16
+            return ['if _off[-1] % 8:',
+                    '    _PER.decode_pad(char)',
+                    '%s = char.get_uint(%i)%s' % (var, bl, off)] + self._off_add(bl)
+        else:
+            return ['%s = _PER.decode_intconst(char, %s)' % (var, self.bind(C))]
+
+    def _enc_intconst(self, C, expr):
+        # C.rdyn > 0
+        if C.lb:
+            off = ' - %i' % C.lb
+        else:
+            off = ''
+        if not self.aligned or C.ra <= 255:
+            return ['GEN.append((T_UINT, %s%s, %i))' % (expr, off, C.rdyn)] + self._off_add(C.rdyn)
+        elif C.ra <= 65536:
+            bl = 8 if C.ra == 256 else 16
+            return ['if _off[-1] % 8:',
+                    '    GEN.extend(_PER.encode_pad())',
+                    'GEN.append((T_UINT, %s%s, %i))' % (expr, off, bl)] + self._off_add(bl)
+        else:
+            return ['GEN.extend(_PER.encode_intconst(%s, %s))' % (expr, self.bind(C))]
+
+    #--------------------------------------------------------------------------#
+    # decoders
+    #--------------------------------------------------------------------------#
+
+    def _dec_fallback(self, o):
+        return ['%s._from_per(char)' % o]
+
+    def _dec_ext_fallback(self, o):
+        # when the extension bit is set, rewind it and use the interpreted decoder
+        return ['if char.get_uint(1):',
+                '    char._cur -= 1',
+                '    %s._from_per(char)' % o,
+                '    return %s._val' % o] + self._off_add(1)
+
+    def dec_leaf(self, Obj):
+        """
+        returns a list of lines decoding the leaf Obj and setting its _val
+        """
+        o = self.bind_obj(Obj)
+        if Obj.TYPE == TYPE_NULL:
+            return ['%s._val = 0' % o]
+        #
+        elif Obj.TYPE == TYPE_BOOL:
+            return ['%s._val = %s[char.get_uint(1)]' % (o, self.bind(Obj._PER_LUT))] \
+                   + self._off_add(1)
+        #
+        elif Obj.TYPE == TYPE_INT:
+            ext, rdyn, lb, ub = self._get_const(Obj._const_val)
+            if rdyn is None:
+                return self._dec_fallback(o)
+            lines = []
+            if ext is not None:
+                lines.extend(['if char.get_uint(1):'] + _indent(self._off_add(1)) + [
+                              '    %s._val = _PER.decode_intunconst(char)' % o,
+                              'else:'])
+                ind = 4
+                lines.extend(_indent(self._off_add(1)))
+            else:
+                ind = 0
+            if rdyn:
+                lines.extend(_indent(self._dec_intconst(Obj._const_val, '%s._val' % o), ind))
+            else:
+                lines.extend(_indent(['%s._val = %i' % (o, lb)], ind))
+            return lines
+        #
+        elif Obj.TYPE == TYPE_ENUM:
+            lines = []
+            if Obj._ext is not None:
+                lines.extend(['if char.get_uint(1):',
+                              '    char._cur -= 1',
+                              '    %s._from_per(char)' % o,
+                              'else:'])
+                ind = 4
+                lines.extend(_indent(self._off_add(1)))
+            else:
+                ind = 0
+            if len(Obj._root) == 1:
+                lines.extend(_indent(['%s._val = %r' % (o, Obj._root[0])], ind))
+            else:
+                r = self.bind(tuple(Obj._root))
+                lines.extend(_indent(self._dec_intconst(Obj._const_ind, 'ind') + [
+                    'if ind >= %i:' % len(Obj._root),
+                    '    raise(ASN1PERDecodeErr(\'{0}: invalid ENUMERATED index, {1!r}\'.format(%s.fullname(), ind)))' % o,
+                    '%s._val = %s[ind]' % (o, r)], ind))
+            return lines
+        #
+        else:
+            return self._dec_fallback(o)
+
+    def dec_comp(self, Obj, Comp, dst):
+        """
+        returns a list of lines decoding the component Comp of Obj and setting
+        its value in dst
+        """
+        o = self.bind_obj(Obj)
+        c = self.bind_obj(Comp)
+        if Comp.TYPE in _COMP_NODES:
+            lines = ['%s = %s(char)' % (dst, self.dec_node(Comp))]
+        elif Comp.TYPE in _COMP_LEAVES:
+            lines = self.dec_leaf(Comp) + ['%s = %s._val' % (dst, c)]
+        else:
+            lines = self._dec_fallback(c) + ['%s = %s._val' % (dst, c)]
+        if Comp._parent is not Obj:
+            # parent must be set for potential table constraint lookups
+            lines = ['_par = %s._parent' % c, '%s._parent = %s' % (c, o)] + lines + \
+                    ['%s._parent = _par' % c]
+        return lines
+
+    def dec_node(self, Obj):
+        """
+        generates the decoder function for Obj and returns its name
+        """
+        if id(Obj) in self._dec:
+            return self._dec[id(Obj)]
+        o = self.bind_obj(Obj)
+        fname = '_d%s%i' % (self.var, id(Obj))
+        self._dec[id(Obj)] = fname
+        #
+        if Obj.TYPE in (TYPE_SEQ, TYPE_SET):
+            body = self._dec_seq(Obj, o)
+        elif Obj.TYPE == TYPE_CHOICE and Obj._root:
+            body = self._dec_cho(Obj, o, fname)
+        elif Obj.TYPE in (TYPE_SEQ_OF, TYPE_SET_OF):
+            body = self._dec_seqof(Obj, o)
+        elif Obj.TYPE in _COMP_LEAVES:
+            body = self._head() + self.dec_leaf(Obj) + ['return %s._val' % o]
+        else:
+            body = self._dec_fallback(o) + ['return %s._val' % o]
+        self.src.extend(['def %s(char):' % fname] + _indent(body) + [''])
+        return fname
+
+    def _dec_seq(self, Obj, o):
+        lines = self._head()
+        if not Obj._cont and Obj._ext is None:
+            return lines + ['%s._val = {}' % o, 'return %s._val' % o]
+        if Obj._ext is not None:
+            lines.extend(self._dec_ext_fallback(o))
+        if Obj._root_opt:
+            opt_len = len(Obj._root_opt)
+            lines.append('Bv = char.get_uint(%i)' % opt_len)
+            lines.extend(self._off_add(opt_len))
+        lines.append('val = {}')
+        if Obj.TYPE == TYPE_SET:
+            root_canon = Obj._root_canon
+        else:
+            root_canon = Obj._root
+        for ident in root_canon:
+            Comp = Obj._cont[ident]
+            comp_lines = self.dec_comp(Obj, Comp, 'val[%r]' % ident)
+            if ident in Obj._root_mand:
+                lines.extend(comp_lines)
+            else:
+                i = Obj._root_opt.index(ident)
+                lines.append('if Bv & %i:' % (1<<(opt_len-1-i)))
+                lines.extend(_indent(comp_lines))
+                if Comp._def is not None:
+                    lines.extend(['elif _PER.GET_DEFVAL:',
+                                  '    val[%r] = %s._def' % (ident, self.bind_obj(Comp))])
+        lines.extend(['%s._val = val' % o, 'return val'])
+        return lines
+
+    def _dec_cho(self, Obj, o, fname):
+        lines = self._head()
+        if Obj._ext is not None:
+            lines.extend(self._dec_ext_fallback(o))
+        if len(Obj._root) == 1:
+            lines.append('ind = 0')
+        else:
+            lines.extend(self._dec_intconst(Obj._const_ind, 'ind'))
+            lines.extend([
+                'if ind >= %i:' % len(Obj._root),
+                '    raise(ASN1PERDecodeErr(\'{0}: invalid CHOICE index, {1!r}\'.format(%s.fullname(), ind)))' % o])
+        # one decoder function per alternative
+        alts = []
+        for i, ident in enumerate(Obj._root):
+            Cho = Obj._cont[ident]
+            if Cho.TYPE in _COMP_NODES and Cho._parent is Obj:
+                alts.append(self.dec_node(Cho))
+            else:
+                aname = '%s_%i' % (fname, i)
+                body = self._head() + self.dec_comp(Obj, Cho, 'v') + ['return v']
+                self.src.extend(['def %s(char):' % aname] + _indent(body) + [''])
+                alts.append(aname)
+        r, a = '_r%s' % fname, '_a%s' % fname
+        self.ns[r] = tuple(Obj._root)
+        self.post.append('%s = (%s, )' % (a, ', '.join(alts)))
+        lines.extend(['val = (%s[ind], %s[ind](char))' % (r, a),
+                      '%s._val = val' % o,
+                      'return val'])
+        return lines
+
+    def _dec_seqof(self, Obj, o):
+        C = Obj._const_sz
+        ext, rdyn, lb, ub = self._get_const(C)
+        if rdyn is None or ub is None or ub >= 65536:
+            return self._dec_fallback(o) + ['return %s._val' % o]
+        lines = self._head()
+        if ext is not None:
+            lines.extend(self._dec_ext_fallback(o))
+        if rdyn:
+            lines.extend(self._dec_intconst(C, 'ldet'))
+        else:
+            lines.append('ldet = %i' % ub)
+        lines.extend(['val = []', 'for _ in range(ldet):'])
+        Comp = Obj._cont
+        lines.extend(_indent(self.dec_comp(Obj, Comp, 'v') + ['val.append(v)']))
+        lines.extend(['%s._val = val' % o, 'return val'])
+        return lines
+
+    #--------------------------------------------------------------------------#
+    # encoders
+    #--------------------------------------------------------------------------#
+
+    def enc_leaf(self, Obj, w):
+        """
+        returns a list of lines encoding the leaf Obj which value is w
+        """
+        o = self.bind_obj(Obj)
+        if Obj.TYPE == TYPE_NULL:
+            return []
+        #
+        elif Obj.TYPE == TYPE_BOOL:
+            return ['GEN.append((T_UINT, %s[%s], 1))' % (self.bind(Obj._PER_LUTR), w)] \
+                   + self._off_add(1)
+        #
+        elif Obj.TYPE == TYPE_INT:
+            ext, rdyn, lb, ub = self._get_const(Obj._const_val)
+            if rdyn is None:
+                return ['GEN.extend(%s._to_per())' % o]
+            if ext is not None:
+                cond = '%s.__class__ is int and %s.in_root(%s)' % (w, self.bind(Obj._const_val), w)
+                lines = ['GEN.append((T_UINT, 0, 1))'] + self._off_add(1)
+            else:
+                cond = '%s.__class__ is int' % w
+                lines = []
+            if rdyn:
+                lines.extend(self._enc_intconst(Obj._const_val, w))
+            if not lines:
+                lines = ['pass']
+            return ['if %s:' % cond] + _indent(lines) + [
+                    'else:',
+                    '    GEN.extend(%s._to_per())' % o]
+        #
+        elif Obj.TYPE == TYPE_ENUM:
+            ind = self.bind(dict([(ident, i) for i, ident in enumerate(Obj._root)]))
+            lines = []
+            if Obj._ext is not None:
+                lines.extend(['GEN.append((T_UINT, 0, 1))'] + self._off_add(1))
+            if len(Obj._root) > 1:
+                lines.extend(self._enc_intconst(Obj._const_ind, 'ind'))
+            if not lines:
+                lines = ['pass']
+            return ['ind = %s.get(%s)' % (ind, w),
+                    'if ind is None:',
+                    '    GEN.extend(%s._to_per())' % o,
+                    'else:'] + _indent(lines)
+        #
+        else:
+            return ['GEN.extend(%s._to_per())' % o]
+
+    def enc_comp(self, Obj, Comp, src):
+        """
+        returns a list of lines encoding the component Comp of Obj, which value
+        is src
+        """
+        o = self.bind_obj(Obj)
+        c = self.bind_obj(Comp)
+        lines = ['%s._val = w = %s' % (c, src)]
+        if Comp.TYPE in _COMP_NODES:
+            lines.append('%s(GEN)' % self.enc_node(Comp))
+        else:
+            lines.extend(self.enc_leaf(Comp, 'w'))
+        if Comp._parent is not Obj:
+            lines = ['_par = %s._parent' % c, '%s._parent = %s' % (c, o)] + lines + \
+                    ['%s._parent = _par' % c]
+        return lines
+
+    def enc_node(self, Obj):
+        """
+        generates the encoder function for Obj and returns its name
+        """
+        if id(Obj) in self._enc:
+            return self._enc[id(Obj)]
+        o = self.bind_obj(Obj)
+        fname = '_e%s%i' % (self.var, id(Obj))
+        self._enc[id(Obj)] = fname
+        #
+        if Obj.TYPE in (TYPE_SEQ, TYPE_SET):
+            body = self._enc_seq(Obj, o)
+        elif Obj.TYPE == TYPE_CHOICE and Obj._root:
+            body = self._enc_cho(Obj, o, fname)
+        elif Obj.TYPE in (TYPE_SEQ_OF, TYPE_SET_OF):
+            body = self._enc_seqof(Obj, o)
+        elif Obj.TYPE in _COMP_LEAVES:
+            body = self._head() + self.enc_leaf(Obj, '%s._val' % o)
+        else:
+            body = ['GEN.extend(%s._to_per())' % o]
+        if not body:
+            body = ['pass']
+        self.src.extend(['def %s(GEN):' % fname] + _indent(body) + [''])
+        return fname
+
+    def _enc_seq(self, Obj, o):
+        lines = self._head() + ['v = %s._val' % o]
+        if not Obj._cont and Obj._ext is None:
+            return lines + ['return']
+        if Obj._ext is not None:
+            lines.extend(['for k in v:',
+                          '    if k in %s or k[:5] == \'_ext_\':' % self.bind(frozenset(Obj._ext)),
+                          '        GEN.extend(%s._to_per())' % o,
+                          '        return',
+                          'GEN.append((T_UINT, 0, 1))'] + self._off_add(1))
+        if Obj._root_opt:
+            opt_len = len(Obj._root_opt)
+            lines.append('Bv = 0')
+            for i, ident in enumerate(Obj._root_opt):
+                Comp = Obj._cont[ident]
+                lines.append('if %r in v:' % ident)
+                if Comp._def is not None:
+                    lines.extend([
+                        '    if _PER.CANONICAL and v[%r] == %s._def:' % (ident, self.bind_obj(Comp)),
+                        '        logger.info(\'_CONSTRUCT._to_per: %%s.%s, removing value equal to the default one\' %% %s.fullname())' % (ident, o),
+                        '        del v[%r]' % ident,
+                        '    else:',
+                        '        Bv += %i' % (1<<(opt_len-1-i))])
+                else:
+                    lines.append('    Bv += %i' % (1<<(opt_len-1-i)))
+            lines.append('GEN.append((T_UINT, Bv, %i))' % opt_len)
+            lines.extend(self._off_add(opt_len))
+        if Obj.TYPE == TYPE_SET:
+            root_canon = Obj._root_canon
+        else:
+            root_canon = Obj._root
+        for ident in root_canon:
+            lines.append('if %r in v:' % ident)
+            lines.extend(_indent(self.enc_comp(Obj, Obj._cont[ident], 'v[%r]' % ident)))
+        return lines
+
+    def _enc_cho(self, Obj, o, fname):
+        ind = self.bind(dict([(ident, i) for i, ident in enumerate(Obj._root)]))
+        lines = self._head() + [
+            'v = %s._val' % o,
+            'ind = %s.get(v[0])' % ind,
+            'if ind is None:',
+            '    GEN.extend(%s._to_per())' % o,
+            '    return']
+        if Obj._ext is not None:
+            lines.extend(['GEN.append((T_UINT, 0, 1))'] + self._off_add(1))
+        if len(Obj._root) > 1:
+            lines.extend(self._enc_intconst(Obj._const_ind, 'ind'))
+        # one encoder function per alternative
+        alts = []
+        for i, ident in enumerate(Obj._root):
+            aname = '%s_%i' % (fname, i)
+            body = self._head() + self.enc_comp(Obj, Obj._cont[ident], 'v')
+            self.src.extend(['def %s(v, GEN):' % aname] + _indent(body) + [''])
+            alts.append(aname)
+        a = '_a%s' % fname
+        self.post.append('%s = (%s, )' % (a, ', '.join(alts)))
+        lines.append('%s[ind](v[1], GEN)' % a)
+        return lines
+
+    def _enc_seqof(self, Obj, o):
+        C = Obj._const_sz
+        ext, rdyn, lb, ub = self._get_const(C)
+        if rdyn is None or ub is None or ub >= 65536 or Obj._ENC_MAXLEN:
+            return ['GEN.extend(%s._to_per())' % o]
+        lines = self._head() + ['v = %s._val' % o]
+        if ext is not None:
+            lines.extend(['if not %s.in_root(len(v)):' % self.bind(C),
+                          '    GEN.extend(%s._to_per())' % o,
+                          '    return',
+                          'GEN.append((T_UINT, 0, 1))'] + self._off_add(1))
+        if rdyn:
+            lines.extend(self._enc_intconst(C, 'len(v)'))
+        lines.append('for x in v:')
+        lines.extend(_indent(self.enc_comp(Obj, Obj._cont, 'x')))
+        return lines
+
+
+def gen_per_src(Obj):
+    """
+    returns the Python source code of the compiled PER codec for Obj, and the
+    namespace dict it must be executed within, together with the names of the
+    4 entry points: APER decoder, UPER decoder, APER encoder, UPER encoder
+    """
+    ns = {'_PER'            : ASN1CodecPER,
+          'T_UINT'          : T_UINT,
+          'ASN1PERDecodeErr': ASN1PERDecodeErr,
+          'logger'          : logger}
+    src, names, post = [], [], []
+    for aligned in (True, False):
+        comp = _PERCompiler(ns, aligned)
+        names.append( comp.dec_node(Obj) )
+        src.extend(comp.src)
+        post.extend(comp.post)
+    for aligned in (True, False):
+        comp = _PERCompiler(ns, aligned)
+        names.append( comp.enc_node(Obj) )
+        src.extend(comp.src)
+        post.extend(comp.post)
+    src.extend(post)
+    return '\n'.join(src) + '\n', ns, names
+
+
+def compile_per(Obj):
+    """
+    compiles the PER codec for Obj, and sets it as Obj._per_comp
+
+    returns the 4-tuple of functions (APER decoder, UPER decoder, APER encoder,
+    UPER encoder), decoders taking a Charpy instance and encoders a BitWriter
+    instance as argument
+    """
+    src, ns, names = gen_per_src(Obj)
+    exec(compile(src, '<percomp %s>' % Obj._name, 'exec'), ns)
+    Obj._per_comp = tuple([ns[name] for name in names])
+    return Obj._per_comp
+
+
+def compile_modules(*args, **kwargs):
+    """
+    enables the compiled PER codec for all objects of the given ASN.1 modules
+
+    args: the list of ASN.1 classes, as generated by pycrate_asn1c
+    kwargs:
+        lazy: bool, if True (default), each object is compiled at its first use,
+              otherwise they are all compiled immediately
+    """
+    lazy = kwargs.get('lazy', True)
+    for Mod in args:
+        for Obj in Mod._all_:
+            if Obj._mode == MODE_TYPE and not Obj._param:
+                Obj._PER_COMP = True
+                if not lazy:
+                    compile_per(Obj)
@@ -0,0 +1,208 @@
+# -*- coding: UTF-8 -*-
+#/**
+# * Software Name : pycrate
+# * Version : 0.4
+# *
+# * This library is free software; you can redistribute it and/or
+# * modify it under the terms of the GNU Lesser General Public
+# * License as published by the Free Software Foundation; either
+# * version 2.1 of the License, or (at your option) any later version.
+# *
+# * This library is distributed in the hope that it will be useful,
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# * Lesser General Public License for more details.
+# *
+# * You should have received a copy of the GNU Lesser General Public
+# * License along with this library; if not, write to the Free Software
+# * Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# * MA 02110-1301  USA
+# *
+# *--------------------------------------------------------
+# * File Name : pycrate_asn1rt/pool.py
+# *--------------------------------------------------------
+#*/
+
+import pickle
+import importlib
+import multiprocessing
+from collections import deque
+from time        import time
+
+from .err  import ASN1Err
+from .glob import GLOBAL
+
+
+#------------------------------------------------------------------------------#
+# parallel decoding over a pool of processes
+#------------------------------------------------------------------------------#
+# ASN.1 objects store the decoded values into themselves, hence a single object
+# cannot be used to decode in several threads at once.
+#
+# Here, buffers are grouped into chunks, which are dispatched to a pool of
+# worker processes: each worker imports the generated Python module once (or
+# restores it from a snapshot), and decodes its chunks with decode_many().
+# Decoded values are streamed back in the order of the input buffers.
+
+# ASN.1 object used by the worker process
+_POOL_OBJ   = None
+_POOL_CODEC = None
+
+
+def _pool_get_obj(pymod, mod, obj, cache_dir=None):
+    if cache_dir is not None:
+        from .snapshot import import_snapshot
+        import_snapshot(pymod, cache_dir=cache_dir)
+    else:
+        importlib.import_module(pymod)
+    try:
+        return GLOBAL.MOD[mod][obj]
+    except KeyError:
+        raise(ASN1Err('object {0}.{1} not found in {2}'.format(mod, obj, pymod)))
+
+
+def _pool_init(pymod, mod, obj, codec, cache_dir):
+    global _POOL_OBJ, _POOL_CODEC
+    _POOL_OBJ   = _pool_get_obj(pymod, mod, obj, cache_dir)
+    _POOL_CODEC = codec
+
+
+def _pool_decode(bufs):
+    ret = list(_POOL_OBJ.decode_many(bufs, _POOL_CODEC, errors='yield'))
+    for i, val in enumerate(ret):
+        if isinstance(val, Exception):
+            # exceptions must be sent back to the parent process
+            try:
+                pickle.dumps(val)
+            except Exception:
+                ret[i] = ASN1Err('{0}: {1}'.format(type(val).__name__, val))
+    return ret
+
+
+class ASN1PoolDecoder(object):
+    """
+    decodes encoded buffers with a given ASN.1 object over a pool of worker
+    processes
+
+    init args:
+        pymod: str, generated Python module (e.g. 'pycrate_asn1dir.TCAP_MAP')
+        mod: str, ASN.1 module name (e.g. 'TCAP-MAP-Messages')
+        obj: str, ASN.1 object name (e.g. 'TCAP-MAP-Message')
+        codec: str, 'aper', 'uper', 'ber', 'cer', 'der', 'oer' or 'coer'
+        workers: int, number of worker processes, default is the number of
+            CPUs, 0 decodes all buffers within the calling process
+        chunksize: int, number of buffers sent at once to a worker
+        cache_dir: str or None, if set, worker processes restore the ASN.1
+            modules from a snapshot within this directory (see snapshot.py)
+
+    attributes after decoding:
+        cnt: number of buffers decoded
+        cnt_err: number of buffers that failed decoding
+        len: number of bytes decoded
+        dur: decoding duration in seconds
+    """
+
+    # max number of chunks pending in the pool, per worker
+    INFLIGHT = 4
+
+    def __init__(self, pymod, mod, obj, codec='ber', workers=None, chunksize=64,
+                 cache_dir=None):
+        self.pymod     = pymod
+        self.mod       = mod
+        self.obj       = obj
+        self.codec     = codec
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        self.workers   = workers
+        self.chunksize = max(1, chunksize)
+        self.cache_dir = cache_dir
+        self._pool     = None
+        self.cnt, self.cnt_err, self.len, self.dur = 0, 0, 0, 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def start(self):
+        """
+        starts the pool of worker processes
+        """
+        if self._pool is None and self.workers > 0:
+            self._pool = multiprocessing.Pool(self.workers, _pool_init,
+                            (self.pymod, self.mod, self.obj, self.codec, self.cache_dir))
+
+    def close(self):
+        """
+        stops the pool of worker processes
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _iter_chunks(self, bufs):
+        chunk = []
+        for buf in bufs:
+            chunk.append(buf)
+            self.len += len(buf)
+            if len(chunk) == self.chunksize:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _iter_results(self, ret):
+        for val in ret:
+            self.cnt += 1
+            if isinstance(val, Exception):
+                self.cnt_err += 1
+            yield val
+
+    def decode(self, bufs):
+        """
+        decodes each buffer from the iterable bufs, and yields the decoded
+        values, in order, or the exception for each buffer that fails decoding
+        """
+        self.cnt, self.cnt_err, self.len, self.dur = 0, 0, 0, 0.0
+        T0 = time()
+        if self.workers == 0:
+            Obj = _pool_get_obj(self.pymod, self.mod, self.obj, self.cache_dir)
+            for chunk in self._iter_chunks(bufs):
+                for val in self._iter_results(Obj.decode_many(chunk, self.codec,
+                                                              errors='yield')):
+                    yield val
+                self.dur = time() - T0
+            return
+        #
+        self.start()
+        pending, inflight = deque(), self.INFLIGHT * self.workers
+        for chunk in self._iter_chunks(bufs):
+            pending.append( self._pool.apply_async(_pool_decode, (chunk, )) )
+            if len(pending) >= inflight:
+                for val in self._iter_results(pending.popleft().get()):
+                    yield val
+                self.dur = time() - T0
+        while pending:
+            for val in self._iter_results(pending.popleft().get()):
+                yield val
+            self.dur = time() - T0
+
+    def throughput(self):
+        """
+        returns the decoding throughput of the last call to decode(), as a
+        2-tuple (buffers per second, bytes per second)
+        """
+        if not self.dur:
+            return (0.0, 0.0)
+        return (self.cnt / self.dur, self.len / self.dur)
+
+    def report(self):
+        """
+        returns a textual report on the last call to decode()
+        """
+        pps, bps = self.throughput()
+        return '%i buffers (%i errors), %i bytes decoded in %.3f s with %i worker(s): '\
+               '%.1f buffers/s, %.1f kB/s' % (self.cnt, self.cnt_err, self.len, self.dur,
+               self.workers, pps, bps/1000)
@@ -0,0 +1,251 @@
+# -*- coding: UTF-8 -*-
+#/**
+# * Software Name : pycrate
+# * Version : 0.4
+# *
+# * This library is free software; you can redistribute it and/or
+# * modify it under the terms of the GNU Lesser General Public
+# * License as published by the Free Software Foundation; either
+# * version 2.1 of the License, or (at your option) any later version.
+# *
+# * This library is distributed in the hope that it will be useful,
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# * Lesser General Public License for more details.
+# *
+# * You should have received a copy of the GNU Lesser General Public
+# * License along with this library; if not, write to the Free Software
+# * Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# * MA 02110-1301  USA
+# *
+# *--------------------------------------------------------
+# * File Name : pycrate_asn1rt/snapshot.py
+# *--------------------------------------------------------
+#*/
+
+import os
+import sys
+import json
+import pickle
+import hashlib
+import importlib
+from importlib.util import find_spec
+
+from .utils   import logger
+from .err     import ASN1Err
+from .glob    import GLOBAL
+from .dictobj import ASN1Dict
+
+
+#------------------------------------------------------------------------------#
+# snapshot of initialized ASN.1 modules
+#------------------------------------------------------------------------------#
+# Importing a Python module generated by pycrate_asn1c builds and initializes
+# all its ASN.1 objects (see init_modules), which is done again at each process
+# start.
+#
+# Here, all ASN.1 modules defined by a set of generated Python modules are saved
+# once initialized into a pickled snapshot file, which can then be loaded in a
+# single step to restore them into GLOBAL.MOD.
+#
+# A snapshot file contains:
+# - a magic line
+# - a JSON header line, with the snapshot format version, a key computed over
+#   the Python version, and the source of the ASN.1 runtime and of the generated
+#   modules, the list of ASN.1 modules, and the SHA-256 digest of the payload
+# - the pickled payload: the list of ASN1Dict for those ASN.1 modules, and the
+#   OID lookup table
+#
+# As unpickling can execute arbitrary code, the payload is only unpickled after
+# the header and the digest have been verified, and, on POSIX systems, if the 
+# snapshot file and its directory belong to the current user and are not 
+# writable by others.
+
+# snapshot format version, to be incremented when the format changes
+SNAPSHOT_VERSION = 2
+
+SNAPSHOT_MAGIC = b'pycrate-asn1-snapshot\n'
+
+# ASN.1 objects are deeply nested, pickling them requires a large recursion 
+# limit, which is only set during the pickling / unpickling
+SNAPSHOT_RECLIM = 100000
+
+# cache of snapshot keys, {tuple of Python modules name: key}
+_SNAPSHOT_KEYS = {}
+
+
+class _RecLim(object):
+    # context manager raising the recursion limit to SNAPSHOT_RECLIM, and 
+    # restoring it at exit, unless it has been changed in the meantime
+    
+    def __enter__(self):
+        self._reclim = sys.getrecursionlimit()
+        if self._reclim < SNAPSHOT_RECLIM:
+            sys.setrecursionlimit(SNAPSHOT_RECLIM)
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if sys.getrecursionlimit() == max(self._reclim, SNAPSHOT_RECLIM):
+            sys.setrecursionlimit(self._reclim)
+
+
+def _chk_owner(path):
+    # returns True if path belongs to the current user and is not writable by
+    # group and others, always True when there is no such notion (non-POSIX)
+    if not hasattr(os, 'getuid'):
+        return True
+    st = os.stat(path)
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def _get_src(name):
+    spec = find_spec(name)
+    if spec is None or not spec.origin:
+        raise(ASN1Err('module {0} not found'.format(name)))
+    with open(spec.origin, 'rb') as fd:
+        return fd.read()
+
+
+def get_snapshot_key(*names):
+    """
+    returns the key (hexadecimal string) for a snapshot of the given generated
+    Python modules (e.g. 'pycrate_asn1dir.S1AP')
+    """
+    if names in _SNAPSHOT_KEYS:
+        return _SNAPSHOT_KEYS[names]
+    h = hashlib.sha256()
+    h.update(('%i %i.%i' % (SNAPSHOT_VERSION, sys.version_info[0], 
+                            sys.version_info[1])).encode())
+    # the pycrate version is identified with the source of the ASN.1 runtime,
+    # this also works with development trees
+    rtdir = os.path.dirname(__file__)
+    for fn in sorted(os.listdir(rtdir)):
+        if fn[-3:] == '.py':
+            with open(os.path.join(rtdir, fn), 'rb') as fd:
+                h.update(fd.read())
+    for name in names:
+        h.update(name.encode())
+        h.update(_get_src(name))
+    _SNAPSHOT_KEYS[names] = h.hexdigest()
+    return _SNAPSHOT_KEYS[names]
+
+
+def _get_asn_modules(name):
+    # returns the list of ASN.1 modules' name defined in the generated module
+    pymod = sys.modules.get(name)
+    if pymod is None:
+        pymod = importlib.import_module(name)
+    return [v._name_ for v in vars(pymod).values() \
+            if hasattr(v, '_name_') and hasattr(v, '_obj_') and hasattr(v, '_all_')]
+
+
+def save_snapshot(path, *names, **kwargs):
+    """
+    saves all ASN.1 modules defined by the given generated Python modules (e.g.
+    'pycrate_asn1dir.S1AP') into the snapshot file `path'
+
+    Python modules not already imported are imported first
+
+    kwargs:
+        GLOBAL: a specific GLOBAL dict, default is the generic GLOBAL
+    """
+    GLOB = kwargs.get('GLOBAL', GLOBAL)
+    mods = []
+    for name in names:
+        mods.extend(_get_asn_modules(name))
+    # all ASN.1 objects are taken from GLOBAL.MOD: this also materializes the
+    # objects of lazily loaded modules
+    mod_dicts = [ASN1Dict([(k, GLOB.MOD[mod][k]) for k in GLOB.MOD[mod]]) for mod in mods]
+    with _RecLim():
+        payload = pickle.dumps((mod_dicts, dict(GLOB.OID)), protocol=pickle.HIGHEST_PROTOCOL)
+    hdr = {'version': SNAPSHOT_VERSION,
+           'key'    : get_snapshot_key(*names),
+           'names'  : list(names),
+           'mods'   : mods,
+           'digest' : hashlib.sha256(payload).hexdigest()}
+    # write into a tmp file first, so that concurrent processes never read an
+    # incomplete snapshot
+    path_tmp = '%s.%i.tmp' % (path, os.getpid())
+    try:
+        with os.fdopen(os.open(path_tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 
+                       'wb') as fd:
+            fd.write(SNAPSHOT_MAGIC)
+            fd.write(json.dumps(hdr).encode() + b'\n')
+            fd.write(payload)
+        os.replace(path_tmp, path)
+    finally:
+        # the tmp file only remains here if its writing failed
+        if os.path.exists(path_tmp):
+            os.remove(path_tmp)
+
+
+def load_snapshot(path, *names, **kwargs):
+    """
+    loads the snapshot file `path' made for the given generated Python modules
+    (e.g. 'pycrate_asn1dir.S1AP') and restores all their ASN.1 modules into
+    GLOBAL.MOD
+
+    returns True if the snapshot is loaded, False if it does not exist, does
+    not correspond to the given modules or to the current source code, is
+    corrupted, or does not belong to the current user (see _chk_owner())
+
+    kwargs:
+        GLOBAL: a specific GLOBAL dict, default is the generic GLOBAL
+    """
+    GLOB = kwargs.get('GLOBAL', GLOBAL)
+    if not os.path.exists(path):
+        return False
+    if not _chk_owner(path) or not _chk_owner(os.path.dirname(os.path.abspath(path))):
+        logger.warning('load_snapshot: snapshot {0} or its directory not owned by '\
+                       'the user, or writable by others, ignored'.format(path))
+        return False
+    with open(path, 'rb') as fd:
+        magic = fd.readline()
+        try:
+            hdr = json.loads(fd.readline().decode())
+        except Exception:
+            hdr = None
+        if magic != SNAPSHOT_MAGIC or not isinstance(hdr, dict):
+            logger.info('load_snapshot: invalid snapshot {0}'.format(path))
+            return False
+        if hdr.get('version') != SNAPSHOT_VERSION \
+        or hdr.get('names') != list(names) \
+        or hdr.get('key') != get_snapshot_key(*names):
+            logger.info('load_snapshot: outdated snapshot {0}'.format(path))
+            return False
+        payload = fd.read()
+    if hashlib.sha256(payload).hexdigest() != hdr.get('digest'):
+        logger.info('load_snapshot: corrupted snapshot {0}'.format(path))
+        return False
+    with _RecLim():
+        mod_dicts, oids = pickle.loads(payload)
+    #
+    for mod, mod_dict in zip(hdr['mods'], mod_dicts):
+        GLOB.MOD[mod] = mod_dict
+    GLOB.OID.update(oids)
+    return True
+
+
+def import_snapshot(*names, **kwargs):
+    """
+    restores all ASN.1 modules defined by the given generated Python modules
+    (e.g. 'pycrate_asn1dir.S1AP') into GLOBAL.MOD, from a snapshot file if
+    one is available and up-to-date, or by importing the Python modules and
+    creating the snapshot file otherwise
+
+    kwargs:
+        cache_dir: directory for snapshot files, default is ~/.cache/pycrate
+        GLOBAL: a specific GLOBAL dict, default is the generic GLOBAL
+
+    returns the path to the snapshot file
+    """
+    cache_dir = kwargs.pop('cache_dir', None)
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'pycrate')
+    path = os.path.join(cache_dir, '%s.%s.pkl' % (
+                        '_'.join([name.split('.')[-1] for name in names]),
+                        get_snapshot_key(*names)[:16]))
+    if not load_snapshot(path, *names, **kwargs):
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        save_snapshot(path, *names, **kwargs)
+    return path
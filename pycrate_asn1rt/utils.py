@@ -612,6 +612,25 @@ def get_val_at(Obj, path):
     return val
 
 
+def hashable_val(val):
+    """returns a hashable version of the value `val', for indexing CLASS set
+    of values, or raises TypeError
+    """
+    # WARNING: a field value is not always a basic value (e.g. INTEGER),
+    # but can be a constructed value, hence a dict or a list
+    # We need to make it hashable for Python, while keeping distinct values
+    # distinct
+    if isinstance(val, list):
+        return (list, tuple([hashable_val(v) for v in val]))
+    elif isinstance(val, dict):
+        return (dict, tuple(sorted([(k, hashable_val(v)) for (k, v) in val.items()])))
+    elif isinstance(val, tuple):
+        return tuple([hashable_val(v) for v in val])
+    else:
+        hash(val)
+        return val
+
+
 #------------------------------------------------------------------------------#
 # working on the json dependency files generated by pycrate_asn1c
 # to list top-level objects
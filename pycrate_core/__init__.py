@@ -27,4 +27,4 @@
 # *--------------------------------------------------------
 #*/
 #
-__all__ = ['utils', 'charpy', 'repr', 'elt', 'base']
+__all__ = ['utils', 'charpy', 'repr', 'elt', 'base', 'pool']
@@ -44,6 +44,24 @@ if _with_json:
     from binascii import hexlify, unhexlify
 
 
+# struct format and conversion function for unpacking fixed length atoms in a 
+# single shot within Envelope._from_char()
+_UNPACK_FMT_UINT = {8: 'B', 16: 'H', 32: 'I', 64: 'Q'}
+_UNPACK_FMT_INT  = {8: 'b', 16: 'h', 32: 'i', 64: 'q'}
+
+def _unpack_uint(buf):
+    return int.from_bytes(buf, 'big')
+
+def _unpack_int(buf):
+    return int.from_bytes(buf, 'big', signed=True)
+
+def _unpack_uint_le(buf):
+    return int.from_bytes(buf, 'little')
+
+def _unpack_int_le(buf):
+    return int.from_bytes(buf, 'little', signed=True)
+
+
 #------------------------------------------------------------------------------#
 # Basic types - bytes' buffers
 #------------------------------------------------------------------------------#
@@ -175,6 +193,12 @@ class Buf(Atom):
         else:
             return []
     
+    def _to_writer(self, w):
+        """Writes the internal value directly into the BitWriter instance `w'
+        """
+        if not self.get_trans():
+            w.write_bytes(self.get_val(), self.get_bl())
+    
     def _from_char(self, char):
         """Consume the charpy intance and set its internal value according to it
         """
@@ -196,6 +220,12 @@ class Buf(Atom):
         except Exception as err:
             raise(EltErr('{0} [_from_char]: {1}'.format(self._name, err)))
     
+    def _get_unpack_fmt(self):
+        if self.__class__._from_char is not Buf._from_char \
+        or not self._bl or self._bl % 8:
+            return None
+        return ('%is' % (self._bl>>3), None)
+    
     #--------------------------------------------------------------------------#
     # json interface
     #--------------------------------------------------------------------------#
@@ -374,6 +404,12 @@ class String(Atom):
         else:
             return []
     
+    def _to_writer(self, w):
+        """Writes the internal value directly into the BitWriter instance `w'
+        """
+        if not self.get_trans():
+            w.write_bytes(self.get_val().encode(self.CODEC), self.get_bl())
+    
     def _from_char(self, char):
         """Consume the charpy intance and set its internal value according to it
         """
@@ -507,6 +543,12 @@ class Uint(Atom):
         else:
             return []
     
+    def _to_writer(self, w):
+        """Writes the internal value directly into the BitWriter instance `w'
+        """
+        if not self.get_trans():
+            w.write_uint(self.get_val(), self.get_bl())
+    
     def _from_char(self, char):
         """Consume the charpy intance and set its internal value according to
         it
@@ -528,6 +570,15 @@ class Uint(Atom):
         except CharpyErr as err:
             raise(CharpyErr('{0} [_from_char]: {1}'.format(self._name, err)))
     
+    def _get_unpack_fmt(self):
+        if self.__class__._from_char is not Uint._from_char \
+        or not self._bl or self._bl % 8:
+            return None
+        elif self._bl in _UNPACK_FMT_UINT:
+            return (_UNPACK_FMT_UINT[self._bl], None)
+        else:
+            return ('%is' % (self._bl>>3), _unpack_uint)
+    
     #--------------------------------------------------------------------------#
     # json interface
     #--------------------------------------------------------------------------#
@@ -647,6 +698,12 @@ class Int(Atom):
         else:
             return []
     
+    def _to_writer(self, w):
+        """Writes the internal value directly into the BitWriter instance `w'
+        """
+        if not self.get_trans():
+            w.write_int(self.get_val(), self.get_bl())
+    
     def _from_char(self, char):
         """Consume the charpy intance and set its internal value according to
         it
@@ -668,6 +725,15 @@ class Int(Atom):
         except CharpyErr as err:
             raise(CharpyErr('{0} [_from_char]: {1}'.format(self._name, err)))
     
+    def _get_unpack_fmt(self):
+        if self.__class__._from_char is not Int._from_char \
+        or not self._bl or self._bl % 8:
+            return None
+        elif self._bl in _UNPACK_FMT_INT:
+            return (_UNPACK_FMT_INT[self._bl], None)
+        else:
+            return ('%is' % (self._bl>>3), _unpack_int)
+    
     #--------------------------------------------------------------------------#
     # json interface
     #--------------------------------------------------------------------------#
@@ -766,6 +832,12 @@ class UintLE(Atom):
         else:
             return []
     
+    def _to_writer(self, w):
+        """Writes the internal value directly into the BitWriter instance `w'
+        """
+        if not self.get_trans():
+            w.write_uint_le(self.get_val(), self.get_bl())
+    
     def _from_char(self, char):
         """Consume the charpy intance and set its internal value according to
         it
@@ -787,6 +859,12 @@ class UintLE(Atom):
         except CharpyErr as err:
             raise(CharpyErr('{0} [_from_char]: {1}'.format(self._name, err)))
     
+    def _get_unpack_fmt(self):
+        if self.__class__._from_char is not UintLE._from_char \
+        or not self._bl or self._bl % 8:
+            return None
+        return ('%is' % (self._bl>>3), _unpack_uint_le)
+    
     #--------------------------------------------------------------------------#
     # json interface
     # value converted to integer
@@ -886,6 +964,12 @@ class IntLE(Atom):
         else:
             return []
     
+    def _to_writer(self, w):
+        """Writes the internal value directly into the BitWriter instance `w'
+        """
+        if not self.get_trans():
+            w.write_int_le(self.get_val(), self.get_bl())
+    
     def _from_char(self, char):
         """Consume the charpy intance and set its internal value according to
         it
@@ -907,6 +991,12 @@ class IntLE(Atom):
         except CharpyErr as err:
             raise(CharpyErr('{0} [_from_char]: {1}'.format(self._name, err)))
     
+    def _get_unpack_fmt(self):
+        if self.__class__._from_char is not IntLE._from_char \
+        or not self._bl or self._bl % 8:
+            return None
+        return ('%is' % (self._bl>>3), _unpack_int_le)
+    
     #--------------------------------------------------------------------------#
     # json interface
     # value converted to integer
@@ -27,7 +27,7 @@
 # *--------------------------------------------------------
 #*/
 
-__all__ = ['CharpyErr', 'Charpy']
+__all__ = ['CharpyErr', 'Charpy', 'CharpyFast']
 
 from .utils import *
 
@@ -64,6 +64,9 @@ class Charpy(object):
     _REPR = 'buf'
     _REPR_MAX = 512
     
+    # view mode for decoding elements, see Element.from_bytes()
+    _view = False
+    
     def __init__(self, buf=None):
         """Initialize the charpy instance
         
@@ -94,6 +97,10 @@ class Charpy(object):
         self._concat = []
         self._cur = cur
     
+    def _append(self, typ, val, bitlen):
+        # stack the value to be appended, _pack() will concatenate it
+        self._concat.append( (typ, val, bitlen) )
+    
     def len_bit(self):
         """Return the length in bits
         
@@ -288,7 +295,7 @@ class Charpy(object):
             bitlen = 8*len(buf)
         elif bitlen <= 0:
             return
-        self._concat.append( (TYPE_BYTES, buf, bitlen) )
+        self._append(TYPE_BYTES, buf, bitlen)
     
     def to_bytes(self, bitlen=None):
         """Provide the bytes buffer of the charpy instance, starting at the 
@@ -702,7 +709,7 @@ class Charpy(object):
             bitlen = val.bit_length()
         elif bitlen == 0:
             return
-        self._concat.append( (TYPE_UINT, val, bitlen) )
+        self._append(TYPE_UINT, val, bitlen)
     
     def to_uint(self, bitlen=None):
         """Provide the unsigned integer value of the charpy instance, starting 
@@ -862,7 +869,7 @@ class Charpy(object):
             bitlen =  1 + val.bit_length()
         elif bitlen == 0:
             return
-        self._concat.append( (TYPE_INT, val, bitlen) )
+        self._append(TYPE_INT, val, bitlen)
     
     def to_int(self, bitlen=None):
         """Provide the signed integer value of the charpy instance, starting 
@@ -1031,7 +1038,7 @@ class Charpy(object):
             return
         elif bitlen % 8:
             bitlen += 8 - (bitlen%8)
-        self._concat.append( (TYPE_UINT_LE, val, bitlen) )
+        self._append(TYPE_UINT_LE, val, bitlen)
     
     def to_uint_le(self, bitlen=None):
         """Provide the unsigned integer value of the charpy instance, starting 
@@ -1208,7 +1215,7 @@ class Charpy(object):
             return
         elif bitlen % 8:
             bitlen += 8 - (bitlen%8)
-        self._concat.append( (TYPE_INT_LE, val, bitlen) )
+        self._append(TYPE_INT_LE, val, bitlen)
     
     def to_int_le(self, bitlen=None):
         """Provide the signed integer value of the charpy instance, starting 
@@ -1426,3 +1433,191 @@ class Charpy(object):
         else:
             return self.__gt__(other)
 
+
+
+#------------------------------------------------------------------------------#
+# Charpy fast path
+#------------------------------------------------------------------------------#
+# Charpy extracts each field by slicing its bytes buffer and converting the
+# slice, which allocates a new bytes object for every single read, and appended
+# values are stacked and packed together with the whole existing buffer at the
+# next read.
+#
+# CharpyFast keeps a zero-copy memoryview over its buffer together with an
+# integer window of _WIN_LEN bytes around the cursor: most unaligned reads of
+# short fields are then a shift and a mask on this cached integer.
+# Appended values go into a BitWriter (see pycrate_core.utils), which never
+# repacks the content already written, and packs values exactly like pack_val().
+
+class CharpyFast(Charpy):
+    """
+    CharpyFast is a bit-stream handler, with the same API as Charpy, optimized
+    for reading and appending many short unaligned fields (e.g. with PER)
+    
+    In addition to Charpy's attributes, it uses:
+    - _mv: memoryview over _buf
+    - _win_buf, _win_off, _win_end, _win: the buffer, byte offsets and 
+      integer value of the cached window
+    - _bw, _wref: the BitWriter for appended values, and the buffer it was
+      synchronized with
+    
+    _concat is only used as a flag indicating that values were appended and
+    not yet packed into _buf
+    """
+    
+    # length in bytes of the cached integer window
+    _WIN_LEN = 32
+    
+    def __init__(self, buf=None):
+        self._win_buf = None
+        self._bw      = BitWriter()
+        self._wref    = None
+        Charpy.__init__(self, buf)
+    
+    def _pack(self):
+        if not self._concat:
+            return
+        # the writer is kept in sync with the resulting buffer, so that
+        # subsequent appends continue from it
+        self._buf, self._len_bit = self._bw.get()
+        self._wref = self._buf
+        self._concat = []
+    
+    def _wsync(self):
+        # (re)initialize the bit writer from the current buffer
+        if self._wref is self._buf and self._bw.len_bit() == self._len_bit:
+            return
+        self._bw.reset()
+        self._bw.write_bytes(self._buf, self._len_bit)
+        self._wref = self._buf
+    
+    def _append(self, typ, val, bitlen):
+        if not self._concat:
+            self._wsync()
+            self._concat = True
+        if typ == TYPE_UINT:
+            self._bw.write_uint(val, bitlen)
+        elif typ == TYPE_BYTES:
+            self._bw.write_bytes(val, bitlen)
+        else:
+            self._bw.write(typ, val, bitlen)
+    
+    def _read(self, cur, bitlen):
+        # return the uint value of bitlen bits at the cur offset in bits
+        off, end = cur>>3, (cur+bitlen+7)>>3
+        if self._win_buf is not self._buf:
+            self._mv = memoryview(self._buf)
+            self._win_buf = self._buf
+            self._win_off, self._win_end = 0, 0
+        if off < self._win_off or end > self._win_end:
+            if end - off > self._WIN_LEN:
+                # large value, no need to cache it
+                return (int.from_bytes(self._mv[off:end], 'big') \
+                        >> ((end<<3)-cur-bitlen)) & ((1<<bitlen)-1)
+            self._win_off = off
+            self._win_end = min(off + self._WIN_LEN, len(self._buf))
+            self._win = int.from_bytes(self._mv[off:self._win_end], 'big')
+        return (self._win >> ((self._win_end<<3)-cur-bitlen)) & ((1<<bitlen)-1)
+    
+    def set_bytes(self, buf=b'', bitlen=None):
+        Charpy.set_bytes(self, buf, bitlen)
+        # invalidates the cached window (as the buffer is a new one)
+        self._win_buf = None
+    
+    set_bytes.__doc__ = Charpy.set_bytes.__doc__
+    
+    def to_bytes(self, bitlen=None):
+        if self._concat: self._pack()
+        if self._cur % 8 == 0 or bitlen == 0:
+            return Charpy.to_bytes(self, bitlen)
+        if bitlen is None:
+            bitlen = self._len_bit - self._cur
+        elif bitlen < 0:
+            raise(CharpyErr('negative bitlen: {0}'.format(bitlen))) 
+        elif self._cur + bitlen > self._len_bit:
+            raise(CharpyErr('bitlen overflow: {0}, max {1}'\
+                            .format(bitlen, self._len_bit-self._cur)))
+        if bitlen == 0:
+            return b''
+        # unaligned access, with padding bits rightmost
+        len_byte = (bitlen+7)>>3
+        return (self._read(self._cur, bitlen) << ((len_byte<<3)-bitlen))\
+               .to_bytes(len_byte, 'big')
+    
+    to_bytes.__doc__ = Charpy.to_bytes.__doc__
+    
+    def get_bytes(self, bitlen=None):
+        ret = self.to_bytes(bitlen)
+        if bitlen is None:
+            self._cur = self._len_bit
+        else:
+            self._cur += bitlen
+        return ret
+    
+    get_bytes.__doc__ = Charpy.get_bytes.__doc__
+    
+    def to_uint(self, bitlen=None):
+        if self._concat: self._pack()
+        if bitlen is None:
+            # get the whole charpy buffer
+            bitlen = self._len_bit - self._cur
+        elif bitlen < 0:
+            raise(CharpyErr('negative bitlen: {0}'.format(bitlen))) 
+        elif self._cur + bitlen > self._len_bit:
+            raise(CharpyErr('bitlen overflow: {0}, max {1}'\
+                            .format(bitlen, self._len_bit-self._cur)))
+        if bitlen == 0:
+            return None
+        return self._read(self._cur, bitlen)
+    
+    to_uint.__doc__ = Charpy.to_uint.__doc__
+    
+    def get_uint(self, bitlen=None):
+        if self._concat: self._pack()
+        if bitlen is None:
+            # get the whole charpy buffer
+            bitlen = self._len_bit - self._cur
+        elif bitlen < 0:
+            raise(CharpyErr('negative bitlen: {0}'.format(bitlen))) 
+        elif self._cur + bitlen > self._len_bit:
+            raise(CharpyErr('bitlen overflow: {0}, max {1}'\
+                            .format(bitlen, self._len_bit-self._cur)))
+        if bitlen == 0:
+            return None
+        cur = self._cur
+        self._cur += bitlen
+        return self._read(cur, bitlen)
+    
+    get_uint.__doc__ = Charpy.get_uint.__doc__
+    
+    def to_int(self, bitlen=None):
+        val = self.to_uint(bitlen)
+        if val is None:
+            return None
+        mask = 1<<((bitlen if bitlen is not None else self._len_bit-self._cur)-1)
+        if val & mask:
+            # negative integer
+            return (val&(mask-1)) - mask
+        else:
+            return val
+    
+    to_int.__doc__ = Charpy.to_int.__doc__
+    
+    def get_int(self, bitlen=None):
+        if bitlen is None:
+            if self._concat: self._pack()
+            bitlen = self._len_bit - self._cur
+        val = self.get_uint(bitlen)
+        if val is None:
+            return None
+        mask = 1<<(bitlen-1)
+        if val & mask:
+            # negative integer
+            return (val&(mask-1)) - mask
+        else:
+            return val
+    
+    get_int.__doc__ = Charpy.get_int.__doc__
+    
+    __index__ = to_uint
+    __bytes__ = to_bytes
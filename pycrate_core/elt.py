@@ -33,6 +33,7 @@ __all__ = ['EltErr', 'REPR_RAW', 'REPR_HEX', 'REPR_BIN', 'REPR_HD', 'REPR_HUM',
 
 
 from binascii import hexlify
+from struct   import Struct
 
 try:
     from json import JSONEncoder, JSONDecoder
@@ -150,6 +151,17 @@ class Element(object):
     _trans      = None
     _transauto  = None
     
+    def __init_subclass__(cls, **kwargs):
+        # a subclass overriding _to_pack() without providing its own 
+        # _to_writer() gets the generic _to_writer() which calls _to_pack()
+        super().__init_subclass__(**kwargs)
+        for c in cls.__mro__:
+            if '_to_writer' in c.__dict__:
+                break
+            elif '_to_pack' in c.__dict__:
+                cls._to_writer = Element._to_writer
+                break
+    
     
     #--------------------------------------------------------------------------#
     # envelope, hierarchy and selection routines
@@ -614,13 +626,17 @@ class Element(object):
     # conversion routines
     #--------------------------------------------------------------------------#
     
-    def from_bytes(self, char):
+    def from_bytes(self, char, view=False):
         """Consume a bytes buffer or Charpy instance `char' and sets the 
         internal value according to it
         
         Args:
             char (bytes or charpy): bytes buffer or charpy instance to be
                 consumed
+            view (bool): if True, composite elements (Envelope, Array, 
+                Sequence) with a length automation are not decoded, but only
+                record their offset within `char', and are decoded when their
+                content is accessed for the first time
         
         Returns:
             None
@@ -628,6 +644,9 @@ class Element(object):
         Raises:
             EltErr : if `char' has not the correct type
             CharpyErr
+        
+        In view mode, decoding errors within a pending element are only raised
+        when this element is accessed.
         """.format(self.__class__.__name__)
         if isinstance(char, bytes_types):
             char = Charpy(char)
@@ -635,7 +654,14 @@ class Element(object):
             raise(EltErr('{0} [from_bytes]: char type is {1}, expecting Charpy'\
                          .format(self._name, type(char).__name__)))
         #
-        self._from_char(char)
+        if view:
+            char._view = True
+            try:
+                self._from_char(char)
+            finally:
+                del char._view
+        else:
+            self._from_char(char)
     
     def to_bytes(self):
         """Produce a bytes buffer from the internal value
@@ -646,7 +672,15 @@ class Element(object):
         Returns:
             char (bytes) : resulting bytes buffer
         """.format(self.__class__.__name__)
-        return pack_val(*self._to_pack())[0]
+        w = BitWriter()
+        self._to_writer(w)
+        return w.to_bytes()
+    
+    def _to_writer(self, w):
+        """Writes the internal value into the BitWriter instance `w', by
+        default through _to_pack()
+        """
+        w.extend(self._to_pack())
     
     def from_uint(self, uint, bl=None):
         """Consume an unsigned integer or Charpy instance `uint' and sets the 
@@ -768,6 +802,66 @@ class Element(object):
     __bin__ = bin
     __hex__ = hex
     
+    #--------------------------------------------------------------------------#
+    # view mode
+    #--------------------------------------------------------------------------#
+    # When decoding with from_bytes(char, view=True), a composite element with 
+    # a length automation only records its position within the buffer, and its
+    # instance attributes listed in _VIEW_ATTRS (which hold the content) are put 
+    # aside.
+    # The first access to one of those attributes decodes the pending element
+    # from the recorded position, hence parsing pipelines only pay for the
+    # elements they actually look into.
+    # As long as it is pending, the element is encoded back and its length
+    # computed from the recorded buffer.
+    
+    # pending decoding: (buf, cur, bl, charpy class, num, stashed attributes)
+    _view       = None
+    _VIEW_ATTRS = ()
+    
+    def __getattr__(self, attr):
+        # only called when attr is not found
+        if attr in self._VIEW_ATTRS and self._pending():
+            self._load_view()
+            return self.__dict__[attr]
+        raise(AttributeError('{0!r} object has no attribute {1!r}'\
+              .format(self.__class__.__name__, attr)))
+    
+    def _pending(self):
+        # returns True if the decoding of self is pending
+        if self._view is None:
+            return False
+        elif self._VIEW_ATTRS[0] in self.__dict__:
+            # the content has been set in the meantime (e.g. with set_val())
+            del self._view
+            return False
+        else:
+            return True
+    
+    def _set_view(self, char, num=None):
+        if char._concat:
+            char._pack()
+        stash = {}
+        for attr in self._VIEW_ATTRS:
+            if attr in self.__dict__:
+                stash[attr] = self.__dict__.pop(attr)
+        bl = char._len_bit - char._cur
+        self._view = (char._buf, char._cur, bl, char.__class__, num, stash)
+        char._cur = char._len_bit
+    
+    def _load_view(self):
+        buf, cur, bl, charcla, num, stash = self.__dict__.pop('_view')
+        self.__dict__.update(stash)
+        char = charcla(buf)
+        char._cur, char._len_bit, char._view = cur, cur + bl, True
+        self._from_char_cont(char, num)
+    
+    def _view_to_pack(self):
+        buf, cur, bl = self._view[:3]
+        char = Charpy(buf)
+        char._cur = cur
+        return [(TYPE_BYTES, char.to_bytes(bl), bl)]
+    
     #--------------------------------------------------------------------------#
     # json api
     #--------------------------------------------------------------------------#
@@ -886,6 +980,9 @@ class Atom(Element):
                  '_dic',
                  '_dicauto')
     
+    # universal attributes transferred by clone()
+    _CLONE_ATTRS = ('_desc', '_rep', '_hier', '_bl', '_val', '_trans', '_dic')
+    
     def __init__(self, *args, **kw):
         """Initializes an instance of Atom
         
@@ -1290,6 +1387,12 @@ class Atom(Element):
         else:
             return []
     
+    def _to_writer(self, w):
+        """Writes the internal value into the BitWriter instance `w', nothing
+        for a generic atom
+        """
+        pass
+    
     def _from_char(self, char):
         """Consume the charpy intance and set its internal value according to
         it
@@ -1297,6 +1400,13 @@ class Atom(Element):
         if not self.get_trans():
             self.set_val(None)
     
+    def _get_unpack_fmt(self):
+        """Returns the struct format and the conversion function (or None) to
+        be used by Envelope._from_char() for unpacking the atom together with
+        its neighbours in a single shot, or None if this is not possible
+        """
+        return None
+    
     #--------------------------------------------------------------------------#
     # copy / cloning routines
     #--------------------------------------------------------------------------#
@@ -1386,6 +1496,16 @@ class Atom(Element):
         Returns:
             clone (self.__class__ instance)
         """
+        if self.__class__.__init__ is Atom.__init__:
+            # fast path: self is already verified, its universal attributes
+            # are copied straight into the clone, without calling __init__()
+            clone = self.__class__.__new__(self.__class__)
+            attrs, clone_attrs = self.__dict__, clone.__dict__
+            for attr in self._CLONE_ATTRS:
+                if attr in attrs:
+                    clone_attrs[attr] = attrs[attr]
+            clone_attrs['_name'] = self._name
+            return clone
         kw = {'rep': self._rep}
         if self._desc != self.__class__._desc:
             kw['desc'] = self._desc
@@ -1523,6 +1643,8 @@ class Envelope(Element):
     _transauto = None
     _GEN       = tuple()
     
+    _VIEW_ATTRS = ('_content', '_by_id', '_by_name')
+    
     __attrs__ = ('_env',
                  '_name',
                  '_desc',
@@ -1590,13 +1712,26 @@ class Envelope(Element):
         if self._SAFE_STAT:
             self._chk_hier()
             self._chk_trans()
-            self._chk_gen(GEN)
+            if not clo or '_GEN_checked' not in self.__class__.__dict__:
+                self._chk_gen(GEN)
+                if clo:
+                    # the class GEN is only verified once
+                    self.__class__._GEN_checked = True
         
         # content list generation
-        self._content, self._by_id, self._by_name = [], [], []
+        # the content is not built lazily at first access: most envelopes 
+        # override __init__() to bind automations to their content, which 
+        # requires it right away
         if clo:
-            self.extend([elt.clone() for elt in GEN])
+            # clones of the class GEN are trusted elements, hence the content
+            # is built without the verifications done in extend()
+            self._content = [elt.clone() for elt in GEN]
+            self._by_id   = list(map(id, self._content))
+            self._by_name = [elt._name for elt in self._content]
+            for elt in self._content:
+                elt._env = self
         else:
+            self._content, self._by_id, self._by_name = [], [], []
             self.extend(GEN)
         
         # if a content dict is passed as argument
@@ -1764,6 +1899,8 @@ class Envelope(Element):
         """
         if self.get_trans():
             return 0
+        elif self._pending():
+            return self._view[2]
         else:
             return sum([elt.get_bl() for elt in self.__iter__()])
     
@@ -1789,20 +1926,32 @@ class Envelope(Element):
         """Produces a list of tuples  (type, val, bl) ready to be packed with 
         pack_val()
         """
-        if not self.get_trans():
+        if self.get_trans():
+            return []
+        elif self._pending():
+            return self._view_to_pack()
+        else:
             pl = []
             [pl.extend(elt._to_pack()) for elt in self.__iter__()]
             return pl
+    
+    def _to_writer(self, w):
+        """Writes the content's values directly into the BitWriter instance `w'
+        """
+        if self.get_trans():
+            return
+        elif self._pending():
+            w.extend(self._view_to_pack())
         else:
-            return []
+            # transparent elements do not write anything, hence there is no
+            # need to go through the stateful iterator
+            for elt in self._content:
+                elt._to_writer(w)
     
     def _from_char(self, char):
         """Dispatch the consumption of a Charpy intance to the elements within
         the content
         """
-        # TODO: in cases some ranges of elt within self have a fixed _bl
-        # it would be more efficient to unpack them in a single shot, 
-        # especially if these are int / uint on 8, 16, 32, 64 bits
         if self.get_trans():
             return
         # truncate char if length automation is set
@@ -1811,13 +1960,89 @@ class Envelope(Element):
             char._len_bit = char._cur + self._blauto()
             if char._len_bit > char_lb:
                 raise(EltErr('{0} [_from_char]: bit length overflow'.format(self._name)))
-        #
-        for elt in self.__iter__():
-            elt._from_char(char)
-        #
-        # in case of length automation, set the original length back
-        if self._blauto is not None:
+            if char._view:
+                # view mode, decoding is postponed
+                self._set_view(char)
+                char._len_bit = char_lb
+                return
+            self._from_char_cont(char)
+            # in case of length automation, set the original length back
             char._len_bit = char_lb
+        else:
+            self._from_char_cont(char)
+    
+    def _from_char_cont(self, char, num=None):
+        plan = self.__class__.__dict__.get('_from_char_plan')
+        if plan is None:
+            plan = self._set_from_char_plan()
+        if plan:
+            self._from_char_planned(char, plan)
+        else:
+            for elt in self.__iter__():
+                elt._from_char(char)
+    
+    # Layout plan for _from_char(), computed once per class from its GEN:
+    # runs of contiguous fixed-length byte-aligned atoms (e.g. Uint8, Uint16,
+    # Uint32 or Buf with a fixed bl) are unpacked with a single struct call.
+    # Each run is a tuple (start index, stop index, Struct, length in bits, 
+    # atom classes, atom bl, conversion functions).
+    # At runtime, a run is only unpacked this way if the char cursor is aligned
+    # and all its atoms still have the same class and bl, without transparency
+    # nor bl or transparency automation, otherwise atoms are processed one by 
+    # one.
+    
+    def _set_from_char_plan(self):
+        cls, plan = self.__class__, []
+        if cls.__iter__ is Envelope.__iter__ and cls.__next__ is Envelope.__next__:
+            run = []
+            for ind, elt in enumerate(cls._GEN + (None, )):
+                if isinstance(elt, Atom) and elt._blauto is None \
+                and elt._transauto is None and not elt.get_trans() \
+                and not elt.DEFAULT_TRANS:
+                    fmt = elt._get_unpack_fmt()
+                else:
+                    fmt = None
+                if fmt is not None:
+                    run.append( (ind, elt, fmt) )
+                else:
+                    if len(run) > 1:
+                        plan.append( (run[0][0], ind,
+                                      Struct('>' + ''.join([r[2][0] for r in run])),
+                                      sum([r[1]._bl for r in run]),
+                                      tuple([r[1].__class__ for r in run]),
+                                      tuple([r[1]._bl for r in run]),
+                                      tuple([r[2][1] for r in run])) )
+                    run = []
+        plan = tuple(plan)
+        setattr(cls, '_from_char_plan', plan)
+        return plan
+    
+    def _from_char_planned(self, char, plan):
+        if char._concat:
+            char._pack()
+        content, ind = self._content, 0
+        sel_trans = self.ENV_SEL_TRANS
+        for start, stop, struct, bl, classes, bls, convs in plan:
+            while ind < start and ind < len(content):
+                elt = content[ind]
+                if sel_trans or not elt.get_trans():
+                    elt._from_char(char)
+                ind += 1
+            cur = char._cur
+            if cur % 8 == 0 and cur + bl <= char._len_bit and stop <= len(content) \
+            and all([elt.__class__ is cl and elt._bl == bl_elt and elt._blauto is None \
+                     and elt._transauto is None and not elt._trans \
+                     for elt, cl, bl_elt in zip(content[start:stop], classes, bls)]):
+                vals = struct.unpack_from(char._buf, cur>>3)
+                for elt, val, conv in zip(content[start:stop], vals, convs):
+                    elt._val = val if conv is None else conv(val)
+                char._cur += bl
+                ind = stop
+        while ind < len(content):
+            elt = content[ind]
+            if sel_trans or not elt.get_trans():
+                elt._from_char(char)
+            ind += 1
     
     #--------------------------------------------------------------------------#
     # copy / cloning routines
@@ -2110,6 +2335,9 @@ class Envelope(Element):
         self._by_name.clear()
     
     def __iter__(self):
+        if self._pending():
+            # decoding iterates over the content too, do it beforehand
+            self._load_view()
         self._it_saved.append(self._it)
         self._it = 0
         return self
@@ -2335,6 +2563,8 @@ class Array(Element):
     _blauto    = None
     _GEN       = Atom()
     
+    _VIEW_ATTRS = ('_val', )
+    
     __attrs__ = ('_env',
                  '_name',
                  '_desc',
@@ -2636,6 +2866,8 @@ class Array(Element):
         """
         if self.get_trans():
             return 0
+        elif self._pending():
+            return self._view[2]
         else:
             ret = []
             for v in self._val:
@@ -2670,6 +2902,8 @@ class Array(Element):
         """Produces a list of tuple ready to be packed with pack_val() from the
         array's values through the template
         """
+        if self._pending() and not self.get_trans():
+            return self._view_to_pack()
         if not self.get_trans():
             if self._SAFE_STAT and self._num is not None and len(self._val) != self._num:
                 raise(EltErr('{0} [_to_pack] invalid number of values: {1} instead of {2}'\
@@ -2686,6 +2920,26 @@ class Array(Element):
         else:
             return []
     
+    def _to_writer(self, w):
+        """Writes the array's values directly into the BitWriter instance `w'
+        through the template
+        """
+        if self.get_trans():
+            return
+        elif self._pending():
+            w.extend(self._view_to_pack())
+            return
+        if self._SAFE_STAT and self._num is not None and len(self._val) != self._num:
+            raise(EltErr('{0} [_to_writer] invalid number of values: {1} instead of {2}'\
+                  .format(self._name, len(self._val), self._num)))
+        for v in self._val:
+            if v == self._tmpl_val:
+                w.extend(self._tmpl_pack)
+            else:
+                self._tmpl.set_val(v)
+                self._tmpl._to_writer(w)
+        self._tmpl.set_val(None)
+    
     def _from_char(self, char):
         """Dispatch the consumption of a Charpy intance to the values within the
         array through the template
@@ -2710,6 +2964,18 @@ class Array(Element):
             char._len_bit = char._cur + self._blauto()
             if char._len_bit > char_lb:
                 raise(EltErr('{0} [_from_char]: bit length overflow'.format(self._name)))
+            if char._view:
+                # view mode, decoding is postponed
+                self._set_view(char, num)
+                char._len_bit = char_lb
+                return
+            self._from_char_cont(char, num)
+            # 5) in case of length automation, set the original length back
+            char._len_bit = char_lb
+        else:
+            self._from_char_cont(char, num)
+    
+    def _from_char_cont(self, char, num=None):
         # 3) init value
         self._val = []
         # 4) consume char and fill in self._val
@@ -2731,9 +2997,6 @@ class Array(Element):
                 else:
                     self._val.append(self._tmpl())
         self._tmpl.set_val(None)
-        # 5) in case of length automation, set the original length back
-        if self._blauto is not None:
-            char._len_bit = char_lb
     
     #--------------------------------------------------------------------------#
     # copy / cloning routines
@@ -3235,6 +3498,8 @@ class Sequence(Element):
     _blauto    = None
     _GEN       = Atom()
     
+    _VIEW_ATTRS = ('_content', )
+    
     __attrs__ = ('_env',
                  '_name',
                  '_desc',
@@ -3560,6 +3825,8 @@ class Sequence(Element):
         """
         if self.get_trans():
             return 0
+        elif self._pending():
+            return self._view[2]
         else:
             return sum([elt.get_bl() for elt in self._content])
     
@@ -3588,6 +3855,8 @@ class Sequence(Element):
         """Produces a list of tuple ready to be packed with pack_val() from the
         sequence's content
         """
+        if self._pending() and not self.get_trans():
+            return self._view_to_pack()
         if not self.get_trans():
             if self._SAFE_STAT and self._num is not None and len(self._content) != self._num:
                 raise(EltErr('{0} [_to_pack]: invalid number of repeated content: {1} instead of {2}'\
@@ -3598,6 +3867,21 @@ class Sequence(Element):
         else:
             return []
     
+    def _to_writer(self, w):
+        """Writes the sequence's content directly into the BitWriter instance 
+        `w'
+        """
+        if self.get_trans():
+            return
+        elif self._pending():
+            w.extend(self._view_to_pack())
+            return
+        if self._SAFE_STAT and self._num is not None and len(self._content) != self._num:
+            raise(EltErr('{0} [_to_writer]: invalid number of repeated content: {1} instead of {2}'\
+                  .format(self._name, len(self._content), self._num)))
+        for elt in self._content:
+            elt._to_writer(w)
+    
     def _from_char(self, char):
         """Dispatch the consumption of a Charpy intance to the elements within
         the sequence's content
@@ -3622,6 +3906,18 @@ class Sequence(Element):
             char._len_bit = char._cur + self._blauto()
             if char._len_bit > char_lb:
                 raise(EltErr('{0} [_from_char]: bit length overflow'.format(self._name)))
+            if char._view:
+                # view mode, decoding is postponed
+                self._set_view(char, num)
+                char._len_bit = char_lb
+                return
+            self._from_char_cont(char, num)
+            # 5) in case of length automation, set the original length back
+            char._len_bit = char_lb
+        else:
+            self._from_char_cont(char, num)
+    
+    def _from_char_cont(self, char, num=None):
         # 3) init content
         self._content = []
         # 4) consume char and fill in self._content
@@ -3646,9 +3942,6 @@ class Sequence(Element):
                     break
                 else:
                     self._content.append(clone)
-        # 5) in case of length automation, set the original length back
-        if self._blauto is not None:
-            char._len_bit = char_lb
     
     #--------------------------------------------------------------------------#
     # copy / cloning routines
@@ -4440,6 +4733,13 @@ class Alt(Element):
         else:
             return []
     
+    def _to_writer(self, w):
+        """Writes the selected element's value directly into the BitWriter 
+        instance `w'
+        """
+        if not self.get_trans():
+            self.get_alt()._to_writer(w)
+    
     def _from_char(self, char):
         """Dispatch the consumption of a Charpy intance to the selected element 
         within the content
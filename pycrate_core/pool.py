@@ -0,0 +1,106 @@
+# -*- coding: UTF-8 -*-
+#/**
+# * Software Name : pycrate
+# * Version : 0.4
+# *
+# * This library is free software; you can redistribute it and/or
+# * modify it under the terms of the GNU Lesser General Public
+# * License as published by the Free Software Foundation; either
+# * version 2.1 of the License, or (at your option) any later version.
+# *
+# * This library is distributed in the hope that it will be useful,
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# * Lesser General Public License for more details.
+# *
+# * You should have received a copy of the GNU Lesser General Public
+# * License along with this library; if not, write to the Free Software
+# * Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# * MA 02110-1301  USA
+# *
+# *--------------------------------------------------------
+# * File Name : pycrate_core/pool.py
+# *--------------------------------------------------------
+#*/
+
+__all__ = ['EltPool']
+
+
+from threading import local
+
+
+#------------------------------------------------------------------------------#
+# pool of reusable Element instances
+#------------------------------------------------------------------------------#
+# Parsers (e.g. parse_GTPC(), parse_SCCP()) instantiate a new message for each
+# buffer, which clones the whole _GEN tree of the message class, before
+# decoding the buffer into it.
+#
+# Here, instances of message classes are kept once released, per thread and
+# per class, and handed back by the parsers for decoding the next buffers,
+# from_bytes() resetting all their content.
+#
+# Contract: an instance returned by a parser using a pool belongs to the caller
+# until it is released into the pool; afterwards, it can be overwritten at any
+# time by another parsing within the same thread, hence the caller must copy
+# out what it needs before (e.g. with get_val(), to_bytes() or clone()).
+
+class EltPool(object):
+    """per-thread pool of reusable Element instances, keyed by their class
+
+    init args:
+        size: int, max number of released instances kept per class and per
+            thread
+    """
+
+    def __init__(self, size=4):
+        self.size   = size
+        self._local = local()
+
+    def _get_free(self):
+        try:
+            return self._local.free
+        except AttributeError:
+            self._local.free = {}
+            return self._local.free
+
+    def get(self, Cls):
+        """returns an instance of the Element class `Cls', taken from the pool
+        of the current thread if available, or newly built otherwise
+        """
+        try:
+            return self._get_free()[Cls].pop()
+        except (KeyError, IndexError):
+            return Cls()
+
+    def release(self, *elts):
+        """releases the Element instances `elts' into the pool of the current
+        thread
+
+        Those instances must not be used anymore by the caller.
+        Instances tainted by their parser (because their structure was modified,
+        e.g. by replacing a container with its decoded content) are dropped.
+        """
+        free = self._get_free()
+        for elt in elts:
+            if elt is None:
+                continue
+            elif getattr(elt, '_pool_taint', False):
+                continue
+            Cls = elt.__class__
+            if Cls in free:
+                if len(free[Cls]) < self.size:
+                    free[Cls].append(elt)
+            else:
+                free[Cls] = [elt]
+
+    def taint(self, elt):
+        """marks the Element instance `elt' as not reusable, as its structure
+        has been modified after its instantiation
+        """
+        elt._pool_taint = True
+
+    def clear(self):
+        """drops all instances from the pool of the current thread
+        """
+        self._get_free().clear()
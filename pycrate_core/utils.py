@@ -28,7 +28,7 @@
 #*/
 
 import sys
-from struct    import pack, unpack
+from struct    import pack, unpack, Struct
 from functools import reduce, partial
 
 # configure max recursion
@@ -2511,3 +2511,263 @@ def pack_val(*val):
     # 7) return the length in bits and bytes buffer
     return b''.join(concat), len_bit
 
+
+#------------------------------------------------------------------------------#
+# linear bit writer
+#------------------------------------------------------------------------------#
+# pack_val() requires the whole list of (type, val, bitlen) tuples to be built
+# beforehand, and then concatenates and re-shifts unaligned chunks of bytes
+#
+# BitWriter is an alternative to it: values are written one after the other
+# into a single bytearray, sub-byte fields being gathered into an accumulator
+# integer which gets flushed to the bytearray once it holds enough bits.
+# Elements and compiled encoders can then write their values into it directly,
+# without building intermediate lists of tuples.
+# It produces exactly the same result as pack_val(), including the handling
+# of overflowing values
+
+_BW_UINT = {
+    8 : Struct('>B').pack,
+    16: Struct('>H').pack,
+    32: Struct('>I').pack,
+    64: Struct('>Q').pack
+    }
+_BW_INT = {
+    8 : Struct('>b').pack,
+    16: Struct('>h').pack,
+    32: Struct('>i').pack,
+    64: Struct('>q').pack
+    }
+_BW_UINT_LE = {
+    8 : Struct('<B').pack,
+    16: Struct('<H').pack,
+    32: Struct('<I').pack,
+    64: Struct('<Q').pack
+    }
+_BW_INT_LE = {
+    8 : Struct('<b').pack,
+    16: Struct('<h').pack,
+    32: Struct('<i').pack,
+    64: Struct('<q').pack
+    }
+
+# number of bits in the accumulator before it gets flushed to the bytearray
+_BW_ACC_MAX = 64
+
+
+class BitWriter(object):
+    """Linear bit writer, concatenating heterogenous bytes buffer and (un)signed 
+    integers, all with a given length in bits, into a single bytes buffer
+    
+    Values are written in order with the write_*() methods, or with write() /
+    extend() from (type, value, bitlen) tuples as used by pack_val().
+    A writer can be reused after calling reset().
+    
+    Example:
+        w = BitWriter()
+        w.write_bytes(b'AAAA\xC0', 34)
+        w.write_uint(2500, 32)
+        w.extend( [(TYPE_INT, -1, 8), (TYPE_UINT, 1, 2)] )
+        w.get()
+            -> (b'AAAA\xc0\x00\x02q?\xd0', 76)
+    """
+    
+    __slots__ = ('_buf', '_acc', '_accl')
+    
+    def __init__(self):
+        # bytearray of whole bytes already written
+        self._buf  = bytearray()
+        # pending bits, and their number
+        self._acc  = 0
+        self._accl = 0
+    
+    def reset(self):
+        """Clear all the values written
+        """
+        del self._buf[:]
+        self._acc, self._accl = 0, 0
+    
+    def len_bit(self):
+        """Returns the number of bits written
+        """
+        return (len(self._buf)<<3) + self._accl
+    
+    def _flush(self):
+        # move all whole bytes from the accumulator to the bytearray
+        n = self._accl >> 3
+        if n:
+            r = self._accl & 7
+            self._buf += int(self._acc >> r).to_bytes(n, 'big')
+            self._acc &= (1<<r)-1
+            self._accl = r
+    
+    def _push(self, u, bl):
+        # append the unsigned integer u of length bl to the accumulator
+        acc  = (self._acc << bl) | u
+        accl = self._accl + bl
+        if accl >= _BW_ACC_MAX:
+            r = accl & 7
+            self._buf += int(acc >> r).to_bytes(accl>>3, 'big')
+            acc &= (1<<r)-1
+            accl = r
+        self._acc, self._accl = acc, accl
+    
+    def _write_buf(self, buf, bl):
+        # append the whole bytes buffer buf of length bl
+        if not self._accl & 7:
+            if self._accl:
+                self._flush()
+            self._buf += buf
+        else:
+            self._push(int.from_bytes(buf, 'big'), bl)
+    
+    def write_uint(self, val, bl):
+        """Write the unsigned integer val over bl bits
+        
+        for 8, 16, 32 and 64 bits, val must fit in bl bits, otherwise
+        struct.error is raised ;
+        for other lengths, val is saturated when the writer is byte-aligned,
+        and truncated otherwise (as with pack_val())
+        """
+        if bl in _BW_UINT:
+            buf = _BW_UINT[bl](val)
+            if not self._accl & 7:
+                if self._accl:
+                    self._flush()
+                self._buf += buf
+                return
+        elif not bl:
+            return
+        elif not self._accl & 7:
+            if val >= 1<<bl:
+                val = (1<<bl)-1
+        else:
+            val &= (1<<bl)-1
+        self._push(val, bl)
+    
+    def write_int(self, val, bl):
+        """Write the signed integer val over bl bits, in 2's complement
+        
+        for 8, 16, 32 and 64 bits, val must fit in bl bits, otherwise
+        struct.error is raised
+        """
+        if bl in _BW_INT:
+            buf = _BW_INT[bl](val)
+            if not self._accl & 7:
+                if self._accl:
+                    self._flush()
+                self._buf += buf
+                return
+            val &= (1<<bl)-1
+        elif not bl:
+            return
+        elif val >= 0:
+            val &= (1<<bl-1)-1
+        else:
+            val += 1<<bl
+            if val < 1<<(bl-1):
+                val = 1<<(bl-1)
+        self._push(val, bl)
+    
+    def write_uint_le(self, val, bl):
+        """Write the unsigned integer val over bl bits in little endian,
+        bl must be a multiple of 8
+        """
+        if bl in _BW_UINT_LE:
+            self._write_buf(_BW_UINT_LE[bl](val), bl)
+        elif bl:
+            self._write_buf(uint_le_to_bytes(val, bl), bl)
+    
+    def write_int_le(self, val, bl):
+        """Write the signed integer val over bl bits in little endian,
+        in 2's complement, bl must be a multiple of 8
+        """
+        if bl in _BW_INT_LE:
+            self._write_buf(_BW_INT_LE[bl](val), bl)
+        elif bl:
+            if val >= 0:
+                val &= (1<<bl-1)-1
+            else:
+                val += 1<<bl
+                if val < 1<<(bl-1):
+                    val = 1<<(bl-1)
+            self._write_buf(uint_le_to_bytes(val, bl), bl)
+    
+    def write_bytes(self, buf, bl):
+        """Write the bl leftmost bits of the bytes buffer buf, zero-padded if
+        shorter than bl
+        """
+        if not bl:
+            return
+        n, r = bl>>3, bl&7
+        if len(buf) < n + (r > 0):
+            # buffer shorter than bl, zero-padded like pack_val()
+            buf = buf + bytes(n + (r > 0) - len(buf))
+        if not self._accl & 7:
+            if self._accl:
+                self._flush()
+            if r:
+                self._buf += buf[:n]
+                # remaining bits go to the accumulator
+                self._acc, self._accl = buf[n] >> (8-r), r
+            elif len(buf) == n:
+                self._buf += buf
+            else:
+                self._buf += buf[:n]
+        elif r:
+            self._push(int.from_bytes(buf[:n+1], 'big') >> (8-r), bl)
+        else:
+            self._push(int.from_bytes(buf[:n], 'big'), bl)
+    
+    def write(self, typ, val, bl):
+        """Write the value val of type typ over bl bits
+        
+        typ must be TYPE_BYTES, TYPE_UINT, TYPE_UINT_LE, TYPE_INT or TYPE_INT_LE
+        """
+        if typ == TYPE_UINT:
+            self.write_uint(val, bl)
+        elif typ == TYPE_BYTES:
+            self.write_bytes(val, bl)
+        elif typ == TYPE_INT:
+            self.write_int(val, bl)
+        elif typ == TYPE_UINT_LE:
+            self.write_uint_le(val, bl)
+        elif typ == TYPE_INT_LE:
+            self.write_int_le(val, bl)
+        else:
+            raise(PycrateErr('invalid type for packing: {0}'.format(typ)))
+    
+    def append(self, v):
+        """Write a single (type, val, bitlen) tuple
+        """
+        self.write(*v)
+    
+    def extend(self, vals):
+        """Write an iterable of (type, val, bitlen) tuples
+        """
+        write_uint, write_bytes, write = self.write_uint, self.write_bytes, self.write
+        for typ, val, bl in vals:
+            if typ == TYPE_UINT:
+                write_uint(val, bl)
+            elif typ == TYPE_BYTES:
+                write_bytes(val, bl)
+            else:
+                write(typ, val, bl)
+    
+    def get(self):
+        """Returns the bytes buffer written, the last byte being padded with 
+        null bits, and its length in bits, like pack_val()
+        """
+        self._flush()
+        if self._accl:
+            return bytes(self._buf) + bchr(self._acc << (8-self._accl)), \
+                   (len(self._buf)<<3) + self._accl
+        else:
+            return bytes(self._buf), len(self._buf)<<3
+    
+    def to_bytes(self):
+        """Returns the bytes buffer written, the last byte being padded with 
+        null bits
+        """
+        return self.get()[0]
+
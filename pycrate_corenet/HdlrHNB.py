@@ -292,20 +292,16 @@ class HNBd(SigStack):
     
     def _encode_ranap_pdu(self, pdus):
         ret = []
-        if not asn_ranap_acquire():
-            self._log('ERR', 'unable to acquire the RANAP module')
-            return ret
         for pdu in pdus:
             try:
-                PDU_RANAP.set_val(pdu)
+                buf = PDU_RANAP.encode(pdu)
             except Exception as err:
                 self._log('ERR', 'unable to set the RANAP pdu value')
                 self._errpdu = pdu
             else:
                 if self.TRACE_ASN_RANAP:
-                    self._log('TRACE_ASN_RANAP_DL', '\n' + PDU_RANAP.to_asn1())
-                ret.append( PDU_RANAP.to_aper() )
-        asn_ranap_release()
+                    self._log('TRACE_ASN_RANAP_DL', '\n' + PDU_RANAP.get_local().to_asn1())
+                ret.append( buf )
         return ret
     
     def process_ranap(self, buf):
@@ -313,13 +309,9 @@ class HNBd(SigStack):
         and return a list of RANAP PDU buffer(s) to be sent back to it
         """
         # decode the RANAP PDU
-        if not asn_ranap_acquire():
-            self._log('ERR', 'unable to acquire the RANAP module')
-            return []
         try:
-            PDU_RANAP.from_aper(buf)
+            pdu_rx = PDU_RANAP.decode(buf)
         except Exception:
-            asn_ranap_release()
             self._log('WNG', 'invalid RANAP PDU transfer-syntax: %s'\
                       % hexlify(buf).decode('ascii'))
             # error cause: protocol, transfer-syntax-error
@@ -329,9 +321,7 @@ class HNBd(SigStack):
             return self._encode_ranap_pdu(Proc.send())
         #
         if self.TRACE_ASN_RANAP:
-            self._log('TRACE_ASN_RANAP_UL', '\n' + PDU_RANAP.to_asn1())
-        pdu_rx = PDU_RANAP()
-        asn_ranap_release()
+            self._log('TRACE_ASN_RANAP_UL', '\n' + PDU_RANAP.get_local().to_asn1())
         #
         errcause = None
         if pdu_rx[0] == 'initiatingMessage':
@@ -132,6 +132,7 @@ class EMMSigProc(NASSigProc):
     
     def abort(self):
         # abort this procedure, and all procedures started within this one
+        self.stop_timer()
         ind = self.EMM.Proc.index(self)
         if ind >= 0:
             for p in self.EMM.Proc[ind+1:]:
@@ -144,6 +145,7 @@ class EMMSigProc(NASSigProc):
     
     def rm_from_emm_stack(self):
         # remove the procedure from the EMM stack of procedures
+        self.stop_timer()
         try:
             if self.EMM.Proc[-1] == self:
                 del self.EMM.Proc[-1]
@@ -159,6 +161,7 @@ class EMMSigProc(NASSigProc):
             self.TimerValue = getattr(self.EMM, self.Timer, self.TimerDefault)
             self.TimerStart = time()
             self.TimerStop  = self.TimerStart + self.TimerValue
+            self.start_timer(self.EMM.Proc)
     
     def get_timer(self):
         if self.Timer is None:
@@ -130,6 +130,7 @@ class FGMMSigProc(NASSigProc):
     
     def abort(self):
         # abort this procedure, and all procedures started within this one
+        self.stop_timer()
         ind = self.FGMM.Proc.index(self)
         if ind >= 0:
             for p in self.FGMM.Proc[ind+1:]:
@@ -142,6 +143,7 @@ class FGMMSigProc(NASSigProc):
     
     def rm_from_fgmm_stack(self):
         # remove the procedure from the FGMM stack of procedures
+        self.stop_timer()
         try:
             if self.FGMM.Proc[-1] == self:
                 del self.FGMM.Proc[-1]
@@ -157,6 +159,7 @@ class FGMMSigProc(NASSigProc):
             self.TimerValue = getattr(self.FGMM, self.Timer, self.TimerDefault)
             self.TimerStart = time()
             self.TimerStop  = self.TimerStart + self.TimerValue
+            self.start_timer(self.FGMM.Proc)
     
     def get_timer(self):
         if self.Timer is None:
@@ -120,6 +120,7 @@ class GMMSigProc(NASSigProc):
     
     def abort(self):
         # abort this procedure, and all procedures started within this one
+        self.stop_timer()
         ind = self.GMM.Proc.index(self)
         if ind >= 0:
             for p in self.GMM.Proc[ind+1:]:
@@ -132,6 +133,7 @@ class GMMSigProc(NASSigProc):
     
     def rm_from_gmm_stack(self):
         # remove the procedure from the GMM stack of procedures
+        self.stop_timer()
         try:
             if self.GMM.Proc[-1] == self:
                 del self.GMM.Proc[-1]
@@ -147,6 +149,7 @@ class GMMSigProc(NASSigProc):
             self.TimerValue = getattr(self.GMM, self.Timer, self.TimerDefault)
             self.TimerStart = time()
             self.TimerStop  = self.TimerStart + self.TimerValue
+            self.start_timer(self.GMM.Proc)
     
     def get_timer(self):
         if self.Timer is None:
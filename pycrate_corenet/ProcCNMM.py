@@ -124,6 +124,7 @@ class MMSigProc(NASSigProc):
     
     def abort(self):
         # abort this procedure, and all procedures started within this one
+        self.stop_timer()
         ind = self.MM.Proc.index(self)
         if ind >= 0:
             for p in self.MM.Proc[ind+1:]:
@@ -136,6 +137,7 @@ class MMSigProc(NASSigProc):
     
     def rm_from_mm_stack(self):
         # remove the procedure from the MM stack of procedures
+        self.stop_timer()
         try:
             if self.MM.Proc[-1] == self:
                 del self.MM.Proc[-1]
@@ -151,6 +153,7 @@ class MMSigProc(NASSigProc):
             self.TimerValue = getattr(self.MM, self.Timer, self.TimerDefault)
             self.TimerStart = time()
             self.TimerStop  = self.TimerStart + self.TimerValue
+            self.start_timer(self.MM.Proc)
     
     def get_timer(self):
         if self.Timer is None:
@@ -47,6 +47,7 @@ class CMSMSProc(NASSigProc):
     instance attributes:
         - Name : procedure name
         - SMS  : reference to the UESMSd instance running this procedure
+        - UE   : reference to the UEd instance connecting the UE
         - RAN  : reference to the UEIuCSd or UES1d instance connecting the UE
         - Cont : 2-tuple of CN-initiated CP message(s) and UE-initiated CP 
                  message(s)
@@ -65,6 +66,7 @@ class CMSMSProc(NASSigProc):
     def __init__(self, smsd, tid=None, cpud=None):
         self._prepare()
         self.SMS = smsd
+        self.UE  = smsd.UE
         self.RAN = smsd.RAN
         self.TID = tid
         if tid is not None:
@@ -81,6 +83,7 @@ class CMSMSProc(NASSigProc):
         self._log('INF', 'aborting')
     
     def rm_from_sms_stack(self):
+        self.stop_timer()
         try:
             del self.SMS.Proc[self.TID]
         except Exception:
@@ -91,6 +94,7 @@ class CMSMSProc(NASSigProc):
             self.TimerValue = getattr(self.SMS, self.Timer, self.TimerDefault)
             self.TimerStart = time()
             self.TimerStop  = self.TimerStart + self.TimerValue
+            self.start_timer(self.SMS.Proc)
     
     def get_timer(self):
         if self.Timer is None:
@@ -726,3 +726,32 @@ class NASSigProc(SigProc):
         """
         pass
 
+    
+    #--------------------------------------------------------------------------#
+    # timer handling
+    #--------------------------------------------------------------------------#
+    
+    def _get_timers(self):
+        # server ProcTimers instance, None when not attached to a server
+        # (e.g. TESTING mode)
+        UE = getattr(self, 'UE', None)
+        if UE is not None and UE.Server is not None:
+            return getattr(UE.Server, 'ProcTimers', None)
+        else:
+            return None
+    
+    def start_timer(self, stack):
+        """register the procedure timer to the server, the procedure being
+        aborted if still within `stack' when its timer expires
+        """
+        Timers = self._get_timers()
+        if Timers is not None:
+            Timers.start(self, self.TimerStop, stack)
+    
+    def stop_timer(self):
+        """unregister the procedure timer from the server
+        """
+        if hasattr(self, 'TimerStop'):
+            Timers = self._get_timers()
+            if Timers is not None:
+                Timers.cancel(self)
@@ -40,6 +40,9 @@
 # and connects them to specific service handler (SMS, GTPU, ...)
 #------------------------------------------------------------------------------#
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from .utils      import *
 from .HdlrHNB    import HNBd
 from .HdlrENB    import ENBd
@@ -58,6 +61,12 @@ from .ProcCNNgap    import NGAPErrorIndNonUECN
 DEBUG_SK = False
 
 
+def _set_ready(fut):
+    # asyncio reader callback, for awaiting a socket to be readable
+    if not fut.done():
+        fut.set_result(None)
+
+
 class CorenetServer(object):
     """Complete control-plane and user-plane server to handle:
     - Home-NodeB, over HNBAP and RUA / RANAP
@@ -118,11 +127,33 @@ class CorenetServer(object):
     # This is the timeout on the main select() loop.
     SCHED_RES = 0.1
     # This is the resolution (in sec) for the Server to start a thread that 
-    # checks the list of registered UE, and checks for ongoing NAS procedures 
-    # potentially in timeout.
+    # checks for ongoing NAS procedures in timeout, according to the timers 
+    # registered into ProcTimers.
     # If set to 0, no check is made (so, NAS procedures can stall)
     # It is useless to make it lower than the SCHED_RES.
     SCHED_UE_TO = 0.5
+    #
+    # Server event loop:
+    # If False, the server runs a select() loop over its SCTP sockets, and GTPUd
+    # and ARPd run their own select() loop in background threads.
+    # If True, the server runs an asyncio event loop, where each listening SCTP 
+    # socket and each SCTP association is served by a coroutine, GTPUd and ARPd
+    # sockets are served by loop readers, and NAS procedures timers are loop
+    # callbacks (SCHED_RES and SCHED_UE_TO are not used).
+    # The processing of RAN PDUs and NAS procedures timeouts is offloaded to a
+    # pool of SERVER_ASYNC_WORKERS worker threads.
+    SERVER_ASYNC = False
+    #
+    # Number of worker threads when SERVER_ASYNC is True:
+    # the PDUs of a given SCTP association are always processed one after the
+    # other, and ASN.1 PDUs are encoded / decoded into per-thread copies; hence
+    # several workers can process PDUs from distinct RAN associations in 
+    # parallel. However, RAN and UE contexts and their NAS procedures are not
+    # protected by locks (as with the select() loop, which processes all RAN
+    # PDUs in a single thread): keep a single worker when UEs can signal 
+    # through several RAN nodes at once (e.g. handovers, paging over several 
+    # eNBs).
+    SERVER_ASYNC_WORKERS = 1
     
     #--------------------------------------------------------------------------#
     # corenet service handlers
@@ -411,6 +442,8 @@ class CorenetServer(object):
         # init the UE procedure cleaner holder
         # (with a dummy thread, which will be overridden at runtime)
         self._clean_ue_proc = threadit( lambda: 1 )
+        # init the heap of NAS procedures timers
+        self.ProcTimers = ProcTimers()
         #
         # clear LAI, RAI, TAI dict
         self.LAI.clear()
@@ -424,14 +457,17 @@ class CorenetServer(object):
         if self.AUCd:
             self.AUCd  = self.__class__.AUCd()
         if self.GTPUd:
-            self.GTPUd = self.__class__.GTPUd()
+            self.GTPUd = self.__class__.GTPUd(threaded=not self.SERVER_ASYNC)
         if self.SMSd:
             self.SMSd  = self.__class__.SMSd()
             self.SMSd.Server = self
         #
         if serving:
             # serve connections
-            self._serve()
+            if self.SERVER_ASYNC:
+                self._serve_async()
+            else:
+                self._serve()
             # self._running has been set to False, main loop exited
             self._log('INF', 'SCTP server stopped')
     
@@ -507,14 +543,119 @@ class CorenetServer(object):
                 self._clean_ue_proc = threadit(self.clean_ue_proc)
                 T0 = time()
     
+    #--------------------------------------------------------------------------#
+    # asyncio event loop
+    #--------------------------------------------------------------------------#
+    
+    _loop = None
+    
+    def _serve_async(self):
+        # Main server loop, using asyncio (see SERVER_ASYNC)
+        self._loop      = asyncio.new_event_loop()
+        self._executor  = ThreadPoolExecutor(max_workers=self.SERVER_ASYNC_WORKERS)
+        self._astopped  = Event()
+        try:
+            self._loop.run_until_complete(self._aserve())
+        finally:
+            self._executor.shutdown(wait=True)
+            self._loop.close()
+            self._loop = None
+            self._astopped.set()
+    
+    async def _aserve(self):
+        loop = asyncio.get_running_loop()
+        self._running = True
+        self._astop   = asyncio.Event()
+        # SCTP sockets served, {socket: task}
+        self._atasks  = {}
+        # loop callback for NAS procedures timers, and its expiry time
+        self._atimer, self._atimer_stop = None, None
+        #
+        for sk, handler in ((self._sk_gnb, self.handle_new_gnb),
+                            (self._sk_enb, self.handle_new_enb),
+                            (self._sk_hnb, self.handle_new_hnb)):
+            if sk is not None:
+                self._aserve_spawn(sk, handler)
+        if self.GTPUd:
+            self.GTPUd.add_readers(loop)
+        if self.SCHED_UE_TO:
+            self.ProcTimers.notify = lambda: loop.call_soon_threadsafe(self._arm_proc_timers)
+            self._arm_proc_timers()
+        #
+        await self._astop.wait()
+        #
+        self.ProcTimers.notify = None
+        if self._atimer is not None:
+            self._atimer.cancel()
+        if self.GTPUd:
+            self.GTPUd.remove_readers()
+        tasks = tuple(self._atasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _aserve_spawn(self, sk, handler, *args):
+        self._atasks[sk] = asyncio.get_running_loop().create_task(
+                            self._aserve_sk(sk, handler, *args))
+    
+    async def _aserve_sk(self, sk, handler, *args):
+        # coroutine serving a listening SCTP socket (handler being one of the 
+        # handle_new_*() method) or an SCTP association (handler being 
+        # handle_stream_msg())
+        loop, fd = asyncio.get_running_loop(), sk.fileno()
+        try:
+            while self._running:
+                ready = loop.create_future()
+                loop.add_reader(fd, _set_ready, ready)
+                try:
+                    await ready
+                finally:
+                    loop.remove_reader(fd)
+                try:
+                    await loop.run_in_executor(self._executor, handler, *args)
+                except Exception as err:
+                    self._log('ERR', '%s() error: %r' % (handler.__name__, err))
+                if args:
+                    if sk not in self.SCTPCli:
+                        # SCTP association closed
+                        break
+                else:
+                    # serve new SCTP associations
+                    for cli in tuple(self.SCTPCli):
+                        if cli not in self._atasks:
+                            self._aserve_spawn(cli, self.handle_stream_msg, cli)
+        finally:
+            if self._atasks.get(sk) is asyncio.current_task():
+                del self._atasks[sk]
+    
+    def _arm_proc_timers(self):
+        # (re)schedule the loop callback for the next NAS procedure timer to 
+        # expire
+        stop = self.ProcTimers.next_stop()
+        if self._atimer is not None:
+            if stop is not None and stop >= self._atimer_stop:
+                # callback already scheduled before this timer expires
+                return
+            self._atimer.cancel()
+            self._atimer = None
+        if stop is not None:
+            self._atimer_stop = stop
+            self._atimer = self._loop.call_later(max(0, stop - time()),
+                                                 self._on_proc_timers)
+    
+    def _on_proc_timers(self):
+        self._atimer = None
+        fut = self._loop.run_in_executor(self._executor, self.clean_ue_proc)
+        fut.add_done_callback(lambda f: self._arm_proc_timers())
+    
     def stop(self):
         self._running = False
-        asn_ngap_release()
-        asn_s1ap_release()
-        asn_hnbap_release()
-        asn_rua_release()
-        asn_ranap_release()
-        sleep(self.SCHED_RES + 0.01)
+        if self._loop is not None:
+            # stop the asyncio event loop
+            self._loop.call_soon_threadsafe(self._astop.set)
+            self._astopped.wait(1)
+        else:
+            sleep(self.SCHED_RES + 0.01)
         if self._sk_hnb is not None:
             self._sk_hnb.close()
         if self._sk_enb is not None:
@@ -649,13 +790,9 @@ class CorenetServer(object):
         if ppid == SCTP_PPID_HNBAP:
             assert( isinstance(ran, HNBd) )
             hnb = ran
-            if not asn_hnbap_acquire():
-                hnb._log('ERR', 'unable to acquire the HNBAP module')
-                return
             try:
-                PDU_HNBAP.from_aper(buf)
+                pdu_rx = PDU_HNBAP.decode(buf)
             except Exception:
-                asn_hnbap_release()
                 hnb._log('WNG', 'invalid HNBAP PDU transfer-syntax: %s'\
                          % hexlify(buf).decode('ascii'))
                 Err = hnb.init_hnbap_proc(HNBAPErrorIndGW,
@@ -663,10 +800,8 @@ class CorenetServer(object):
                 Err.recv(buf)
                 pdu_tx = Err.send()
             else:
-                pdu_rx = PDU_HNBAP()
                 if hnb.TRACE_ASN_HNBAP:
-                    hnb._log('TRACE_ASN_HNBAP_UL', PDU_HNBAP.to_asn1())
-                asn_hnbap_release()
+                    hnb._log('TRACE_ASN_HNBAP_UL', PDU_HNBAP.get_local().to_asn1())
                 if not isinstance(pdu_rx[1], dict):
                     # invalid PDU, undefined extension
                     hnb._log('WNG', 'invalid HNBAP PDU transfer-syntax: %s'\
@@ -683,13 +818,9 @@ class CorenetServer(object):
         elif ppid == SCTP_PPID_RUA:
             assert( isinstance(ran, HNBd) )
             hnb = ran
-            if not asn_rua_acquire():
-                hnb._log('ERR', 'unable to acquire the RUA module')
-                return
             try:
-                PDU_RUA.from_aper(buf)
+                pdu_rx = PDU_RUA.decode(buf)
             except Exception:
-                asn_rua_release()
                 self._log('WNG', 'invalid RUA PDU transfer-syntax: %s'\
                           % hexlify(buf).decode('ascii'))
                 Err = hnb.init_rua_proc(RUAErrorInd,
@@ -697,10 +828,8 @@ class CorenetServer(object):
                 Err.recv(buf)
                 pdu_tx = Err.send()
             else:
-                pdu_rx = PDU_RUA()
                 if hnb.TRACE_ASN_RUA:
-                    hnb._log('TRACE_ASN_RUA_UL', PDU_HNBAP.to_asn1())
-                asn_rua_release()
+                    hnb._log('TRACE_ASN_RUA_UL', PDU_RUA.get_local().to_asn1())
                 if not isinstance(pdu_rx[1], dict):
                     # invalid PDU, undefined extension
                     self._log('WNG', 'invalid RUA PDU transfer-syntax: %s'\
@@ -717,13 +846,9 @@ class CorenetServer(object):
         elif ppid == SCTP_PPID_S1AP:
             assert( isinstance(ran, ENBd) )
             enb = ran
-            if not asn_s1ap_acquire():
-                enb._log('ERR', 'unable to acquire the S1AP module')
-                return
             try:
-                PDU_S1AP.from_aper(buf)
+                pdu_rx = PDU_S1AP.decode(buf)
             except Exception:
-                asn_s1ap_release()
                 enb._log('WNG', 'invalid S1AP PDU transfer-syntax: %s'\
                          % hexlify(buf).decode('ascii'))
                 Err = enb.init_s1ap_proc(S1APErrorIndNonUECN,
@@ -731,10 +856,8 @@ class CorenetServer(object):
                 Err.recv(buf)
                 pdu_tx = Err.send()
             else:
-                pdu_rx = PDU_S1AP()
                 if enb.TRACE_ASN_S1AP:
-                    enb._log('TRACE_ASN_S1AP_UL', PDU_S1AP.to_asn1())
-                asn_s1ap_release()
+                    enb._log('TRACE_ASN_S1AP_UL', PDU_S1AP.get_local().to_asn1())
                 if not isinstance(pdu_rx[1], dict):
                     # invalid PDU, undefined extension
                     enb._log('WNG', 'invalid S1AP PDU transfer-syntax: %s'\
@@ -756,13 +879,9 @@ class CorenetServer(object):
         elif ppid == SCTP_PPID_NGAP:
             assert( isinstance(ran, GNBd) )
             gnb = ran
-            if not asn_ngap_acquire():
-                gnb._log('ERR', 'unable to acquire the NGAP module')
-                return
             try:
-                PDU_NGAP.from_aper(buf)
+                pdu_rx = PDU_NGAP.decode(buf)
             except Exception:
-                asn_ngap_release()
                 gnb._log('WNG', 'invalid NGAP PDU transfer-syntax: %s'\
                          % hexlify(buf).decode('ascii'))
                 Err = gnb.init_ngap_proc(NGAPErrorIndNonUECN,
@@ -770,10 +889,8 @@ class CorenetServer(object):
                 Err.recv(buf)
                 pdu_tx = Err.send()
             else:
-                pdu_rx = PDU_NGAP()
                 if gnb.TRACE_ASN_NGAP:
-                    gnb._log('TRACE_ASN_NGAP_UL', PDU_NGAP.to_asn1())
-                asn_ngap_release()
+                    gnb._log('TRACE_ASN_NGAP_UL', PDU_NGAP.get_local().to_asn1())
                 if not isinstance(pdu_rx[1], dict):
                     # invalid PDU, undefined extension
                     gnb._log('WNG', 'invalid NGAP PDU transfer-syntax: %s'\
@@ -799,47 +916,27 @@ class CorenetServer(object):
             return
     
     def send_hnbap_pdu(self, hnb, pdu):
-        if not asn_hnbap_acquire():
-            hnb._log('ERR', 'unable to acquire the HNBAP module')
-            return
-        PDU_HNBAP.set_val(pdu)
+        buf = PDU_HNBAP.encode(pdu)
         if hnb.TRACE_ASN_HNBAP:
-            hnb._log('TRACE_ASN_HNBAP_DL', PDU_HNBAP.to_asn1())
-        buf = PDU_HNBAP.to_aper()
-        asn_hnbap_release()
+            hnb._log('TRACE_ASN_HNBAP_DL', PDU_HNBAP.get_local().to_asn1())
         return self._write_sk(hnb.SK, buf, ppid=SCTP_PPID_HNBAP)
     
     def send_rua_pdu(self, hnb, pdu):
-        if not asn_rua_acquire():
-            hnb._log('ERR', 'unable to acquire the RUA module')
-            return
-        PDU_RUA.set_val(pdu)
+        buf = PDU_RUA.encode(pdu)
         if hnb.TRACE_ASN_RUA:
-            hnb._log('TRACE_ASN_RUA_DL', PDU_RUA.to_asn1())
-        buf = PDU_RUA.to_aper()
-        asn_rua_release()
+            hnb._log('TRACE_ASN_RUA_DL', PDU_RUA.get_local().to_asn1())
         return self._write_sk(hnb.SK, buf, ppid=SCTP_PPID_RUA)
     
     def send_s1ap_pdu(self, enb, pdu, sid):
-        if not asn_s1ap_acquire():
-            enb._log('ERR', 'unable to acquire the S1AP module')
-            return
-        PDU_S1AP.set_val(pdu)
+        buf = PDU_S1AP.encode(pdu)
         if enb.TRACE_ASN_S1AP:
-            enb._log('TRACE_ASN_S1AP_DL', PDU_S1AP.to_asn1())
-        buf = PDU_S1AP.to_aper()
-        asn_s1ap_release()
+            enb._log('TRACE_ASN_S1AP_DL', PDU_S1AP.get_local().to_asn1())
         return self._write_sk(enb.SK, buf, ppid=SCTP_PPID_S1AP, stream=sid)
     
     def send_ngap_pdu(self, gnb, pdu, sid):
-        if not asn_ngap_acquire():
-            gnb._log('ERR', 'unable to acquire the NGAP module')
-            return
-        PDU_NGAP.set_val(pdu)
+        buf = PDU_NGAP.encode(pdu)
         if gnb.TRACE_ASN_NGAP:
-            gnb._log('TRACE_ASN_NGAP_DL', PDU_NGAP.to_asn1())
-        buf = PDU_NGAP.to_aper()
-        asn_ngap_release()
+            gnb._log('TRACE_ASN_NGAP_DL', PDU_NGAP.get_local().to_asn1())
         return self._write_sk(gnb.SK, buf, ppid=SCTP_PPID_NGAP, stream=sid)
     
     #--------------------------------------------------------------------------#
@@ -886,14 +983,10 @@ class CorenetServer(object):
                 'procedureCode': 17,
                 'value': (('S1AP-PDU-Contents', 'S1SetupFailure'),
                           {'protocolIEs' : IEs})})
-        if not asn_s1ap_acquire():
-            self._log('ERR', 'unable to acquire the S1AP module')
-        else:
-            PDU_S1AP.set_val(pdu)
-            if ENBd.TRACE_ASN_S1AP:
-                self._log('TRACE_ASN_S1AP_DL', PDU_S1AP.to_asn1())
-            self._write_sk(sk, PDU_S1AP.to_aper(), ppid=SCTP_PPID_S1AP, stream=0)
-            asn_s1ap_release()
+        buf = PDU_S1AP.encode(pdu)
+        if ENBd.TRACE_ASN_S1AP:
+            self._log('TRACE_ASN_S1AP_DL', PDU_S1AP.get_local().to_asn1())
+        self._write_sk(sk, buf, ppid=SCTP_PPID_S1AP, stream=0)
         if self.SERVER_ENB['errclo']:
             sk.close()
     
@@ -914,21 +1007,15 @@ class CorenetServer(object):
                 sk.close()
             return
         #
-        if not asn_s1ap_acquire():
-            self._log('ERR', 'unable to acquire the S1AP module')
-            return
         try:
-            PDU_S1AP.from_aper(buf)
+            pdu_rx = PDU_S1AP.decode(buf)
         except Exception:
             self._log('WNG', 'invalid S1AP PDU transfer-syntax: %s'\
                       % hexlify(buf).decode('ascii'))
-            asn_s1ap_release()
             # return nothing, no need to bother
             return
         if ENBd.TRACE_ASN_S1AP:
-            self._log('TRACE_ASN_S1AP_UL', PDU_S1AP.to_asn1())
-        pdu_rx = PDU_S1AP()
-        asn_s1ap_release()
+            self._log('TRACE_ASN_S1AP_UL', PDU_S1AP.get_local().to_asn1())
         #
         ENBId = self._parse_s1setup(pdu_rx)
         if ENBId is None:
@@ -975,15 +1062,11 @@ class CorenetServer(object):
             self._set_enb_loc(enb)
         #
         # send available PDU(s) back
-        if not asn_s1ap_acquire():
-           enb._log('ERR', 'unable to acquire the S1AP module')
-           return
         for pdu in pdu_tx:
-            PDU_S1AP.set_val(pdu)
+            buf = PDU_S1AP.encode(pdu)
             if ENBd.TRACE_ASN_S1AP:
-                enb._log('TRACE_ASN_S1AP_DL', PDU_S1AP.to_asn1())
-            self._write_sk(sk, PDU_S1AP.to_aper(), ppid=SCTP_PPID_S1AP, stream=sid)
-        asn_s1ap_release()
+                enb._log('TRACE_ASN_S1AP_DL', PDU_S1AP.get_local().to_asn1())
+            self._write_sk(sk, buf, ppid=SCTP_PPID_S1AP, stream=sid)
     
     def _set_enb_loc(self, enb):
         for tai in enb.Config['TAIs']:
@@ -1039,14 +1122,10 @@ class CorenetServer(object):
                 'procedureCode': 21,
                 'value': (('NGAP-PDU-Contents', 'NGSetupFailure'),
                           {'protocolIEs' : IEs})})
-        if not asn_ngap_acquire():
-            self._log('ERR', 'unable to acquire the NGAP module')
-        else:
-            PDU_NGAP.set_val(pdu)
-            if GNBd.TRACE_ASN_NGAP:
-                self._log('TRACE_ASN_NGAP_DL', PDU_NGAP.to_asn1())
-            self._write_sk(sk, PDU_NGAP.to_aper(), ppid=SCTP_PPID_NGAP, stream=0)
-            asn_ngap_release()
+        buf = PDU_NGAP.encode(pdu)
+        if GNBd.TRACE_ASN_NGAP:
+            self._log('TRACE_ASN_NGAP_DL', PDU_NGAP.get_local().to_asn1())
+        self._write_sk(sk, buf, ppid=SCTP_PPID_NGAP, stream=0)
         if self.SERVER_GNB['errclo']:
             sk.close()
     
@@ -1067,21 +1146,15 @@ class CorenetServer(object):
                 sk.close()
             return
         #
-        if not asn_ngap_acquire():
-            self._log('ERR', 'unable to acquire the NGAP module')
-            return
         try:
-            PDU_NGAP.from_aper(buf)
+            pdu_rx = PDU_NGAP.decode(buf)
         except Exception:
             self._log('WNG', 'invalid NGAP PDU transfer-syntax: %s'\
                       % hexlify(buf).decode('ascii'))
-            asn_ngap_release()
             # return nothing, no need to bother
             return
         if GNBd.TRACE_ASN_NGAP:
-            self._log('TRACE_ASN_NGAP_UL', PDU_NGAP.to_asn1())
-        pdu_rx = PDU_NGAP()
-        asn_ngap_release()
+            self._log('TRACE_ASN_NGAP_UL', PDU_NGAP.get_local().to_asn1())
         #
         GNBId = self._parse_ngsetup(pdu_rx)
         if GNBId is None:
@@ -1128,15 +1201,11 @@ class CorenetServer(object):
             self._set_gnb_loc(gnb)
         #
         # send available PDU(s) back
-        if not asn_ngap_acquire():
-           gnb._log('ERR', 'unable to acquire the NGAP module')
-           return
         for pdu in pdu_tx:
-            PDU_NGAP.set_val(pdu)
+            buf = PDU_NGAP.encode(pdu)
             if GNBd.TRACE_ASN_NGAP:
-                gnb._log('TRACE_ASN_NGAP_DL', PDU_NGAP.to_asn1())
-            self._write_sk(sk, PDU_NGAP.to_aper(), ppid=SCTP_PPID_NGAP, stream=sid)
-        asn_ngap_release()
+                gnb._log('TRACE_ASN_NGAP_DL', PDU_NGAP.get_local().to_asn1())
+            self._write_sk(sk, buf, ppid=SCTP_PPID_NGAP, stream=sid)
     
     # in 5G, gNB are dealing with TA more or less in the same way as in 4G
     _set_gnb_loc    = _set_enb_loc
@@ -1184,14 +1253,10 @@ class CorenetServer(object):
                 'procedureCode': 1,
                 'value': (('HNBAP-PDU-Contents', 'HNBRegisterReject'),
                           {'protocolIEs' : IEs})})
-        if not asn_hnbap_acquire():
-            self._log('ERR', 'unable to acquire the HNBAP module')
-        else:
-            PDU_HNBAP.set_val(pdu)
-            if HNBd.TRACE_ASN_HNBAP:
-                self._log('TRACE_ASN_HNBAP_DL', PDU_HNBAP.to_asn1())
-            self._write_sk(sk, PDU_HNBAP.to_aper(), ppid=SCTP_PPID_HNBAP)
-            asn_hnbap_release()
+        buf = PDU_HNBAP.encode(pdu)
+        if HNBd.TRACE_ASN_HNBAP:
+            self._log('TRACE_ASN_HNBAP_DL', PDU_HNBAP.get_local().to_asn1())
+        self._write_sk(sk, buf, ppid=SCTP_PPID_HNBAP)
         if self.SERVER_HNB['errclo']:
             sk.close()
     
@@ -1211,21 +1276,15 @@ class CorenetServer(object):
                 sk.close()
             return
         #
-        if not asn_hnbap_acquire():
-            self._log('ERR', 'unable to acquire the HNBAP module')
-            return
         try:
-            PDU_HNBAP.from_aper(buf)
+            pdu = PDU_HNBAP.decode(buf)
         except Exception:
             self._log('WNG', 'invalid HNBAP PDU transfer-syntax: %s'\
                       % hexlify(buf).decode('ascii'))
-            asn_hnbap_release()
             # return nothing, no need to bother
             return
         if HNBd.TRACE_ASN_HNBAP:
-            self._log('TRACE_ASN_HNBAP_UL', PDU_HNBAP.to_asn1())
-        pdu = PDU_HNBAP()
-        asn_hnbap_release()
+            self._log('TRACE_ASN_HNBAP_UL', PDU_HNBAP.get_local().to_asn1())
         #
         # ensure we have a HNBRegisterRequest with PLMN and CellID provided
         HNBId = self._parse_hnbregreq(pdu)
@@ -1273,15 +1332,11 @@ class CorenetServer(object):
             self._set_hnb_loc(hnb)
         #
         # send available PDU(s) back
-        if not asn_hnbap_acquire():
-           hnb._log('ERR', 'unable to acquire the HNBAP module')
-           return
         for retpdu in ret:
-            PDU_HNBAP.set_val(retpdu)
+            buf = PDU_HNBAP.encode(retpdu)
             if HNBd.TRACE_ASN_HNBAP:
-                hnb._log('TRACE_ASN_HNBAP_DL', PDU_HNBAP.to_asn1())
-            self._write_sk(sk, PDU_HNBAP.to_aper(), ppid=SCTP_PPID_HNBAP)
-        asn_hnbap_release()
+                hnb._log('TRACE_ASN_HNBAP_DL', PDU_HNBAP.get_local().to_asn1())
+            self._write_sk(sk, buf, ppid=SCTP_PPID_HNBAP)
     
     def _set_hnb_loc(self, hnb):
         lai = (hnb.Config['PLMNidentity'], hnb.Config['LAC'])
@@ -1395,90 +1450,14 @@ class CorenetServer(object):
     
     def clean_ue_proc(self):
         #self._log('DBG', 'clean_ue_proc()')
-        # go over all UE and abort() NAS signalling procedures in timeout
-        T = time()
-        for ue in self.UE.values():
-            
-            if ue.IuCS is not None:
-                
-                if ue.IuCS.MM.Proc:
-                    for P in ue.IuCS.MM.Proc:
-                        if hasattr(P, 'TimerStop') and T > P.TimerStop:
-                            P._log('WNG', 'timeout: aborting')
-                            P.abort()
-                
-                if ue.IuCS.CC.Proc:
-                    for P in ue.IuCS.CC.Proc.values():
-                        if hasattr(P, 'TimerStop') and T > P.TimerStop:
-                            P._log('WNG', 'timeout: aborting')
-                            P.abort()
-                
-                if ue.IuCS.SMS.Proc:
-                    for P in tuple(ue.IuCS.SMS.Proc.values()):
-                        if hasattr(P, 'TimerStop') and T > P.TimerStop:
-                            P._log('WNG', 'timeout: aborting')
-                            P.abort()
-                
-                if ue.IuCS.SS.Proc:
-                    for P in ue.IuCS.SS.Proc.values():
-                        if hasattr(P, 'TimerStop') and T > P.TimerStop:
-                            P._log('WNG', 'timeout: aborting')
-                            P.abort()
-            
-            
-            if ue.IuPS is not None:
-            
-                if ue.IuPS.GMM.Proc:
-                    for P in ue.IuPS.GMM.Proc:
-                        if hasattr(P, 'TimerStop') and T > P.TimerStop:
-                            P._log('WNG', 'timeout: aborting')
-                            P.abort()
-                
-                if ue.IuPS.SM.Proc:
-                    for P in tuple(ue.IuPS.SM.Proc.values()):
-                        if hasattr(P, 'TimerStop') and T > P.TimerStop:
-                            P._log('WNG', 'timeout: aborting')
-                            P.abort()
-            
-            if ue.S1 is not None:
-            
-                if ue.S1.EMM.Proc:
-                    for P in ue.S1.EMM.Proc:
-                        if hasattr(P, 'TimerStop') and T > P.TimerStop:
-                            P._log('WNG', 'timeout: aborting')
-                            P.abort()
-                
-                if ue.S1.ESM.Proc:
-                    for P in tuple(ue.S1.ESM.Proc.values()):
-                        if hasattr(P, 'TimerStop') and T > P.TimerStop:
-                            P._log('WNG', 'timeout: aborting')
-                            P.abort()
-                
-                if ue.S1.SMS.Proc:
-                    for P in tuple(ue.S1.SMS.Proc.values()):
-                        if hasattr(P, 'TimerStop') and T > P.TimerStop:
-                            P._log('WNG', 'timeout: aborting')
-                            P.abort()
-            
-            if ue.NG is not None:
-                
-                if ue.NG.FGMM.Proc:
-                    for P in ue.NG.FGMM.Proc:
-                        if hasattr(P, 'TimerStop') and T > P.TimerStop:
-                            P._log('WNG', 'timeout: aborting')
-                            P.abort()
-                
-                if ue.NG.FGSM.Proc:
-                    for P in tuple(ue.NG.FGSM.Proc.values()):
-                        if hasattr(P, 'TimerStop') and T > P.TimerStop:
-                            P._log('WNG', 'timeout: aborting')
-                            P.abort()
-                
-                if ue.NG.SMS.Proc:
-                    for P in tuple(ue.NG.SMS.Proc.values()):
-                        if hasattr(P, 'TimerStop') and T > P.TimerStop:
-                            P._log('WNG', 'timeout: aborting')
-                            P.abort()
+        # abort() NAS signalling procedures in timeout: only the timers expired
+        # are taken from ProcTimers, ongoing procedures are not scanned
+        for P, Stack in self.ProcTimers.expire(time()):
+            # procedures started within a procedure in timeout get aborted
+            # together with it
+            if ProcTimers.ongoing(P, Stack):
+                P._log('WNG', 'timeout: aborting')
+                P.abort()
     
     def get_gtp_teid(self):
         if self._GTP_TEID_UL > 4294967294:
@@ -38,10 +38,15 @@
 #------------------------------------------------------------------------------#
 
 # filtering exports
-__all__ = ['ARPd', 'GTPUd', 'DPI', 'MOD', 'DNSRESP', 'TCPSYNACK']
+__all__ = ['MMsgRing', 'ARPd', 'GTPUd', 'GTPUdMP', 'DPI', 'MOD', 'DNSRESP', 'TCPSYNACK']
 
 import os
+import errno
 import signal
+import ctypes
+import multiprocessing
+from struct import Struct, pack_into
+from functools import partial
 #
 if os.name != 'nt':
     from fcntl  import ioctl
@@ -85,6 +90,167 @@ def set_promisc(sk, iff, val=1):
     sk.setsockopt(SOL_PACKET, cmd, mreq)
 
 
+#------------------------------------------------------------------------------#
+# batched socket I/O                                                           #
+#------------------------------------------------------------------------------#
+# recvmmsg() / sendmmsg() receive / send several packets within a single 
+# syscall: they are called through ctypes, as the socket module does not provide
+# them. Without them, sockets are drained / flushed with a loop of non-blocking
+# recv_into() / send() calls.
+#
+# Packets are received into, or written before sending into, a ring of 
+# preallocated buffers, hence no new buffer is built per packet.
+
+MSG_DONTWAIT = 0x40
+
+class _iovec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p),
+                ('iov_len', ctypes.c_size_t)]
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p),
+                ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(_iovec)),
+                ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p),
+                ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _msghdr),
+                ('msg_len', ctypes.c_uint)]
+
+try:
+    _libc     = ctypes.CDLL(None, use_errno=True)
+    _recvmmsg = _libc.recvmmsg
+    _sendmmsg = _libc.sendmmsg
+except (OSError, AttributeError):
+    _recvmmsg, _sendmmsg = None, None
+else:
+    _recvmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int,
+                          ctypes.c_void_p]
+    _recvmmsg.restype  = ctypes.c_int
+    _sendmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+    _sendmmsg.restype  = ctypes.c_int
+
+
+def _raise_errno():
+    err = ctypes.get_errno()
+    if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+        return 0
+    raise(OSError(err, os.strerror(err)))
+
+
+class MMsgRing(object):
+    '''
+    ring of preallocated packet buffers, to receive packets in bulk from a
+    socket with .recv(sk), or to send packets in bulk to the socket .sk with
+    .push(parts, dst) and .flush()
+    
+    init args:
+        num: number of buffers, i.e. max number of packets per syscall
+        buflen: length of each buffer
+        sk: socket to send packets to, None for receiving only
+    '''
+    
+    def __init__(self, num, buflen, sk=None):
+        self.num, self.buflen, self.sk = num, buflen, sk
+        self.bufs  = [bytearray(buflen) for i in range(num)]
+        self.views = [memoryview(buf) for buf in self.bufs]
+        # length and destination address of each packet
+        self.lens  = [0] * num
+        self.dsts  = [None] * num
+        # number of packets pending for sending
+        self.cnt   = 0
+        #
+        if _recvmmsg is not None:
+            # mmsghdr vector pointing to the buffers, and sockaddr_in buffer
+            self._cbufs = [(ctypes.c_char * buflen).from_buffer(buf) for buf in self.bufs]
+            self._iov   = (_iovec * num)()
+            self._msg   = (_mmsghdr * num)()
+            self._names = ctypes.create_string_buffer(16 * num)
+            for i in range(num):
+                self._iov[i].iov_base = ctypes.addressof(self._cbufs[i])
+                self._iov[i].iov_len  = buflen
+                self._msg[i].msg_hdr.msg_iov    = ctypes.pointer(self._iov[i])
+                self._msg[i].msg_hdr.msg_iovlen = 1
+    
+    def recv(self, sk):
+        """receives up to .num packets from the socket sk without blocking,
+        and returns the number of packets received, available with .get(i)
+        """
+        if _recvmmsg is not None:
+            ret = _recvmmsg(sk.fileno(), ctypes.addressof(self._msg), self.num,
+                            MSG_DONTWAIT, None)
+            if ret < 0:
+                return _raise_errno()
+            msg, lens = self._msg, self.lens
+            for i in range(ret):
+                lens[i] = msg[i].msg_len
+            return ret
+        else:
+            for i in range(self.num):
+                try:
+                    self.lens[i] = sk.recv_into(self.bufs[i], self.buflen, MSG_DONTWAIT)
+                except (BlockingIOError, InterruptedError, timeout):
+                    return i
+            return self.num
+    
+    def get(self, i):
+        """returns the i-th packet received, as a memoryview valid until the 
+        next call to .recv()
+        """
+        return self.views[i][:self.lens[i]]
+    
+    def push(self, parts, dst=None):
+        """appends a packet made of the buffers in parts, to be sent to the 
+        (IPv4 addr, port) dst, or None for a bound PF_PACKET socket,
+        and returns True when the ring is full and must be flushed
+        """
+        view, off = self.views[self.cnt], 0
+        for part in parts:
+            l = len(part)
+            view[off:off+l] = part
+            off += l
+        self.lens[self.cnt], self.dsts[self.cnt] = off, dst
+        self.cnt += 1
+        return self.cnt == self.num
+    
+    def flush(self):
+        """sends all pending packets, and returns the number of packets sent
+        """
+        cnt, self.cnt = self.cnt, 0
+        if not cnt:
+            return 0
+        if _sendmmsg is not None:
+            msg, names = self._msg, self._names
+            for i in range(cnt):
+                self._iov[i].iov_len = self.lens[i]
+                hdr, dst = msg[i].msg_hdr, self.dsts[i]
+                if dst is None:
+                    hdr.msg_name, hdr.msg_namelen = None, 0
+                else:
+                    pack_into('=H2s4s8x', names, 16*i, AF_INET, pack('>H', dst[1]),
+                              inet_aton(dst[0]))
+                    hdr.msg_name, hdr.msg_namelen = ctypes.addressof(names) + 16*i, 16
+            sent, fd, addr = 0, self.sk.fileno(), ctypes.addressof(msg)
+            while sent < cnt:
+                ret = _sendmmsg(fd, addr + sent*ctypes.sizeof(_mmsghdr), cnt - sent, 0)
+                if ret <= 0:
+                    # remaining packets are dropped
+                    _raise_errno()
+                    break
+                sent += ret
+            return sent
+        else:
+            for i in range(cnt):
+                if self.dsts[i] is None:
+                    self.sk.send(self.views[i][:self.lens[i]])
+                else:
+                    self.sk.sendto(self.views[i][:self.lens[i]], self.dsts[i])
+            return cnt
+
+
 #------------------------------------------------------------------------------#
 # ARPd                                                                         #
 #------------------------------------------------------------------------------#
@@ -97,6 +263,9 @@ class ARPd(object):
     
     The method .resolve(ipaddr) returns the MAC address for the requested IP 
     address.
+    When the resolver is served by an asyncio event loop (see add_readers()),
+    the method .resolve_async(ipaddr, cb) must be used from within the loop
+    instead, so that the loop is not blocked while waiting for the ARP response.
     It runs a background thread too, that answers ARP requests on behalf of 
     connected mobiles.
 
@@ -130,6 +299,12 @@ class ARPd(object):
     # select() timeout and wait period
     SELECT_TO       = 0.1
     SELECT_SLEEP    = 0.05
+    # max number of packets received within a single syscall (see MMsgRing),
+    # 0 to receive them one by one
+    BATCH           = 0
+    # max number of callbacks waiting for the ARP resolution of a single IP
+    # address, when served by an asyncio event loop (see resolve_async())
+    RESOLV_PEND_MAX = 64
     #
     # all Gi interface parameters
     # Our GGSN ethernet parameters (IF, MAC and IP addresses)
@@ -152,7 +327,7 @@ class ARPd(object):
     #
     CATCH_SIGINT = False
     
-    def __init__(self, opportunist=False):
+    def __init__(self, opportunist=False, threaded=True):
         #
         self.GGSN_MAC_BUF   = mac_aton(self.GGSN_MAC_ADDR)
         self.GGSN_IP_BUF    = inet_aton(self.GGSN_IP_ADDR)
@@ -186,6 +361,11 @@ class ARPd(object):
         for ip in self.IP_POOL:
             self.ARP_RESOLV_TABLE[ip] = self.GGSN_MAC_BUF
         #
+        if self.BATCH:
+            self._rx = MMsgRing(self.BATCH, self.BUFLEN)
+        else:
+            self._rx = None
+        #
         # interrupt handler
         if self.CATCH_SIGINT:
             def sigint_handler(signum, frame):
@@ -194,11 +374,21 @@ class ARPd(object):
                 self.stop()
             signal.signal(signal.SIGINT, sigint_handler)
         #
+        # callbacks waiting for an ARP resolution, when served by an asyncio
+        # event loop: {ip: list of callbacks}
+        self._resolv_pend = {}
+        #
+        self._loop = None
         self.set_opportunist(opportunist)
-        # starting main listening loop in background
-        self._listening  = True
-        self._listener_t = threadit(self.listen)
-        self._log('INF', 'ARP resolver started')
+        if threaded:
+            # starting main listening loop in background
+            self._listening  = True
+            self._listener_t = threadit(self.listen)
+            self._log('INF', 'ARP resolver started')
+        else:
+            # sockets to be served by an asyncio event loop, see add_readers()
+            self._listening  = False
+            self._listener_t = None
         #
         # .resolve(ip) method is available for ARP resolution by GTPUd
     
@@ -209,14 +399,45 @@ class ARPd(object):
     
     def set_opportunist(self, state):
         if state:
-            self.sk_list = (self.sk_arp, self.sk_ip)
+            sk_list = (self.sk_arp, self.sk_ip)
         else:
-            self.sk_list = (self.sk_arp, )
+            sk_list = (self.sk_arp, )
+        if self._loop is None:
+            self.sk_list = sk_list
+        else:
+            # sockets served by an asyncio event loop
+            self._loop.call_soon_threadsafe(self._set_sk_list, sk_list)
+    
+    def _set_sk_list(self, sk_list):
+        loop = self._loop
+        if loop is not None:
+            self.remove_readers()
+            self.sk_list = sk_list
+            self.add_readers(loop)
+    
+    def add_readers(self, loop):
+        """serve the sockets with the given asyncio event loop, instead of the
+        listen() thread; to be called from within the loop
+        """
+        for sk in self.sk_list:
+            loop.add_reader(sk.fileno(), self._handle_sk, sk)
+        self._loop, self._listening = loop, True
+        self._log('INF', 'ARP resolver started')
+    
+    def remove_readers(self):
+        """stop serving the sockets with the asyncio event loop; to be called 
+        from within the loop, before stop()
+        """
+        if self._loop is not None:
+            for sk in self.sk_list:
+                self._loop.remove_reader(sk.fileno())
+            self._loop = None
     
     def stop(self):
         if self._listening:
             self._listening = False
-            sleep(self.SELECT_TO * 2)
+            if self._listener_t is not None:
+                sleep(self.SELECT_TO * 2)
             try:
                 self.sk_arp.close()
                 self.sk_ip.close()
@@ -229,29 +450,48 @@ class ARPd(object):
             r = []
             r = select(self.sk_list, [], [], self.SELECT_TO)[0]
             for sk in r:
-                try:
-                    buf = sk.recvfrom(self.BUFLEN)[0]
-                except Exception as err:
-                    self._log('ERR', 'external network error (recvfrom): %r' % err)
-                    buf = b''
-                # dipatch ARP request / IP response
-                if sk != self.sk_arp:
-                    # sk == self.sk_ip
-                    if len(buf) >= 34 and buf[12:14] == b'\x08\x00':
-                        self._process_ipbuf(buf)
-                else:
-                    # sk == self.sk_arp
-                    if len(buf) >= 42 and buf[12:14] == b'\x08\x06':
-                        self._process_arpbuf(buf)
+                self._handle_sk(sk)
             #
             # if select() timeouts, take a little rest
             if len(r) == 0:
                 sleep(self.SELECT_SLEEP)
         self._log('INF', 'ARP resolver stopped')
     
+    def _handle_sk(self, sk):
+        if self._rx is not None:
+            self._handle_sk_batch(sk)
+            return
+        try:
+            buf = sk.recvfrom(self.BUFLEN)[0]
+        except Exception as err:
+            self._log('ERR', 'external network error (recvfrom): %r' % err)
+            buf = b''
+        self._process_buf(sk, buf)
+    
+    def _handle_sk_batch(self, sk):
+        rx = self._rx
+        try:
+            num = rx.recv(sk)
+        except Exception as err:
+            self._log('ERR', 'external network error (recvmmsg): %r' % err)
+            return
+        for i in range(num):
+            self._process_buf(sk, rx.get(i))
+    
+    def _process_buf(self, sk, buf):
+        # dipatch ARP request / IP response
+        if sk != self.sk_arp:
+            # sk == self.sk_ip
+            if len(buf) >= 34 and buf[12:14] == b'\x08\x00':
+                self._process_ipbuf(buf)
+        else:
+            # sk == self.sk_arp
+            if len(buf) >= 42 and buf[12:14] == b'\x08\x06':
+                self._process_arpbuf(buf)
+    
     def _process_arpbuf(self, buf):
         # this is an ARP request or response:
-        arpop = ord(buf[21:22])
+        arpop = buf[21]
         # 1) check if it requests for one of our IP
         if arpop == 1:
             ipreq = inet_ntoa(buf[38:42])
@@ -276,8 +516,10 @@ class ARPd(object):
                 ipres = inet_ntoa(ipres_buf)
                 if ipres not in self.ARP_RESOLV_TABLE:
                     # WNG: no protection (at all) against ARP cache poisoning
-                    self.ARP_RESOLV_TABLE[ipres] = buf[22:28]
+                    self.ARP_RESOLV_TABLE[ipres] = bytes(buf[22:28])
                     self._log('DBG', 'got ARP response for new local IP: %s' % ipres)
+                    if ipres in self._resolv_pend:
+                        self._resolve_done(ipres)
     
     def _process_ipbuf(self, buf):
         # this is an random IPv4 packet incoming into our interface: 
@@ -289,10 +531,14 @@ class ARPd(object):
             ipsrc = inet_ntoa(ipsrc_buf)
             if ipsrc not in self.ARP_RESOLV_TABLE:
                 # WNG: no protection (at all) against ARP cache poisoning
-                self.ARP_RESOLV_TABLE[ipsrc] = buf[6:12]
+                self.ARP_RESOLV_TABLE[ipsrc] = bytes(buf[6:12])
                 self._log('DBG', 'got MAC address from IPv4 packet for new local IP: %s' % ipsrc)
+                if ipsrc in self._resolv_pend:
+                    self._resolve_done(ipsrc)
     
-    def resolve(self, ip):
+    def lookup(self, ip):
+        # returns the MAC address for ip without any ARP resolution, or None
+        # if an ARP resolution is required
         # check if already resolved
         if ip in self.ARP_RESOLV_TABLE:
             return self.ARP_RESOLV_TABLE[ip]
@@ -300,21 +546,33 @@ class ARPd(object):
         ip_buf = inet_aton(ip)
         if unpack('>i', ip_buf)[0] & self.SUBNET_MASK != self.SUBNET_PREFIX:
             return self.ROUTER_MAC_BUF
+        else:
+            return None
+    
+    def _send_request(self, ip):
+        try:
+            self.sk_arp.sendto(
+                b''.join((self.ROUTER_MAC_BUF, self.GGSN_MAC_BUF, # Ethernet hdr
+                          b'\x08\x06\0\x01\x08\0\x06\x04\0\x01',
+                          self.GGSN_MAC_BUF, self.GGSN_IP_BUF,    # ARP sender
+                          b'\0\0\0\0\0\0', inet_aton(ip),         # ARP target
+                          b'\0\0\0\0\0\0\0\0\0\0\0\0\0\0\0\0\0\0')),
+                (self.GGSN_ETH_IF, 0x0806))
+        except Exception as err:
+            self._log('ERR', 'external network error (sendto) on ARP request: %r' % err)
+        else:
+            self._log('DBG', 'ARP request sent for local IP: %s' % ip)
+    
+    def resolve(self, ip):
+        # blocking resolution, not to be called from the asyncio event loop 
+        # serving self (see resolve_async())
+        mac = self.lookup(ip)
+        if mac is not None:
+            return mac
         # requesting an IP within our local LAN
         # starting a resolution for it
         else:
-            try:
-                self.sk_arp.sendto(
-                    b''.join((self.ROUTER_MAC_BUF, self.GGSN_MAC_BUF, # Ethernet hdr
-                              b'\x08\x06\0\x01\x08\0\x06\x04\0\x01',
-                              self.GGSN_MAC_BUF, self.GGSN_IP_BUF,    # ARP sender
-                              b'\0\0\0\0\0\0', inet_aton(ip),         # ARP target
-                              b'\0\0\0\0\0\0\0\0\0\0\0\0\0\0\0\0\0\0')),
-                    (self.GGSN_ETH_IF, 0x0806))
-            except Exception as err:
-                self._log('ERR', 'external network error (sendto) on ARP request: %r' % err)
-            else:
-                self._log('DBG', 'ARP request sent for local IP: %s' % ip)
+            self._send_request(ip)
             # wait for the answer
             cnt = 0
             while ip not in self.ARP_RESOLV_TABLE:
@@ -326,6 +584,40 @@ class ARPd(object):
                 return self.ARP_RESOLV_TABLE[ip]
             else:
                 return 6*b'\xFF' # LAN broadcast, maybe a bit strong !
+    
+    def resolve_async(self, ip, cb):
+        """non-blocking resolution, to be called from the asyncio event loop 
+        serving self: cb(mac) is called from the loop when the ARP response is
+        received, or with the LAN broadcast address after the same timeout as 
+        resolve()
+        
+        returns False if cb is dropped, because too many callbacks are already
+        waiting for ip
+        """
+        if ip in self.ARP_RESOLV_TABLE:
+            # resolved in the meantime
+            self._loop.call_soon(cb, self.ARP_RESOLV_TABLE[ip])
+        elif ip in self._resolv_pend:
+            pend = self._resolv_pend[ip]
+            if len(pend) >= self.RESOLV_PEND_MAX:
+                return False
+            pend.append(cb)
+        else:
+            self._resolv_pend[ip] = [cb]
+            self._send_request(ip)
+            self._loop.call_later(3*self.SELECT_SLEEP, self._resolve_done, ip)
+        return True
+    
+    def _resolve_done(self, ip):
+        # ARP response received or timeout: call the pending callbacks
+        pend = self._resolv_pend.pop(ip, None)
+        if pend:
+            mac = self.ARP_RESOLV_TABLE.get(ip, 6*b'\xFF')
+            for cb in pend:
+                try:
+                    cb(mac)
+                except Exception as err:
+                    self._log('ERR', 'ARP resolution callback error: %r' % err)
 
 
 #------------------------------------------------------------------------------#
@@ -336,6 +628,10 @@ BLACKHOLE_LAN   = 0b01
 BLACKHOLE_WAN   = 0b10
 IPV6_LOCAL_PREF = b'\xfe\x80\0\0\0\0\0\0'
 
+# GTP-U header (flags, msg type, length, TEID), and its length field packer
+_GTPU_HDR       = Struct('>BBHI')
+_GTPU_LEN_into  = Struct('>H').pack_into
+
 class GTPUd(object):
     '''
     GTP-U forwarder
@@ -390,6 +686,10 @@ class GTPUd(object):
     BUFLEN        = 2048
     # select loop settings
     SELECT_TO     = 0.1
+    # max number of packets received or sent within a single syscall (see 
+    # MMsgRing), 0 to receive and send them one by one
+    # batch statistics are then placed into the attribute .stats_batch
+    BATCH         = 0
     #
     # Gi interface, with GGSN ethernet IF, MAC address and IPv6 /64 network prefix
     EXT_IF        = ARPd.GGSN_ETH_IF
@@ -420,7 +720,7 @@ class GTPUd(object):
     # in case we want to stop the listener when typing CTRL+C
     CATCH_SIGINT = False
     
-    def __init__(self):
+    def __init__(self, threaded=True):
         #
         self.EXT_MAC_BUF   = mac_aton(self.EXT_MAC_ADDR)
         self.IPV6_NET_PREF = inet_pton(AF_INET6, self.EXT_IPV6_PREF + '::')[:8]
@@ -434,7 +734,9 @@ class GTPUd(object):
         #         teid_dl (uint), 
         #         ipv4_addr (4-bytes or None),
         #         ipv6_addr (8-bytes -if addr suffix- or None),
-        #         ctx_num (uint)]
+        #         ctx_num (uint),
+        #         dl_tpl (3-tuple: sk_int ref, GTP-U header template, RAN addr, 
+        #                 or None, see build_dl_tpl())]
         self._mobiles_teid = {}
         #
         # initialize the traffic statistics
@@ -478,14 +780,21 @@ class GTPUd(object):
                 self.stop()
             signal.signal(signal.SIGINT, sigint_handler)
         #
-        # and start listening and transferring packets in background
         self.sk_list = (self.sk_ext_v4, self.sk_ext_v6) + self.sk_int
-        self._listening = True
-        self._listener_t = threadit(self.listen)
-        self._log('INF', 'GTP-U tunnels handler started')
+        self._init_batch()
+        self._loop = None
+        if threaded:
+            # and start listening and transferring packets in background
+            self._listening = True
+            self._listener_t = threadit(self.listen)
+            self._log('INF', 'GTP-U tunnels handler started')
+        else:
+            # sockets to be served by an asyncio event loop, see add_readers()
+            self._listening = False
+            self._listener_t = None
         #
         # and finally start ARP resolver
-        self.arpd = ARPd()
+        self.arpd = ARPd(threaded=threaded)
     
     def _log(self, logtype='DBG', msg=''):
         # logtype: 'ERR', 'WNG', 'INF', 'DBG'
@@ -505,13 +814,60 @@ class GTPUd(object):
         self.stats[ip] = stats
         return stats
     
+    def init_stats_batch(self):
+        self.stats_batch = {
+            'rx_batch': 0, # number of batches received
+            'rx_pkt'  : 0, # number of packets received in batches
+            'rx_max'  : 0, # largest batch received
+            'tx_batch': 0, # number of batches sent
+            'tx_pkt'  : 0, # number of packets sent in batches
+            }
+        return self.stats_batch
+    
+    def _init_batch(self):
+        # rings of buffers for batched I/O: 1 for receiving, 1 per socket for
+        # sending
+        if self.BATCH:
+            self._rx        = MMsgRing(self.BATCH, self.BUFLEN)
+            self._tx_ext_v4 = MMsgRing(self.BATCH, self.BUFLEN, self.sk_ext_v4)
+            self._tx_ext_v6 = MMsgRing(self.BATCH, self.BUFLEN, self.sk_ext_v6)
+            self._tx_int    = {sk: MMsgRing(self.BATCH, self.BUFLEN, sk) for sk in self.sk_int}
+            self._tx_list   = (self._tx_ext_v4, self._tx_ext_v6) + \
+                              tuple(self._tx_int[sk] for sk in self.sk_int)
+        else:
+            self._rx, self._tx_ext_v4, self._tx_ext_v6, self._tx_int, self._tx_list = \
+                None, None, None, None, ()
+        self.init_stats_batch()
+    
+    def add_readers(self, loop):
+        """serve the sockets of self and of the ARP resolver with the given 
+        asyncio event loop, instead of the listen() threads; to be called from 
+        within the loop
+        """
+        for sk in self.sk_list:
+            loop.add_reader(sk.fileno(), self._handle_sk, sk)
+        self._loop, self._listening = loop, True
+        self._log('INF', 'GTP-U tunnels handler started')
+        self.arpd.add_readers(loop)
+    
+    def remove_readers(self):
+        """stop serving the sockets of self and of the ARP resolver with the 
+        asyncio event loop; to be called from within the loop, before stop()
+        """
+        self.arpd.remove_readers()
+        if self._loop is not None:
+            for sk in self.sk_list:
+                self._loop.remove_reader(sk.fileno())
+            self._loop = None
+    
     def stop(self):
         # stop ARP resolver
         self.arpd.stop()
         # stop local GTPU handler
         if self._listening:
             self._listening = False
-            sleep(self.SELECT_TO * 2)
+            if self._listener_t is not None:
+                sleep(self.SELECT_TO * 2)
             try:
                 set_promisc(self.sk_ext_v4, self.EXT_IF, 0)
                 set_promisc(self.sk_ext_v6, self.EXT_IF, 0)
@@ -529,56 +885,110 @@ class GTPUd(object):
             r = select(self.sk_list, [], [], self.SELECT_TO)[0]
             # read ext and int sockets until they are empty
             for sk in r:
-                #
-                if sk == self.sk_ext_v4:
-                    # DL IPv4
-                    try:
-                        buf = sk.recvfrom(self.BUFLEN)[0]
-                    #except timeout:
-                    #    pass
-                    except Exception as err:
-                        self._log('ERR', 'sk_ext_v4 IF error (recvfrom): %r' % err)
-                    else:
-                        #self._log('DBG', 'sk_ext_v4, recvfrom()')
-                        if len(buf) >= 34 and buf[:6] == self.EXT_MAC_BUF \
-                        and buf[30:34] in self._mobiles_addr:
-                            # IPv4 of a mobile, transfer over GTP-U
-                            # after removing the Ethernet header
-                            self.transfer_v4_to_int(buf[14:])
-                            #threadit(self.transfer_v4_to_int, buf[14:])
-                #
-                elif sk == self.sk_ext_v6:
-                    # DL IPv6
-                    try:
-                        buf = sk.recvfrom(self.BUFLEN)[0]
-                    #except timeout:
-                    #    pass
-                    except Exception as err:
-                        self._log('ERR', 'sk_ext_v6 IF error (recvfrom): %r' % err)
-                    else:
-                        #self._log('DBG', 'sk_ext_v6, recvfrom()')
-                        if len(buf) >= 54 and buf[:6] == self.EXT_MAC_BUF \
-                        and buf[46:54] in self._mobiles_addr:
-                            # IPv6 of a mobile, transfer over GTP-U
-                            # after removing the Ethernet header
-                            self.transfer_v6_to_int(buf[14:])
-                            #threadit(self.transfer_v6_to_int, buf[14:])
-                #
-                else:
-                    #sk in self.sk_int
-                    # UL, both IPv4 and IPv6 packets
-                    try:
-                        buf = sk.recv(self.BUFLEN)
-                    #except timeout:
-                    #    pass
-                    except Exception as err:
-                        self._log('ERR', 'sk_int IF error (recv): %r' % err)
-                    else:
-                        self.transfer_to_ext(buf)
-                        #threadit(self.transfer_to_ext, buf)
+                self._handle_sk(sk)
         #
         self._log('INF', 'GTPU handler stopped')
     
+    def _handle_sk(self, sk):
+        if self._rx is not None:
+            self._handle_sk_batch(sk)
+            return
+        if sk == self.sk_ext_v4:
+            # DL IPv4
+            try:
+                buf = sk.recvfrom(self.BUFLEN)[0]
+            #except timeout:
+            #    pass
+            except Exception as err:
+                self._log('ERR', 'sk_ext_v4 IF error (recvfrom): %r' % err)
+            else:
+                #self._log('DBG', 'sk_ext_v4, recvfrom()')
+                if len(buf) >= 34 and buf[:6] == self.EXT_MAC_BUF \
+                and buf[30:34] in self._mobiles_addr:
+                    # IPv4 of a mobile, transfer over GTP-U
+                    # after removing the Ethernet header
+                    self.transfer_v4_to_int(buf[14:])
+                    #threadit(self.transfer_v4_to_int, buf[14:])
+        #
+        elif sk == self.sk_ext_v6:
+            # DL IPv6
+            try:
+                buf = sk.recvfrom(self.BUFLEN)[0]
+            #except timeout:
+            #    pass
+            except Exception as err:
+                self._log('ERR', 'sk_ext_v6 IF error (recvfrom): %r' % err)
+            else:
+                #self._log('DBG', 'sk_ext_v6, recvfrom()')
+                if len(buf) >= 54 and buf[:6] == self.EXT_MAC_BUF \
+                and buf[46:54] in self._mobiles_addr:
+                    # IPv6 of a mobile, transfer over GTP-U
+                    # after removing the Ethernet header
+                    self.transfer_v6_to_int(buf[14:])
+                    #threadit(self.transfer_v6_to_int, buf[14:])
+        #
+        else:
+            #sk in self.sk_int
+            # UL, both IPv4 and IPv6 packets
+            try:
+                buf = sk.recv(self.BUFLEN)
+            #except timeout:
+            #    pass
+            except Exception as err:
+                self._log('ERR', 'sk_int IF error (recv): %r' % err)
+            else:
+                self.transfer_to_ext(buf)
+                #threadit(self.transfer_to_ext, buf)
+    
+    def _handle_sk_batch(self, sk):
+        # drain up to BATCH packets from the socket, process them all, and
+        # flush the packets to be sent
+        rx = self._rx
+        try:
+            num = rx.recv(sk)
+        except Exception as err:
+            self._log('ERR', 'IF error (recvmmsg): %r' % err)
+            return
+        if not num:
+            return
+        stats = self.stats_batch
+        stats['rx_batch'] += 1
+        stats['rx_pkt']   += num
+        if num > stats['rx_max']:
+            stats['rx_max'] = num
+        #
+        if sk == self.sk_ext_v4:
+            # DL IPv4
+            for i in range(num):
+                buf = rx.get(i)
+                if len(buf) >= 34 and buf[:6] == self.EXT_MAC_BUF \
+                and bytes(buf[30:34]) in self._mobiles_addr:
+                    self.transfer_v4_to_int(buf[14:])
+        elif sk == self.sk_ext_v6:
+            # DL IPv6
+            for i in range(num):
+                buf = rx.get(i)
+                if len(buf) >= 54 and buf[:6] == self.EXT_MAC_BUF \
+                and bytes(buf[46:54]) in self._mobiles_addr:
+                    self.transfer_v6_to_int(buf[14:])
+        else:
+            # UL, both IPv4 and IPv6 packets
+            for i in range(num):
+                self.transfer_to_ext(rx.get(i))
+        #
+        for tx in self._tx_list:
+            if tx.cnt:
+                self._flush_tx(tx)
+    
+    def _flush_tx(self, tx):
+        try:
+            sent = tx.flush()
+        except Exception as err:
+            self._log('ERR', 'IF error (sendmmsg): %r' % err)
+        else:
+            self.stats_batch['tx_batch'] += 1
+            self.stats_batch['tx_pkt']   += sent
+    
     def resolve_mac(self, ipdst):
         if len(ipdst) == 4:
             return self.arpd.resolve(inet_ntoa(ipdst))
@@ -594,7 +1004,7 @@ class GTPUd(object):
         try:
             # extract the GTP header
             flags, msgtype, msglen, teid_ul = unpack('>BBHI', buf[:8])
-            ran_info, teid_dl, ipv4buf, ipv6buf, ctx_num = self._mobiles_teid[teid_ul]
+            ipv4buf, ipv6buf = self._mobiles_teid[teid_ul][2:4]
             if msgtype != 0xff:
                 # TODO: handle GTP ECHO
                 self._log('WNG', 'unsupported GTP type from RAN: 0x%.2x' % msgtype)
@@ -605,7 +1015,7 @@ class GTPUd(object):
                 msglen -= 4
             ipbuf = buf[-msglen:]
             # get the IP version
-            ipvers = ord(ipbuf[0:1])>>4
+            ipvers = ipbuf[0]>>4
             if ipvers == 4:
                 ipsrc = ipbuf[12:16]
                 ipdst = ipbuf[16:20]
@@ -626,6 +1036,8 @@ class GTPUd(object):
             if self.DPI:
                 self._analyze(ipvers, inet_ntoa(ipsrc), ipbuf)
             if self.MOD:
+                # modules work on bytes buffers
+                ipbuf = bytes(ipbuf)
                 try:
                     for mod in self.MOD:
                         if mod.TYPE == 0:
@@ -635,30 +1047,20 @@ class GTPUd(object):
                 except Exception as err:
                     self._log('ERR', 'MOD error: %r' % err)
             # resolve the dest MAC addr
-            macdst = self.resolve_mac(ipdst)
-            # apply blackholing
-            if self.BLACKHOLING:
-                if macdst != self.arpd.ROUTER_MAC_BUF:
-                    if self.BLACKHOLING & BLACKHOLE_LAN:
-                        drop = True
-                    else:
-                        drop = False
-                else:
-                    if self.BLACKHOLING & BLACKHOLE_WAN:
-                        drop = True
-                    else:
-                        drop = False
-                if drop and self.WL_ACTIVE:
-                    ipdst, prot, pay = DPIv4.get_ip_info(ipbuf)
-                    if prot in (6, 17) and pay:
-                        # UDP / TCP
-                        port = DPIv4.get_port(pay)
-                        if (self._prot_dict[prot], port) in self.WL_PORTS:
-                            self._transfer_v4_to_ext(macdst, ipbuf)
-                        else:
-                            return
+            if self._loop is not None:
+                # served by an asyncio event loop, which must not be blocked by 
+                # an ARP resolution: the packet is forwarded once resolved
+                ip = inet_ntoa(ipdst)
+                macdst = self.arpd.lookup(ip)
+                if macdst is None:
+                    if not self.arpd.resolve_async(ip, partial(self._transfer_to_ext_arp,
+                                                               ipvers, bytes(ipbuf))):
+                        self._log('WNG', 'too many packets waiting for the ARP '\
+                                  'resolution of %s, dropping it' % ip)
+                    return
             else:
-                self._transfer_v4_to_ext(macdst, ipbuf)
+                macdst = self.resolve_mac(ipdst)
+            self._transfer_ip_to_ext(ipvers, ipbuf, macdst)
         #
         else:
             #ipvers == 6
@@ -668,6 +1070,8 @@ class GTPUd(object):
             if self.DPI:
                 self._analyze(ipvers, inet_ntop(AF_INET6, ipsrc), ipbuf)
             if self.MOD:
+                # modules work on bytes buffers
+                ipbuf = bytes(ipbuf)
                 try:
                     for mod in self.MOD:
                         if mod.TYPE == 0:
@@ -678,33 +1082,52 @@ class GTPUd(object):
                     self._log('ERR', 'MOD error: %r' % err)
             # resolve the dest MAC addr
             macdst = self.resolve_mac(ipdst)
-            # apply blackholing
-            if self.BLACKHOLING:
-                if macdst != self.arpd.ROUTER_MAC_BUF:
-                    if self.BLACKHOLING & BLACKHOLE_LAN:
-                        drop = True
-                    else:
-                        drop = False
+            self._transfer_ip_to_ext(ipvers, ipbuf, macdst)
+    
+    def _transfer_ip_to_ext(self, ipvers, ipbuf, macdst):
+        if ipvers == 4:
+            DPI, transfer = DPIv4, self._transfer_v4_to_ext
+        else:
+            DPI, transfer = DPIv6, self._transfer_v6_to_ext
+        # apply blackholing
+        if self.BLACKHOLING:
+            if macdst != self.arpd.ROUTER_MAC_BUF:
+                if self.BLACKHOLING & BLACKHOLE_LAN:
+                    drop = True
                 else:
-                    if self.BLACKHOLING & BLACKHOLE_WAN:
-                        drop = True
-                    else:
-                        drop = False
-                if drop and self.WL_ACTIVE:
-                    ipdst, prot, pay = DPIv6.get_ip_info(ipbuf)
-                    if prot in (6, 17) and pay:
-                        # UDP / TCP
-                        port = DPIv6.get_port(pay)
-                        if (self._prot_dict[prot], port) in self.WL_PORTS:
-                            self._transfer_v6_to_ext(macdst, ipbuf)
-                        else:
-                            return
+                    drop = False
             else:
-                self._transfer_v6_to_ext(macdst, ipbuf)
+                if self.BLACKHOLING & BLACKHOLE_WAN:
+                    drop = True
+                else:
+                    drop = False
+            if drop and self.WL_ACTIVE:
+                ipdst, prot, pay = DPI.get_ip_info(ipbuf)
+                if prot in (6, 17) and pay:
+                    # UDP / TCP
+                    port = DPI.get_port(pay)
+                    if (self._prot_dict[prot], port) in self.WL_PORTS:
+                        transfer(macdst, ipbuf)
+                    else:
+                        return
+        else:
+            transfer(macdst, ipbuf)
+    
+    def _transfer_to_ext_arp(self, ipvers, ipbuf, macdst):
+        # called from the asyncio event loop by the ARP resolver, for a packet 
+        # which waited for the resolution of its dest MAC addr
+        self._transfer_ip_to_ext(ipvers, ipbuf, macdst)
+        for tx in self._tx_list:
+            if tx.cnt:
+                self._flush_tx(tx)
     
     def _transfer_v4_to_ext(self, macdst, ipbuf):
         # forward to the external PF_PACKET socket, over the Gi interface
         try:
+            if self._tx_ext_v4 is not None:
+                if self._tx_ext_v4.push((macdst, self.EXT_MAC_BUF, b'\x08\0', ipbuf)):
+                    self._flush_tx(self._tx_ext_v4)
+                return
             self.sk_ext_v4.sendto(b''.join((macdst, self.EXT_MAC_BUF, b'\x08\0', ipbuf)),
                                   (self.EXT_IF, 0x0800))
         except Exception as err:
@@ -713,6 +1136,10 @@ class GTPUd(object):
     def _transfer_v6_to_ext(self, macdst, ipbuf):
         # forward to the external PF_PACKET socket, over the Gi interface
         try:
+            if self._tx_ext_v6 is not None:
+                if self._tx_ext_v6.push((macdst, self.EXT_MAC_BUF, b'\x86\xdd', ipbuf)):
+                    self._flush_tx(self._tx_ext_v6)
+                return
             self.sk_ext_v6.sendto(b''.join((macdst, self.EXT_MAC_BUF, b'\x86\xdd', ipbuf)),
                                   (self.EXT_IF, 0x86dd))
         except Exception as err:
@@ -758,12 +1185,42 @@ class GTPUd(object):
     # DL transfer
     #--------------------------------------------------------------------------#
     
+    def build_dl_tpl(self, ran_info, teid_dl):
+        """returns the DL encapsulation template for a mobile context, as a 
+        3-tuple (sk_int, GTP-U header, RAN (addr, port)), or None if the DL 
+        GTP parameters are not set
+        
+        only the length field of the GTP-U header needs to be set per packet
+        """
+        if ran_info and teid_dl is not None:
+            return (ran_info[2],
+                    bytearray(_GTPU_HDR.pack(0x30, 0xff, 0, teid_dl)),
+                    (ran_info[1], self.GTP_PORT))
+        else:
+            return None
+    
+    def _transfer_to_int(self, dl_tpl, ipbuf):
+        # forward to the internal UDP socket, over GTP-U
+        sk, gtphdr, dst = dl_tpl
+        try:
+            _GTPU_LEN_into(gtphdr, 2, len(ipbuf))
+            if self._tx_int is not None:
+                tx = self._tx_int[sk]
+                if tx.push((gtphdr, ipbuf), dst):
+                    self._flush_tx(tx)
+            else:
+                # sendmsg() with separate buffers is not faster than this
+                sk.sendto(gtphdr + ipbuf, dst)
+        except Exception as err:
+            self._log('ERR', 'sk_int IF error (sendto): %r' % err)
+    
     def transfer_v4_to_int(self, buf):
         #self._log('DBG', 'transfer_v4_to_int()')
         # buf length is guaranteed >= 20 and ipdst in self._mobiles_addr
         #
         if self.MOD:
             # possibly process the DL GTP-U payload within modules
+            buf = bytes(buf)
             try:
                 for mod in self.MOD:
                     if mod.TYPE == 0:
@@ -773,16 +1230,12 @@ class GTPUd(object):
             except Exception as err:
                 self._log('ERR', 'MOD error: %r' % err)        
         #
-        teid_ul = self._mobiles_addr[buf[16:20]]
-        ran_info, teid_dl = self._mobiles_teid[teid_ul][:2]
+        teid_ul = self._mobiles_addr[bytes(buf[16:20])]
+        dl_tpl  = self._mobiles_teid[teid_ul][5]
         #
         # prepend GTP header and forward to the RAN IP
-        if ran_info and teid_dl is not None:
-            gtphdr = pack('>BBHI', 0x30, 0xff, len(buf), teid_dl)
-            try:
-                ret = ran_info[2].sendto(gtphdr + buf, (ran_info[1], self.GTP_PORT))
-            except Exception as err:
-                self._log('ERR', 'sk_int IF error (sendto): %r' % err)
+        if dl_tpl is not None:
+            self._transfer_to_int(dl_tpl, buf)
         else:
             self._log('WNG', 'teid_ul 0x%.8x, downlink GTP parameters not set' % teid_ul)
     
@@ -792,6 +1245,7 @@ class GTPUd(object):
         #
         if self.MOD:
             # possibly process the DL GTP-U payload within modules
+            buf = bytes(buf)
             try:
                 for mod in self.MOD:
                     if mod.TYPE == 0:
@@ -801,16 +1255,12 @@ class GTPUd(object):
             except Exception as err:
                 self._log('ERR', 'MOD error: %r' % err)        
         #
-        teid_ul = self._mobiles_addr[buf[32:40]]
-        ran_info, teid_dl = self._mobiles_teid[teid_ul][:2]
+        teid_ul = self._mobiles_addr[bytes(buf[32:40])]
+        dl_tpl  = self._mobiles_teid[teid_ul][5]
         #
         # prepend GTP header and forward to the RAN IP
-        if ran_info and teid_dl is not None:
-            gtphdr = pack('>BBHI', 0x30, 0xff, len(buf), teid_dl)
-            try:
-                ret = ran_info[2].sendto(gtphdr + buf, (ran_info[1], self.GTP_PORT))
-            except Exception as err:
-                self._log('ERR', 'sk_int IF error (sendto): %r' % err)
+        if dl_tpl is not None:
+            self._transfer_to_int(dl_tpl, buf)
         else:
             self._log('WNG', 'teid_ul 0x%.8x, downlink GTP parameters not set' % teid_ul)
     
@@ -821,7 +1271,7 @@ class GTPUd(object):
     def add_mobile(self, teid_ul, mobile_addr, ran_ip, teid_dl):
         if teid_ul in self._mobiles_teid:
             # just increment the ctx_num
-            self._mobiles_teid[teid_ul][-1] += 1
+            self._mobiles_teid[teid_ul][4] += 1
         #
         else:
             if mobile_addr[0] == 1:
@@ -868,7 +1318,8 @@ class GTPUd(object):
             else:
                 ran_info = None
             # insert a new context
-            self._mobiles_teid[teid_ul] = [ran_info, teid_dl, ipv4buf, ipv6buf, 1]
+            self._mobiles_teid[teid_ul] = [ran_info, teid_dl, ipv4buf, ipv6buf, 1,
+                                           self.build_dl_tpl(ran_info, teid_dl)]
             if ipv4buf:
                 self._mobiles_addr[ipv4buf] = teid_ul
             if ipv6buf:
@@ -880,7 +1331,7 @@ class GTPUd(object):
     def set_mobile_dl(self, teid_ul, ran_ip=None, teid_dl=None):
         # enables to reconfigure the DL parameters (RAN IP, DL TEID)
         try:
-            ran_info_ori, teid_dl_ori, ipv4buf, ipv6buf, ctx_num = self._mobiles_teid[teid_ul]
+            ran_info_ori, teid_dl_ori, ipv4buf, ipv6buf, ctx_num = self._mobiles_teid[teid_ul][:5]
         except Exception as err:
             self._log('ERR', 'invalid teid_ul 0x%.8x' % teid_ul)
             return
@@ -897,18 +1348,19 @@ class GTPUd(object):
                 ran_info = None
             if teid_dl is None:
                 teid_dl = teid_dl_ori
-            self._mobiles_teid[teid_ul] = [ran_info, teid_dl, ipv4buf, ipv6buf, ctx_num]
+            self._mobiles_teid[teid_ul] = [ran_info, teid_dl, ipv4buf, ipv6buf, ctx_num,
+                                           self.build_dl_tpl(ran_info, teid_dl)]
     
     def rem_mobile(self, teid_ul):
         if teid_ul in self._mobiles_teid:
             mobile_ctx = self._mobiles_teid[teid_ul]
-            if mobile_ctx[-1] > 1:
+            if mobile_ctx[4] > 1:
                 # decrement the number of GTP contexts
-                mobile_ctx[-1] -= 1
+                mobile_ctx[4] -= 1
             else:
                 # delete the mobile context
                 del self._mobiles_teid[teid_ul]
-                ran_info, teid_dl, ipv4buf, ipv6buf, ctx_num = mobile_ctx
+                ran_info, teid_dl, ipv4buf, ipv6buf, ctx_num = mobile_ctx[:5]
                 if ipv4buf:
                     ipv4addr = inet_ntoa(ipv4buf)
                     try:
@@ -949,6 +1401,7 @@ class GTPUd(object):
         #
         # prepend GTP header and forward to the RAN IP
         if ran_info and teid_dl is not None:
+            # not batched, as this may be called from another thread
             gtphdr = pack('>BBHI', 0x30, 0xff, len(ipbuf), teid_dl)
             try:
                 ret = ran_info[2].sendto(gtphdr + ipbuf, (ran_info[1], self.GTP_PORT))
@@ -958,6 +1411,496 @@ class GTPUd(object):
             self._log('INF', 'teid_ul 0x%.8x, downlink GTP parameters not set' % teid_ul)
 
 
+#------------------------------------------------------------------------------#
+# GTPUdMP                                                                      #
+#------------------------------------------------------------------------------#
+# GTPUd handles all GTP-U tunnels within a single thread, which bounds the user
+# plane throughput to a single CPU core.
+#
+# GTPUdMP spreads the user plane over several worker processes, each owning a 
+# shard of the mobiles' contexts: UL packets are dispatched according to their
+# TEID, DL packets according to the mobile IP address (the IPv4 address, or the
+# last 4 bytes of the IPv6 interface identifier), modulo the number of workers.
+#
+# The dispatching is done by the kernel: each worker has its own set of sockets,
+# UDP ones sharing the GTP-U port with SO_REUSEPORT, and PF_PACKET ones joined
+# into PACKET_FANOUT groups, both steered with a classic BPF program.
+# If the kernel refuses those BPF programs, packets are dispatched per flow by
+# the kernel, and each worker gets all contexts.
+#
+# The parent process keeps the complete tables of contexts, and pushes each
+# update to the workers owning the corresponding shards. It also runs the ARP
+# resolver, which is queried by the workers over a pipe.
+
+SO_ATTACH_REUSEPORT_CBPF = 51
+PACKET_FANOUT            = 18
+PACKET_FANOUT_DATA       = 22
+PACKET_FANOUT_CBPF       = 6
+#
+# cBPF instructions used: ld [k], mod #k, ret a
+BPF_LD_W_ABS             = 0x20
+BPF_ALU_MOD_K            = 0x94
+BPF_RET_A                = 0x16
+# base offset for loading from the network header, whatever the socket type
+SKF_NET_OFF              = -0x100000
+
+
+def bpf_prog_mod(off, num):
+    """returns the cBPF program loading the uint32 at offset off and returning it 
+    modulo num, as a 2-tuple (sock_fprog struct buffer, instructions buffer)
+    
+    the instructions buffer must be kept alive until the program is attached
+    """
+    insns = ctypes.create_string_buffer(b''.join((
+        pack('HBBI', BPF_LD_W_ABS,  0, 0, off & 0xffffffff),
+        pack('HBBI', BPF_ALU_MOD_K, 0, 0, num),
+        pack('HBBI', BPF_RET_A,     0, 0, 0))))
+    return pack('HP', 3, ctypes.addressof(insns)), insns
+
+
+class _ARPProxy(object):
+    '''
+    ARP resolver used within GTPUdMP worker processes, forwarding resolution 
+    requests to the ARPd of the parent process, and caching their results
+    '''
+    
+    def __init__(self, rpc):
+        self._rpc = rpc
+        self.ROUTER_MAC_BUF   = mac_aton(ARPd.ROUTER_MAC_ADDR)
+        self.ARP_RESOLV_TABLE = {}
+    
+    def resolve(self, ip):
+        try:
+            return self.ARP_RESOLV_TABLE[ip]
+        except KeyError:
+            self._rpc.send( ('resolve', ip) )
+            mac = self._rpc.recv()
+            if mac != 6*b'\xFF':
+                # do not cache failed resolutions
+                self.ARP_RESOLV_TABLE[ip] = mac
+            return mac
+
+
+class GTPUdWorker(GTPUd):
+    '''
+    GTP-U forwarder worker process, started by GTPUdMP
+    
+    It handles the UL packets for its shard of TEIDs and the DL packets for its 
+    shard of mobile IP addresses, with its own set of sockets. Mobiles' contexts
+    are pushed by the parent process over the ctl pipe.
+    '''
+    #
+    # settings taken from the parent GTPUdMP instance
+    SETTINGS = ('DEBUG', 'BUFLEN', 'SELECT_TO', 'EXT_IF', 'EXT_MAC_ADDR', 'EXT_IPV6_PREF',
+                'GTP_PORT', 'GTP_IF', 'BLACKHOLING', 'WL_ACTIVE', 'WL_PORTS', 'DPI',
+                'DROP_SPOOF', 'BATCH')
+    
+    def __init__(self, gtpu, ind, sk_ext_v4, sk_ext_v6, sk_int, sk_int_ind, ctl, rpc):
+        #
+        for attr in self.SETTINGS:
+            setattr(self, attr, getattr(gtpu, attr))
+        self.ind           = ind
+        self.EXT_MAC_BUF   = mac_aton(self.EXT_MAC_ADDR)
+        self.IPV6_NET_PREF = inet_pton(AF_INET6, self.EXT_IPV6_PREF + '::')[:8]
+        self._mobiles_addr = {}
+        self._mobiles_teid = {}
+        self.stats         = {}
+        self._prot_dict    = {1:'ICMP', 6:'TCP', 17:'UDP'}
+        self.MOD           = list(gtpu.MOD)
+        #
+        self.sk_ext_v4     = sk_ext_v4
+        self.sk_ext_v6     = sk_ext_v6
+        self.sk_int        = sk_int
+        self._sk_int_ind   = sk_int_ind
+        self.sk_list       = (sk_ext_v4, sk_ext_v6) + sk_int
+        self._init_batch()
+        self._loop         = None
+        self._listening    = False
+        self._listener_t   = None
+        #
+        # ctl: pipe for receiving contexts updates from the parent process
+        # rpc: pipe for querying the parent process (ARP resolution)
+        self._ctl          = ctl
+        self._rpc          = rpc
+        self.arpd          = _ARPProxy(rpc)
+    
+    def _log(self, logtype='DBG', msg=''):
+        # logtype: 'ERR', 'WNG', 'INF', 'DBG'
+        if logtype in self.DEBUG:
+            log('[%s] [GTPUd-%i] %s' % (logtype, self.ind, msg))
+    
+    def run(self):
+        # the parent process keeps handling CTRL+C
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        self._listening = True
+        self._log('INF', 'GTP-U worker started')
+        sk_list = self.sk_list + (self._ctl, )
+        while self._listening:
+            r = select(sk_list, [], [], self.SELECT_TO)[0]
+            for sk in r:
+                if sk is self._ctl:
+                    self._handle_ctl()
+                else:
+                    self._handle_sk(sk)
+        self._log('INF', 'GTP-U worker stopped')
+    
+    def _handle_ctl(self):
+        try:
+            msg = self._ctl.recv()
+        except EOFError:
+            # parent process is gone
+            self._listening = False
+            return
+        if msg[0] == 'set':
+            self._set_ctx(*msg[1:])
+        elif msg[0] == 'del':
+            self._del_ctx(msg[1])
+        elif msg[0] == 'inj':
+            GTPUd.inj_mobile(self, *msg[1:])
+        elif msg[0] == 'stats':
+            self._rpc.send( ('stats', self.stats, self.stats_batch) )
+        elif msg[0] == 'stop':
+            self._listening = False
+    
+    def _set_ctx(self, teid_ul, ran_ip, teid_dl, ipv4buf, ipv6buf, ctx_num, addrs):
+        if ran_ip:
+            ran_info = (ran_ip[0], ran_ip[1], self.sk_int[self._sk_int_ind[ran_ip[0]]])
+        else:
+            ran_info = None
+        self._mobiles_teid[teid_ul] = [ran_info, teid_dl, ipv4buf, ipv6buf, ctx_num,
+                                       self.build_dl_tpl(ran_info, teid_dl)]
+        for addr in addrs:
+            self._mobiles_addr[addr] = teid_ul
+    
+    def _del_ctx(self, teid_ul):
+        try:
+            ran_info, teid_dl, ipv4buf, ipv6buf = self._mobiles_teid.pop(teid_ul)[:4]
+        except KeyError:
+            return
+        for addr in (ipv4buf, ipv6buf):
+            if addr and self._mobiles_addr.get(addr) == teid_ul:
+                del self._mobiles_addr[addr]
+
+
+def _gtpu_worker_run(worker):
+    try:
+        worker.run()
+    finally:
+        for sk in worker.sk_list:
+            sk.close()
+
+
+class GTPUdMP(GTPUd):
+    '''
+    multi-process GTP-U forwarder
+    
+    It provides the same API as GTPUd, but the packets are forwarded by WORKERS
+    GTPUdWorker processes, each owning a shard of the mobiles' contexts:
+    - UL GTP-U packets are dispatched according to teid_ul % WORKERS
+    - DL IP packets are dispatched according to the mobile IPv4 address, or the
+      last 4 bytes of the mobile IPv6 address, as uint32 % WORKERS
+    
+    To use it in place of GTPUd within the corenet server, set:
+    CorenetServer.GTPUd = GTPUdMP
+    
+    Worker processes are forked when the instance is created, hence modules and
+    settings that act on GTP-U payloads (MOD, DPI, BLACKHOLING, WL_*) must be 
+    set before (e.g. as class attributes). Traffic statistics are kept within 
+    each worker, and gathered into the attribute .stats by calling 
+    .collect_stats().
+    '''
+    #
+    # number of worker processes, None for the number of CPUs
+    WORKERS = None
+    #
+    # modules that can act on GTP-U payloads, copied within each worker
+    MOD_INIT = []
+    #
+    # timeout for workers to answer and to terminate
+    WORKER_TO = 1.0
+    
+    def __init__(self, threaded=True):
+        #
+        self.EXT_MAC_BUF   = mac_aton(self.EXT_MAC_ADDR)
+        self.IPV6_NET_PREF = inet_pton(AF_INET6, self.EXT_IPV6_PREF + '::')[:8]
+        # complete tables of mobiles' contexts, see GTPUd
+        self._mobiles_addr = {}
+        self._mobiles_teid = {}
+        # workers to which each context has been pushed: {teid_ul: set of ind}
+        self._mobiles_wk   = {}
+        self.stats         = {}
+        self._prot_dict    = {1:'ICMP', 6:'TCP', 17:'UDP'}
+        self.MOD           = list(self.MOD_INIT)
+        self.init_stats_batch()
+        #
+        if self.WORKERS is None:
+            self.num = multiprocessing.cpu_count()
+        else:
+            self.num = max(1, self.WORKERS)
+        #
+        # create the sockets of all workers, in order, as the index of a socket
+        # within its reuseport / fanout group is its order of creation
+        fanout_id = os.getpid() & 0xffff
+        wk_sks = []
+        for ind in range(self.num):
+            sk_ext_v4 = socket.socket(socket.AF_PACKET, socket.SOCK_RAW)
+            sk_ext_v4.bind((self.EXT_IF, 0x0800))
+            sk_ext_v4.setsockopt(SOL_PACKET, PACKET_FANOUT,
+                                 fanout_id | (PACKET_FANOUT_CBPF<<16))
+            sk_ext_v6 = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, ntohs(0x86dd))
+            sk_ext_v6.bind((self.EXT_IF, 0x86dd))
+            sk_ext_v6.setsockopt(SOL_PACKET, PACKET_FANOUT,
+                                 ((fanout_id+1) & 0xffff) | (PACKET_FANOUT_CBPF<<16))
+            if ind == 0:
+                set_promisc(sk_ext_v4, self.EXT_IF, 1)
+                set_promisc(sk_ext_v6, self.EXT_IF, 1)
+            sk_int, sk_int_ind = [], {}
+            for gtpip in self.GTP_IF:
+                sk = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                sk.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sk.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                sk.bind((gtpip, self.GTP_PORT))
+                sk_int_ind[gtpip] = len(sk_int)
+                sk_int.append(sk)
+            for sk in (sk_ext_v4, sk_ext_v6) + tuple(sk_int):
+                sk.settimeout(0.001)
+            wk_sks.append( (sk_ext_v4, sk_ext_v6, tuple(sk_int), sk_int_ind) )
+        self._sharded = self._attach_bpf(wk_sks)
+        #
+        # the parent process only uses the sockets of the 1st worker for 
+        # checking RAN IP and unsetting the promiscuous mode
+        self.sk_ext_v4, self.sk_ext_v6, self.sk_int, self._sk_int_ind = wk_sks[0]
+        self.sk_list = ()
+        self._loop   = None
+        #
+        # fork the workers, before starting any thread of ours
+        mpctx = multiprocessing.get_context('fork')
+        self._wk_ctl, self._wk_rpc, self._wk_proc = [], [], []
+        for ind in range(self.num):
+            ctl_r, ctl_w = mpctx.Pipe(duplex=False)
+            rpc_p, rpc_w = mpctx.Pipe()
+            worker = GTPUdWorker(self, ind, *wk_sks[ind], ctl=ctl_r, rpc=rpc_w)
+            proc = mpctx.Process(target=_gtpu_worker_run, args=(worker, ),
+                                 name='GTPUd-%i' % ind, daemon=True)
+            proc.start()
+            ctl_r.close()
+            rpc_w.close()
+            self._wk_ctl.append(ctl_w)
+            self._wk_rpc.append(rpc_p)
+            self._wk_proc.append(proc)
+            if ind > 0:
+                for sk in worker.sk_list:
+                    sk.close()
+        self._ctl_lock = Lock()
+        self._stats_ev, self._stats_cnt, self._stats_lock = Event(), 0, Lock()
+        #
+        # interrupt handler
+        if self.CATCH_SIGINT:
+            def sigint_handler(signum, frame):
+                if self.DEBUG > 1:
+                    self._log('INF', 'CTRL+C caught')
+                self.stop()
+            signal.signal(signal.SIGINT, sigint_handler)
+        #
+        # serve the workers' requests in background
+        self._listening  = True
+        self._listener_t = threadit(self.listen)
+        self._log('INF', 'GTP-U tunnels handler started, with %i workers%s'\
+                  % (self.num, '' if self._sharded else ' (unsharded)'))
+        #
+        # and finally start ARP resolver
+        self.arpd = ARPd(threaded=threaded)
+    
+    def _attach_bpf(self, wk_sks):
+        # attach the cBPF programs steering packets to the workers, returns
+        # True if all programs are attached
+        num = self.num
+        try:
+            # UL: TEID within the GTP-U header, after the UDP header
+            fprog, insns = bpf_prog_mod(4, num)
+            for i in range(len(self.GTP_IF)):
+                wk_sks[0][2][i].setsockopt(socket.SOL_SOCKET, SO_ATTACH_REUSEPORT_CBPF,
+                                           fprog)
+            # DL: IPv4 dest addr, and last 4 bytes of the IPv6 dest addr
+            fprog, insns = bpf_prog_mod(SKF_NET_OFF + 16, num)
+            wk_sks[0][0].setsockopt(SOL_PACKET, PACKET_FANOUT_DATA, fprog)
+            fprog, insns = bpf_prog_mod(SKF_NET_OFF + 36, num)
+            wk_sks[0][1].setsockopt(SOL_PACKET, PACKET_FANOUT_DATA, fprog)
+        except Exception as err:
+            if num > 1:
+                self._log('WNG', 'unable to attach cBPF programs, contexts are '\
+                          'replicated in all workers: %r' % err)
+                return False
+        return True
+    
+    def get_shards(self, teid_ul, ipv4buf, ipv6buf):
+        """returns the dict of {worker index: list of mobile addresses handled}
+        for a given mobile context
+        """
+        num = self.num
+        if not self._sharded:
+            addrs = [addr for addr in (ipv4buf, ipv6buf) if addr]
+            return {ind: addrs for ind in range(num)}
+        shards = {teid_ul % num: []}
+        if ipv4buf:
+            ind = unpack('>I', ipv4buf)[0] % num
+            if ind in shards:
+                shards[ind].append(ipv4buf)
+            else:
+                shards[ind] = [ipv4buf]
+        if ipv6buf:
+            ind = unpack('>I', ipv6buf[4:8])[0] % num
+            if ind in shards:
+                shards[ind].append(ipv6buf)
+            else:
+                shards[ind] = [ipv6buf]
+        return shards
+    
+    def _send_ctl(self, ind, msg):
+        try:
+            with self._ctl_lock:
+                self._wk_ctl[ind].send(msg)
+        except Exception as err:
+            self._log('ERR', 'unable to reach worker %i: %r' % (ind, err))
+    
+    def _sync_mobile(self, teid_ul):
+        # push the context for teid_ul to the workers owning its shards
+        wk_ori = self._mobiles_wk.pop(teid_ul, set())
+        if teid_ul in self._mobiles_teid:
+            ran_info, teid_dl, ipv4buf, ipv6buf, ctx_num = self._mobiles_teid[teid_ul][:5]
+            if ran_info:
+                ran_ip = ran_info[:2]
+            else:
+                ran_ip = None
+            shards = self.get_shards(teid_ul, ipv4buf, ipv6buf)
+            for ind, addrs in shards.items():
+                self._send_ctl(ind, ('set', teid_ul, ran_ip, teid_dl, ipv4buf, ipv6buf,
+                                     ctx_num, addrs))
+            self._mobiles_wk[teid_ul] = set(shards)
+            wk_ori.difference_update(shards)
+        for ind in wk_ori:
+            self._send_ctl(ind, ('del', teid_ul))
+    
+    def add_readers(self, loop):
+        """serve the sockets of the ARP resolver with the given asyncio event 
+        loop, GTP-U sockets being served by the worker processes
+        """
+        self.arpd.add_readers(loop)
+    
+    def stop(self):
+        # stop ARP resolver
+        self.arpd.stop()
+        # stop workers and the local handler
+        if self._listening:
+            for ind in range(self.num):
+                self._send_ctl(ind, ('stop', ))
+            for proc in self._wk_proc:
+                proc.join(self.WORKER_TO)
+                if proc.is_alive():
+                    proc.terminate()
+            self._listening = False
+            sleep(self.SELECT_TO * 2)
+            try:
+                set_promisc(self.sk_ext_v4, self.EXT_IF, 0)
+                set_promisc(self.sk_ext_v6, self.EXT_IF, 0)
+                self.sk_ext_v4.close()
+                self.sk_ext_v6.close()
+                for sk in self.sk_int:
+                    sk.close()
+            except Exception as err:
+                self._log('ERR', 'socket error: %r' % err)
+            for conn in self._wk_ctl + self._wk_rpc:
+                conn.close()
+    
+    def listen(self):
+        # serve the requests from the workers
+        while self._listening:
+            try:
+                r = select(self._wk_rpc, [], [], self.SELECT_TO)[0]
+            except (OSError, ValueError):
+                # pipes closed
+                break
+            for conn in r:
+                try:
+                    msg = conn.recv()
+                except (EOFError, OSError):
+                    self._wk_rpc = [c for c in self._wk_rpc if c is not conn]
+                    continue
+                if msg[0] == 'resolve':
+                    conn.send( self.arpd.resolve(msg[1]) )
+                elif msg[0] == 'stats':
+                    self._merge_stats(*msg[1:])
+        #
+        self._log('INF', 'GTPU handler stopped')
+    
+    def _merge_stats(self, stats, stats_batch):
+        # called from the listen() thread, while collect_stats() resets the
+        # counters from the caller's thread (late replies may still come in
+        # after a timeout)
+        with self._stats_lock:
+            for ip, ipstats in stats.items():
+                if ip not in self.stats:
+                    self.init_stats(ip)
+                for key, val in ipstats.items():
+                    self.stats[ip][key].update(val)
+            for key, val in stats_batch.items():
+                if key == 'rx_max':
+                    self._stats_batch[key] = max(self._stats_batch[key], val)
+                else:
+                    self._stats_batch[key] += val
+            self._stats_cnt -= 1
+            if self._stats_cnt <= 0:
+                self._stats_ev.set()
+    
+    def collect_stats(self):
+        """gather the traffic statistics from all workers into .stats, and the
+        batch statistics into .stats_batch, and return .stats
+        """
+        with self._stats_lock:
+            self._stats_ev.clear()
+            self._stats_cnt = self.num
+            self._stats_batch = {key: 0 for key in self.stats_batch}
+        for ind in range(self.num):
+            self._send_ctl(ind, ('stats', ))
+        if not self._stats_ev.wait(self.WORKER_TO):
+            self._log('WNG', 'traffic statistics not received from all workers')
+        with self._stats_lock:
+            self.stats_batch = dict(self._stats_batch)
+        return self.stats
+    
+    #--------------------------------------------------------------------------#
+    # UE management
+    #--------------------------------------------------------------------------#
+    
+    def add_mobile(self, teid_ul, mobile_addr, ran_ip, teid_dl):
+        GTPUd.add_mobile(self, teid_ul, mobile_addr, ran_ip, teid_dl)
+        self._sync_mobile(teid_ul)
+    
+    def set_mobile_dl(self, teid_ul, ran_ip=None, teid_dl=None):
+        GTPUd.set_mobile_dl(self, teid_ul, ran_ip, teid_dl)
+        self._sync_mobile(teid_ul)
+    
+    def rem_mobile(self, teid_ul):
+        GTPUd.rem_mobile(self, teid_ul)
+        self._sync_mobile(teid_ul)
+    
+    #--------------------------------------------------------------------------#
+    # DL packet injection
+    #--------------------------------------------------------------------------#
+    
+    def inj_mobile(self, ip4addr, ipbuf):
+        ip4b = inet_aton(ip4addr)
+        if ip4b not in self._mobiles_addr:
+            self._log('INF', 'unknown IP address: %s' % ip4addr)
+            return
+        # the worker owning the DL shard of the address sends the packet
+        if self._sharded:
+            ind = unpack('>I', ip4b)[0] % self.num
+        else:
+            ind = 0
+        self._send_ctl(ind, ('inj', ip4addr, ipbuf))
+
+
 
 class _DPI(object):
     
@@ -39,6 +39,7 @@ from threading import Thread, Lock, Event
 from random    import SystemRandom, randint
 from time      import time, sleep
 from datetime  import datetime
+from heapq     import heappush, heappop, heapify
 from socket    import AF_INET, AF_INET6, AF_PACKET, ntohl, htonl, ntohs, htons
 
 # SCTP support for NGAP / S1AP / HNBAP / RUA interfaces
@@ -130,6 +131,9 @@ PDU_SS_Facility = SS.SS_Facility.Facility
 # objects' value will be mixed in case a thread ctxt switch occurs between 
 # the fg interpreter and the bg CorenetServer loop, and both accesses the same
 # ASN.1 modules / objects
+# the CorenetServer itself now only uses the .decode() / .encode() methods of
+# the PDU objects, which work on a thread-local copy of them: the locks below
+# are only kept for user's scripts accessing the global PDU objects directly
 ASN_READY_NGAP  = Event()
 ASN_READY_S1AP  = Event()
 ASN_READY_HNBAP = Event()
@@ -366,6 +370,119 @@ def threadit(f, *args, **kwargs):
     return t
 
 
+#------------------------------------------------------------------------------#
+# NAS procedures timers
+#------------------------------------------------------------------------------#
+# NAS signalling procedures register the expiry time of their timer when they
+# start it, and cancel it when they end: the server only handles the timers 
+# that expire, instead of scanning all UEs and all their procedures.
+
+class ProcTimers(object):
+    """heap of NAS signalling procedures' timers, ordered by expiry time
+    
+    counters:
+        cnt_start: number of timers started
+        cnt_canc : number of timers cancelled
+        cnt_exp  : number of timers expired
+    """
+    
+    # the heap is rebuilt when cancelled entries represent more than half of it
+    COMPACT_MIN = 256
+    
+    # callable, called when a timer is started that expires before all others 
+    # (e.g. to reschedule an event loop callback)
+    notify = None
+    
+    def __init__(self):
+        # heap entries: [stop time, sequence number, procedure, procedure stack]
+        self._heap  = []
+        # {procedure: heap entry}
+        self._entry = {}
+        self._seq   = 0
+        self._lock  = Lock()
+        self.cnt_start, self.cnt_canc, self.cnt_exp = 0, 0, 0
+    
+    def __len__(self):
+        return len(self._entry)
+    
+    def start(self, proc, stop, stack):
+        """registers the timer of the procedure `proc' expiring at time `stop',
+        `stack' being the list or dict of procedures that contains `proc' as 
+        long as it is ongoing
+        
+        a timer already registered for `proc' is replaced
+        """
+        with self._lock:
+            if proc in self._entry:
+                self._entry.pop(proc)[2] = None
+                self.cnt_canc += 1
+            self._seq += 1
+            entry = [stop, self._seq, proc, stack]
+            self._entry[proc] = entry
+            heappush(self._heap, entry)
+            self.cnt_start += 1
+            first = self._heap[0] is entry
+        if first and self.notify is not None:
+            self.notify()
+    
+    def cancel(self, proc):
+        """cancels the timer registered for the procedure `proc', if any
+        """
+        with self._lock:
+            if proc in self._entry:
+                # the heap entry is discarded lazily
+                self._entry.pop(proc)[2] = None
+                self.cnt_canc += 1
+                if len(self._heap) > self.COMPACT_MIN \
+                and len(self._heap) > 2 * len(self._entry):
+                    self._heap = [e for e in self._heap if e[2] is not None]
+                    heapify(self._heap)
+    
+    def expire(self, T):
+        """unregisters all timers expiring before time `T', and returns the 
+        list of corresponding 2-tuple (procedure, procedure stack)
+        """
+        procs = []
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][0] < T:
+                stop, _, proc, stack = heappop(heap)
+                if proc is None:
+                    # cancelled
+                    continue
+                del self._entry[proc]
+                self.cnt_exp += 1
+                procs.append( (proc, stack) )
+        return procs
+    
+    def next_stop(self):
+        """returns the expiry time of the next timer to expire, or None
+        """
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][2] is None:
+                heappop(heap)
+            return heap[0][0] if heap else None
+    
+    @staticmethod
+    def ongoing(proc, stack):
+        """returns True if the procedure `proc' is still within its `stack'
+        """
+        if isinstance(stack, dict):
+            return proc in stack.values()
+        else:
+            return proc in stack
+    
+    def get_stats(self):
+        """returns a dict with the number of pending, started, cancelled and
+        expired timers
+        """
+        return {'pending': len(self._entry),
+                'start'  : self.cnt_start,
+                'cancel' : self.cnt_canc,
+                'expire' : self.cnt_exp}
+
+
 #------------------------------------------------------------------------------#
 # global constants
 #------------------------------------------------------------------------------#
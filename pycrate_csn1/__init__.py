@@ -27,4 +27,4 @@
 # *--------------------------------------------------------
 #*/
 
-__all__ = ['utils', 'trans', 'csnobj']
+__all__ = ['utils', 'trans', 'csnobj', 'csncomp', 'lazy']
@@ -0,0 +1,768 @@
+# -*- coding: UTF-8 -*-
+#/**
+# * Software Name : pycrate
+# * Version : 0.4
+# *
+# * This library is free software; you can redistribute it and/or
+# * modify it under the terms of the GNU Lesser General Public
+# * License as published by the Free Software Foundation; either
+# * version 2.1 of the License, or (at your option) any later version.
+# *
+# * This library is distributed in the hope that it will be useful,
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# * Lesser General Public License for more details.
+# *
+# * You should have received a copy of the GNU Lesser General Public
+# * License along with this library; if not, write to the Free Software
+# * Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# * MA 02110-1301  USA
+# *
+# *--------------------------------------------------------
+# * File Name : pycrate_csn1/csncomp.py
+# *--------------------------------------------------------
+#*/
+
+from pycrate_core.utils  import *
+
+from .utils  import *
+from .csnobj import CSN1Obj, CSN1Bit, CSN1Val, CSN1Ref, CSN1List, CSN1Alt, \
+                    CSN1SelfRef
+
+
+#------------------------------------------------------------------------------#
+# compiled CSN.1 codec
+#------------------------------------------------------------------------------#
+# Instead of interpreting the tree of CSN.1 objects for each message (like
+# CSN1Obj._from_char_csn() and CSN1Obj._to_pack_csn() do, with the global
+# _root_obj, and the transfer of the offset and value into each object), Python
+# functions are generated for a given root CSN.1 object: 1 decoder and 1 encoder
+# function per list and alternative, where bit fields and fixed values are
+# inlined. The offset within the padding pattern and the values of the
+# enclosing lists, required to resolve dynamic references, are passed as local
+# variables. Bits are extracted from the whole buffer converted to an integer.
+#
+# The compiled codec returns the same values (as get_val()) and buffers as the
+# interpreted one. It does not set values into the CSN.1 objects, except for
+# the length of bit fields consuming all remaining bits (_valbl), which is
+# required for re-encoding them; hence, it can be used from several threads at
+# once. When decoding a self-reference fails within a truncated list or a
+# repetition, the interpreted runtime keeps the partial value into the root
+# object, whereas the compiled codec discards it.
+#
+# The compiled codec is enabled per root object, by setting its _CSN_COMP
+# attribute to True (e.g. with compile_modules()); CSN1Obj.from_bytes() and
+# to_bytes() then dispatch to it, compiling it at first use. Clones of the
+# root object share the compiled codec. CSN1Obj.decode() and encode() always
+# use it, and work on values only.
+
+_ERRS = '(CSN1NoCharErr, CSN1InvalidValueErr)'
+
+
+def _indent(lines, n=4):
+    return [n*' ' + l for l in lines]
+
+
+def _csn_getu(char, B, L, bl):
+    # same as char.get_uint(bl), with B the integer value of the buffer of
+    # L bits
+    c = char._cur
+    if bl < 0 or c + bl > char._len_bit:
+        raise(CSN1NoCharErr())
+    elif bl == 0:
+        return None
+    char._cur = c + bl
+    return (B >> (L - c - bl)) & ((1 << bl) - 1)
+
+
+def _csn_altsel(char, B, L, sel):
+    # selects the key of an alternative, from the shortest to the longest
+    # sel: tuple of (key length, {uint value: key})
+    c = char._cur
+    for kl, keys in sel:
+        if c + kl > char._len_bit:
+            raise(CSN1NoCharErr())
+        k = keys.get((B >> (L - c - kl)) & ((1 << kl) - 1))
+        if k is not None:
+            return k, kl
+    raise(CSN1InvalidValueErr())
+
+
+def _csn_refval(val):
+    if isinstance(val, str_types):
+        # CSN1T_BSTR
+        return int(val, 2)
+    else:
+        return val
+
+
+def _csn_refunres(name, ref):
+    logger.warning('%s: unable to resolve reference, %s' % (name, ref))
+    return 0
+
+
+def _csn_refnone():
+    raise(AssertionError('no enclosing object to resolve the reference'))
+
+
+def _pad_bits(k, Lb, off):
+    # converts the L / H bit-string k into a 0 / 1 bit-string at offset off
+    # within the padding pattern Lb
+    return ''.join([Lb[(off+i)%8] if c == 'L' else '01'[Lb[(off+i)%8] == '0'] \
+                    for i, c in enumerate(k)])
+
+
+def _key_uints(k, pad, Lb):
+    # returns the uint value of the key or fixed value k, or the tuple of uint
+    # values at each offset within the padding pattern, or None if k cannot be
+    # decoded
+    if pad:
+        return tuple([int(_pad_bits(k, Lb, off), 2) for off in range(8)])
+    elif set(k) <= set('01'):
+        return int(k, 2)
+    else:
+        return None
+
+
+class _CSN1Compiler(object):
+    """
+    generates the Python source code of the decoder and encoder functions for a
+    given root CSN.1 object
+    """
+
+    def __init__(self, ns):
+        # ns: namespace dict shared by the generated functions
+        self.ns    = ns
+        self.src   = []
+        self._fn   = {}
+        self._need = {}
+        self._cnt  = 0
+
+    #--------------------------------------------------------------------------#
+    # namespace handling
+    #--------------------------------------------------------------------------#
+
+    def bind(self, obj, pref='_c'):
+        name = '%s%i' % (pref, id(obj))
+        if name not in self.ns:
+            self.ns[name] = obj
+        return name
+
+    def tmp(self, pref):
+        self._cnt += 1
+        return '%s%i' % (pref, self._cnt)
+
+    #--------------------------------------------------------------------------#
+    # structure
+    #--------------------------------------------------------------------------#
+
+    @staticmethod
+    def children(X):
+        # returns the list of (instance expression, CSN1Obj) for the content of
+        # the list or alternative X
+        if isinstance(X, CSN1List):
+            return [('X._list[%i]' % i, O) for i, O in enumerate(X._list)]
+        else:
+            return [('X._alt[%r][1][%i]' % (k, i), O) for k, alt in X._alt.items() \
+                    if k is not None for i, O in enumerate(alt[1])]
+
+    @staticmethod
+    def root_of(Obj):
+        while Obj._par is not None:
+            Obj = Obj._par
+        return Obj
+
+    @staticmethod
+    def refs(O):
+        return [r for r in (O._num, O._lref, getattr(O, '_bit', None)) \
+                if isinstance(r, tuple)]
+
+    @staticmethod
+    def ref_depth(O, ref):
+        # returns the number of enclosing objects to go through for resolving
+        # ref, 0 being the parent of O
+        if isinstance(ref[0], str_types):
+            return 0
+        depth = 0
+        for r in ref[0]:
+            if r == -1:
+                depth += 1
+            else:
+                break
+        return depth
+
+    def need(self, X):
+        """
+        returns the number of values of enclosing lists and alternatives
+        required by the decoder / encoder of X
+        """
+        if id(X) in self._need:
+            return self._need[id(X)]
+        n = 0
+        for oi, O in self.children(X):
+            for ref in self.refs(O):
+                n = max(n, self.ref_depth(O, ref))
+            if isinstance(O, (CSN1List, CSN1Alt)):
+                n = max(n, self.need(O) - 1)
+        self._need[id(X)] = n
+        return n
+
+    def ref(self, O, ref):
+        """
+        returns an expression resolving the dynamic reference ref of O, within
+        the function of the parent of O, as CSN1Obj._resolve_ref() does
+        """
+        if ref[0][0] == '#':
+            return '_csn_refunres(%r, %r)' % (O._name, ref[0])
+        par, depth = O._par, 0
+        if par is None:
+            return '_csn_refnone()'
+        for r in ref[0]:
+            if r == -1:
+                par, depth = par._par, depth + 1
+                if par is None:
+                    return '_csn_refnone()'
+            else:
+                if depth == 0:
+                    lst = 'val'
+                else:
+                    lst = 'P[%i]' % (depth-1)
+                return '%s(_csn_refval(%s[%i]))' % (self.bind(ref[1]), lst, r)
+        return 'None'
+
+    def par_vals(self, O):
+        # returns the expression for the values of enclosing lists and
+        # alternatives to be passed to the function of O
+        if O._par is not None and self.need(O):
+            return '(val, ) + P'
+        else:
+            return '()'
+
+    def _off_add(self, n):
+        if n % 8:
+            return ['off = (off + %i) %% 8' % n]
+        else:
+            return []
+
+    #--------------------------------------------------------------------------#
+    # decoders
+    #--------------------------------------------------------------------------#
+
+    def dec_one(self, O, oi):
+        """
+        returns a list of lines decoding a single iteration of O (as
+        O._from_char_obj()), setting its value in v and updating off
+        """
+        if isinstance(O, CSN1Bit):
+            if isinstance(O._bit, integer_types) and O._bit > 0:
+                bl = O._bit
+                lines = ['c = char._cur',
+                         'if c + %i > char._len_bit:' % bl,
+                         '    raise(CSN1NoCharErr())',
+                         'char._cur = c + %i' % bl,
+                         'v = (B >> (L - c - %i)) & 0x%x' % (bl, (1<<bl)-1)] + \
+                        self._off_add(bl)
+                if O._type == CSN1T_BSTR:
+                    lines.append('v = uint_to_bitstr(v, %i)' % bl)
+                return lines
+            if isinstance(O._bit, tuple):
+                lines = ['bl = %s' % self.ref(O, O._bit)]
+            elif O._bit == -1:
+                lines = ['bl = char._len_bit - char._cur',
+                         '%s._valbl = bl' % oi]
+            else:
+                lines = ['bl = %i' % O._bit]
+            lines.extend(['v = _csn_getu(char, B, L, bl)',
+                          'off = (off + bl) % 8'])
+            if O._type == CSN1T_BSTR:
+                lines.append('v = uint_to_bitstr(v, bl)')
+            return lines
+        #
+        elif isinstance(O, CSN1Val):
+            if O._stat == 'null' or not O._stat:
+                return ['v = None']
+            bl = len(O._stat)
+            exp = _key_uints(O._stat, O._pad_gsm, O.Lb)
+            if exp is None:
+                # a value which cannot be decoded
+                return ['if char._cur + %i > char._len_bit:' % bl,
+                        '    raise(CSN1NoCharErr())',
+                        'char._cur += %i' % bl,
+                        'raise(CSN1InvalidValueErr())']
+            elif O._pad_gsm:
+                exp = '%s[off]' % self.bind(exp)
+            else:
+                exp = '0x%x' % exp
+            return ['c = char._cur',
+                    'if c + %i > char._len_bit:' % bl,
+                    '    raise(CSN1NoCharErr())',
+                    'char._cur = c + %i' % bl,
+                    'if ((B >> (L - c - %i)) & 0x%x) != %s:' % (bl, (1<<bl)-1, exp),
+                    '    raise(CSN1InvalidValueErr())',
+                    'v = %r' % O._stat] + self._off_add(bl)
+        #
+        elif isinstance(O, (CSN1List, CSN1Alt)):
+            return ['v, off = %s(char, B, L, off, %s, %s, R)' \
+                    % (self.dec_node(O), self.par_vals(O), oi)]
+        #
+        elif isinstance(O, CSN1Ref):
+            return ['v, off = %s(char, B, L, off, %s._obj)' % (self.dec_root(O._obj), oi)]
+        #
+        elif isinstance(O, CSN1SelfRef):
+            return ['v, off = %s(char, B, L, off, R)' % self.dec_root(self.root_of(O))]
+        #
+        else:
+            raise(CSN1Err('{0}: unable to compile object of type {1}'\
+                  .format(O._name, O.__class__.__name__)))
+
+    def _dec_rep(self, one, num):
+        # in case of error, the offset is not updated with the iterations
+        # already decoded
+        return ['o = off',
+                'vl = []',
+                'try:',
+                '    for _ in range(%s):' % num] + _indent(one + ['vl.append(v)'], 8) + \
+               ['except %s:' % _ERRS,
+                '    off = o',
+                '    raise',
+                'v = vl']
+
+    def _dec_inf(self, O, one):
+        # repeat until the end of the buffer or an error, in which case the
+        # buffer is rewinded (but lists and alternatives keep their offset)
+        lines = ['vl = []',
+                 'while char._len_bit - char._cur:',
+                 '    cc = char._cur',
+                 '    try:'] + _indent(one, 8) + [
+                 '    except %s as err:' % _ERRS,
+                 '        char._cur = cc']
+        if isinstance(O, (CSN1List, CSN1Alt)):
+            lines.append('        off = err._off')
+        return lines + ['        break',
+                        '    vl.append(v)',
+                        'v = vl']
+
+    def dec_obj(self, O, oi):
+        """
+        returns a list of lines decoding O (as O._from_char_csn()), with its
+        length limitation and repetitions, setting its value in v and
+        updating off
+        """
+        lines = []
+        if O._lref is not None:
+            lb = self.tmp('lb')
+            if isinstance(O._lref, integer_types):
+                lref = '%i' % O._lref
+            else:
+                lref = self.ref(O, O._lref)
+            lines.extend(['%s = char._len_bit' % lb,
+                          'char._len_bit = char._cur + %s' % lref,
+                          'if char._len_bit > %s:' % lb,
+                          '    raise(AssertionError(\'invalid length limitation\'))'])
+        one = self.dec_one(O, oi)
+        if isinstance(O._num, tuple):
+            lines.append('n = %s' % self.ref(O, O._num))
+            lines.extend(['if n == 1:'] + _indent(one) + \
+                         ['elif n > 1:'] + _indent(self._dec_rep(one, 'n')) + \
+                         ['elif n == -1:'] + _indent(self._dec_inf(O, one)) + \
+                         ['else:',
+                          '    raise(AssertionError(\'invalid number of repetitions\'))'])
+        elif O._num == 1:
+            lines.extend(one)
+        elif O._num > 1:
+            lines.extend(self._dec_rep(one, '%i' % O._num))
+        elif O._num == -1:
+            lines.extend(self._dec_inf(O, one))
+        else:
+            lines.append('raise(AssertionError(\'invalid number of repetitions\'))')
+        if O._lref is not None:
+            lines.append('char._len_bit = %s' % lb)
+        return lines
+
+    def dec_root(self, Obj):
+        """
+        generates the decoder function for the root object Obj and returns its
+        name
+        """
+        key = ('c', id(Obj))
+        if key in self._fn:
+            return self._fn[key]
+        fname = '_c%i' % id(Obj)
+        self._fn[key] = fname
+        body = self.dec_obj(Obj, 'R') + ['return v, off']
+        self.src.extend(['def %s(char, B, L, off, R):' % fname] + _indent(body) + [''])
+        return fname
+
+    def dec_node(self, X):
+        """
+        generates the decoder function for the list or alternative X and
+        returns its name
+        """
+        key = ('d', id(X))
+        if key in self._fn:
+            return self._fn[key]
+        fname = '_d%i' % id(X)
+        self._fn[key] = fname
+        if isinstance(X, CSN1List):
+            head = ['val = []']
+            body = []
+            for i, O in enumerate(X._list):
+                body.extend(self.dec_obj(O, 'X._list[%i]' % i) + ['val.append(v)'])
+        else:
+            head = self._dec_altsel(X) + ['val = [k]']
+            body, cond = [], 'if'
+            for k, (name, objs) in X._alt.items():
+                if k is None:
+                    continue
+                alt = []
+                for i, O in enumerate(objs):
+                    alt.extend(self.dec_obj(O, 'X._alt[%r][1][%i]' % (k, i)) + \
+                               ['val.append(v)'])
+                body.extend(['%s k == %r:' % (cond, k)] + _indent(alt or ['pass']))
+                cond = 'elif'
+        # the offset reached is kept into the error, for the caller repeating X
+        exc = ['except %s as err:' % _ERRS,
+               '    err._off = off',
+               '    raise(err)']
+        if X._trunc:
+            if len(head) > 1:
+                head = ['try:'] + _indent(head) + exc
+            if body:
+                body = ['try:'] + _indent(body) + ['except %s:' % _ERRS,
+                                                   '    pass']
+            body = head + body
+        else:
+            body = ['try:'] + _indent(head + body) + exc
+        body.append('return val, off')
+        self.src.extend(['def %s(char, B, L, off, P, X, R):' % fname] + \
+                        _indent(body) + [''])
+        return fname
+
+    def _dec_altsel(self, X):
+        # returns a list of lines selecting the alternative key k
+        lines = ['rem = char._len_bit - char._cur']
+        cond = 'if'
+        if '' in X._alt:
+            lines.extend(['if rem > 0:',
+                          '    k = \'\''])
+            cond = 'elif'
+        if None in X._alt:
+            lines.extend(['%s rem == 0:' % cond,
+                          '    return [], off'])
+            cond = 'elif'
+        sel = self._dec_keysel(X)
+        if cond == 'elif':
+            lines.extend(['else:'] + _indent(sel))
+        else:
+            lines.extend(sel)
+        return lines
+
+    def _dec_keysel(self, X):
+        pad, Lb = X._pad_gsm, X.Lb
+        # {key length: {uint value or tuple of uint values per offset: key}}
+        kord = {}
+        for k in X._alt:
+            if k:
+                u = _key_uints(k, pad, Lb)
+                if u is not None:
+                    if len(k) not in kord:
+                        kord[len(k)] = {}
+                    kord[len(k)][u] = k
+        if not kord:
+            return ['raise(CSN1InvalidValueErr())']
+        klen = sorted(kord)
+        kmax = klen[-1]
+        # dispatch tables (for each offset, if pad), of (key, key length)
+        # indexed by the uint value of the next kmax bits
+        if pad:
+            offs = range(8)
+        else:
+            offs = [None]
+        if kmax <= X._KDISP_MAX:
+            tabs = []
+            for off in offs:
+                tab = [None] * (1 << kmax)
+                for kl in klen:
+                    for u, k in kord[kl].items():
+                        if off is not None:
+                            u = u[off]
+                        u <<= (kmax - kl)
+                        for i in range(u, u + (1 << (kmax - kl))):
+                            if tab[i] is None:
+                                tab[i] = (k, kl) if len(klen) > 1 else k
+                tabs.append(tuple(tab))
+            if pad:
+                tab = '%s[off]' % self.bind(tuple(tabs))
+            else:
+                tab = self.bind(tabs[0])
+            if len(klen) == 1:
+                return ['c = char._cur',
+                        'if c + %i > char._len_bit:' % kmax,
+                        '    raise(CSN1NoCharErr())',
+                        'k = %s[(B >> (L - c - %i)) & 0x%x]' % (tab, kmax, (1<<kmax)-1),
+                        'if k is None:',
+                        '    raise(CSN1InvalidValueErr())',
+                        'char._cur = c + %i' % kmax] + self._off_add(kmax)
+        # per-length selection, when there are not enough bits for kmax
+        sels = []
+        for off in offs:
+            sel = []
+            for kl in klen:
+                if off is None:
+                    sel.append( (kl, dict(kord[kl])) )
+                else:
+                    sel.append( (kl, dict([(u[off], k) for u, k in kord[kl].items()])) )
+            sels.append(tuple(sel))
+        if pad:
+            sel = '%s[off]' % self.bind(tuple(sels))
+        else:
+            sel = self.bind(sels[0])
+        if kmax <= X._KDISP_MAX:
+            return ['c = char._cur',
+                    'if char._len_bit - c >= %i:' % kmax,
+                    '    kk = %s[(B >> (L - c - %i)) & 0x%x]' % (tab, kmax, (1<<kmax)-1),
+                    '    if kk is None:',
+                    '        raise(CSN1InvalidValueErr())',
+                    '    k, kl = kk',
+                    'else:',
+                    '    k, kl = _csn_altsel(char, B, L, %s)' % sel,
+                    'char._cur = c + kl',
+                    'off = (off + kl) % 8']
+        else:
+            return ['c = char._cur',
+                    'k, kl = _csn_altsel(char, B, L, %s)' % sel,
+                    'char._cur = c + kl',
+                    'off = (off + kl) % 8']
+
+    #--------------------------------------------------------------------------#
+    # encoders
+    #--------------------------------------------------------------------------#
+
+    def enc_one(self, O, w, oi):
+        """
+        returns a list of lines encoding a single iteration of O (as
+        O._to_pack_obj()), which value is w, and updating off
+        """
+        if isinstance(O, CSN1Bit):
+            if O._type == CSN1T_UINT:
+                tv = 'CSN1T_UINT, %s' % w
+            else:
+                tv = 'CSN1T_BSTR, int(%s, 2)' % w
+            if isinstance(O._bit, integer_types) and O._bit >= 0:
+                return self._off_add(O._bit) + ['GEN.append((%s, %i))' % (tv, O._bit)]
+            elif isinstance(O._bit, tuple):
+                lines = ['bl = %s' % self.ref(O, O._bit)]
+            elif O._bit == -1:
+                return ['bl = getattr(%s, \'_valbl\', None)' % oi,
+                        'if bl is not None:',
+                        '    off = (off + bl) % 8',
+                        '    GEN.append((%s, bl))' % tv]
+            else:
+                lines = ['bl = %i' % O._bit]
+            return lines + ['off = (off + bl) % 8',
+                            'GEN.append((%s, bl))' % tv]
+        #
+        elif isinstance(O, CSN1Val):
+            if O._stat == 'null' or not O._stat:
+                return []
+            bl = len(O._stat)
+            if O._pad_gsm:
+                Lb = ''.join(map(str, O.Lv))
+                u = '%s[off]' % self.bind(_key_uints(O._stat, 1, Lb))
+            else:
+                u = '0x%x' % int(O._stat, 2)
+            return ['GEN.append((CSN1T_UINT, %s, %i))' % (u, bl)] + self._off_add(bl)
+        #
+        elif isinstance(O, (CSN1List, CSN1Alt)):
+            return ['off = %s(GEN, %s, off, %s, %s, R)' \
+                    % (self.enc_node(O), w, self.par_vals(O), oi)]
+        #
+        elif isinstance(O, CSN1Ref):
+            return ['off = %s(GEN, %s, off, %s._obj)' % (self.enc_root(O._obj), w, oi)]
+        #
+        elif isinstance(O, CSN1SelfRef):
+            return ['off = %s(GEN, %s, off, R)' % (self.enc_root(self.root_of(O)), w)]
+        #
+        else:
+            raise(CSN1Err('{0}: unable to compile object of type {1}'\
+                  .format(O._name, O.__class__.__name__)))
+
+    def _enc_rep(self, O, w, oi, num=None):
+        lines = ['ww = %s' % w,
+                 'if not isinstance(ww, list):',
+                 '    raise(AssertionError(\'invalid repeated value\'))']
+        if num is not None:
+            lines.extend(['if len(ww) != %s:' % num,
+                          '    raise(AssertionError(\'invalid number of repetitions\'))'])
+        return lines + ['for w in ww:'] + _indent(self.enc_one(O, 'w', oi) or ['pass'])
+
+    def enc_obj(self, O, w, oi):
+        """
+        returns a list of lines encoding O (as O._to_pack_csn()), with its
+        repetitions, which value is w, and updating off
+        """
+        if isinstance(O._num, tuple):
+            return ['n = %s' % self.ref(O, O._num),
+                    'if n == 1:'] + _indent(self.enc_one(O, w, oi) or ['pass']) + \
+                   ['elif n == -1:'] + _indent(self._enc_rep(O, w, oi)) + \
+                   ['elif n > 1:'] + _indent(self._enc_rep(O, w, oi, 'n')) + \
+                   ['else:',
+                    '    raise(AssertionError(\'invalid number of repetitions\'))']
+        elif O._num == 1:
+            return self.enc_one(O, w, oi)
+        elif O._num == -1:
+            return self._enc_rep(O, w, oi)
+        elif O._num > 1:
+            return self._enc_rep(O, w, oi, '%i' % O._num)
+        else:
+            return ['raise(AssertionError(\'invalid number of repetitions\'))']
+
+    def enc_root(self, Obj):
+        """
+        generates the encoder function for the root object Obj and returns its
+        name
+        """
+        key = ('f', id(Obj))
+        if key in self._fn:
+            return self._fn[key]
+        fname = '_f%i' % id(Obj)
+        self._fn[key] = fname
+        body = self.enc_obj(Obj, 'v', 'R') + ['return off']
+        self.src.extend(['def %s(GEN, v, off, R):' % fname] + _indent(body) + [''])
+        return fname
+
+    def _enc_list(self, objs, oi, ind):
+        # objs are encoded with the values val[ind:]
+        lines = ['nv = len(val)',
+                 'if nv > %i:' % (len(objs) + ind),
+                 '    raise(IndexError(\'list index out of range\'))']
+        for i, O in enumerate(objs):
+            enc = self.enc_obj(O, 'val[%i]' % (i + ind), oi % i)
+            if enc:
+                lines.extend(['if nv > %i:' % (i + ind)] + _indent(enc))
+        return lines
+
+    def enc_node(self, X):
+        """
+        generates the encoder function for the list or alternative X and
+        returns its name
+        """
+        key = ('e', id(X))
+        if key in self._fn:
+            return self._fn[key]
+        fname = '_e%i' % id(X)
+        self._fn[key] = fname
+        if isinstance(X, CSN1List):
+            body = ['if val is not None:'] + \
+                   _indent(self._enc_list(X._list, 'X._list[%i]', 0))
+        else:
+            body = []
+            if None in X._alt:
+                body.extend(['if not val:',
+                             '    return off'])
+            body.extend(['k = val[0]',
+                         'if not isinstance(k, str_types):',
+                         '    raise(AssertionError(\'invalid alternative key\'))'])
+            cond = 'if'
+            for k, (name, objs) in X._alt.items():
+                if k is None:
+                    continue
+                alt = []
+                if k:
+                    if X._pad_gsm:
+                        Lb = ''.join(map(str, X.Lv))
+                        u = '%s[off]' % self.bind(_key_uints(k, 1, Lb))
+                    else:
+                        u = '0x%x' % int(k, 2)
+                    alt.append('GEN.append((CSN1T_UINT, %s, %i))' % (u, len(k)))
+                    alt.extend(self._off_add(len(k)))
+                alt.extend(self._enc_list(objs, 'X._alt[%r][1][%%i]' % k, 1))
+                body.extend(['%s k == %r:' % (cond, k)] + _indent(alt))
+                cond = 'elif'
+            if cond == 'elif':
+                body.extend(['else:',
+                             '    raise(KeyError(k))'])
+            else:
+                body.append('raise(KeyError(k))')
+        body.append('return off')
+        self.src.extend(['def %s(GEN, val, off, P, X, R):' % fname] + \
+                        _indent(body) + [''])
+        return fname
+
+
+def gen_csn1_src(Obj):
+    """
+    returns the Python source code of the compiled codec for the root object
+    Obj, and the namespace dict it must be executed within, together with the
+    names of the 2 entry points: decoder and encoder
+
+    The decoder is called with a Charpy instance and an instance of Obj (or of
+    a clone of it), and returns the 2-tuple (value, offset).
+    The encoder is called with a list or a BitWriter instance, to which the
+    3-tuples to be packed are appended, the value to be encoded, the initial
+    offset and an instance of Obj (or of a clone of it), and returns the final
+    offset.
+    """
+    if Obj._par is not None:
+        raise(CSN1Err('{0}: only root objects can be compiled'.format(Obj._name)))
+    ns = {'CSN1NoCharErr'      : CSN1NoCharErr,
+          'CSN1InvalidValueErr': CSN1InvalidValueErr,
+          'CSN1T_UINT'         : CSN1T_UINT,
+          'CSN1T_BSTR'         : CSN1T_BSTR,
+          'str_types'          : str_types,
+          'bytes_to_uint'      : bytes_to_uint,
+          'uint_to_bitstr'     : uint_to_bitstr,
+          '_csn_getu'          : _csn_getu,
+          '_csn_altsel'        : _csn_altsel,
+          '_csn_refval'        : _csn_refval,
+          '_csn_refunres'      : _csn_refunres,
+          '_csn_refnone'       : _csn_refnone}
+    comp = _CSN1Compiler(ns)
+    dec  = comp.dec_root(Obj)
+    enc  = comp.enc_root(Obj)
+    src  = comp.src + [
+        'def _csn_dec(char, R):',
+        '    if char._concat:',
+        '        char._pack()',
+        '    L = 8 * len(char._buf)',
+        '    B = bytes_to_uint(char._buf, L) if L else 0',
+        '    return %s(char, B, L, 0, R)' % dec,
+        '']
+    return '\n'.join(src) + '\n', ns, ('_csn_dec', enc)
+
+
+def compile_csn1(Obj):
+    """
+    compiles the codec for the root object Obj, for the current padding
+    patterns, and stores it into Obj._csn_comp (which is shared with its
+    clones)
+
+    returns the 2-tuple of functions (decoder, encoder), see gen_csn1_src()
+    """
+    pad = (CSN1Alt.Lb, CSN1Val.Lb)
+    if Obj._csn_comp is None:
+        Obj._csn_comp = {}
+    elif pad in Obj._csn_comp:
+        return Obj._csn_comp[pad]
+    src, ns, names = gen_csn1_src(Obj)
+    exec(compile(src, '<csncomp %s>' % Obj._name, 'exec'), ns)
+    Obj._csn_comp[pad] = (ns[names[0]], ns[names[1]])
+    return Obj._csn_comp[pad]
+
+
+def compile_modules(*args, **kwargs):
+    """
+    enables the compiled codec for all root CSN.1 objects of the given Python
+    modules (e.g. from pycrate_csn1dir or pycrate_gmr1_csn1)
+
+    kwargs:
+        lazy: bool, if True (default), each object is compiled at its first use,
+              otherwise they are all compiled immediately
+    """
+    lazy = kwargs.get('lazy', True)
+    for pymod in args:
+        for Obj in list(vars(pymod).values()):
+            if isinstance(Obj, CSN1Obj) and Obj._par is None:
+                Obj._CSN_COMP = True
+                if not lazy:
+                    compile_csn1(Obj)
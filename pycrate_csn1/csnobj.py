@@ -93,6 +93,12 @@ class CSN1Obj(Element):
     _lref = None
     _par  = None
     
+    # compiled codec, see pycrate_csn1.csncomp
+    # when enabled on a root object, from_bytes() and to_bytes() use the codec
+    # compiled at first use
+    _CSN_COMP = False
+    _csn_comp = None
+    
     @classmethod
     def set_pad_null(cls):
         cls.Lv = [0, 0, 0, 0, 0, 0, 0, 0]
@@ -272,7 +278,17 @@ class CSN1Obj(Element):
     #def _to_pack_obj(self):
     #    raise(CSN1Err('not implemented'))
     
+    def _get_csn_comp(self):
+        try:
+            return self._csn_comp[(CSN1Alt.Lb, CSN1Val.Lb)]
+        except (TypeError, KeyError):
+            from .csncomp import compile_csn1
+            return compile_csn1(self)
+    
     def _from_char(self, char):
+        if self._CSN_COMP and self._par is None:
+            self._val, self._off = self._get_csn_comp()[0](char, self)
+            return
         # TODO: ultimately, this offset reset could be removed...
         self._off = 0
         self._from_char_csn(char)
@@ -339,6 +355,10 @@ class CSN1Obj(Element):
             _root_obj = root_obj
     
     def _to_pack(self):
+        if self._CSN_COMP and self._par is None:
+            ret = []
+            self._off = self._get_csn_comp()[1](ret, self._val, 0, self)
+            return ret
         # TODO: ultimately, this offset reset could be removed...
         self._off = 0
         return self._to_pack_csn()
@@ -412,7 +432,27 @@ class CSN1Obj(Element):
         if self._val is None:
             return b''
         else:
-            return pack_val( *self._to_pack() )[0]
+            w = BitWriter()
+            w.extend(self._to_pack())
+            return w.to_bytes()
+    
+    def decode(self, buf):
+        """Decodes buf with the compiled codec of the root object, and returns 
+        the value, without setting it into self
+        """
+        if isinstance(buf, bytes_types):
+            char = Charpy(buf)
+        else:
+            char = buf
+        return self._get_csn_comp()[0](char, self)[0]
+    
+    def encode(self, val):
+        """Encodes val with the compiled codec of the root object, and returns 
+        the bytes buffer, without setting val into self
+        """
+        w = BitWriter()
+        self._get_csn_comp()[1](w, val, 0, self)
+        return w.to_bytes()
     
     # TODO: implement _from_char / _to_pack methods building structures
     # with Envelope() and Atom() elements... hard work
@@ -432,6 +472,16 @@ class CSN1Obj(Element):
             kw['lref'] = self._lref
         return kw
     
+    def _clone_set_comp(self, clo):
+        # clones share the compiled codec
+        if self._CSN_COMP != self.__class__._CSN_COMP:
+            clo._CSN_COMP = self._CSN_COMP
+        if self._csn_comp is None:
+            # to be shared with self, once compiled
+            self._csn_comp = {}
+        clo._csn_comp = self._csn_comp
+        return clo
+    
     def clone(self):
         """Returns a independant instance of self, all internal attributes
         are cloned except value
@@ -627,7 +677,7 @@ class CSN1Bit(CSN1Obj):
             kw['type'] = self._type
         if self._dic != self.__class__._dic:
             kw['dic'] = self._dic
-        return self.__class__(**kw)
+        return self._clone_set_comp(self.__class__(**kw))
     
     if _with_json:
         
@@ -708,6 +758,28 @@ class CSN1Val(CSN1Obj):
         if self._stat[-2:] == '**':
             self._stat = self._stat[:-2]
             self._num = -1
+        # uint values to be decoded, {padding pattern and offset: uint value},
+        # built at first use
+        self._stat_uint = {}
+    
+    def _get_stat_uint(self):
+        # with L / H values, the uint value depends on the padding pattern and
+        # current offset
+        if self._pad_gsm:
+            dk = (self.Lb, self._off)
+        else:
+            dk = None
+        try:
+            return self._stat_uint[dk]
+        except KeyError:
+            pass
+        if self._pad_gsm:
+            sb = [self.Lb[(self._off+i)%8] for i in range(len(self._stat))]
+            sb = ''.join([b if c == 'L' else '01'[b == '0'] for (c, b) in zip(self._stat, sb)])
+        else:
+            sb = self._stat
+        self._stat_uint[dk] = int(sb, 2)
+        return self._stat_uint[dk]
     
     def set_val(self, val):
         self._val = val
@@ -731,18 +803,11 @@ class CSN1Val(CSN1Obj):
         except CharpyErr:
             raise(CSN1NoCharErr())
         else:
-            if self._pad_gsm:
-                # convert val to a bit-string to be compared to self._stat
-                val_p = CSN1Obj.conv_b_pad_gsm(uint_to_bitstr(val, bit), self._off)
-                if self._stat != val_p:
-                    raise(CSN1InvalidValueErr())
-                else:
-                    self._val = self._stat
+            # compare val to the uint value of self._stat
+            if self._get_stat_uint() != val:
+                raise(CSN1InvalidValueErr())
             else:
-                if int(self._stat, 2) != val:
-                    raise(CSN1InvalidValueErr())
-                else:
-                    self._val = self._stat
+                self._val = self._stat
             self._off = (self._off + bit) % 8
     
     def _to_pack_obj(self):
@@ -754,7 +819,7 @@ class CSN1Val(CSN1Obj):
         if self._pad_gsm:
             bl = []
             for i, c in enumerate(self._stat):
-                p = self.Lv[self._off+i]
+                p = self.Lv[(self._off+i)%8]
                 if c == 'L':
                     # padding value
                     bl.append(p)
@@ -770,7 +835,7 @@ class CSN1Val(CSN1Obj):
     def clone(self):
         kw = self._clone_get_kw()
         kw['val'] = self._stat
-        return self.__class__(**kw)
+        return self._clone_set_comp(self.__class__(**kw))
     
     if _with_json:
         
@@ -845,7 +910,7 @@ class CSN1Ref(CSN1Obj):
     def clone(self):
         kw = self._clone_get_kw()
         kw['obj'] = self._obj.clone()
-        return self.__class__(**kw)
+        return self._clone_set_comp(self.__class__(**kw))
     
     if _with_json:
         
@@ -955,7 +1020,7 @@ class CSN1List(CSN1Obj):
             kw['list'] = [Obj.clone() for Obj in self._list]
         if self._trunc:
             kw['trunc'] = True
-        return self.__class__(**kw)
+        return self._clone_set_comp(self.__class__(**kw))
     
     if _with_json:
         
@@ -996,6 +1061,11 @@ class CSN1Alt(CSN1Obj):
         - alt  : dict of { key bit-string : 2-tuple(alternative_name, list of CSN1Obj instances) }
         - trunc: in case the list of objects within alternatives can be truncated
         - kord : dict of {key length: {set of keys of given length}}, built at init
+        - kmax : max key length, if the alternative can be selected with a 
+                 dispatch table, 0 otherwise
+        - kdisp: dict of dispatch tables {padding pattern and offset: list of 
+                 (key, key length) indexed by the uint value of kmax bits}, 
+                 built at first use
         - val  : list of CSN1Obj values
     
     specific init args:
@@ -1008,6 +1078,10 @@ class CSN1Alt(CSN1Obj):
     _alt   = {}
     _trunc = False
     
+    # max key length for which a dispatch table is built, longer keys are 
+    # tested one length after the other
+    _KDISP_MAX = 12
+    
     def __init__(self, **kw):
         CSN1Obj.__init__(self, **kw)
         if 'alt' in kw and kw['alt']:
@@ -1034,8 +1108,46 @@ class CSN1Alt(CSN1Obj):
         else:
             self._pad_gsm = 0
         #
-        klen = set([len(k) for k in keys])
+        # start with the shortest to the longest key
+        klen = sorted(set([len(k) for k in keys]))
         self._kord = {kl: set([k for k in keys if len(k) == kl]) for kl in klen}
+        #
+        if klen and klen[-1] <= self._KDISP_MAX \
+        and (self._pad_gsm or all([set(k) <= set('01') for k in keys])):
+            self._kmax = klen[-1]
+        else:
+            self._kmax = 0
+        self._kdisp = {}
+    
+    def _get_kdisp(self):
+        # dispatch table, mapping the uint value of the next kmax bits to the
+        # selected (key, key length), or None
+        # with L / H keys, it depends on the padding pattern and current offset
+        if self._pad_gsm:
+            dk = (self.Lb, self._off)
+        else:
+            dk = None
+        try:
+            return self._kdisp[dk]
+        except KeyError:
+            pass
+        km = self._kmax
+        disp = [None] * (1 << km)
+        for kl, keys in self._kord.items():
+            for k in keys:
+                if self._pad_gsm:
+                    kb = [self.Lb[(self._off+i)%8] for i in range(kl)]
+                    kb = ''.join([b if c == 'L' else '01'[b == '0'] for (c, b) in zip(k, kb)])
+                else:
+                    kb = k
+                # all values prefixed with the key, unless already selected
+                # by a shorter key
+                kv = int(kb, 2) << (km - kl)
+                for v in range(kv, kv + (1 << (km - kl))):
+                    if disp[v] is None:
+                        disp[v] = (k, kl)
+        self._kdisp[dk] = disp
+        return disp
     
     def _repr_val(self):
         if not self._val:
@@ -1091,6 +1203,14 @@ class CSN1Alt(CSN1Obj):
             # not entering any alternative
             #self._val = None
             return
+        elif self._kmax and char.len_bit() >= self._kmax:
+            # select the key with a single lookup into the dispatch table
+            kk = self._get_kdisp()[char.to_uint(self._kmax)]
+            if kk is None:
+                raise(CSN1InvalidValueErr())
+            k, kl = kk
+            char._cur += kl
+            self._off  = (self._off + kl) % 8
         else:
             # start with the shortest to the longest key
             found = False
@@ -1144,7 +1264,7 @@ class CSN1Alt(CSN1Obj):
             if self._pad_gsm:
                 bl = []
                 for i, c in enumerate(k):
-                    p = self.Lv[self._off+i]
+                    p = self.Lv[(self._off+i)%8]
                     if c == 'L':
                         # padding value
                         bl.append(p)
@@ -1182,7 +1302,9 @@ class CSN1Alt(CSN1Obj):
             clo._alt[k] = (altname, clo_altlist)
         clo._kord    = self._kord
         clo._pad_gsm = self._pad_gsm
-        return clo
+        clo._kmax    = self._kmax
+        clo._kdisp   = self._kdisp
+        return self._clone_set_comp(clo)
     
     if _with_json:
         
@@ -1283,7 +1405,7 @@ class CSN1SelfRef(CSN1Obj):
         return ret
     
     def clone(self):
-        return self.__class__(**self._clone_get_kw())
+        return self._clone_set_comp(self.__class__(**self._clone_get_kw()))
     
     if _with_json:
         
@@ -0,0 +1,87 @@
+# -*- coding: UTF-8 -*-
+#/**
+# * Software Name : pycrate
+# * Version : 0.4
+# *
+# * This library is free software; you can redistribute it and/or
+# * modify it under the terms of the GNU Lesser General Public
+# * License as published by the Free Software Foundation; either
+# * version 2.1 of the License, or (at your option) any later version.
+# *
+# * This library is distributed in the hope that it will be useful,
+# * but WITHOUT ANY WARRANTY; without even the implied warranty of
+# * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# * Lesser General Public License for more details.
+# *
+# * You should have received a copy of the GNU Lesser General Public
+# * License along with this library; if not, write to the Free Software
+# * Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# * MA 02110-1301  USA
+# *
+# *--------------------------------------------------------
+# * File Name : pycrate_csn1/lazy.py
+# *--------------------------------------------------------
+#*/
+
+import importlib
+
+
+#------------------------------------------------------------------------------#
+# lazy loading of CSN.1 objects
+#------------------------------------------------------------------------------#
+# Each Python module generated in pycrate_csn1dir or pycrate_gmr1_csn1 builds
+# the whole tree of CSN.1 objects for a given definition at import time, and
+# the modules handling GSM / GMR-1 RR messages refer to dozens of them.
+#
+# Here, a stub stands for such a CSN.1 object, and the Python module defining it
+# is only imported when the stub is used for the first time (e.g. when the
+# first message containing it is decoded or encoded). All attributes and
+# methods are then the ones of the CSN.1 object.
+
+
+class CSN1LazyObj(object):
+    """
+    stub for a CSN.1 object defined in a Python module, which is only imported
+    at first use
+
+    init args:
+        pymod: str, name of the Python module, e.g. 'pycrate_csn1dir.ia_rest_octets'
+        name : str, name of the CSN.1 object within the module,
+            default is the last component of pymod
+        clone: bool, if True, the stub stands for a clone of the CSN.1 object
+            instead of the object itself
+    """
+
+    def __init__(self, pymod, name=None, clone=False):
+        if name is None:
+            name = pymod.rsplit('.', 1)[-1]
+        object.__setattr__(self, '_lazy_', (pymod, name, clone))
+        object.__setattr__(self, '_lazy_obj_', None)
+
+    def _get_obj_(self):
+        """returns the CSN.1 object, importing its Python module if required
+        """
+        Obj = self._lazy_obj_
+        if Obj is None:
+            pymod, name, clone = self._lazy_
+            Obj = getattr(importlib.import_module(pymod), name)
+            if clone:
+                Obj = Obj.clone()
+            object.__setattr__(self, '_lazy_obj_', Obj)
+        return Obj
+
+    def __getattr__(self, attr):
+        # only called when attr is not set in the stub
+        return getattr(self._get_obj_(), attr)
+
+    def __setattr__(self, attr, val):
+        setattr(self._get_obj_(), attr, val)
+
+    def __repr__(self):
+        if self._lazy_obj_ is None:
+            return '<%s.%s (lazy)>' % self._lazy_[:2]
+        else:
+            return repr(self._lazy_obj_)
+
+    def __call__(self):
+        return self._get_obj_()()
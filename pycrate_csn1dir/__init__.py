@@ -262,3 +262,16 @@ __all__ = [
 "vgcs_neighbour_cell_information",
 "vgcs_sms_information"
 ]
+
+# the modules are only imported when accessed as attributes of the package
+# (PEP 562), e.g. pycrate_csn1dir.si2quater_rest_octets, as importing all of
+# them builds thousands of CSN.1 objects
+import importlib
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module('%s.%s' % (__name__, name))
+    raise(AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name)))
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -49,12 +49,14 @@ from .TS101376_04_08_IE         import *
 # TS 101 376 04-08 Message specified with CSN.1
 #------------------------------------------------------------------------------#
 
-from pycrate_gmr1_csn1.channel_request_type_3_message_content import channel_request_type_3_message_content
-from pycrate_gmr1_csn1.system_information_type_1 import system_information_type_1
-from pycrate_gmr1_csn1.system_information_type_2 import system_information_type_2
-from pycrate_gmr1_csn1.gbch_information import gbch_information_message
-from pycrate_gmr1_csn1.gbch3_ecef_information_message import gbch3_ecef_information_message
-from pycrate_gmr1_csn1.gbch3_kc_information_message import gbch3_kc_information_message
+from pycrate_csn1.lazy import CSN1LazyObj
+
+channel_request_type_3_message_content = CSN1LazyObj('pycrate_gmr1_csn1.channel_request_type_3_message_content')
+system_information_type_1              = CSN1LazyObj('pycrate_gmr1_csn1.system_information_type_1')
+system_information_type_2              = CSN1LazyObj('pycrate_gmr1_csn1.system_information_type_2')
+gbch_information_message               = CSN1LazyObj('pycrate_gmr1_csn1.gbch_information', 'gbch_information_message')
+gbch3_ecef_information_message         = CSN1LazyObj('pycrate_gmr1_csn1.gbch3_ecef_information_message')
+gbch3_kc_information_message           = CSN1LazyObj('pycrate_gmr1_csn1.gbch3_kc_information_message')
 
 
 #------------------------------------------------------------------------------#
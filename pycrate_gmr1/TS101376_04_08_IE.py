@@ -57,7 +57,9 @@ from pycrate_mobile.TS23038    import (
 # TS 101 376 04-08 IE specified with CSN.1
 #------------------------------------------------------------------------------#
 
-from pycrate_gmr1_csn1.prefixed_gps_position_ie import prefixed_gps_position_ie
+from pycrate_csn1.lazy import CSN1LazyObj
+
+prefixed_gps_position_ie = CSN1LazyObj('pycrate_gmr1_csn1.prefixed_gps_position_ie')
 
 
 #------------------------------------------------------------------------------#
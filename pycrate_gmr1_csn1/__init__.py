@@ -0,0 +1,293 @@
+__all__ = [
+"activation_time_ie",
+"capability_update_requirement_ie",
+"carrier_reconfiguration_type_ie",
+"cell_update_cause_ie",
+"cell_update_confirm_message_content",
+"cell_update_started_var",
+"channel_change_preparation_complete_message_content",
+"channel_info_ie",
+"channel_request_description_ie",
+"channel_request_type_3_message_content",
+"ciphering_algorithm_ie",
+"ciphering_mode_info_ie",
+"ciphering_status_var",
+"cn_domain_identity_ie",
+"cn_information_info_ie",
+"data_compression_parameter_ie",
+"downlink_direct_transfer_message_content",
+"downlink_key_exchange_message_content",
+"downlink_rlc_mac_control_message",
+"downlink_rrc_messages",
+"established_rabs_var",
+"established_signalling_connections_var",
+"establishment_cause_ie",
+"establishment_cause_var",
+"extension_ie",
+"failure_cause_and_error_information_ie",
+"failure_cause_ie",
+"failure_cause_var",
+"failure_indicator_var",
+"frequency_parameters_ie",
+"g_rnti_ie",
+"g_rnti_var",
+"gbch3_ecef_information_message",
+"gbch3_kc_information_message",
+"gbch_information",
+"geran_a_gb_security_info_ie",
+"geran_iu_mode_dtm_reject_message_content",
+"geran_iu_mode_dtm_request_message_content",
+"geran_iu_or_utran_security_info_ie",
+"geran_mobility_information_confirm_message_content",
+"geran_mobility_information_failure_message_content",
+"geran_mobility_information_message_content",
+"global_tfi_ie",
+"gmprs_ack_nack_description_ie",
+"gmprs_terminal_type_identifier_ie",
+"gmr_1_cell_identity_ie",
+"gmr_1_spotbeam_description_ie",
+"gps_position_ie",
+"gra_identity_ie",
+"gra_identity_var",
+"gra_update_cause_ie",
+"gra_update_confirm_message_content",
+"gsm_mes_security_capability_ie",
+"handover_complete_message_content",
+"handover_failure_message_content",
+"handover_reference_ie",
+"handover_traffic_carrier_info_ie",
+"incompatible_security_reconfiguration_var",
+"initial_direct_transfer_message_content",
+"initial_mes_identity_ie",
+"initial_mes_identity_var",
+"integrity_check_info_ie",
+"integrity_protection_activation_info_ie",
+"integrity_protection_activation_info_var",
+"integrity_protection_algorithm_ie",
+"integrity_protection_info_var",
+"integrity_protection_mode_info_ie",
+"inter_rat_or_mode_handover_info_with_mes_capabilities_message_content",
+"intra_domain_nas_node_selector_ie",
+"invalid_configuration_var",
+"iu_mode_channel_request_description_ie",
+"latest_configured_cn_domain_var",
+"lcs_downlink_information_message_content",
+"lcs_uplink_information_message_content",
+"link_quality_report_ie",
+"measurement_order_message_content",
+"measurement_report_message_content",
+"mes_additional_timers_and_constants_in_rrc_connected_mode_ie",
+"mes_capability_enquiry_message_content",
+"mes_capability_information_confirm_message_content",
+"mes_capability_information_message_content",
+"mes_capability_requested_var",
+"mes_capability_transferred_var",
+"mes_geran_a_gb_mode_radio_access_capability_ie",
+"mes_geran_iu_mode_radio_access_capability_ie",
+"mes_geran_iu_mode_rlc_capability_ie",
+"mes_measurement_capability_ie",
+"mes_multi_mode_and_multi_rat_capability_ie",
+"mes_positioning_capability_ie",
+"mes_rf_capability_gsm_ie",
+"mes_timers_and_constants_in_rrc_connected_mode_ie",
+"multiple_tbf_downlink_assignment_message_content",
+"multiple_tbf_timeslot_reconfigure_message_content",
+"multiple_tbf_uplink_assignment_message_content",
+"nas_message_ie",
+"nas_synchronization_info_ie",
+"nas_system_information_gsm_map_ie",
+"ordered_reconfiguration_var",
+"packet_access_reject_message_content",
+"packet_cell_change_failure_message_content",
+"packet_cell_change_order_message_content",
+"packet_channel_request_64_bit_message_content",
+"packet_channel_request_type_2_message_content",
+"packet_control_acknowledgement_message_content",
+"packet_dch_assignment_message_content",
+"packet_dch_downlink_ack_nack_message_content",
+"packet_dch_uplink_ack_nack_message_content",
+"packet_downlink_ack_nack_message_content",
+"packet_downlink_assignment_message_content",
+"packet_downlink_assignment_type_2_message_content",
+"packet_downlink_dummy_control_block_message_content",
+"packet_gmprs_resume_response_message_content",
+"packet_link_adaptation_control_message_content",
+"packet_link_control_message_content",
+"packet_link_quality_report_message_content",
+"packet_link_quality_report_type2_message_content",
+"packet_link_synchronization_ie",
+"packet_link_synchronization_parameters_ie",
+"packet_measurement_order_message_content",
+"packet_measurement_report_message_content",
+"packet_mobile_tbf_status_message_content",
+"packet_paging_request_message_content",
+"packet_pdch_release_message_content",
+"packet_resource_request_message_content",
+"packet_tbf_assignment_type_2_message_content",
+"packet_tbf_release_message_content",
+"packet_tbf_release_type_2_message_content",
+"packet_timeslot_reconfigure_message_content",
+"packet_uplink_ack_nack_message_content",
+"packet_uplink_ack_nack_type_2_message_content",
+"packet_uplink_assignment_message_content",
+"packet_uplink_assignment_type_2_message_content",
+"packet_uplink_dummy_control_block_message_content",
+"packet_uplink_talk_burst_control_message_content",
+"packet_uplink_talk_burst_control_response_message_content",
+"padding_bits",
+"paging_cause_ie",
+"paging_record_type_identifier_ie",
+"pdch_mcs_ie",
+"pdch_organization_message_content",
+"pdch_uplink_organization_ie",
+"pdcp_capability_ie",
+"pdcp_context_relocation_info_ie",
+"pdcp_info_ie",
+"pdcp_rb_information_to_reconfigure_ie",
+"pdcp_rb_information_to_setup_ie",
+"pdcp_sn_info_ie",
+"pdcp_sn_info_var",
+"physical_channel_configuration_ie",
+"physical_channel_description_ie",
+"physical_information_message_content",
+"plmn_identity_ie",
+"position_report_request_message_content",
+"position_report_response_message_content",
+"position_update_indication_message_content",
+"power_control_synch_offset_ie",
+"prach_control_parameters_ie",
+"prefixed_gps_position_ie",
+"protocol_error_cause_ie",
+"protocol_error_indicator_ie",
+"protocol_error_indicator_var",
+"protocol_error_information_ie",
+"protocol_error_information_var",
+"protocol_error_reject_var",
+"rab_binding_request_message_content",
+"rab_binding_response_message_content",
+"rab_identity_ie",
+"rab_info_ie",
+"rab_info_post_ie",
+"rab_info_to_relocate_ie",
+"rab_information_for_handover_ie",
+"rab_information_for_setup_ie",
+"rab_information_to_reconfigure_ie",
+"rab_upper_layer_reconfiguration_complete_message_content",
+"rab_upper_layer_reconfiguration_message_content",
+"radio_bearer_reconfiguration_complete_message_content",
+"radio_bearer_reconfiguration_failure_message_content",
+"radio_bearer_reconfiguration_message_content",
+"radio_bearer_release_complete_message_content",
+"radio_bearer_release_failure_message_content",
+"radio_bearer_release_message_content",
+"radio_bearer_setup_complete_message_content",
+"radio_bearer_setup_failure_message_content",
+"radio_bearer_setup_message_content",
+"rb_activation_time_info_ie",
+"rb_ciphering_synchronization_ie",
+"rb_count_c_information_ie",
+"rb_count_c_msb_information_ie",
+"rb_identity_ie",
+"rb_information_to_be_affected_ie",
+"rb_information_to_reconfigure_ie",
+"rb_information_to_release_ie",
+"rb_information_to_setup_ie",
+"rb_timer_indicator",
+"rb_timer_indicator_var",
+"rb_uplink_ciphering_activation_time_info_var",
+"rb_with_pdcp_information_ie",
+"re_establishment_timer_ie",
+"reference_ie",
+"rejection_cause_ie",
+"release_cause_ie",
+"rfc_3095_context_info_ie",
+"rlc_hfn_ie",
+"rlc_info_ie",
+"rlc_sequence_number_ie",
+"rrb_identity_ie",
+"rrc_cause_ie",
+"rrc_connection_release_complete_message_content",
+"rrc_connection_release_message_content",
+"rrc_connection_setup_complete_message_content",
+"rrc_connection_setup_message_content",
+"rrc_failure_info_message_content",
+"rrc_information_target_bss_to_source_bss_message_content",
+"rrc_information_to_target_geran_iu_mode_bss_message_content",
+"rrc_packet_downlink_assignment_ie",
+"rrc_packet_uplink_assignment_ie",
+"rrc_state_indicator_ie",
+"rrc_status_message_content",
+"rrc_transaction_identifier_ie",
+"sbss_relocation_information_message_content",
+"security_capability_ie",
+"security_mode_command_message_content",
+"security_mode_complete_message_content",
+"security_mode_failure_message_content",
+"security_modification_var",
+"segment_1a",
+"segment_2a",
+"segment_2abis",
+"segment_2b",
+"segment_2bbis",
+"segment_3a",
+"segment_3b",
+"segment_3bbis",
+"segment_3c",
+"segment_3e",
+"segment_3f",
+"segment_3g",
+"segment_3i",
+"segment_3j",
+"segment_3jbis",
+"segment_3kbis",
+"segment_4a",
+"segment_4b",
+"segment_4c",
+"segment_4d",
+"segment_4e",
+"segment_4f",
+"signalling_connection_release_indication_message_content",
+"signalling_connection_release_message_content",
+"signalling_rb_information_to_setup_ie",
+"slot_allocation_ie",
+"srns_context_info_ie",
+"start_ie",
+"start_threshold_var",
+"start_value_to_transmit_var",
+"starting_time_ie",
+"synchronization_indication_ie",
+"system_information_type_1",
+"system_information_type_2",
+"time_and_frequency_correction_ie",
+"timers_and_constants_var",
+"transactions_var",
+"transmission_rlc_discard_ie",
+"ue_cdma2000_radio_access_capability_ie",
+"ue_software_version_indicator_ie",
+"ue_utran_predefined_configuration_status_information_ie",
+"ue_utran_radio_access_capability_extension_ie",
+"ue_utran_radio_access_capability_ie",
+"unsupported_configuration_var",
+"uplink_direct_transfer_message_content",
+"uplink_key_exchange_message_content",
+"uplink_rlc_mac_control_message",
+"uplink_rrc_messages",
+"upper_layer_bearer_info_ie",
+"utran_fdd_target_cell_ie",
+"wait_indication_ie",
+"wait_time_ie",
+"zbhc_context_info_ie"
+]
+
+# the modules are only imported when accessed as attributes of the package
+# (PEP 562), e.g. pycrate_gmr1_csn1.system_information_type_1, as importing
+# all of them builds thousands of CSN.1 objects
+import importlib
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module('%s.%s' % (__name__, name))
+    raise(AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name)))
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
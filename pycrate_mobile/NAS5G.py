@@ -40,7 +40,7 @@ from .TS24011_PPSMS import PPSMSCPTypeClasses
 # TODO: migrate TS24519_TSNAF to the new TS24539 spec
 
 
-def parse_NAS5G(buf, inner=True, sec_hdr=True, null_cipher=False):
+def parse_NAS5G(buf, inner=True, sec_hdr=True, null_cipher=False, pool=None):
     """Parses a 5G NAS message bytes' buffer
     
     Args:
@@ -52,6 +52,9 @@ def parse_NAS5G(buf, inner=True, sec_hdr=True, null_cipher=False):
                  otherwise, just consider the NAS message is in plain text
         null_cipher: if True, try to decode the 1st level inner payload, even if security header
                      indicates encryption is applied, but suppose null-cipher is used
+        pool: EltPool instance or None, if set, the message instance is taken
+              from this pool, and must be released into it by the caller once
+              processed (see pycrate_core.pool)
     
     Returns:
         element, err: 2-tuple
@@ -69,10 +72,12 @@ def parse_NAS5G(buf, inner=True, sec_hdr=True, null_cipher=False):
         # 5GMM
         if sec_hdr and shdr in (1, 2, 3, 4):
             # 5GMM security protected NAS message
-            Msg = FGMMSecProtNASMessage()
+            Msg = FGMMSecProtNASMessage() if pool is None else pool.get(FGMMSecProtNASMessage)
             try:
                 Msg.from_bytes(buf)
             except Exception:
+                if pool is not None:
+                    pool.release(Msg)
                 # error 96, invalid mandatory info
                 return None, 96
             if inner and (shdr in (1, 3) or null_cipher):
@@ -80,6 +85,8 @@ def parse_NAS5G(buf, inner=True, sec_hdr=True, null_cipher=False):
                 cont, err = parse_NAS5G(Msg[3].get_val(), inner=inner)
                 if cont is not None:
                     Msg.replace(Msg[3], cont)
+                    if pool is not None:
+                        pool.taint(Msg)
                 return Msg, err
             else:
                 return Msg, 0
@@ -87,7 +94,7 @@ def parse_NAS5G(buf, inner=True, sec_hdr=True, null_cipher=False):
             # sec hdr == 0 or undefined
             # no security, straight 5GMM message
             try:
-                Msg = FGMMTypeClasses[typ]()
+                Cls = FGMMTypeClasses[typ]
             except KeyError:
                 # error 97, message type non-existent or not implemented
                 return None, 97
@@ -100,7 +107,7 @@ def parse_NAS5G(buf, inner=True, sec_hdr=True, null_cipher=False):
             # error 111, unspecified protocol error
             return None, 111
         try:
-            Msg = FGSMTypeClasses[typ]()
+            Cls = FGSMTypeClasses[typ]
         except KeyError:
             # error 97, message type non-existent or not implemented
             return None, 97
@@ -109,9 +116,12 @@ def parse_NAS5G(buf, inner=True, sec_hdr=True, null_cipher=False):
         # error 97: message type non-existent or not implemented
         return None, 97
     #
+    Msg = Cls() if pool is None else pool.get(Cls)
     try:
         Msg.from_bytes(buf)
     except Exception:
+        if pool is not None:
+            pool.release(Msg)
         # error 96, invalid mandatory info
         return None, 96
     #
@@ -124,6 +134,8 @@ def parse_NAS5G(buf, inner=True, sec_hdr=True, null_cipher=False):
                     Cont, err = parse_NAS5G(nasc[-1].get_val(), inner=inner)
                     if err == 0:
                         nasc.replace(nasc['V'], Cont)
+                        if pool is not None:
+                            pool.taint(Msg)
             #
             if typ in (65, 79, 103, 104):
                 payct, payc = Msg['PayloadContainerType'], Msg['PayloadContainer']
@@ -133,6 +145,8 @@ def parse_NAS5G(buf, inner=True, sec_hdr=True, null_cipher=False):
                     Cont, err = parse_PayCont(conttype, contbuf)
                     if err == 0:
                         payc.replace(payc['V'], Cont)
+                        if pool is not None:
+                            pool.taint(Msg)
         #
         elif pd == 46:
             if typ in (193, 201, 203, 204):
@@ -142,6 +156,8 @@ def parse_NAS5G(buf, inner=True, sec_hdr=True, null_cipher=False):
                     Cont, err = parse_PortMgmtInfoCont(ethc['V'].get_val())
                     if err == 0:
                         ethc.replace(ethc['V'], Cont)
+                        if pool is not None:
+                            pool.taint(Msg)
     #
     return Msg, 0
 
@@ -35,7 +35,7 @@ from .TS24301_ESM   import ESMTypeClasses
 from .TS24011_PPSMS import PPSMSCPTypeClasses
 
 
-def parse_NASLTE_MO(buf, inner=True, sec_hdr=True, null_cipher=False):
+def parse_NASLTE_MO(buf, inner=True, sec_hdr=True, null_cipher=False, pool=None):
     """Parses a Mobile Originated LTE NAS message bytes' buffer
     
     Args:
@@ -47,6 +47,9 @@ def parse_NASLTE_MO(buf, inner=True, sec_hdr=True, null_cipher=False):
                  otherwise, just consider the NAS message is in plain text
         null_cipher: if True, try to decode the 1st level inner payload, even if security header
                      indicates encryption is applied, but suppose null-cipher is used
+        pool: EltPool instance or None, if set, the message instance is taken
+              from this pool, and must be released into it by the caller once
+              processed (see pycrate_core.pool)
     
     Returns:
         element, err: 2-tuple
@@ -62,10 +65,12 @@ def parse_NASLTE_MO(buf, inner=True, sec_hdr=True, null_cipher=False):
         
     if sec_hdr and shdr in {1, 2, 3, 4}:
         # EMM security protected NAS message
-        Msg = EMMSecProtNASMessage()
+        Msg = EMMSecProtNASMessage() if pool is None else pool.get(EMMSecProtNASMessage)
         try:
             Msg.from_bytes(buf)
         except Exception:
+            if pool is not None:
+                pool.release(Msg)
             # error 96, invalid mandatory info
             return None, 96
         #
@@ -74,16 +79,20 @@ def parse_NASLTE_MO(buf, inner=True, sec_hdr=True, null_cipher=False):
             cont, err = parse_NASLTE_MO(Msg[3].get_val(), inner=inner)
             if cont is not None:
                 Msg.replace(Msg[3], cont)
+                if pool is not None:
+                    pool.taint(Msg)
             return Msg, err
         else:
             return Msg, 0
         
     elif sec_hdr and shdr == 12:
         # EMM service request message
-        Msg = EMMServiceRequest()
+        Msg = EMMServiceRequest() if pool is None else pool.get(EMMServiceRequest)
         try:
             Msg.from_bytes(buf)
         except Exception:
+            if pool is not None:
+                pool.release(Msg)
             return None, 96
         return Msg, 0
     
@@ -98,7 +107,7 @@ def parse_NASLTE_MO(buf, inner=True, sec_hdr=True, null_cipher=False):
             except Exception:
                 return None, 111
             try:
-                Msg = EMMTypeMOClasses[typ]()
+                Cls = EMMTypeMOClasses[typ]
             except KeyError:
                 # error 97, message type non-existent or not implemented
                 return None, 97
@@ -109,15 +118,18 @@ def parse_NASLTE_MO(buf, inner=True, sec_hdr=True, null_cipher=False):
             except Exception:
                 return None, 111
             try:
-                Msg = ESMTypeClasses[typ]()
+                Cls = ESMTypeClasses[typ]
             except KeyError:
                 return None, 97
         else:
             return None, 97
         #
+        Msg = Cls() if pool is None else pool.get(Cls)
         try:
             Msg.from_bytes(buf)
         except Exception:
+            if pool is not None:
+                pool.release(Msg)
             # error 96, invalid mandatory info
             return None, 96
         #
@@ -130,6 +142,8 @@ def parse_NASLTE_MO(buf, inner=True, sec_hdr=True, null_cipher=False):
                     cont, err = parse_NASLTE_MO(esmc[-1].get_val(), inner=inner)
                     if cont is not None:
                         esmc.replace(esmc[-1], cont)
+                        if pool is not None:
+                            pool.taint(Msg)
             if typ in {77, 98, 99}:
                 nasc   = Msg['NASContainer']
                 if not nasc.get_trans():
@@ -147,6 +161,8 @@ def parse_NASLTE_MO(buf, inner=True, sec_hdr=True, null_cipher=False):
                         except Exception:
                             return Msg, 96
                         nasc.replace(nasc[-1], cont)
+                        if pool is not None:
+                            pool.taint(Msg)
         #
         return Msg, err
 
@@ -830,6 +830,8 @@ class SCCPMessage(Envelope):
         # numptr: number of pointers
         for ind, ptr in enumerate(e._content):
             if ptr._field == 'Opt' and ptr._val == 0:
+                # no optional field
+                self._content[start+ind]._reset_opts()
                 break
             # update the charpy cursor
             char._cur = ccur + (8 * ptr.get_val()) - ((numptr-ind) * ptr._bl)
@@ -891,10 +893,29 @@ class SCCPOpt(Envelope):
         Envelope.__init__(self, *args, **kwargs)
         # build a dict of name : optional field
         self._opts = {e[0]._val: e for e in self._content}
+        # keep the initial ordering of optional fields
+        self._opts_init = list(self._content)
+    
+    def _reset_opts(self):
+        # restore all optional fields as transparent, in their initial order, 
+        # and remove unknown ones, in case the instance was already decoded
+        init = self._opts_init
+        for opt in init:
+            opt.set_trans(True)
+        if len(self._content) != len(init) or \
+        any([a is not b for a, b in zip(self._content, init)]):
+            for opt in self._content[:]:
+                if not any([opt is o for o in init]):
+                    self.remove(opt)
+            for ind, opt in enumerate(init):
+                if self._content[ind] is not opt:
+                    self.remove(opt)
+                    self.insert(ind, opt)
     
     def _from_char(self, char):
         if self.get_trans():
             return
+        self._reset_opts()
         # parse the different options in the given order
         ind = 0
         while char.len_bit() >= 8:
@@ -1548,11 +1569,15 @@ def get_scmg_msg_instances():
 # SCPP Message parser
 #------------------------------------------------------------------------------#
 
-def parse_SCCP(buf, w_scmg=True):
+def parse_SCCP(buf, w_scmg=True, pool=None):
     """Parses an SCCP message bytes' buffer
     
     Args:
         buf: SCCP message bytes' buffer
+        w_scmg: if True, parses SCMG messages further
+        pool: EltPool instance or None, if set, the message instance is taken
+              from this pool, and must be released into it by the caller once
+              processed (see pycrate_core.pool)
     
     Returns:
         element, err: 2-tuple
@@ -1563,12 +1588,15 @@ def parse_SCCP(buf, w_scmg=True):
     if not buf:
         return None, 1
     try:
-        Msg = SCCPTypeClasses[buf[0]]()
+        Cls = SCCPTypeClasses[buf[0]]
     except:
         return None, 1
+    Msg = Cls() if pool is None else pool.get(Cls)
     try:
         Msg.from_bytes(buf)
     except:
+        if pool is not None:
+            pool.release(Msg)
         return None, 2
     #
     # if SCMG, parses it further (UDT/XUDT/LUDT, ProtocolClass 0, both addresses on SSN 1)
@@ -1582,6 +1610,8 @@ def parse_SCCP(buf, w_scmg=True):
                 scmg, err = parse_SCMG(dataval.get_val())
                 if err == 0:
                     data.replace(dataval, scmg)
+                    if pool is not None:
+                        pool.taint(Msg)
         except:
             pass
     #
@@ -64,6 +64,7 @@ from pycrate_core.elt    import (
 from pycrate_core.base   import *
 from pycrate_core.repr   import *
 from pycrate_csn1.csnobj import CSN1Obj
+from pycrate_csn1.lazy   import CSN1LazyObj
 
 _logger = logging.getLogger(__name__)
 
@@ -338,12 +339,13 @@ class IE(Envelope):
     _V = None
     # _IE_stat stores an instance of an IE class that must be kept as is
     # when required (during encoding / decoding) it is cloned into _IE
+    # it can be a CSN1LazyObj stub, imported when cloned for the first time
     _IE_stat = None
     _IE      = None
     
     def __init__(self, *args, **kw):
         if 'IE' in kw:
-            if isinstance(kw['IE'], (Element, CSN1Obj)):
+            if isinstance(kw['IE'], (Element, CSN1Obj, CSN1LazyObj)):
                 self._IE_stat = kw['IE']
             elif self._SAFE_STAT:
                 raise(PycrateErr('IE [__init__]: IE type is {0}, expecting Element'\
@@ -57,11 +57,15 @@ from pycrate_mobile.TS24007 import ProtDisc_dict
 #------------------------------------------------------------------------------#
 # TS 24.008 IE specified with CSN.1
 #------------------------------------------------------------------------------#
+# those are only imported from pycrate_csn1dir when a message using them is
+# decoded or encoded, see pycrate_csn1.lazy
 
-from pycrate_csn1dir.classmark_3_value_part           import classmark_3_value_part
-from pycrate_csn1dir.ms_network_capability_value_part import ms_network_capability_value_part
-from pycrate_csn1dir.ms_ra_capability_value_part      import ms_ra_capability_value_part
-from pycrate_csn1dir.receive_npdu_number_list_value   import receive_npdu_number_list_value
+from pycrate_csn1.lazy import CSN1LazyObj
+
+classmark_3_value_part            = CSN1LazyObj('pycrate_csn1dir.classmark_3_value_part')
+ms_network_capability_value_part  = CSN1LazyObj('pycrate_csn1dir.ms_network_capability_value_part')
+ms_ra_capability_value_part       = CSN1LazyObj('pycrate_csn1dir.ms_ra_capability_value_part')
+receive_npdu_number_list_value    = CSN1LazyObj('pycrate_csn1dir.receive_npdu_number_list_value')
 
 #------------------------------------------------------------------------------#
 # str shortcuts
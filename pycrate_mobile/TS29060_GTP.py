@@ -34,6 +34,7 @@
 import logging
 from binascii import *
 from enum   import IntEnum
+from struct import Struct
 
 from pycrate_core.utils     import *
 from pycrate_core.elt       import *
@@ -5524,3 +5525,105 @@ def parse_GTP(buf):
         Msg, Err = parse_GTP_GGSN(buf)
     return Msg, Err
 
+
+#------------------------------------------------------------------------------#
+# Header-only classifier
+#------------------------------------------------------------------------------#
+# parse_GTP() instantiates the whole message structure and decodes all its IEs.
+# Here, only the header is unpacked, without building any Element, so that 
+# requests and responses can be correlated (type, TEID, sequence number) at a 
+# high rate, and only the relevant messages fully decoded afterwards.
+
+_GTPHdr_unpack      = Struct('>BBHI').unpack_from
+_GTPHdrOpt_unpack   = Struct('>BBHIHBB').unpack_from
+_GTPIETLVHdr_unpack = Struct('>BH').unpack_from
+
+# fixed length of TV IEs' value (type: length)
+GTPIETVLen_dict = {k: v[1] for k, v in GTPIEType_dict.items() if v[0] == 'TV' and v[1] >= 0}
+
+
+def classify_GTP_hdr(buf):
+    """unpacks the header of the GTPv1 message in buffer `buf' and returns a 
+    6-tuple, or None if the buffer is too short or invalid:
+    (flags, type, TEID, sequence number or None, message end offset, 
+     offset following the header and its extensions)
+    
+    this is common to GTPv1-C and GTP-U
+    """
+    if len(buf) < 8:
+        return None
+    if buf[0] & 0x7:
+        # optional fields
+        if len(buf) < 12:
+            return None
+        flags, typ, ln, teid, seq, npdu, ne = _GTPHdrOpt_unpack(buf)
+        if not flags & 0x2:
+            seq = None
+        end, off = 8 + ln, 12
+        if flags & 0x4:
+            # extension headers
+            while ne:
+                if off >= end:
+                    return None
+                ln_ext = buf[off] << 2
+                if not ln_ext or off + ln_ext > end:
+                    return None
+                off += ln_ext
+                ne = buf[off-1]
+    else:
+        flags, typ, ln, teid = _GTPHdr_unpack(buf)
+        seq, end, off = None, 8 + ln, 8
+    if end > len(buf) or off > end:
+        return None
+    return flags, typ, teid, seq, end, off
+
+
+def classify_GTP_ies(buf, off, end):
+    """returns the list of GTPv1 IEs in buffer `buf' between offsets off and end,
+    as 3-tuple (type, value offset, value length), or None if the IEs are invalid
+    """
+    ies, tvlen = [], GTPIETVLen_dict
+    while off < end:
+        typ = buf[off]
+        if typ & 0x80:
+            # TLV
+            if off + 3 > end:
+                return None
+            typ, ln = _GTPIETLVHdr_unpack(buf, off)
+            off += 3
+        elif typ in tvlen:
+            ln = tvlen[typ]
+            off += 1
+        else:
+            return None
+        if off + ln > end:
+            return None
+        ies.append( (typ, off, ln) )
+        off += ln
+    return ies
+
+
+def classify_GTP(buf, with_ies=False):
+    """classifies the buffer `buf' as GTPv1-C message from its header only, and 
+    returns a 2-tuple:
+    - 5-tuple (type, TEID, sequence number or None, message length, IEs), or None
+      if classification failed, IEs being None, or the list of top-level IEs as
+      3-tuple (type, value offset, value length) if with_ies is True
+    - error code, 0 if classification succeeded, > 0 otherwise
+    """
+    if len(buf) < 8:
+        return None, ERR_GTP_BUF_TOO_SHORT
+    hdr = classify_GTP_hdr(buf)
+    if hdr is None or hdr[0] >> 4 != 3:
+        # not GTPv1 (version 1, PT 1)
+        return None, ERR_GTP_BUF_INVALID
+    flags, typ, teid, seq, end, off = hdr
+    if typ not in GTPMsgType_dict:
+        return None, ERR_GTP_TYPE_NONEXIST
+    if with_ies:
+        ies = classify_GTP_ies(buf, off, end)
+        if ies is None:
+            return None, ERR_GTP_BUF_INVALID
+    else:
+        ies = None
+    return (typ, teid, seq, end, ies), 0
@@ -57,7 +57,10 @@ __all__ = [
     'ERR_PFCP_BUF_TOO_SHORT',
     'ERR_PFCP_BUF_INVALID',
     'ERR_PFCP_TYPE_NONEXIST',
+    'ERR_PFCP_MAND_IE_MISS',
     'parse_PFCP',
+    'classify_PFCP',
+    'classify_PFCP_ies',
     ]
 
 
@@ -69,7 +72,9 @@ __all__ = [
 # listening on UDP 8805
 
 import re
-from enum   import IntEnum
+from enum      import IntEnum
+from struct    import Struct
+from threading import local
 
 from pycrate_core.utils     import *
 from pycrate_core.elt       import *
@@ -89,6 +94,10 @@ class PFCPDecErr(PycrateErr):
     pass
 
 
+# per-thread decoding context, see parse_PFCP()
+_PFCPDecCtx = local()
+
+
 #------------------------------------------------------------------------------#
 # some utilities and generic structures
 #------------------------------------------------------------------------------#
@@ -666,14 +675,30 @@ class PFCPIEs(Sequence):
         Sequence._from_char(self, char)
         #
         # eventually verify mandatory IE
-        if self.VERIF_MAND:
-            self._ie_mand = set(self.MAND)
-            for ie in self:
-                self._ie_mand.discard( ie[0].get_val() )
+        if self.VERIF_MAND and getattr(_PFCPDecCtx, 'mand_defer', None) is not self:
+            self._set_mand_miss()
             if self._ie_mand:
                 raise(PFCPDecErr('{0}: missing mandatory IE(s), {1}'\
                       .format(self._name, ', '.join(['%i (%s)' % (i, PFCPIEType_dict[i]) for i in self._ie_mand]))))
     
+    def _set_mand_miss(self):
+        self._ie_mand = set(self.MAND)
+        for ie in self:
+            self._ie_mand.discard( ie[0].get_val() )
+    
+    def get_mand_miss(self):
+        """returns the list of missing mandatory IEs, as 2-tuple (grouped IE name,
+        mandatory IE type), within the sequence of IEs and all its grouped IEs
+        
+        This is to be used after decoding without verifying mandatory IEs.
+        """
+        self._set_mand_miss()
+        miss = [(self._name, i) for i in self._ie_mand]
+        for ie in self:
+            if isinstance(ie[3], PFCPIEs):
+                miss.extend( ie[3].get_mand_miss() )
+        return miss
+    
     def add_ie(self, ie_type, val=None):
         """add the IE of given type `ie_type` and sets the value `val` (raw bytes 
         buffer or structured data) into its data part
@@ -6066,32 +6091,107 @@ ERR_PFCP_TYPE_NONEXIST = 3
 ERR_PFCP_MAND_IE_MISS  = 4
 
 
-def parse_PFCP(buf):
+def parse_PFCP(buf, pool=None):
     """parses the buffer `buf' for PFCP message and returns a 2-tuple:
     - PFCP message structure, or None if parsing failed
     - parsing error code, 0 if parsing succeeded, > 0 otherwise
+    
+    The buffer is decoded in a single pass: the mandatory IEs of the message are
+    verified afterwards on the decoded content, the missing ones being then
+    reported by Msg[1].get_mand_miss(). This is thread-safe. As for any
+    decoding, an exception may be raised on a malformed buffer.
+    
+    If `pool' (pycrate_core.pool.EltPool) is set, the message instance is taken
+    from it, and must be released into it by the caller once processed.
     """
     if len(buf) < 8:
         return None, ERR_PFCP_BUF_TOO_SHORT
     typ = buf[1]
     try:
-        Msg = PFCPDispatcher[typ]()
+        Cls = PFCPDispatcher[typ]
     except KeyError:
         return None, ERR_PFCP_TYPE_NONEXIST
+    Msg = Cls() if pool is None else pool.get(Cls)
+    # mandatory IEs of grouped IEs are verified while decoding (a grouped IE
+    # missing one being kept as raw data), those of the message afterwards
+    mand_defer = getattr(_PFCPDecCtx, 'mand_defer', None)
+    _PFCPDecCtx.mand_defer = Msg[1]
     try:
         Msg.from_bytes(buf)
-    except PFCPDecErr:
-        PFCPIEs.VERIF_MAND = False
-        Msg = Msg.__class__()
-        try:
-            Msg.from_bytes(buf)
-            PFCPIEs.VERIF_MAND = True
-        except Exception:
-            PFCPIEs.VERIF_MAND = True
-            return None, ERR_PFCP_BUF_INVALID
-        else:
+    except Exception:
+        if pool is not None:
+            pool.release(Msg)
+        raise
+    finally:
+        _PFCPDecCtx.mand_defer = mand_defer
+    if Msg[1].VERIF_MAND:
+        Msg[1]._set_mand_miss()
+        if Msg[1]._ie_mand:
             return Msg, ERR_PFCP_MAND_IE_MISS
-    else:
-        # TODO: support piggy-backed PFCP message (FO flag)
-        return Msg, 0
+    # TODO: support piggy-backed PFCP message (FO flag)
+    return Msg, 0
 
+
+#------------------------------------------------------------------------------#
+# Header-only classifier
+#------------------------------------------------------------------------------#
+# parse_PFCP() instantiates the whole message structure and decodes all its IEs.
+# Here, only the header is unpacked, without building any Element, so that 
+# requests and responses can be correlated (type, SEID, sequence number) at a 
+# high rate, and only the relevant messages fully decoded afterwards.
+
+_PFCPHdr_unpack     = Struct('>BBHQI').unpack_from
+_PFCPHdrNoS_unpack  = Struct('>BBHI').unpack_from
+_PFCPIEHdr_unpack   = Struct('>HH').unpack_from
+
+
+def classify_PFCP_ies(buf, off, end):
+    """returns the list of PFCP IEs in buffer `buf' between offsets off and end,
+    as 3-tuple (type, value offset, value length), or None if the IEs are invalid
+    
+    the value of vendor-specific IEs (type >= 32768) starts with the enterprise 
+    ID
+    """
+    ies = []
+    while off < end:
+        if off + 4 > end:
+            return None
+        typ, ln = _PFCPIEHdr_unpack(buf, off)
+        off += 4
+        if off + ln > end:
+            return None
+        ies.append( (typ, off, ln) )
+        off += ln
+    return ies
+
+
+def classify_PFCP(buf, with_ies=False):
+    """classifies the buffer `buf' as PFCP message from its header only, and 
+    returns a 2-tuple:
+    - 5-tuple (type, SEID or None, sequence number, message length, IEs), or None
+      if classification failed, IEs being None, or the list of top-level IEs as
+      3-tuple (type, value offset, value length) if with_ies is True
+    - error code, 0 if classification succeeded, > 0 otherwise
+    """
+    if len(buf) < 8:
+        return None, ERR_PFCP_BUF_TOO_SHORT
+    if buf[0] & 0x1:
+        if len(buf) < 16:
+            return None, ERR_PFCP_BUF_TOO_SHORT
+        flags, typ, ln, seid, seq = _PFCPHdr_unpack(buf)
+        off = 16
+    else:
+        flags, typ, ln, seq = _PFCPHdrNoS_unpack(buf)
+        seid, off = None, 8
+    end = 4 + ln
+    if flags >> 5 != 1 or end > len(buf) or end < off:
+        return None, ERR_PFCP_BUF_INVALID
+    if typ not in PFCPDispatcher:
+        return None, ERR_PFCP_TYPE_NONEXIST
+    if with_ies:
+        ies = classify_PFCP_ies(buf, off, end)
+        if ies is None:
+            return None, ERR_PFCP_BUF_INVALID
+    else:
+        ies = None
+    return (typ, seid, seq >> 8, end, ies), 0
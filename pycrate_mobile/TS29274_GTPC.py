@@ -38,7 +38,9 @@
 # release 16 (h11)
 #------------------------------------------------------------------------------#
 
-from enum   import IntEnum
+from enum      import IntEnum
+from struct    import Struct
+from threading import local
 
 from pycrate_core.utils import *
 from pycrate_core.elt   import *
@@ -72,9 +74,11 @@ from pycrate_mobile.TS24008_IE      import (
     TMGI as _TMGI,
     MSCm2,
     classmark_3_value_part,
-    ms_network_capability_value_part,
     SuppCodecList,
     )
+# MMContextMSNetCap embeds it directly in its _GEN, hence requires the actual
+# CSN.1 object and not the lazy one from TS24008_IE
+from pycrate_csn1dir.ms_network_capability_value_part import ms_network_capability_value_part
 from pycrate_mobile.TS44018_IE      import (
     ChanNeeded,
     )
@@ -95,6 +99,10 @@ class GTPCDecErr(PycrateErr):
     pass
 
 
+# per-thread decoding context, see parse_GTPC()
+_GTPCDecCtx = local()
+
+
 #------------------------------------------------------------------------------#
 # GTP-C header
 # TS 29.274, section 5.1
@@ -4072,14 +4080,30 @@ class GTPCIEs(Sequence):
         Sequence._from_char(self, char)
         #
         # eventually verify mandatory IE
-        if self.VERIF_MAND:
-            self._ie_mand = set(self.MAND)
-            for ie in self:
-                self._ie_mand.discard( (ie[0]['Type'].get_val(), ie[0]['Inst'].get_val()) )
+        if self.VERIF_MAND and getattr(_GTPCDecCtx, 'mand_defer', None) is not self:
+            self._set_mand_miss()
             if self._ie_mand:
                 raise(GTPCDecErr('{0}: missing mandatory IE(s), {1}'\
                       .format(self._name, ', '.join([self.MAND[k][1] for k in self._ie_mand]))))
     
+    def _set_mand_miss(self):
+        self._ie_mand = set(self.MAND)
+        for ie in self:
+            self._ie_mand.discard( (ie[0]['Type'].get_val(), ie[0]['Inst'].get_val()) )
+    
+    def get_mand_miss(self):
+        """returns the list of missing mandatory IEs, as 2-tuple (grouped IE name,
+        mandatory IE name), within the sequence of IEs and all its grouped IEs
+        
+        This is to be used after decoding without verifying mandatory IEs.
+        """
+        self._set_mand_miss()
+        miss = [(self._name, self.MAND[k][1]) for k in self._ie_mand]
+        for ie in self:
+            if isinstance(ie[1], GTPCIEs):
+                miss.extend( ie[1].get_mand_miss() )
+        return miss
+    
     def add_ie(self, ie_type, ie_inst=0, val=None):
         """add the IE of given type `ie_type` and instance `ie_inst` and sets the
         value `val` (raw bytes buffer or structured data) into its data part
@@ -7592,32 +7616,113 @@ ERR_GTPC_TYPE_NONEXIST = 3
 ERR_GTPC_MAND_IE_MISS  = 4
 
 
-def parse_GTPC(buf):
+def parse_GTPC(buf, pool=None):
     """parses the buffer `buf' for GTPv2-C message and returns a 2-tuple:
     - GTPv2-C message structure, or None if parsing failed
     - parsing error code, 0 if parsing succeeded, > 0 otherwise
+    
+    The buffer is decoded in a single pass: the mandatory IEs of the message are
+    verified afterwards on the decoded content, the missing ones being then
+    reported by Msg[1].get_mand_miss(). This is thread-safe. As for any
+    decoding, an exception may be raised on a malformed buffer.
+    
+    If `pool' (pycrate_core.pool.EltPool) is set, the message instance is taken
+    from it, and must be released into it by the caller once processed.
     """
     if len(buf) < 8:
         return None, ERR_GTPC_BUF_TOO_SHORT
     typ = buf[1]
     try:
-        Msg = GTPCDispatcher[typ]()
+        Cls = GTPCDispatcher[typ]
     except KeyError:
         return None, ERR_GTPC_TYPE_NONEXIST
+    Msg = Cls() if pool is None else pool.get(Cls)
+    # mandatory IEs of grouped IEs are verified while decoding (a grouped IE
+    # missing one being kept as raw data), those of the message afterwards
+    mand_defer = getattr(_GTPCDecCtx, 'mand_defer', None)
+    _GTPCDecCtx.mand_defer = Msg[1]
     try:
         Msg.from_bytes(buf)
-    except GTPCDecErr:
-        GTPCIEs.VERIF_MAND = False
-        Msg = Msg.__class__()
-        try:
-            Msg.from_bytes(buf)
-            GTPCIEs.VERIF_MAND = True
-        except Exception:
-            GTPCIEs.VERIF_MAND = True
-            return None, ERR_GTPC_BUF_INVALID
-        else:
+    except Exception:
+        if pool is not None:
+            pool.release(Msg)
+        raise
+    finally:
+        _GTPCDecCtx.mand_defer = mand_defer
+    if Msg[1].VERIF_MAND:
+        Msg[1]._set_mand_miss()
+        if Msg[1]._ie_mand:
             return Msg, ERR_GTPC_MAND_IE_MISS
-    else:
-        # TODO: support piggy-backed GTP-C message (see 5.5.1 and P flag)
-        return Msg, 0
+    # TODO: support piggy-backed GTP-C message (see 5.5.1 and P flag)
+    return Msg, 0
 
+
+#------------------------------------------------------------------------------#
+# Header-only classifier
+#------------------------------------------------------------------------------#
+# parse_GTPC() instantiates the whole message structure and decodes all its IEs.
+# Here, only the header is unpacked, without building any Element, so that 
+# requests and responses can be correlated (type, TEID, sequence number) at a 
+# high rate, and only the relevant messages fully decoded afterwards.
+
+_GTPCHdr_unpack     = Struct('>BBHII').unpack_from
+_GTPCHdrNoT_unpack  = Struct('>BBHI').unpack_from
+_GTPCIEHdr_unpack   = Struct('>BHB').unpack_from
+
+
+def classify_GTPC_ies(buf, off, end):
+    """returns the list of GTPv2-C IEs in buffer `buf' between offsets off and 
+    end, as 4-tuple (type, instance, value offset, value length), or None if the
+    IEs are invalid
+    
+    the type of an IE with extended type (254) is its extended type
+    """
+    ies = []
+    while off < end:
+        if off + 4 > end:
+            return None
+        typ, ln, inst = _GTPCIEHdr_unpack(buf, off)
+        off += 4
+        if off + ln > end:
+            return None
+        if typ == 254:
+            if ln < 2:
+                return None
+            typ = (buf[off] << 8) + buf[off+1]
+            ies.append( (typ, inst & 0xf, off+2, ln-2) )
+        else:
+            ies.append( (typ, inst & 0xf, off, ln) )
+        off += ln
+    return ies
+
+
+def classify_GTPC(buf, with_ies=False):
+    """classifies the buffer `buf' as GTPv2-C message from its header only, and 
+    returns a 2-tuple:
+    - 5-tuple (type, TEID or None, sequence number, message length, IEs), or None
+      if classification failed, IEs being None, or the list of top-level IEs as
+      4-tuple (type, instance, value offset, value length) if with_ies is True
+    - error code, 0 if classification succeeded, > 0 otherwise
+    """
+    if len(buf) < 8:
+        return None, ERR_GTPC_BUF_TOO_SHORT
+    if buf[0] & 0x8:
+        if len(buf) < 12:
+            return None, ERR_GTPC_BUF_TOO_SHORT
+        flags, typ, ln, teid, seq = _GTPCHdr_unpack(buf)
+        off = 12
+    else:
+        flags, typ, ln, seq = _GTPCHdrNoT_unpack(buf)
+        teid, off = None, 8
+    end = 4 + ln
+    if flags >> 5 != 2 or end > len(buf) or end < off:
+        return None, ERR_GTPC_BUF_INVALID
+    if typ not in GTPCDispatcher:
+        return None, ERR_GTPC_TYPE_NONEXIST
+    if with_ies:
+        ies = classify_GTPC_ies(buf, off, end)
+        if ies is None:
+            return None, ERR_GTPC_BUF_INVALID
+    else:
+        ies = None
+    return (typ, teid, seq >> 8, end, ies), 0
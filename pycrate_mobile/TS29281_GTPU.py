@@ -40,6 +40,7 @@ __all__ = [
     'GTPUType',
     'GTPUDispatcher',
     'parse_GTPU',
+    'classify_GTPU',
     'ERR_GTPU_BUF_TOO_SHORT',
     'ERR_GTPU_BUF_INVALID',
     'ERR_GTPU_TYPE_NONEXIST'
@@ -67,7 +68,10 @@ from pycrate_mobile.TS29060_GTP     import (
     GTPHdrExtList,
     GTPHdrOpt,
     ProtType_dict,
-    GTPHdr
+    GTPHdr,
+    # header-only classifier
+    classify_GTP_hdr,
+    classify_GTP_ies,
     )
 from pycrate_mobile.TS38415_PDUSess import *
 
@@ -429,3 +433,23 @@ def parse_GTPU(buf):
     else:
         return Msg, 0
 
+
+def classify_GTPU(buf):
+    """classifies the buffer `buf' as GTP-U message from its header only, without
+    building any Element, and returns a 2-tuple:
+    - 5-tuple (type, TEID, sequence number or None, message length, payload 
+      offset), or None if classification failed, the payload offset pointing to
+      the T-PDU or to the IEs, following the header and its extensions
+    - error code, 0 if classification succeeded, > 0 otherwise
+    
+    IEs of non-G-PDU messages can be listed with classify_GTP_ies()
+    """
+    if len(buf) < 8:
+        return None, ERR_GTPU_BUF_TOO_SHORT
+    hdr = classify_GTP_hdr(buf)
+    if hdr is None or hdr[0] >> 4 != 3:
+        return None, ERR_GTPU_BUF_INVALID
+    flags, typ, teid, seq, end, off = hdr
+    if typ not in GTPUDispatcher:
+        return None, ERR_GTPU_TYPE_NONEXIST
+    return (typ, teid, seq, end, off), 0
@@ -45,60 +45,61 @@ from .TS24008_IE import LAI, RAI, ID, MSCm2, BroadcastCallRef, TMGI, AddUpdatePa
 #------------------------------------------------------------------------------#
 # TS 44.018 IE specified with CSN.1
 #------------------------------------------------------------------------------#
-
-from pycrate_csn1dir.ba_list_pref           import ba_list_pref
-from pycrate_csn1dir.utran_freq_list        import utran_freq_list
-from pycrate_csn1dir.individual_priorities  import individual_priorities
-from pycrate_csn1dir.classmark_3_value_part import classmark_3_value_part
-from pycrate_csn1dir.dynamic_arfcn_mapping  import dynamic_arfcn_mapping
-from pycrate_csn1dir.ia_rest_octets         import ia_rest_octets
-from pycrate_csn1dir.ipa_rest_octets        import ipa_rest_octets
-from pycrate_csn1dir.iax_rest_octets        import iax_rest_octets
-from pycrate_csn1dir.iar_rest_octets        import iar_rest_octets
-from pycrate_csn1dir.notification_facch     import notification_facch
-from pycrate_csn1dir.ntn_rest_octets        import ntn_rest_octets
-from pycrate_csn1dir.vbs_vgcs_reconfigure   import vbs_vgcs_reconfigure
-from pycrate_csn1dir.vbs_vgcs_reconfigure2  import vbs_vgcs_reconfigure2
-from pycrate_csn1dir.p1_rest_octets         import p1_rest_octets
-from pycrate_csn1dir.p2_rest_octets         import p2_rest_octets
-from pycrate_csn1dir.p3_rest_octets         import p3_rest_octets
-from pycrate_csn1dir.si1_rest_octets        import si1_rest_octets
-from pycrate_csn1dir.si2bis_rest_octets     import si2bis_rest_octets
-from pycrate_csn1dir.si2ter_rest_octets     import si2ter_rest_octets
-from pycrate_csn1dir.si2quater_rest_octets  import si2quater_rest_octets
-from pycrate_csn1dir.si2n_rest_octets       import si2n_rest_octets
-from pycrate_csn1dir.si3_rest_octet         import si3_rest_octet
-from pycrate_csn1dir.si4_rest_octets        import si4_rest_octets
-from pycrate_csn1dir.si6_rest_octets        import si6_rest_octets
-from pycrate_csn1dir.si9_rest_octets        import si9_rest_octets
-from pycrate_csn1dir.si_13_rest_octets      import si_13_rest_octets
-from pycrate_csn1dir.si16_rest_octets       import si16_rest_octets, si17_rest_octets
-from pycrate_csn1dir.si_19_rest_octets      import si_19_rest_octets
-from pycrate_csn1dir.si_18_rest_octets      import si_18_rest_octets
-from pycrate_csn1dir.si14_rest_octets       import si14_rest_octets
-from pycrate_csn1dir.si15_rest_octets       import si15_rest_octets
-from pycrate_csn1dir.si_13alt_rest_octets   import si_13alt_rest_octets
-from pycrate_csn1dir.si_21_rest_octets      import si_21_rest_octets
-from pycrate_csn1dir.si_22_rest_octets      import si_22_rest_octets
-from pycrate_csn1dir.si_23_rest_octets      import si_23_rest_octets
-from pycrate_csn1dir.gprs_broadcast_information_value_part      import gprs_broadcast_information_value_part
-from pycrate_csn1dir.rr_packet_uplink_assignment_value_part     import rr_packet_uplink_assignment_value_part
-from pycrate_csn1dir.rr_packet_downlink_assignment_value_part   import rr_packet_downlink_assignment_value_part
-from pycrate_csn1dir.dtm_information_details_value_part         import dtm_information_details_value_part
-from pycrate_csn1dir.channel_request_description_2_value_part   import channel_request_description_2_value_part
-from pycrate_csn1dir.packet_channel_description                 import packet_channel_description
-from pycrate_csn1dir.measurement_results_contents               import measurement_results_contents
-from pycrate_csn1dir.gprs_broadcast_information_value_part      import gprs_broadcast_information_value_part
-from pycrate_csn1dir.mprach_description_value_part              import mprach_description_value_part
-from pycrate_csn1dir.mbms_p_t_m_channel_description_value_part  import mbms_p_t_m_channel_description_value_part
-from pycrate_csn1dir.mbms_session_parameters_list_value_part    import mbms_session_parameters_list_value_part
-from pycrate_csn1dir.ec_packet_channel_description_type_1       import ec_packet_channel_description_type_1
-from pycrate_csn1dir.rr_packet_downlink_assignment_type_2_value_part import \
-    rr_packet_downlink_assignment_type_2_value_part
-from pycrate_csn1dir.ec_immediate_assignment_type_2_message_content  import \
-    ec_immediate_assignment_type_2_message_content
-from pycrate_csn1dir.cell_selection_indicator_after_release_of_all_tch_and_sdcch_value_part import \
-    cell_selection_indicator_after_release_of_all_tch_and_sdcch_value_part
+# those are only imported from pycrate_csn1dir when a message using them is
+# decoded or encoded, see pycrate_csn1.lazy
+
+from pycrate_csn1.lazy import CSN1LazyObj
+
+ba_list_pref                                     = CSN1LazyObj('pycrate_csn1dir.ba_list_pref')
+utran_freq_list                                  = CSN1LazyObj('pycrate_csn1dir.utran_freq_list')
+individual_priorities                            = CSN1LazyObj('pycrate_csn1dir.individual_priorities')
+classmark_3_value_part                           = CSN1LazyObj('pycrate_csn1dir.classmark_3_value_part')
+dynamic_arfcn_mapping                            = CSN1LazyObj('pycrate_csn1dir.dynamic_arfcn_mapping')
+ia_rest_octets                                   = CSN1LazyObj('pycrate_csn1dir.ia_rest_octets')
+ipa_rest_octets                                  = CSN1LazyObj('pycrate_csn1dir.ipa_rest_octets')
+iax_rest_octets                                  = CSN1LazyObj('pycrate_csn1dir.iax_rest_octets')
+iar_rest_octets                                  = CSN1LazyObj('pycrate_csn1dir.iar_rest_octets')
+notification_facch                               = CSN1LazyObj('pycrate_csn1dir.notification_facch')
+ntn_rest_octets                                  = CSN1LazyObj('pycrate_csn1dir.ntn_rest_octets')
+vbs_vgcs_reconfigure                             = CSN1LazyObj('pycrate_csn1dir.vbs_vgcs_reconfigure')
+vbs_vgcs_reconfigure2                            = CSN1LazyObj('pycrate_csn1dir.vbs_vgcs_reconfigure2')
+p1_rest_octets                                   = CSN1LazyObj('pycrate_csn1dir.p1_rest_octets')
+p2_rest_octets                                   = CSN1LazyObj('pycrate_csn1dir.p2_rest_octets')
+p3_rest_octets                                   = CSN1LazyObj('pycrate_csn1dir.p3_rest_octets')
+si1_rest_octets                                  = CSN1LazyObj('pycrate_csn1dir.si1_rest_octets')
+si2bis_rest_octets                               = CSN1LazyObj('pycrate_csn1dir.si2bis_rest_octets')
+si2ter_rest_octets                               = CSN1LazyObj('pycrate_csn1dir.si2ter_rest_octets')
+si2quater_rest_octets                            = CSN1LazyObj('pycrate_csn1dir.si2quater_rest_octets')
+si2n_rest_octets                                 = CSN1LazyObj('pycrate_csn1dir.si2n_rest_octets')
+si3_rest_octet                                   = CSN1LazyObj('pycrate_csn1dir.si3_rest_octet')
+si4_rest_octets                                  = CSN1LazyObj('pycrate_csn1dir.si4_rest_octets')
+si6_rest_octets                                  = CSN1LazyObj('pycrate_csn1dir.si6_rest_octets')
+si9_rest_octets                                  = CSN1LazyObj('pycrate_csn1dir.si9_rest_octets')
+si_13_rest_octets                                = CSN1LazyObj('pycrate_csn1dir.si_13_rest_octets')
+si16_rest_octets                                 = CSN1LazyObj('pycrate_csn1dir.si16_rest_octets')
+si17_rest_octets                                 = CSN1LazyObj('pycrate_csn1dir.si16_rest_octets', 'si17_rest_octets')
+si_19_rest_octets                                = CSN1LazyObj('pycrate_csn1dir.si_19_rest_octets')
+si_18_rest_octets                                = CSN1LazyObj('pycrate_csn1dir.si_18_rest_octets')
+si14_rest_octets                                 = CSN1LazyObj('pycrate_csn1dir.si14_rest_octets')
+si15_rest_octets                                 = CSN1LazyObj('pycrate_csn1dir.si15_rest_octets')
+si_13alt_rest_octets                             = CSN1LazyObj('pycrate_csn1dir.si_13alt_rest_octets')
+si_21_rest_octets                                = CSN1LazyObj('pycrate_csn1dir.si_21_rest_octets')
+si_22_rest_octets                                = CSN1LazyObj('pycrate_csn1dir.si_22_rest_octets')
+si_23_rest_octets                                = CSN1LazyObj('pycrate_csn1dir.si_23_rest_octets')
+gprs_broadcast_information_value_part            = CSN1LazyObj('pycrate_csn1dir.gprs_broadcast_information_value_part')
+rr_packet_uplink_assignment_value_part           = CSN1LazyObj('pycrate_csn1dir.rr_packet_uplink_assignment_value_part')
+rr_packet_downlink_assignment_value_part         = CSN1LazyObj('pycrate_csn1dir.rr_packet_downlink_assignment_value_part')
+dtm_information_details_value_part               = CSN1LazyObj('pycrate_csn1dir.dtm_information_details_value_part')
+channel_request_description_2_value_part         = CSN1LazyObj('pycrate_csn1dir.channel_request_description_2_value_part')
+packet_channel_description                       = CSN1LazyObj('pycrate_csn1dir.packet_channel_description')
+measurement_results_contents                     = CSN1LazyObj('pycrate_csn1dir.measurement_results_contents')
+mprach_description_value_part                    = CSN1LazyObj('pycrate_csn1dir.mprach_description_value_part')
+mbms_p_t_m_channel_description_value_part        = CSN1LazyObj('pycrate_csn1dir.mbms_p_t_m_channel_description_value_part')
+mbms_session_parameters_list_value_part          = CSN1LazyObj('pycrate_csn1dir.mbms_session_parameters_list_value_part')
+ec_packet_channel_description_type_1             = CSN1LazyObj('pycrate_csn1dir.ec_packet_channel_description_type_1')
+rr_packet_downlink_assignment_type_2_value_part  = CSN1LazyObj('pycrate_csn1dir.rr_packet_downlink_assignment_type_2_value_part')
+ec_immediate_assignment_type_2_message_content   = CSN1LazyObj('pycrate_csn1dir.ec_immediate_assignment_type_2_message_content')
+cell_selection_indicator_after_release_of_all_tch_and_sdcch_value_part = CSN1LazyObj('pycrate_csn1dir.cell_selection_indicator_after_release_of_all_tch_and_sdcch_value_part')
 
 
 #------------------------------------------------------------------------------#
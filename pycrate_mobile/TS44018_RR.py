@@ -39,32 +39,34 @@ from pycrate_core.base  import *
 from .TS24007    import *
 from .TS44018_IE import *
 
-from pycrate_csn1dir.notification_facch                             import notification_facch
-from pycrate_csn1dir.vbs_vgcs_reconfigure                           import vbs_vgcs_reconfigure
-from pycrate_csn1dir.vbs_vgcs_reconfigure2                          import vbs_vgcs_reconfigure2
-from pycrate_csn1dir.ec_system_information_type_1                   import ec_system_information_type_1
-from pycrate_csn1dir.ec_system_information_type_2                   import ec_system_information_type_2
-from pycrate_csn1dir.ec_system_information_type_3                   import ec_system_information_type_3
-from pycrate_csn1dir.ec_system_information_type_4                   import ec_system_information_type_4
-from pycrate_csn1dir.uplink_free                                    import uplink_free
-from pycrate_csn1dir.vgcs_additional_info                           import vgcs_additional_info
-from pycrate_csn1dir.vgcs_sms_information                           import vgcs_sms_information
-from pycrate_csn1dir.system_information_type_10                     import system_information_type_10
-from pycrate_csn1dir.system_information_type_10bis                  import system_information_type_10bis
-from pycrate_csn1dir.system_information_type_10ter                  import system_information_type_10ter
-from pycrate_csn1dir.measurement_information                        import measurement_information
-from pycrate_csn1dir.enhanced_measurement_report                    import enhanced_measurement_report
-from pycrate_csn1dir.vgcs_neighbour_cell_information                import vgcs_neighbour_cell_information
-from pycrate_csn1dir.notify_application_data                        import notify_application_data
-from pycrate_csn1dir.ec_immediate_assignment_type_2_message_content import ec_immediate_assignment_type_2_message_content
-from pycrate_csn1dir.ec_immediate_assignment_reject_message_content import ec_immediate_assignment_reject_message_content
-from pycrate_csn1dir.ec_dummy_message_content                       import ec_dummy_message_content
-from pycrate_csn1dir.ec_paging_request_message_content              import ec_paging_request_message_content
-from pycrate_csn1dir.ec_downlink_assignment_message_content         import ec_downlink_assignment_message_content
-from pycrate_csn1dir.ec_immediate_assignment_type_4_message_content import ec_immediate_assignment_type_4_message_content
-from pycrate_csn1dir.ec_downlink_assignment_message_type_2_content  import ec_downlink_assignment_message_type_2_content
-from pycrate_csn1dir.ec_immediate_assignment_type_3_message_content import ec_immediate_assignment_type_3_message_content
-from pycrate_csn1dir.ec_paging_indication                           import ec_paging_indication
+from pycrate_csn1.lazy import CSN1LazyObj
+
+notification_facch                             = CSN1LazyObj('pycrate_csn1dir.notification_facch')
+vbs_vgcs_reconfigure                           = CSN1LazyObj('pycrate_csn1dir.vbs_vgcs_reconfigure')
+vbs_vgcs_reconfigure2                          = CSN1LazyObj('pycrate_csn1dir.vbs_vgcs_reconfigure2')
+ec_system_information_type_1                   = CSN1LazyObj('pycrate_csn1dir.ec_system_information_type_1')
+ec_system_information_type_2                   = CSN1LazyObj('pycrate_csn1dir.ec_system_information_type_2')
+ec_system_information_type_3                   = CSN1LazyObj('pycrate_csn1dir.ec_system_information_type_3')
+ec_system_information_type_4                   = CSN1LazyObj('pycrate_csn1dir.ec_system_information_type_4')
+uplink_free                                    = CSN1LazyObj('pycrate_csn1dir.uplink_free')
+vgcs_additional_info                           = CSN1LazyObj('pycrate_csn1dir.vgcs_additional_info')
+vgcs_sms_information                           = CSN1LazyObj('pycrate_csn1dir.vgcs_sms_information')
+system_information_type_10                     = CSN1LazyObj('pycrate_csn1dir.system_information_type_10')
+system_information_type_10bis                  = CSN1LazyObj('pycrate_csn1dir.system_information_type_10bis')
+system_information_type_10ter                  = CSN1LazyObj('pycrate_csn1dir.system_information_type_10ter')
+measurement_information                        = CSN1LazyObj('pycrate_csn1dir.measurement_information')
+enhanced_measurement_report                    = CSN1LazyObj('pycrate_csn1dir.enhanced_measurement_report')
+vgcs_neighbour_cell_information                = CSN1LazyObj('pycrate_csn1dir.vgcs_neighbour_cell_information')
+notify_application_data                        = CSN1LazyObj('pycrate_csn1dir.notify_application_data')
+ec_immediate_assignment_type_2_message_content = CSN1LazyObj('pycrate_csn1dir.ec_immediate_assignment_type_2_message_content')
+ec_immediate_assignment_reject_message_content = CSN1LazyObj('pycrate_csn1dir.ec_immediate_assignment_reject_message_content')
+ec_dummy_message_content                       = CSN1LazyObj('pycrate_csn1dir.ec_dummy_message_content')
+ec_paging_request_message_content              = CSN1LazyObj('pycrate_csn1dir.ec_paging_request_message_content')
+ec_downlink_assignment_message_content         = CSN1LazyObj('pycrate_csn1dir.ec_downlink_assignment_message_content')
+ec_immediate_assignment_type_4_message_content = CSN1LazyObj('pycrate_csn1dir.ec_immediate_assignment_type_4_message_content')
+ec_downlink_assignment_message_type_2_content  = CSN1LazyObj('pycrate_csn1dir.ec_downlink_assignment_message_type_2_content')
+ec_immediate_assignment_type_3_message_content = CSN1LazyObj('pycrate_csn1dir.ec_immediate_assignment_type_3_message_content')
+ec_paging_indication                           = CSN1LazyObj('pycrate_csn1dir.ec_paging_indication')
 
 
 #------------------------------------------------------------------------------#
@@ -1971,37 +1973,37 @@ def get_rr_msg_instances():
 #------------------------------------------------------------------------------#
 
 RRShortPDTypeMsg = {
-    0 : system_information_type_10.clone(),
-    1 : notification_facch.clone(),
-    2 : uplink_free.clone(),
-    4 : enhanced_measurement_report.clone(), # UL
-    5 : measurement_information.clone(), # DL
-    6 : vbs_vgcs_reconfigure.clone(),
-    7 : vbs_vgcs_reconfigure2.clone(),
-    8 : vgcs_additional_info.clone(),
-    9 : vgcs_sms_information.clone(),
-    10: system_information_type_10bis.clone(),
-    11: system_information_type_10ter.clone(),
-    12: vgcs_neighbour_cell_information.clone(),
-    13: notify_application_data.clone()
+    0 : CSN1LazyObj('pycrate_csn1dir.system_information_type_10', clone=True),
+    1 : CSN1LazyObj('pycrate_csn1dir.notification_facch', clone=True),
+    2 : CSN1LazyObj('pycrate_csn1dir.uplink_free', clone=True),
+    4 : CSN1LazyObj('pycrate_csn1dir.enhanced_measurement_report', clone=True), # UL
+    5 : CSN1LazyObj('pycrate_csn1dir.measurement_information', clone=True), # DL
+    6 : CSN1LazyObj('pycrate_csn1dir.vbs_vgcs_reconfigure', clone=True),
+    7 : CSN1LazyObj('pycrate_csn1dir.vbs_vgcs_reconfigure2', clone=True),
+    8 : CSN1LazyObj('pycrate_csn1dir.vgcs_additional_info', clone=True),
+    9 : CSN1LazyObj('pycrate_csn1dir.vgcs_sms_information', clone=True),
+    10: CSN1LazyObj('pycrate_csn1dir.system_information_type_10bis', clone=True),
+    11: CSN1LazyObj('pycrate_csn1dir.system_information_type_10ter', clone=True),
+    12: CSN1LazyObj('pycrate_csn1dir.vgcs_neighbour_cell_information', clone=True),
+    13: CSN1LazyObj('pycrate_csn1dir.notify_application_data', clone=True)
     }
 
 RRShortPDECBCCHTypeMsg = {
-    1 : ec_system_information_type_1.clone(),
-    2 : ec_system_information_type_2.clone(),
-    3 : ec_system_information_type_3.clone(),
-    4 : ec_system_information_type_4.clone()
+    1 : CSN1LazyObj('pycrate_csn1dir.ec_system_information_type_1', clone=True),
+    2 : CSN1LazyObj('pycrate_csn1dir.ec_system_information_type_2', clone=True),
+    3 : CSN1LazyObj('pycrate_csn1dir.ec_system_information_type_3', clone=True),
+    4 : CSN1LazyObj('pycrate_csn1dir.ec_system_information_type_4', clone=True)
     }
 
 RRShortPDECTypeMsg = {
-    1 : ec_immediate_assignment_type_2_message_content.clone(),
-    2 : ec_immediate_assignment_reject_message_content.clone(),
-    3 : ec_dummy_message_content.clone(),
-    4 : ec_downlink_assignment_message_content.clone(),
-    5 : ec_immediate_assignment_type_3_message_content.clone(),
-    6 : ec_downlink_assignment_message_type_2_content.clone(),
-    7 : ec_immediate_assignment_type_4_message_content.clone(),
-    8 : ec_paging_indication.clone(),
-    9 : ec_paging_request_message_content.clone()
+    1 : CSN1LazyObj('pycrate_csn1dir.ec_immediate_assignment_type_2_message_content', clone=True),
+    2 : CSN1LazyObj('pycrate_csn1dir.ec_immediate_assignment_reject_message_content', clone=True),
+    3 : CSN1LazyObj('pycrate_csn1dir.ec_dummy_message_content', clone=True),
+    4 : CSN1LazyObj('pycrate_csn1dir.ec_downlink_assignment_message_content', clone=True),
+    5 : CSN1LazyObj('pycrate_csn1dir.ec_immediate_assignment_type_3_message_content', clone=True),
+    6 : CSN1LazyObj('pycrate_csn1dir.ec_downlink_assignment_message_type_2_content', clone=True),
+    7 : CSN1LazyObj('pycrate_csn1dir.ec_immediate_assignment_type_4_message_content', clone=True),
+    8 : CSN1LazyObj('pycrate_csn1dir.ec_paging_indication', clone=True),
+    9 : CSN1LazyObj('pycrate_csn1dir.ec_paging_request_message_content', clone=True)
     }
 
@@ -2411,9 +2411,87 @@ def _test_lteran():
             NBIoT_SIB1.from_jer(txt)
             assert( NBIoT_SIB1() == val )
 
+def _test_lteran_percomp():
+    # compiled PER codec must be bit-exact with the interpreted one
+    S1PDU = GLOBAL.MOD['S1AP-PDU-Descriptions']['S1AP-PDU']
+    X2PDU = GLOBAL.MOD['X2AP-PDU-Descriptions']['X2AP-PDU']
+    for PDU, pkts in ((S1PDU, pkts_s1ap), (X2PDU, pkts_x2ap)):
+        for p in pkts:
+            PDU._PER_COMP = False
+            PDU.from_aper(p)
+            val = PDU()
+            buf = PDU.to_uper()
+            PDU._PER_COMP = True
+            PDU.from_aper(p)
+            assert( PDU() == val )
+            assert( PDU.to_aper() == p )
+            PDU.from_uper(buf)
+            assert( PDU() == val )
+            assert( PDU.to_uper() == buf )
+        del PDU._PER_COMP
+    # objects are compiled at first use, or all immediately when not lazy
+    from pycrate_asn1rt.percomp import compile_modules
+    from pycrate_asn1dir.S1AP   import S1AP_PDU_Descriptions, S1AP_CommonDataTypes
+    Mods = (S1AP_PDU_Descriptions, S1AP_CommonDataTypes)
+    Objs = [Obj for Mod in Mods for Obj in Mod._all_ if Obj._mode == MODE_TYPE and not Obj._param]
+    for Obj in Objs:
+        Obj.__dict__.pop('_per_comp', None)
+    compile_modules(*Mods)
+    assert( all([Obj._PER_COMP and Obj._per_comp is None for Obj in Objs]) )
+    compile_modules(*Mods, lazy=False)
+    assert( all([len(Obj._per_comp) == 4 for Obj in Objs]) )
+    S1PDU.from_aper(pkts_s1ap[0])
+    assert( S1PDU.to_aper() == pkts_s1ap[0] )
+    for Obj in Objs:
+        del Obj._PER_COMP, Obj._per_comp
+
+def _test_lteran_thread():
+    # decode() / encode() work on thread-local copies of the PDU object
+    from threading import Thread
+    S1PDU = GLOBAL.MOD['S1AP-PDU-Descriptions']['S1AP-PDU']
+    vals, errs = [], []
+    for p in pkts_s1ap:
+        S1PDU.from_aper(p)
+        vals.append( S1PDU() )
+    #
+    def run(codec):
+        try:
+            for i in range(4):
+                for p, val in zip(pkts_s1ap, vals):
+                    buf = S1PDU.encode(val, codec)
+                    assert( S1PDU.decode(buf, codec) == val )
+                    if codec == 'aper':
+                        assert( buf == p )
+        except Exception as err:
+            errs.append(err)
+    #
+    thr = [Thread(target=run, args=(codec, )) for codec in ('aper', 'uper')*2]
+    for t in thr:
+        t.start()
+    for t in thr:
+        t.join()
+    assert( not errs )
+
+def _test_lteran_batch():
+    # batch decoding must return the same values as one-shot decoding
+    S1PDU = GLOBAL.MOD['S1AP-PDU-Descriptions']['S1AP-PDU']
+    vals, bufs = [], []
+    for p in pkts_s1ap:
+        S1PDU.from_aper(p)
+        vals.append( S1PDU() )
+        bufs.append( S1PDU.to_uper() )
+    assert( list(S1PDU.decode_many(pkts_s1ap)) == vals )
+    assert( list(S1PDU.decode_many(bufs, 'uper')) == vals )
+    ret = list(S1PDU.decode_many([pkts_s1ap[0], b'\xff\xff', pkts_s1ap[1]], errors='yield'))
+    assert( ret[0] == vals[0] and ret[2] == vals[1] )
+    assert( isinstance(ret[1], Exception) )
+
 def test_lteran():
     _load_lteran()
     _test_lteran()
+    _test_lteran_percomp()
+    _test_lteran_thread()
+    _test_lteran_batch()
 
 
 pkts_rrc_nr = tuple(map(unhexlify, (
@@ -2550,10 +2628,211 @@ def _test_tcap_map_rt():
     M.reset_val()
 
 
+def _test_tcap_map_batch():
+    M = GLOBAL.MOD['TCAP-MAP-Messages']['TCAP-MAP-Message']
+    vals = []
+    for p in pkts_tcap_map:
+        M.from_ber(p)
+        vals.append( M() )
+    assert( list(M.decode_many(pkts_tcap_map, 'ber')) == vals )
+
+def _test_tcap_map_pool():
+    from pycrate_asn1rt.pool import ASN1PoolDecoder
+    M = GLOBAL.MOD['TCAP-MAP-Messages']['TCAP-MAP-Message']
+    vals = list(M.decode_many(pkts_tcap_map, 'ber'))
+    for workers in (0, 2):
+        with ASN1PoolDecoder('pycrate_asn1dir.TCAP_MAP', 'TCAP-MAP-Messages',
+                             'TCAP-MAP-Message', 'ber', workers=workers, chunksize=2) as P:
+            assert( list(P.decode(pkts_tcap_map)) == vals )
+            assert( P.cnt == len(pkts_tcap_map) and P.cnt_err == 0 )
+
+def _test_tcap_map_berscan():
+    import os, tempfile
+    from pycrate_core.charpy     import Charpy
+    from pycrate_asn1rt.codecs   import ASN1CodecBER
+    from pycrate_asn1rt.berscan  import BERScanner
+    #
+    def flatten(tlvs, depth=0):
+        # (depth, cl, pc, tval, lval, voff) from ASN1CodecBER.decode_all()
+        ret = []
+        for cl, pc, tval, lval, V, ccur in tlvs:
+            if (cl, pc, tval, lval) != (0, 0, 0, 0):
+                ret.append( (depth, cl, pc, tval, lval, ccur>>3) )
+                if pc:
+                    ret.extend( flatten(V, depth+1) )
+        return ret
+    #
+    buf = b''.join(pkts_tcap_map)
+    fd, path = tempfile.mkstemp()
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(buf)
+        with BERScanner(path) as S:
+            evts = list(S.iter_tlv())
+            assert( [e[:5] + e[6:] for e in evts] == \
+                    flatten(ASN1CodecBER.decode_all(Charpy(buf))) )
+            tops = list(S.iter_tlv(maxdepth=0))
+            assert( [e[0] for e in tops] == [0] * len(pkts_tcap_map) )
+            assert( [bytes(S.get_tlv(e[5])) for e in tops] == list(pkts_tcap_map) )
+            # skipping the content of each top-level TLV
+            gen, evts_skip = S.iter_tlv(), []
+            evt = next(gen)
+            while True:
+                evts_skip.append(evt)
+                try:
+                    evt = gen.send(True)
+                except StopIteration:
+                    break
+            assert( evts_skip == tops )
+    finally:
+        os.remove(path)
+    #
+    # undefinite length, with top-level padding
+    buf = unhexlify('3080020101a08004020102000000003080000000000000040100')
+    S = BERScanner(buf)
+    assert( list(S.iter_tlv()) == [
+        (0, 0, 1, 16, -1, 0, 2),
+        (1, 0, 0, 2, 1, 2, 4),
+        (1, 2, 1, 0, -1, 5, 7),
+        (2, 0, 0, 4, 2, 7, 9),
+        (0, 0, 1, 16, -1, 15, 17),
+        (0, 0, 0, 4, 1, 23, 25)] )
+    assert( S.tlv_end(0) == 15 and S.tlv_end(15) == 19 )
+    assert( list(S.iter_tlv(maxdepth=0)) == [
+        (0, 0, 1, 16, -1, 0, 2),
+        (0, 0, 1, 16, -1, 15, 17),
+        (0, 0, 0, 4, 1, 23, 25)] )
+    try:
+        list(BERScanner(buf[:12]).iter_tlv())
+    except ASN1BERDecodeErr:
+        pass
+    else:
+        assert()
+
+def _test_tcap_map_berindex():
+    import os, tempfile
+    from pycrate_asn1rt.berscan  import BERIndex, INDEX_MAGIC
+    M = GLOBAL.MOD['TCAP-MAP-Messages']['TCAP-MAP-Message']
+    vals = list(M.decode_many(pkts_tcap_map, 'ber'))
+    #
+    # records with zero-padding, indexed per originating transaction id
+    buf = b''.join([p + b'\0\0' for p in pkts_tcap_map])
+    fd, path = tempfile.mkstemp()
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(buf)
+        keys = {'otid': [(1, 8)]}
+        with BERIndex(path, keys) as I:
+            assert( not I.load() )
+            I.open()
+            assert( len(I) == len(pkts_tcap_map) )
+            assert( [bytes(I.get_buf(i)) for i in range(len(I))] == list(pkts_tcap_map) )
+            assert( list(I.tag) == [2, 2, 2, 4, 2, 5] and set(I.cl) == {1} )
+            assert( I.find_tag(1, 4) == [3] )
+            assert( I.decode(M, 4) == vals[4] )
+            assert( list(I.decode_many(M, range(len(I)))) == vals )
+            assert( I.find('otid', b'mS\x07\x02') == [1] )
+            assert( list(I.decode_match(M, 'otid', b'mS\x07\x02')) == [vals[1]] )
+            assert( I.find('otid', b'\0\0\0\0') == [] )
+            assert( sum(map(len, I.kval['otid'].values())) == 5 )
+            kval = I.kval
+        # reloading the index without re-scanning
+        with BERIndex(path, keys) as I:
+            assert( I.load() )
+            assert( len(I) == len(pkts_tcap_map) and I.kval == kval )
+            assert( I.decode(M, 5) == vals[5] )
+        # the index is not pickled, and is invalid once truncated or extended
+        with open(path + '.idx', 'rb') as f:
+            buf_idx = f.read()
+        assert( buf_idx.startswith(INDEX_MAGIC) )
+        for buf_inv in (buf_idx[:-1], buf_idx + b'\0', buf_idx.replace(b'"num": 6', b'"num": 7')):
+            with open(path + '.idx', 'wb') as f:
+                f.write(buf_inv)
+            with BERIndex(path, keys) as I:
+                assert( not I.load() and len(I) == 0 )
+        # a failed save does not leave any tmp file, nor alter the index
+        with BERIndex(path, keys) as I:
+            I.build()
+            I.kval['otid'][b'\0'] = None
+            try:
+                I.save()
+            except TypeError:
+                pass
+            else:
+                assert()
+        assert( [fn for fn in os.listdir(os.path.dirname(path)) \
+                 if fn.startswith(os.path.basename(path) + '.idx.')] == [] )
+        with open(path + '.idx', 'rb') as f:
+            assert( f.read() == buf_inv )
+        # the index is outdated with other key fields
+        with BERIndex(path, {'dtid': [(1, 9)]}) as I:
+            assert( not I.load() )
+            I.build()
+            assert( I.find('dtid', b'\x10\x01\x08s') == [5] )
+    finally:
+        os.remove(path)
+        if os.path.exists(path + '.idx'):
+            os.remove(path + '.idx')
+
+def _test_tcap_map_classidx():
+    # hash-indexed lookups into class sets must return the same values as a
+    # linear enumeration of the sets
+    for mod in ('TCAP-MAP-Messages', 'MAP-Protocol', 'Remote-Operations-Information-Objects'):
+        if mod not in GLOBAL.MOD:
+            continue
+        for Obj in GLOBAL.MOD[mod].values():
+            if not isinstance(Obj, CLASS) or Obj._mode != MODE_SET:
+                continue
+            vals = list(Obj._val.root)
+            if Obj._val.ext:
+                vals.extend(Obj._val.ext)
+            for name in Obj._cont:
+                for v in vals:
+                    if name not in v:
+                        continue
+                    lin = [w for w in vals if name in w and w[name] == v[name]]
+                    assert( Obj.get_mult(name, v[name]) == lin )
+                    assert( Obj.get_uniq(name, v[name]) is lin[0] )
+    # cached table constraint lookups must not change decoding
+    M = GLOBAL.MOD['TCAP-MAP-Messages']['TCAP-MAP-Message']
+    vals = []
+    for p in pkts_tcap_map:
+        M.from_ber(p)
+        vals.append( M() )
+    for p, val in zip(pkts_tcap_map[::-1], vals[::-1]):
+        M.from_ber(p)
+        assert( M() == val )
+    # only key values found in the table constraint are cached
+    objs, stack = [], [M]
+    while stack:
+        Obj = stack.pop()
+        if Obj._tab_cache is not None:
+            objs.append(Obj)
+        if isinstance(Obj._cont, ASN1Dict):
+            stack.extend(o for o in Obj._cont.values() if isinstance(o, ASN1Obj))
+        elif isinstance(Obj._cont, ASN1Obj):
+            stack.append(Obj._cont)
+    assert( objs )
+    for Obj in objs:
+        assert( all(ret[0] != CLASET_NONE for ret in Obj._tab_cache[2].values()) )
+    Obj, unk = objs[0], object()
+    Obj._get_val_by_path = lambda path: unk
+    try:
+        assert( Obj._get_tab_obj() == (CLASET_NONE, None) )
+        assert( len([k for k in Obj._tab_cache[2] if k[1] is unk]) == 0 )
+    finally:
+        del Obj._get_val_by_path
+
+
 def test_tcap_map():
     _load_tcap_map()
     _test_tcap_map()
     _test_tcap_map_rt()
+    _test_tcap_map_batch()
+    _test_tcap_map_pool()
+    _test_tcap_map_berscan()
+    _test_tcap_map_berindex()
+    _test_tcap_map_classidx()
 
 
 # https://wiki.wireshark.org/SampleCaptures?action=AttachFile&do=get&target=camel.pcap
@@ -2653,6 +2932,121 @@ def test_X509():
     _test_X509()
 
 
+def _test_lazy():
+    # ASN.1 objects are only built when accessed, with their dependencies
+    import importlib
+    import pycrate_asn1dir
+    from pycrate_asn1rt.lazy import import_lazy, ASN1LazyModDict
+    # the lazy module replaces any already imported one, restored at the end
+    X2AP_imp = sys.modules.get('pycrate_asn1dir.X2AP')
+    try:
+        X2AP = import_lazy('pycrate_asn1dir.X2AP')
+        Loader = X2AP._loader_
+        assert( not Loader._done )
+        Cause = X2AP.X2AP_IEs.Cause
+        assert( GLOBAL.MOD['X2AP-IEs']['Cause'] is Cause )
+        assert( 0 < len(Loader._done) < 10 )
+        Cause.from_aper(b'\x00\x00')
+        assert( Cause() == ('radioNetwork', 'handover-desirable-for-radio-reasons') )
+        #
+        # later imports return the lazy module, without building anything
+        done = set(Loader._done)
+        assert( importlib.import_module('pycrate_asn1dir.X2AP') is X2AP )
+        from pycrate_asn1dir import X2AP as X2AP_from
+        assert( X2AP_from is X2AP and import_lazy('pycrate_asn1dir.X2AP') is X2AP )
+        assert( isinstance(GLOBAL.MOD['X2AP-IEs'], ASN1LazyModDict) and Loader._done == done )
+        #
+        PDU = GLOBAL.MOD['X2AP-PDU-Descriptions']['X2AP-PDU']
+        assert( PDU is X2AP.X2AP_PDU_Descriptions.X2AP_PDU )
+        for p in pkts_x2ap:
+            PDU.from_aper(p)
+            assert( PDU.to_aper() == p )
+    finally:
+        if X2AP_imp is None:
+            sys.modules.pop('pycrate_asn1dir.X2AP', None)
+            if hasattr(pycrate_asn1dir, 'X2AP'):
+                delattr(pycrate_asn1dir, 'X2AP')
+        else:
+            sys.modules['pycrate_asn1dir.X2AP'] = X2AP_imp
+            pycrate_asn1dir.X2AP = X2AP_imp
+
+def test_lazy():
+    _test_lazy()
+
+
+def _test_snapshot():
+    # initialized ASN.1 modules are restored from a snapshot file
+    import os, shutil, tempfile
+    from pycrate_asn1rt.snapshot import import_snapshot, load_snapshot, save_snapshot, \
+        _get_asn_modules
+    cache_dir = tempfile.mkdtemp()
+    reclim = sys.getrecursionlimit()
+    try:
+        path = import_snapshot('pycrate_asn1dir.S1AP', cache_dir=cache_dir)
+        assert( os.path.exists(path) and os.listdir(cache_dir) == [os.path.basename(path)] )
+        assert( sys.getrecursionlimit() == reclim )
+        PDU_ref = GLOBAL.MOD['S1AP-PDU-Descriptions']['S1AP-PDU']
+        del GLOBAL.MOD['S1AP-PDU-Descriptions']
+        assert( load_snapshot(path, 'pycrate_asn1dir.S1AP') )
+        assert( not load_snapshot(path, 'pycrate_asn1dir.X2AP') )
+        PDU = GLOBAL.MOD['S1AP-PDU-Descriptions']['S1AP-PDU']
+        assert( PDU is not PDU_ref )
+        for p in pkts_s1ap:
+            PDU.from_aper(p)
+            val = PDU()
+            assert( PDU.to_aper() == p )
+            PDU_ref.from_aper(p)
+            assert( PDU_ref() == val )
+        assert( sys.getrecursionlimit() == reclim )
+        #
+        # snapshots writable by others are not loaded
+        if hasattr(os, 'getuid'):
+            os.chmod(path, 0o666)
+            assert( not load_snapshot(path, 'pycrate_asn1dir.S1AP') )
+            os.chmod(path, 0o600)
+        # corrupted snapshots are not loaded
+        with open(path, 'r+b') as fd:
+            fd.seek(-1, 2)
+            last = fd.read(1)
+            fd.seek(-1, 2)
+            fd.write(bytes([last[0] ^ 0xff]))
+        assert( not load_snapshot(path, 'pycrate_asn1dir.S1AP') )
+        #
+        # no tmp file is left when the snapshot cannot be saved
+        class G(object):
+            MOD = {mod: {'Obj': lambda: None} for mod in _get_asn_modules('pycrate_asn1dir.S1AP')}
+            OID = {}
+        path_err = os.path.join(cache_dir, 'err.pkl')
+        try:
+            save_snapshot(path_err, 'pycrate_asn1dir.S1AP', GLOBAL=G)
+        except Exception:
+            saved = False
+        else:
+            saved = True
+        assert( not saved and os.listdir(cache_dir) == [os.path.basename(path)] )
+        assert( sys.getrecursionlimit() == reclim )
+    finally:
+        shutil.rmtree(cache_dir)
+
+def test_snapshot():
+    _test_snapshot()
+
+
+def _perf_berindex(num=20000):
+    import os, tempfile
+    from pycrate_asn1rt.berscan  import BERIndex
+    fd, path = tempfile.mkstemp()
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b''.join(pkts_tcap_map) * num)
+        with BERIndex(path, {'otid': [(1, 8)]}) as I:
+            I.build()
+            rps, bps = I.throughput()
+            print('berindex: {0} records, {1:.1f} records/s, {2:.2f} MB/s'.format(
+                  len(I), rps, bps/1000000))
+    finally:
+        os.remove(path)
+
 def test_perf_asn1rt():
     
     _load_rt_base()
@@ -2669,6 +3063,9 @@ def test_perf_asn1rt():
     print('[+] LTE S1AP and X2AP encoding / decoding (APER)')
     Tc = timeit(_test_lteran, number=2)
     print('test_lteran: {0:.4f}'.format(Tc))
+    print('[+] LTE S1AP batch decoding (APER, UPER)')
+    Tcb = timeit(_test_lteran_batch, number=2)
+    print('test_lteran_batch: {0:.4f}'.format(Tcb))
     
     _load_nrran()
     print('[+] NR RRC inter-node encoding / decoding (UPER)')
@@ -2679,6 +3076,8 @@ def test_perf_asn1rt():
     print('[+] TCAP MAP encoding / decoding (BER)')
     Te = timeit(_test_tcap_map, number=3)
     print('test_tcap_map: {0:.4f}'.format(Te))
+    print('[+] TCAP MAP BER records indexing')
+    _perf_berindex()
     
     _load_tcap_cap()
     print('[+] TCAP CAP encoding / decoding (BER)')
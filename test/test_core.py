@@ -203,6 +203,58 @@ def test_pack():
              3228) )
 
 
+def test_bitwriter():
+    
+    # BitWriter must produce exactly the same result as pack_val()
+    val0 = [(TYPE_BYTES, b'AAAA', 28),
+             (TYPE_UINT, 100, 8),
+             (TYPE_INT, -100, 8),
+             (TYPE_UINT, 1024, 16),
+             (TYPE_BYTES, b'BB', 12)]
+    val1 = [(TYPE_UINT, 1, 3),
+             (TYPE_UINT, 200, 8),
+             (TYPE_UINT, 12, 3),
+             (TYPE_INT, -5, 3),
+             (TYPE_INT, 6, 3),
+             (TYPE_UINT_LE, 0x1234, 16),
+             (TYPE_INT_LE, -2, 24),
+             (TYPE_UINT, 1000, 9),
+             (TYPE_BYTES, b'', 0),
+             (TYPE_UINT_LE, 1<<40, 40)]
+    for val in (val0, val1, _pack_val2, _pack_val3):
+        w = BitWriter()
+        w.extend(val)
+        assert( w.get() == pack_val(*val) )
+        assert( w.len_bit() == pack_val(*val)[1] )
+    #
+    w.reset()
+    w.write_uint(1, 1)
+    w.write_bytes(b'\xff\xff', 12)
+    w.write_int(-1, 3)
+    assert( w.get() == (b'\xff\xff', 16) )
+    #
+    # buffers shorter than their bit length are zero-padded
+    val = [(TYPE_UINT, 1, 1), (TYPE_BYTES, b'\xff', 12)]
+    w.reset()
+    w.extend(val)
+    assert( w.get() == pack_val(*val) == (b'\xff\x80', 13) )
+    for val in ([(TYPE_BYTES, b'\xff', 12), (TYPE_UINT, 1, 4)],
+                [(TYPE_UINT, 1, 1), (TYPE_BYTES, b'\xff', 24), (TYPE_UINT, 1, 7)],
+                [(TYPE_UINT, 1, 8), (TYPE_BYTES, b'', 16), (TYPE_UINT, 1, 8)]):
+        w.reset()
+        w.extend(val)
+        pad = [(TYPE_BYTES, v + bytes((bl+7)//8 - len(v)), bl) if t == TYPE_BYTES \
+               else (t, v, bl) for (t, v, bl) in val]
+        assert( w.get() == pack_val(*pad) )
+    #
+    # elements overriding _to_pack() are written through it
+    class U(Uint8):
+        def _to_pack(self):
+            return [(TYPE_UINT, 0xff - self.get_val(), 8)]
+    E = Envelope('E', GEN=(Uint('A', val=1, bl=4), U('B', val=1), Uint('C', val=2, bl=4)))
+    assert( E.to_bytes() == pack_val(*E._to_pack())[0] == b'\x1f\xe2' )
+
+
 def test_charpy():
     
     A = Charpy(b'test')
@@ -296,6 +348,62 @@ def test_charpy():
     assert( A.to_bytes() == b'\xce\xe4\xde\xe6@\xe8\xca\xe6\xff\xff\xff\xff\xff\xff\xff' )
 
 
+def test_charpy_fast():
+    
+    # CharpyFast must provide the same values as Charpy
+    for buf, bitlen in ((b'test', None), (bytes_long, 2600), (bytes_long, 2595)):
+        A, B = Charpy(), CharpyFast()
+        A.set_bytes(buf, bitlen)
+        B.set_bytes(buf, bitlen)
+        for bl in (1, 3, 7, 8, 13, 16, 31, 64, 300):
+            A.rewind()
+            B.rewind()
+            while A.len_bit() >= bl:
+                assert( B.to_uint(bl) == A.to_uint(bl) )
+                assert( B.to_int(bl) == A.to_int(bl) )
+                assert( B.to_bytes(bl) == A.to_bytes(bl) )
+                assert( B.get_uint(bl) == A.get_uint(bl) )
+                assert( B._cur == A._cur )
+                A.forward(1)
+                B.forward(1)
+            assert( B.to_bytes() == A.to_bytes() )
+    #
+    A, B = Charpy(b'\xa5'), CharpyFast(b'\xa5')
+    for i in range(50):
+        for C in (A, B):
+            C.append_uint(i, 6+i%13)
+            C.append_int(-i, 7+i%17)
+            C.append_bytes(bytes_short, 5+i)
+            C.append_uint_le(i, 16)
+        assert( B.get_uint(i%5) == A.get_uint(i%5) )
+        assert( B.len_bit() == A.len_bit() )
+        assert( B.to_bytes() == A.to_bytes() )
+    B.set_uint(2**100+1, 101)
+    B.append_uint(0xf, 4)
+    assert( B.to_uint() == 2**104+0x1f )
+    # out-of-range values are saturated or truncated exactly as with Charpy
+    A, B = Charpy(), CharpyFast()
+    for C in (A, B):
+        C.append_uint(1, 1)
+        C.append_uint(232460, 15)
+    assert( A.to_bytes() == B.to_bytes() == b'\x8c\x0c' )
+    for off in range(9):
+        A, B = Charpy(), CharpyFast()
+        for C in (A, B):
+            C.append_uint(0, off)
+            for i in range(1, 40):
+                # 8, 16, 32 and 64 bits are excluded, overflowing them raises
+                C.append_uint(3**i, 1+i%7)
+                C.append_uint(3**i, 9+i%6)
+                C.append_int(-3**i, 2+i%6)
+                C.append_int(3**i, 9+i%6)
+                C.append_bytes(bytes_short[:i%4], 9+i%19)
+                C.append_uint_le(3**i, 24)
+                C.append_int_le(-3**i, 24)
+        assert( B.len_bit() == A.len_bit() )
+        assert( B.to_bytes() == A.to_bytes() )
+
+
 def test_elt_1():
     
     class Test(Envelope):
@@ -661,6 +769,109 @@ def test_elt_4():
         assert( ls.get_val() == lsv )
 
 
+def test_elt_5():
+    
+    # fixed length byte-aligned atoms are unpacked in a single shot
+    class Hdr(Envelope):
+        _GEN = (
+            Uint8('U8'),
+            Int16('I16'),
+            Uint24('U24'),
+            Buf('B', bl=32),
+            Uint16LE('U16LE'),
+            Int24('I24'),
+            Uint('U4', bl=4),
+            Uint('U12', bl=12),
+            Uint32('U32'),
+            Int64('I64')
+            )
+    
+    hv = [1, -2, 0x030405, b'abcd', 0x0201, -5, 7, 0xfff, 0xffffffff, -(2**63)]
+    hb = b'\x01\xff\xfe\x03\x04\x05abcd\x01\x02\xff\xff\xfb\x7f\xff\xff\xff\xff\xff'\
+         b'\x80\x00\x00\x00\x00\x00\x00\x00'
+    assert( [(p[0], p[1]) for p in Hdr()._set_from_char_plan()] == [(0, 6), (8, 10)] )
+    h = Hdr(val=hv)
+    assert( h.to_bytes() == hb )
+    h = Hdr()
+    h.from_bytes(hb)
+    assert( h.get_val() == hv )
+    # unaligned access
+    class HdrUnal(Envelope):
+        _GEN = (Uint('X', bl=4), ) + Hdr._GEN + (Uint('Y', bl=4), )
+    h = HdrUnal(val=[5] + hv + [10])
+    hub = h.to_bytes()
+    h = HdrUnal()
+    h.from_bytes(hub)
+    assert( h.get_val() == [5] + hv + [10] )
+    # transparency and bl automation fall back to element by element decoding
+    h = Hdr()
+    h['I16'].set_trans(True)
+    h['U24'].set_blauto(lambda: 16)
+    h.from_bytes(hb[:1] + hb[3:5] + hb[6:])
+    assert( h.get_val() == [1, 0, 0x0304, b'abcd', 0x0201, -5, 7, 0xfff, 0xffffffff, -(2**63)] )
+    #
+    # cloning
+    h = Hdr(val=hv)
+    h['U8'].set_valauto(lambda: 2)
+    h['B'].set_trans(True)
+    hc = h.clone()
+    assert( hc.get_val() == [1, -2, 0x030405, b'abcd', 0x0201, -5, 7, 0xfff, 0xffffffff, -(2**63)] )
+    assert( hc['U8']._valauto is None and hc['B'].get_trans() )
+    assert( all([elt.get_env() is hc for elt in hc]) )
+    u = h['U16LE'].clone()
+    assert( u.get_env() is None and u.get_val() == 0x0201 )
+
+
+def test_elt_6():
+    
+    # view mode: composite elements with a length automation are only decoded
+    # when accessed
+    class Val(Envelope):
+        _GEN = (
+            Uint16('A'),
+            Array('B', GEN=Uint8())
+            )
+    
+    class TLV(Envelope):
+        _GEN = (
+            Uint8('T'),
+            Uint8('L'),
+            Val('V')
+            )
+        def __init__(self, *args, **kwargs):
+            Envelope.__init__(self, *args, **kwargs)
+            self[1].set_valauto(lambda: self[2].get_len())
+            self[2].set_blauto(lambda: 8 * self[1].get_val())
+            self[2][1].set_blauto(lambda: 8 * (self[1].get_val() - 2))
+    
+    tlvs = Sequence('TLVs', GEN=TLV())
+    tv   = [[1, 5, [0x102, [3, 4, 5]]], [2, 2, [0x304, []]], [3, 3, [0x506, [7]]]]
+    tb   = b'\x01\x05\x01\x02\x03\x04\x05\x02\x02\x03\x04\x03\x03\x05\x06\x07'
+    tlvs.set_val(tv)
+    assert( tlvs.to_bytes() == tb )
+    #
+    tlvs = Sequence('TLVs', GEN=TLV())
+    tlvs.from_bytes(tb, view=True)
+    assert( tlvs.get_num() == 3 )
+    assert( all([tlv[2]._pending() for tlv in tlvs]) )
+    assert( tlvs[0][0].get_val() == 1 and tlvs[2][1].get_val() == 3 )
+    # pending elements are encoded back from the original buffer
+    assert( tlvs.get_bl() == 8 * len(tb) and tlvs.to_bytes() == tb )
+    assert( all([tlv[2]._pending() for tlv in tlvs]) )
+    # and decoded on first access
+    assert( tlvs[1][2]['A'].get_val() == 0x304 )
+    assert( not tlvs[1][2]._pending() and tlvs[1][2][1]._pending() )
+    assert( tlvs[0][2][1].get_val() == [3, 4, 5] )
+    assert( tlvs.get_val() == tv and tlvs.to_bytes() == tb )
+    # setting a value ends the pending state
+    tlvs = Sequence('TLVs', GEN=TLV())
+    tlvs.from_bytes(tb, view=True)
+    tlvs[0][2].set_val([0x708, [9, 9, 9]])
+    assert( tlvs.get_val()[0] == [1, 5, [0x708, [9, 9, 9]]] )
+    tlvs[2][2][1].set_val([8])
+    assert( tlvs.to_bytes()[-4:] == b'\x03\x05\x06\x08' )
+
+
 #------------------------------------------------------------------------------#
 # performance tests
 #------------------------------------------------------------------------------#
@@ -698,6 +909,16 @@ def test_perf_pack_short():
 def test_perf_pack_long():
     pack_val(*_pack_val3)
 
+def test_perf_writer_short():
+    w = BitWriter()
+    w.extend(_pack_val2)
+    w.get()
+
+def test_perf_writer_long():
+    w = BitWriter()
+    w.extend(_pack_val3)
+    w.get()
+
 def test_perf_charpy_short():
     A = Charpy(bytes_short)
     A.to_bytes()
@@ -744,6 +965,14 @@ def test_perf_core():
     Td = timeit(test_perf_pack_long, number=1000)
     print('test_perf_pack_long: {0:.4f}'.format(Td))
     
+    print('[+] writing few heterogeneous values')
+    Tk = timeit(test_perf_writer_short, number=20000)
+    print('test_perf_writer_short: {0:.4f}'.format(Tk))
+    
+    print('[+] writing many heterogeneous values')
+    Tl = timeit(test_perf_writer_long, number=1000)
+    print('test_perf_writer_long: {0:.4f}'.format(Tl))
+    
     print('[+] charpy with short bytes')
     Te = timeit(test_perf_charpy_short, number=40000)
     print('test_perf_charpy_short: {0:.4f}'.format(Te))
@@ -768,7 +997,7 @@ def test_perf_core():
     Tj = timeit(test_elt_3, number=500)
     print('test_elt_4: {0:.4f}'.format(Tj))
     
-    print('[+] core total time: {0:.4f}'.format(Ta+Tb+Tc+Td+Te+Tf+Tg+Th+Ti+Tj))
+    print('[+] core total time: {0:.4f}'.format(Ta+Tb+Tc+Td+Te+Tf+Tg+Th+Ti+Tj+Tk+Tl))
 
 if __name__ == '__main__':
     test_perf_core()
@@ -38,6 +38,10 @@ from pycrate_csn1dir.si2quater_rest_octets            import si2quater_rest_octe
 from pycrate_csn1dir.si_13_rest_octets                import si_13_rest_octets
 
 from pycrate_csn1.csnobj import _with_json
+from pycrate_csn1.csnobj import CSN1List, CSN1Alt, CSN1Bit, CSN1Val
+from pycrate_csn1.utils  import CSN1Err
+from pycrate_csn1.csncomp import compile_csn1
+from pycrate_csn1.lazy    import CSN1LazyObj
 
 
 def test_msnetcap():
@@ -596,6 +600,96 @@ def test_si13r():
         assert( Obj.get_val() == val )
 
 
+def test_csn1alt():
+    # alternatives selected with a dispatch table must be the same as when
+    # testing keys one length after the other, at every offset
+    alts = (
+        CSN1Alt(alt={
+            '00': ('', [CSN1Bit(name='a', bit=2)]),
+            '01': ('', []),
+            '1': ('', [CSN1Bit(name='b', bit=3)])}),
+        CSN1Alt(alt={
+            'LL': ('', [CSN1Val(name='c', val='HL')]),
+            'LH': ('', [CSN1Bit(name='d', bit=4)]),
+            'H': ('', [])})
+        )
+    for alt in alts:
+        for off in range(8):
+            if off:
+                Obj = CSN1List(list=[CSN1Bit(name='pre', bit=off), alt.clone()])
+            else:
+                Obj = CSN1List(list=[alt.clone()])
+            Ref = Obj.clone()
+            Ref._list[-1]._kmax = 0
+            for v in range(256):
+                buf = bytes([v, 0x2b])
+                ret = []
+                for O in (Obj, Ref):
+                    try:
+                        O.from_bytes(buf)
+                    except CSN1Err as err:
+                        ret.append( type(err) )
+                    else:
+                        ret.append( O.get_val() )
+                assert( ret[0] == ret[1] )
+
+
+_csn1comp_bufs = (
+    (classmark_3_value_part, b'601404cf65233b880092f28000'),
+    (ms_ra_capability_value_part, b'1a53432b259ef9890040009dd9c633120080013a332c662401000260'),
+    (ms_ra_capability_value_part, b'1bb3432b259ef989004000d801bbe8c662401000360068f8b1989004000d8010'),
+    (si2quater_rest_octets, b'46a032caa88c2fcf8e0b2b2b2b2b2b2b2b2b2b2b'),
+    (si2quater_rest_octets, b'cee0048648c0100401004010040100401000802b'),
+    (si2quater_rest_octets, b'ef200bc10996463fc15010c1ceada382a02b2b2b'),
+    (si_13_rest_octets, b'a0005847eb4a93e51a298a16ab2b2b2b2b2b2b2b')
+    )
+
+def test_csn1comp():
+    # the compiled codec must return the same values and buffers as the
+    # interpreted one, including for truncated buffers
+    for Obj, buf in _csn1comp_bufs:
+        buf  = unhexlify(buf)
+        Comp = Obj.clone()
+        Comp._CSN_COMP = True
+        for i in range(len(buf), 0, -1):
+            ret = []
+            for O in (Obj, Comp):
+                try:
+                    O.from_bytes(buf[:i])
+                except (CSN1Err, AssertionError) as err:
+                    ret.append( type(err) )
+                else:
+                    ret.append( (O.get_val(), O.to_bytes()) )
+            assert( ret[0] == ret[1] )
+            if isinstance(ret[0], tuple):
+                assert( Obj.decode(buf[:i]) == ret[0][0] )
+                assert( Obj.encode(ret[0][0]) == ret[0][1] )
+    # clones share the compiled codec
+    assert( Comp._csn_comp is Obj._csn_comp )
+    assert( compile_csn1(Comp) is compile_csn1(Obj) )
+
+
+def test_csn1lazy():
+    import pycrate_csn1dir
+    assert( pycrate_csn1dir.si_13_rest_octets.si_13_rest_octets is si_13_rest_octets )
+    # stubs for CSN.1 objects imported at first use
+    Obj = CSN1LazyObj('pycrate_csn1dir.si_13_rest_octets')
+    Clo = CSN1LazyObj('pycrate_csn1dir.si_13_rest_octets', clone=True)
+    buf = unhexlify(b'a0005847eb4a93e51a298a16ab2b2b2b2b2b2b2b')
+    for O in (Obj.clone(), Clo):
+        O.from_bytes(buf)
+        assert( O.to_bytes() == buf )
+    assert( Obj._get_obj_() is si_13_rest_octets )
+    assert( Clo._get_obj_() is not si_13_rest_octets )
+    assert( Clo.get_val() == Clo() )
+
+
+def _perf_csn1comp():
+    for Obj, buf in _csn1comp_bufs:
+        buf = unhexlify(buf)
+        assert( Obj.encode(Obj.decode(buf)) == buf )
+
+
 def test_perf_csn1():
     
     print('[+] CSN.1 MS network capability decoding and re-encoding')
@@ -618,7 +712,11 @@ def test_perf_csn1():
     Te = timeit(test_si13r, number=200)
     print('test_si13r: {0:.4f}'.format(Te))
     
-    print('[+] test_csn1 total time: {0:.4f}'.format(Ta+Tb+Tc+Td+Te))
+    print('[+] CSN.1 compiled codec decoding and re-encoding')
+    Tf = timeit(_perf_csn1comp, number=200)
+    print('_perf_csn1comp: {0:.4f}'.format(Tf))
+    
+    print('[+] test_csn1 total time: {0:.4f}'.format(Ta+Tb+Tc+Td+Te+Tf))
 
 
 if __name__ == '__main__':
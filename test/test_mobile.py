@@ -27,6 +27,8 @@
 # *--------------------------------------------------------
 #*/
 
+import os
+import re
 from binascii   import unhexlify
 from timeit     import timeit
 
@@ -36,15 +38,18 @@ from timeit     import timeit
 
 from pycrate_mobile.GSMTAP          import *
 from pycrate_mobile.NAS             import parse_NAS_MO, parse_NAS_MT, parse_NAS5G
+from pycrate_mobile.NASLTE          import parse_NASLTE_MO
 from pycrate_mobile.SIGTRAN         import SIGTRAN
 from pycrate_mobile.M3UA            import parse_M3UA
 from pycrate_mobile.SCCP            import parse_SCCP
 from pycrate_mobile.ISUP            import parse_ISUP
 from pycrate_mobile.TS0960_GTPv0    import parse_GTPv0
-from pycrate_mobile.TS29060_GTP     import parse_GTP
-from pycrate_mobile.TS29281_GTPU    import parse_GTPU
-from pycrate_mobile.TS29274_GTPC    import parse_GTPC
-from pycrate_mobile.TS29244_PFCP    import parse_PFCP
+from pycrate_mobile.TS29060_GTP     import parse_GTP, classify_GTP
+from pycrate_mobile.TS29281_GTPU    import parse_GTPU, classify_GTPU
+from pycrate_mobile.TS29274_GTPC    import parse_GTPC, classify_GTPC, GTPCDecErr, EchoReq, \
+                                           GTPCDispatcher
+from pycrate_mobile.TS29244_PFCP    import parse_PFCP, classify_PFCP, PFCPDecErr, PFCPHeartbeatReq, \
+                                           PFCPDispatcher
 from pycrate_diameter.Diameter      import DiameterGeneric
 from pycrate_diameter.DiameterIETF  import DiameterIETF
 from pycrate_diameter.Diameter3GPP  import Diameter3GPP
@@ -57,6 +62,8 @@ from pycrate_mobile.TS24501_IE      import (
     )
 #
 from pycrate_core.elt               import _with_json
+from pycrate_core.pool              import EltPool
+from pycrate_core.utils             import PycrateErr
 
 
 # uplink messages
@@ -543,6 +550,144 @@ def test_pfcp(pfcp_pdu=pfcp_pdu):
             assert( m.get_val() == v )
 
 
+def _get_ies_num(m):
+    return len([ie for ie in m[1] if not ie.get_trans()])
+
+
+def test_gtp_classify():
+    for pdu in gtp_pdu:
+        m, e = parse_GTP(pdu)
+        (typ, teid, seq, ln, ies), e = classify_GTP(pdu, with_ies=True)
+        assert( e == 0 )
+        assert( (typ, teid, seq, ln) == (m[0]['Type'].get_val(), m[0]['TEID'].get_val(),
+                m[0]['GTPHdrOpt']['SeqNum'].get_val(), len(pdu)) )
+        assert( len(ies) == _get_ies_num(m) )
+        assert( ies[-1][1] + ies[-1][2] == len(pdu) if ies else True )
+    #
+    for pdu in gtpu_pdu:
+        m, e = parse_GTPU(pdu)
+        (typ, teid, seq, ln, off), e = classify_GTPU(pdu)
+        assert( e == 0 )
+        assert( (typ, teid, ln, off) == (m[0]['Type'].get_val(), m[0]['TEID'].get_val(),
+                len(pdu), m[0].get_len()) )
+    #
+    for pdu in gtpc_pdu:
+        m, e = parse_GTPC(pdu)
+        (typ, teid, seq, ln, ies), e = classify_GTPC(pdu, with_ies=True)
+        assert( e == 0 )
+        assert( (typ, teid, seq, ln) == (m[0]['Type'].get_val(), m[0]['TEID'].get_val(),
+                m[0]['SeqNum'].get_val(), len(pdu)) )
+        assert( [(ie[0], ie[1]) for ie in ies] == \
+                [(ie[0]['Type'].get_val(), ie[0]['Inst'].get_val()) for ie in m[1] if not ie.get_trans()] )
+    #
+    for pdu in pfcp_pdu:
+        m, e = parse_PFCP(pdu)
+        (typ, seid, seq, ln, ies), e = classify_PFCP(pdu, with_ies=True)
+        assert( e == 0 )
+        assert( (typ, seid, seq, ln) == (m[0]['Type'].get_val(), m[0]['SEID'].get_val() \
+                if m[0]['S'].get_val() else None, m[0]['SeqNum'].get_val(), len(pdu)) )
+        assert( len(ies) == _get_ies_num(m) )
+    #
+    # invalid buffers
+    assert( classify_GTP(gtp_pdu[0][:6]) == (None, 1) )
+    assert( classify_GTP(gtp_pdu[0][:-1]) == (None, 2) )
+    assert( classify_GTPC(gtp_pdu[0]) == (None, 2) )
+    assert( classify_GTPC(gtpc_pdu[0][:1] + b'\xfe' + gtpc_pdu[0][2:]) == (None, 3) )
+    assert( classify_PFCP(pfcp_pdu[0][:-1]) == (None, 2) )
+
+
+def test_gtpc_pfcp_mand():
+    # messages missing a mandatory IE: Recovery, Recovery Time Stamp
+    for pdu, parse, Msg, Err, Disp in (
+            (unhexlify('4001000400000100'), parse_GTPC, EchoReq, GTPCDecErr, GTPCDispatcher),
+            (unhexlify('200100040000bd00'), parse_PFCP, PFCPHeartbeatReq, PFCPDecErr, PFCPDispatcher)):
+        # the buffer is decoded only once
+        dec = []
+        class MsgCnt(Msg):
+            def _from_char(self, char):
+                dec.append(self)
+                Msg._from_char(self, char)
+        Disp[1] = MsgCnt
+        try:
+            m, e = parse(pdu)
+        finally:
+            Disp[1] = Msg
+        assert( e == 4 and dec == [m] )
+        assert( len(m[1].get_mand_miss()) == 1 )
+        assert( m.to_bytes() == pdu )
+        # decoding outside of the parser still verifies mandatory IEs
+        try:
+            Msg().from_bytes(pdu)
+        except Err:
+            pass
+        else:
+            assert()
+    m, e = parse_GTPC(gtpc_pdu[8])
+    assert( e == 0 and m[1].get_mand_miss() == [] )
+    # grouped IE missing a mandatory IE (EPS Bearer ID): kept as raw data
+    pdu = unhexlify('4822002f0000000200006a0056000d001842f4700fca42f47000115a025d00120049'\
+                    '0001ea055700090080000009610a554b32')
+    m, e = parse_GTPC(pdu)
+    assert( e == 0 and isinstance(m[1][1][1], Buf) and m.to_bytes() == pdu )
+    # malformed buffers raise, as with from_bytes()
+    for pdu, parse in ((gtpc_pdu[8], parse_GTPC), (pfcp_pdu[0], parse_PFCP)):
+        try:
+            parse(pdu[:-1])
+        except PycrateErr:
+            pass
+        else:
+            assert()
+
+
+def _load_pcapr(fn, layer):
+    # returns the list of raw buffers for the given layer from a tshark JSON file
+    path, bufs = os.path.join(os.path.dirname(__file__), 'res', fn), []
+    with open(path) as fd:
+        for line in fd:
+            bufs.extend( [unhexlify(h) for h in re.findall('"%s_raw": "([0-9a-f]*)"' % layer, line)] )
+    return bufs
+
+
+def _get_pool_corpora():
+    return (
+        ('nas_lte_mo', parse_NASLTE_MO, nas_pdu_mo),
+        ('nas_5g', parse_NAS5G, nas_5g_pdu),
+        ('sccp', parse_SCCP, sccp_pdu + tuple(_load_pcapr('tcapmap_pcapr.json', 'sccp'))),
+        ('gtpc', parse_GTPC, gtpc_pdu),
+        ('pfcp', parse_PFCP, pfcp_pdu)
+        )
+
+
+def test_pool():
+    pool = EltPool()
+    for name, parse, pdus in _get_pool_corpora():
+        vals = []
+        for pdu in pdus:
+            m, e = parse(pdu)
+            vals.append( (e, m.get_val() if m else None) )
+        # decode each message into instances released by the previous ones
+        for pdus_ord, vals_ord in ((pdus, vals), (pdus[::-1], vals[::-1])):
+            for pdu, val in zip(pdus_ord, vals_ord):
+                m, e = parse(pdu, pool=pool)
+                assert( (e, m.get_val() if m else None) == val )
+                if m is not None:
+                    assert( m.to_bytes() == pdu )
+                pool.release(m)
+        pool.clear()
+
+
+def _perf_pool(num=10):
+    for name, parse, pdus in _get_pool_corpora():
+        pool = EltPool()
+        def parse_pool():
+            for pdu in pdus:
+                pool.release( parse(pdu, pool=pool)[0] )
+        Tn = timeit(lambda: [parse(pdu) for pdu in pdus], number=num)
+        Tp = timeit(parse_pool, number=num)
+        print('{0}: {1} msg, {2:.1f} msg/s, with pool {3:.1f} msg/s'.format(
+              name, len(pdus), num*len(pdus)/Tn, num*len(pdus)/Tp))
+
+
 def test_bssap(bssap_pdu=bssap_pdu):
     
     bm = BSSMAP()
@@ -579,6 +724,17 @@ def test_bssap(bssap_pdu=bssap_pdu):
                 assert( BM.get_val() == v )
 
 
+def _perf_gtp_classify(num=200):
+    for name, pdus, parse, classify in (
+            ('gtp',  gtp_pdu,  parse_GTP,  classify_GTP),
+            ('gtpc', gtpc_pdu, parse_GTPC, classify_GTPC),
+            ('pfcp', pfcp_pdu, parse_PFCP, classify_PFCP)):
+        Tp = timeit(lambda: [parse(pdu) for pdu in pdus], number=max(1, num//20))
+        Tc = timeit(lambda: [classify(pdu) for pdu in pdus], number=num)
+        print('{0}: parse {1:.1f} msg/s, classify {2:.1f} msg/s'.format(name,
+              max(1, num//20)*len(pdus)/Tp, num*len(pdus)/Tc))
+
+
 def test_perf_mobile():
     
     print('[+] NAS MO decoding and re-encoding')
@@ -637,11 +793,21 @@ def test_perf_mobile():
     Ti = timeit(test_pfcp, number=50)
     print('test_pfcp: {0:.4f}'.format(Ti))
     
+    print('[+] GTPv1-C, GTP-U, GTPv2-C and PFCP header-only classification')
+    To = timeit(test_gtp_classify, number=20)
+    print('test_gtp_classify: {0:.4f}'.format(To))
+    _perf_gtp_classify()
+    
+    print('[+] NAS, SCCP, GTPv2-C and PFCP decoding with message instance pools')
+    Tp = timeit(test_pool, number=2)
+    print('test_pool: {0:.4f}'.format(Tp))
+    _perf_pool()
+    
     print('[+] BSSAP / BSSMAP decoding / re-encoding')
     Tn = timeit(test_bssap, number=200)
     print('test_bssap: {0:.4f}'.format(Tn))
     
-    print('[+] test_mobile total time: {0:.4f}'.format(Ta+Tb+Tc+Td+Te+Tf+Tg+Th+Ti+Tj+Tk+Tl+Tm+Tn))
+    print('[+] test_mobile total time: {0:.4f}'.format(Ta+Tb+Tc+Td+Te+Tf+Tg+Th+Ti+Tj+Tk+Tl+Tm+Tn+To+Tp))
 
 
 if __name__ == '__main__':
@@ -42,6 +42,14 @@ try:
 except ImportError:
     _with_crcmod = False
 
+try:
+    # required for corenet, together with CryptoMobile
+    import sctp
+    from test.test_corenet import *
+    _with_corenet = True
+except ImportError:
+    _with_corenet = False
+
 from test.test_core   import *
 from test.test_media  import *
 from test.test_ether  import *
@@ -90,11 +98,15 @@ class TestPycrate(unittest.TestCase):
         test_int()
         test_blb()
         test_pack()
+        test_bitwriter()
         test_charpy()
+        test_charpy_fast()
         test_elt_1()
         test_elt_2()
         test_elt_3()
         test_elt_4()
+        test_elt_5()
+        test_elt_6()
     
     # fmt_media objects
     def test_media(self):
@@ -195,6 +207,8 @@ class TestPycrate(unittest.TestCase):
         test_tcap_map()
         test_tcap_cap()
         test_X509()
+        test_lazy()
+        test_snapshot()
         GLOBAL.clear()
     
     # csn1
@@ -207,6 +221,9 @@ class TestPycrate(unittest.TestCase):
         test_msracap()
         test_si2qr()
         test_si13r()
+        test_csn1alt()
+        test_csn1comp()
+        test_csn1lazy()
     
     # mobile
     def test_mobile(self):
@@ -224,6 +241,9 @@ class TestPycrate(unittest.TestCase):
         test_gtpc()
         test_diameter()
         test_pfcp()
+        test_gtp_classify()
+        test_gtpc_pfcp_mand()
+        test_pool()
         test_bssap()
     
     # mobile / GSM RR
@@ -249,6 +269,12 @@ class TestPycrate(unittest.TestCase):
         if _with_crcmod:
             test_sedebugmux()
     
+    # corenet servers
+    def test_corenet(self):
+        if _with_corenet:
+            print('[<>] testing pycrate_corenet')
+            test_corenet()
+    
     # crypto protocols
     def test_crypto(self):
         print('[<>] testing pycrate_crypto')
@@ -43,7 +43,7 @@ logger.addHandler(loghdlr)
 from pycrate_asn1c.generator    import _Generator
 from pycrate_asn1c.asnproc      import (
     compile_text, compile_spec, compile_all, \
-    generate_modules, PycrateGenerator, JSONDepGraphGenerator,
+    generate_modules, PycrateGenerator, PycratePERCompGenerator, JSONDepGraphGenerator,
     ASN_SPECS, GLOBAL, get_spec_dir
     )
 
@@ -109,6 +109,8 @@ def main():
                         help='force EXTENSIBILITY IMPLIED for all ASN.1 modules')
     parser.add_argument('-fverifwarn', action='store_true',
                         help='force warning instead of raising during the verification stage')
+    parser.add_argument('-fpercomp', action='store_true',
+                        help='enable the compiled PER codec for all objects in the generated Python module')
     parser.add_argument('-v', dest='verbose', action='store_true',
                         help='print additional debugging info from the decoding')
     #
@@ -124,7 +126,10 @@ def main():
     if args.verbose:
         logger.setLevel(logging.INFO)
     #
-    generator_class = PycrateGenerator
+    if args.fpercomp:
+        generator_class = PycratePERCompGenerator
+    else:
+        generator_class = PycrateGenerator
     if args.generator_path:
         generator_class, err = import_generator_from_file(args.generator_path)
         if err:
@@ -37,6 +37,9 @@ from binascii import unhexlify, hexlify
 from pycrate_core.utils    import str_types, bytes_types
 from pycrate_core.charpy   import Charpy
 from pycrate_asn1rt.codecs import ASN1CodecBER
+from pycrate_asn1rt.err    import ASN1BERDecodeErr
+from pycrate_asn1rt.pool   import ASN1PoolDecoder
+from pycrate_asn1rt.berscan import BERScanner
 from pycrate_core.log      import logging, logger, logfmt
 logger.setLevel(logging.WARNING)
 loghdlr = logging.StreamHandler(sys.stderr)
@@ -61,6 +64,58 @@ class MyPrettyPrinter(pprint.stdprinter):
         return pprint.stdprinter._format(self, obj, *args, **kwargs)
 
 
+def iter_tlv_bufs(scan):
+    """yields each top-level BER encoded object from the BERScanner scan, as bytes
+    """
+    off = scan.off
+    while scan.end - off >= 2:
+        try:
+            end = scan.tlv_end(off)
+        except Exception as err:
+            print('Invalid BER buffer: %s' % err)
+            off += 2
+        else:
+            yield scan.buf[off:end]
+            off = end
+
+
+def print_events(scan, maxdepth):
+    """prints the TLV structure of all objects from the BERScanner scan, without 
+    their values
+    """
+    try:
+        for depth, cl, pc, tval, lval, off, voff in scan.iter_tlv(maxdepth=maxdepth):
+            if cl == 0 and tval in ASN1CodecBER.TagUnivLUT:
+                tag = ASN1CodecBER.TagUnivLUT[tval]
+            else:
+                tag = '%s %i' % (ASN1CodecBER.TagClassLUT[cl], tval)
+            print('%s[%s] %s, off %i, len %s' % (depth*'  ', tag, ASN1CodecBER.TagPCLUT[pc],
+                  off, 'undef' if lval < 0 else lval))
+    except ASN1BERDecodeErr as err:
+        print('Invalid BER buffer: %s' % err)
+    return 0
+
+
+def decode_pool(scan, args):
+    if not args.type or args.type.count('.') != 1:
+        print('%s, args error: invalid ASN.1 object %s' % (sys.argv[0], args.type))
+        return 0
+    mod, obj = args.type.split('.')
+    pymod = args.module
+    if '.' not in pymod:
+        pymod = 'pycrate_asn1dir.' + pymod
+    with ASN1PoolDecoder(pymod, mod, obj, codec='ber', workers=args.workers,
+                         chunksize=args.chunksize) as Dec:
+        for cnt, val in enumerate(Dec.decode(iter_tlv_bufs(scan))):
+            print('\n' + 14*'--' + ' object %i ' % cnt + 14*'--' + '\n')
+            if isinstance(val, Exception):
+                print('Invalid %s buffer: %s' % (obj, val))
+            else:
+                pprint.pprint(val)
+    print('\n' + Dec.report(), file=sys.stderr)
+    return 0
+
+
 def main():
     
     parser = argparse.ArgumentParser(description='print any ASN.1 BER/CER/DER encoded objects '\
@@ -74,19 +129,34 @@ def main():
                         help='offset to start decoding at')
     parser.add_argument('-x', dest='hex', action='store_true',
                         help='print non-ascii strings in hexadecimal form')
+    parser.add_argument('-m', dest='module', type=str,
+                        help='pycrate_asn1dir module to decode the objects with (e.g. TCAP_MAP), '\
+                             'instead of the generic tag-length-value structure')
+    parser.add_argument('-t', dest='type', type=str,
+                        help='ASN.1 object to decode the objects with, as ASN1Module.ASN1Object '\
+                             '(e.g. TCAP-MAP-Messages.TCAP-MAP-Message), requires -m')
+    parser.add_argument('-w', dest='workers', type=int, default=None,
+                        help='number of worker processes for decoding with -m (default: number '\
+                             'of CPUs, 0: no worker process)')
+    parser.add_argument('-c', dest='chunksize', type=int, default=64,
+                        help='number of objects sent at once to a worker process (default: 64)')
+    parser.add_argument('-e', dest='events', action='store_true',
+                        help='only print the tag, offset and length of each TLV, '\
+                             'without loading the input file in memory')
+    parser.add_argument('-d', dest='depth', type=int, default=None,
+                        help='maximum depth of TLVs printed with -e (0: only top-level objects)')
     #
     args = parser.parse_args()
     if args.input:
+        # the input file is mmap'ed
         try:
-            fd = open(args.input, 'rb')
+            scan = BERScanner(args.input, off=args.offset)
         except:
             print('%s, args error: file %s not found' % (sys.argv[0], args.input))
             return 0
-        buf = fd.read()[args.offset:]
-        fd.close()
     elif args.stream:
         try:
-            buf = unhexlify(args.stream)[args.offset:]
+            scan = BERScanner(unhexlify(args.stream), off=args.offset)
         except:
             print('%s, args error: invalid hex stream %s' % (sys.argv[0], args.stream))
             return 0
@@ -96,14 +166,17 @@ def main():
     if args.hex:
         pprint.PrettyPrinter=MyPrettyPrinter
     #
-    char = Charpy(buf)
-    cnt  = 0 
-    while char.len_bit() >= 16:
+    if args.events:
+        return print_events(scan, args.depth)
+    elif args.module:
+        return decode_pool(scan, args)
+    #
+    cnt = 0
+    for buf in iter_tlv_bufs(scan):
         try:
-            Obj, V = ASN1CodecBER.decode_tlv_ws(char)
+            Obj, V = ASN1CodecBER.decode_tlv_ws(Charpy(buf))
         except Exception as err:
             print('Invalid BER buffer: %s' % err)
-            char._cur += 16
         else:
             print('\n' + 14*'--' + ' object %i ' % cnt + 14*'--' + '\n')
             pprint.pprint(V)